@@ -0,0 +1,456 @@
+"""
+Synthetic large-scale data generator for load and scale testing.
+
+Creates users, players, teams and finished tournaments with realistic match
+histories (round robin groups and single elimination brackets whose scores
+follow the MR12/MR15 rules) and bulk-loads them with PostgreSQL COPY.
+Rows are streamed in chunks, so memory stays flat no matter how many
+matches are generated.
+
+Usage (from the backend directory):
+    python -m benchmarks.generate_data --database-url postgresql://... \\
+        --users 100000 --teams 50000 --tournaments 1700000 --truncate
+    python -m benchmarks.generate_data --csv-dir /tmp/match_score_data ...
+
+With --csv-dir the rows are written to one CSV file per table instead,
+ready for psql's \\copy.
+"""
+
+import argparse
+import csv
+from datetime import datetime, timedelta
+from enum import Enum
+import io
+import multiprocessing
+import operator
+import os
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Iterable, Iterator
+import uuid
+
+from benchmarks.seed import (
+    generate_finished_tournament,
+    generate_players,
+    generate_teams,
+    generate_users,
+)
+from sqlalchemy import create_engine
+from src.models import Base
+from src.models.enums import Role, TournamentFormat
+
+COLUMNS = {
+    "user": ["id", "email", "password_hash", "role", "created_at"],
+    "team": ["id", "name", "logo", "played_games", "won_games", "tournament_id"],
+    "player": [
+        "id",
+        "username",
+        "first_name",
+        "last_name",
+        "country",
+        "avatar",
+        "played_games",
+        "won_games",
+        "user_id",
+        "team_id",
+    ],
+    "tournament": [
+        "id",
+        "title",
+        "tournament_format",
+        "start_date",
+        "end_date",
+        "prize_pool",
+        "current_stage",
+        "director_id",
+    ],
+    "match": [
+        "id",
+        "match_format",
+        "start_time",
+        "is_finished",
+        "stage",
+        "team1_id",
+        "team2_id",
+        "team1_score",
+        "team2_score",
+        "winner_team_id",
+        "tournament_id",
+    ],
+    "prizecut": ["id", "place", "prize_cut", "tournament_id", "team_id"],
+}
+
+# Derived once from the loaded matches instead of being tracked per row
+UPDATE_STATISTICS = [
+    """
+    UPDATE team SET played_games = stats.played, won_games = stats.won
+    FROM (
+        SELECT team_id, count(*) AS played,
+               count(*) FILTER (WHERE winner_team_id = team_id) AS won
+        FROM (
+            SELECT team1_id AS team_id, winner_team_id FROM match
+            UNION ALL
+            SELECT team2_id AS team_id, winner_team_id FROM match
+        ) AS appearances
+        GROUP BY team_id
+    ) AS stats
+    WHERE team.id = stats.team_id
+    """,
+    """
+    UPDATE player SET played_games = team.played_games,
+                      won_games = team.won_games
+    FROM team
+    WHERE player.team_id = team.id
+    """,
+]
+
+
+_FORMATTERS = {
+    str: str,
+    int: str,
+    float: str,
+    uuid.UUID: str,
+    bool: lambda value: "t" if value else "f",
+    datetime: lambda value: value.isoformat(sep=" "),
+}
+
+
+def format_value(value) -> str | None:
+    """
+    Convert a generated value to its COPY CSV representation.
+    Formatters are looked up by exact type, which keeps this hot path
+    free of isinstance chains.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        str | None: The text value, or None for SQL NULL.
+    """
+    if value is None:
+        return None
+
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is None:
+        if isinstance(value, Enum):
+            # SQLAlchemy stores enums by their member name
+            formatter = _FORMATTERS[type(value)] = operator.attrgetter("name")
+        else:
+            formatter = _FORMATTERS[type(value)] = str
+
+    return formatter(value)
+
+
+def generate_tournaments(
+    first_index: int,
+    count: int,
+    teams: list[dict],
+    director_ids: list,
+    single_elimination_share: float,
+    rng: random.Random,
+) -> Iterator[tuple[dict, list[dict], list[dict]]]:
+    """
+    Lazily generate finished tournaments spread over the last years.
+
+    Args:
+        first_index (int): The running number of the first tournament.
+        count (int): The number of tournaments to generate.
+        teams (list[dict]): The team rows to draw participants from.
+        director_ids (list): The IDs of the users directing tournaments.
+        single_elimination_share (float): The share of single elimination
+        tournaments, the rest being round robin.
+        rng (random.Random): The random generator to draw from.
+
+    Yields:
+        tuple[dict, list[dict], list[dict]]: The tournament row,
+        its match rows and its prize cut rows.
+    """
+    first_day = datetime(2020, 1, 1)
+    span_days = (datetime.now() - first_day).days - 30
+
+    for index in range(first_index, first_index + count):
+        if rng.random() < single_elimination_share:
+            tournament_format = TournamentFormat.SINGLE_ELIMINATION
+            team_count = rng.choice((4, 8))
+        else:
+            tournament_format = TournamentFormat.ROUND_ROBIN
+            team_count = 4
+
+        yield generate_finished_tournament(
+            index,
+            tournament_format,
+            rng.sample(teams, team_count),
+            rng.choice(director_ids),
+            first_day + timedelta(days=rng.randrange(span_days)),
+            rng,
+        )
+
+
+def render_rows(table: str, rows: Iterable[dict]) -> tuple[str, int]:
+    """
+    Render rows of a table as COPY compatible CSV text.
+
+    Args:
+        table (str): The name of the table.
+        rows (Iterable[dict]): The rows to render.
+
+    Returns:
+        tuple[str, int]: The CSV text and the number of rendered rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    columns = COLUMNS[table]
+    count = 0
+    for row in rows:
+        writer.writerow([format_value(row[column]) for column in columns])
+        count += 1
+    return buffer.getvalue(), count
+
+
+class CopySink:
+    """
+    Streams rendered rows into PostgreSQL tables with COPY ... FROM STDIN.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def write(self, table: str, text: str) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY "{table}" ({", ".join(COLUMNS[table])}) '
+                f"FROM STDIN WITH (FORMAT csv)",
+                io.StringIO(text),
+            )
+
+
+class CsvDirSink:
+    """
+    Appends rendered rows to one CSV file per table.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for table in COLUMNS:
+            (self.directory / f"{table}.csv").unlink(missing_ok=True)
+
+    def write(self, table: str, text: str) -> None:
+        with open(self.directory / f"{table}.csv", "a", newline="") as file:
+            file.write(text)
+
+
+# Set in every worker process by _init_worker
+_worker_state: dict = {}
+
+
+def _init_worker(
+    team_ids: list, director_ids: list, single_elimination_share: float, seed: int
+) -> None:
+    _worker_state.update(
+        team_ids=team_ids,
+        director_ids=director_ids,
+        single_elimination_share=single_elimination_share,
+        seed=seed,
+    )
+
+
+def render_tournament_chunk(chunk: tuple[int, int]) -> dict[str, tuple[str, int]]:
+    """
+    Generate and render a chunk of finished tournaments. Every chunk has its
+    own random generator, so the output does not depend on the worker count.
+
+    Args:
+        chunk (tuple[int, int]): The index of the first tournament
+        and the number of tournaments in the chunk.
+
+    Returns:
+        dict[str, tuple[str, int]]: The CSV text and row count per table.
+    """
+    first_index, count = chunk
+    rng = random.Random(f"{_worker_state['seed']}-{first_index}")
+
+    # Statistics are derived in SQL after loading, so fresh rows are enough here
+    teams = [
+        {"id": team_id, "played_games": 0, "won_games": 0}
+        for team_id in _worker_state["team_ids"]
+    ]
+
+    tournaments, matches, prize_cuts = [], [], []
+    for tournament, tournament_matches, tournament_prizes in generate_tournaments(
+        first_index,
+        count,
+        teams,
+        _worker_state["director_ids"],
+        _worker_state["single_elimination_share"],
+        rng,
+    ):
+        tournaments.append(tournament)
+        matches.extend(tournament_matches)
+        prize_cuts.extend(tournament_prizes)
+
+    return {
+        "tournament": render_rows("tournament", tournaments),
+        "match": render_rows("match", matches),
+        "prizecut": render_rows("prizecut", prize_cuts),
+    }
+
+
+def load(args: argparse.Namespace, sink) -> dict[str, int]:
+    """
+    Generate every table and push it to the sink in chunks. Tournament
+    chunks are generated in parallel and written in order.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+        sink: A CopySink or CsvDirSink.
+
+    Returns:
+        dict[str, int]: The number of rows written per table.
+    """
+    rng = random.Random(args.seed)
+    counts = dict.fromkeys(COLUMNS, 0)
+
+    users = generate_users(args.users, rng)
+    directors = users[: max(1, args.directors)]
+    for user in directors:
+        user["role"] = Role.DIRECTOR
+
+    teams = generate_teams(args.teams, rng)
+    players = generate_players(teams, users, rng)
+    for table, rows in (("user", users), ("team", teams), ("player", players)):
+        text, counts[table] = render_rows(table, rows)
+        sink.write(table, text)
+
+    team_ids = [team["id"] for team in teams]
+    director_ids = [user["id"] for user in directors]
+    del users, teams, players
+
+    chunks = [
+        (first_index, min(args.chunk_size, args.tournaments - first_index))
+        for first_index in range(0, args.tournaments, args.chunk_size)
+    ]
+
+    started = time.perf_counter()
+    with multiprocessing.Pool(
+        processes=args.workers,
+        initializer=_init_worker,
+        initargs=(team_ids, director_ids, args.single_elimination_share, args.seed),
+    ) as pool:
+        for rendered in pool.imap(render_tournament_chunk, chunks):
+            for table in ("tournament", "match", "prizecut"):
+                text, count = rendered[table]
+                sink.write(table, text)
+                counts[table] += count
+
+            elapsed = time.perf_counter() - started
+            print(
+                f"{counts['tournament']:>10} tournaments "
+                f"{counts['match']:>11} matches "
+                f"({counts['match'] / max(elapsed, 1e-9):,.0f} matches/s)",
+                flush=True,
+            )
+
+    return counts
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--database-url", help="PostgreSQL database to COPY the rows into"
+    )
+    target.add_argument("--csv-dir", type=Path, help="write CSV files here instead")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--directors", type=int, default=50)
+    parser.add_argument("--teams", type=int, default=2_000)
+    parser.add_argument("--tournaments", type=int, default=10_000)
+    parser.add_argument(
+        "--single-elimination-share",
+        type=float,
+        default=0.5,
+        help="share of single elimination tournaments, the rest is round robin",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=20_000,
+        help="number of tournaments generated and copied at once",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of processes generating tournament chunks",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="create missing tables before loading",
+    )
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="empty every table before loading",
+    )
+    args = parser.parse_args(argv)
+
+    if args.teams < 8:
+        parser.error("--teams must be at least 8 to fill the largest bracket")
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    started = time.perf_counter()
+
+    if args.csv_dir:
+        counts = load(args, CsvDirSink(args.csv_dir))
+    else:
+        if not args.database_url.startswith(("postgresql", "postgres://")):
+            print("COPY loading needs a PostgreSQL database", file=sys.stderr)
+            return 2
+
+        engine = create_engine(
+            args.database_url.replace("postgres://", "postgresql://")
+        )
+        if args.create_schema:
+            Base.metadata.create_all(bind=engine)
+
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                if args.truncate:
+                    cursor.execute(
+                        "TRUNCATE TABLE match, prizecut, request, player, "
+                        'tournament, team, "user" CASCADE'
+                    )
+
+            counts = load(args, CopySink(connection))
+
+            with connection.cursor() as cursor:
+                for statement in UPDATE_STATISTICS:
+                    cursor.execute(statement)
+                cursor.execute("ANALYZE")
+
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+            engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    summary = ", ".join(f"{count:,} {table}" for table, count in counts.items())
+    print(f"Loaded {summary} in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
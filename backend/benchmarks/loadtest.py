@@ -0,0 +1,363 @@
+"""
+HTTP load test replaying a match-day traffic mix against a running API.
+
+Virtual users loop over a weighted mix of requests: anonymous polling of
+the match list and tournament pages, directors upvoting live scores,
+logins and avatar uploads. Throughput, p50/p95/p99 latency and the error
+rate are reported per endpoint.
+
+Usage (from the backend directory, with the API and the stand-ins running):
+    python -m benchmarks.stand_ins
+    python -m benchmarks.loadtest --email kitten0@kitten.com --password ...
+
+The director account must own at least one tournament with unfinished
+matches, e.g. the "Kitten Cup Live" tournament seeded by benchmarks.seed.
+Uses httpx, which is installed with the application dependencies.
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import io
+import itertools
+import json
+import os
+import random
+import sys
+import time
+
+import httpx
+from PIL import Image
+
+DEFAULT_BASE_URL = "http://localhost:8000/api/v1"
+# Relative weights of the actions in the match-day mix
+MIX = {
+    "GET /matches/": 50,
+    "GET /tournaments/{id}": 30,
+    "PUT /matches/{id}/team-scores": 10,
+    "POST /users/login": 5,
+    "PUT /players/{id}": 5,
+}
+
+
+@dataclass
+class EndpointStats:
+    """
+    Latencies and failures recorded for a single endpoint.
+
+    Attributes:
+        latencies (list[float]): The latency of every request in milliseconds.
+        errors (int): The number of failed requests (non 2xx or transport errors).
+    """
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, duration: float) -> dict:
+        """
+        Summarize the recorded requests.
+
+        Args:
+            duration (float): The length of the run in seconds.
+
+        Returns:
+            dict: Request count, throughput, latency percentiles and error rate.
+        """
+        latencies = sorted(self.latencies)
+        requests = len(latencies)
+        return {
+            "requests": requests,
+            "rps": round(requests / duration, 2),
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "error_rate": round(self.errors / requests, 4) if requests else 0.0,
+        }
+
+
+@dataclass
+class Targets:
+    """
+    Identifiers discovered before the run that the actions refer to.
+
+    Attributes:
+        token (str): The director's access token.
+        tournament_ids (list[str]): Tournaments to poll.
+        live_match_ids (list[str]): Unfinished matches the director may score.
+        player_ids (list[str]): Players without a user the director may edit.
+    """
+
+    token: str
+    tournament_ids: list[str]
+    live_match_ids: list[str]
+    player_ids: list[str]
+
+
+def percentile(values: list[float], p: float) -> float:
+    """
+    Compute a percentile using the nearest-rank method.
+
+    Args:
+        values (list[float]): The sorted values.
+        p (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0.0 for no values.
+    """
+    if not values:
+        return 0.0
+    rank = max(int(round(p / 100 * len(values))) - 1, 0)
+    return round(values[min(rank, len(values) - 1)], 3)
+
+
+def make_avatar() -> bytes:
+    """
+    Render a small PNG that passes the avatar validation.
+
+    Returns:
+        bytes: The PNG image.
+    """
+    output = io.BytesIO()
+    Image.new("RGB", (400, 400), (255, 153, 51)).save(output, format="PNG")
+    return output.getvalue()
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post(
+        "/users/login", data={"username": email, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def discover(client: httpx.AsyncClient, email: str, password: str) -> Targets:
+    """
+    Log in as the director and collect the identifiers the mix needs.
+
+    Args:
+        client (httpx.AsyncClient): The HTTP client.
+        email (str): The director's email.
+        password (str): The director's password.
+
+    Returns:
+        Targets: The discovered identifiers.
+    """
+    token = await login(client, email, password)
+    auth = {"Authorization": f"Bearer {token}"}
+    director_id = (await client.get("/users/me", headers=auth)).json()["id"]
+
+    tournaments = (await client.get("/tournaments/", params={"limit": 100})).json()
+    live_match_ids = []
+    for tournament in tournaments:
+        if tournament["director_id"] != director_id:
+            continue
+
+        details = (await client.get(f"/tournaments/{tournament['id']}")).json()
+        live_match_ids.extend(
+            match["id"]
+            for match in details.get("matches_of_current_stage", [])
+            if not match["is_finished"]
+        )
+
+    players = (await client.get("/players/", params={"limit": 100})).json()
+
+    return Targets(
+        token=token,
+        tournament_ids=[tournament["id"] for tournament in tournaments],
+        live_match_ids=live_match_ids,
+        player_ids=[player["id"] for player in players if not player["user_email"]],
+    )
+
+
+class MatchDay:
+    """
+    The actions of the match-day mix and the statistics they record.
+
+    Args:
+        client (httpx.AsyncClient): The HTTP client shared by all virtual users.
+        targets (Targets): The discovered identifiers.
+        email (str): The director's email, used by the login action.
+        password (str): The director's password.
+    """
+
+    def __init__(
+        self, client: httpx.AsyncClient, targets: Targets, email: str, password: str
+    ):
+        self.client = client
+        self.targets = targets
+        self.email = email
+        self.password = password
+        self.auth = {"Authorization": f"Bearer {targets.token}"}
+        self.avatar = make_avatar()
+        self.stats = {name: EndpointStats() for name in MIX}
+        self.live_matches = itertools.cycle(targets.live_match_ids)
+        # Always upvote the trailing team, so the live matches never finish
+        self.trailing_team = dict.fromkeys(targets.live_match_ids, "team1")
+
+    def available_actions(self) -> dict[str, int]:
+        """
+        Drop the actions for which no target was discovered.
+
+        Returns:
+            dict[str, int]: The weights of the actions that can run.
+        """
+        required = {
+            "GET /tournaments/{id}": self.targets.tournament_ids,
+            "PUT /matches/{id}/team-scores": self.targets.live_match_ids,
+            "PUT /players/{id}": self.targets.player_ids,
+        }
+        return {name: weight for name, weight in MIX.items() if required.get(name, 1)}
+
+    async def request(self, name: str, rng: random.Random) -> httpx.Response:
+        if name == "GET /matches/":
+            return await self.client.get(
+                "/matches/", params={"limit": 20, "offset": rng.randrange(0, 100, 20)}
+            )
+        if name == "GET /tournaments/{id}":
+            tournament_id = rng.choice(self.targets.tournament_ids)
+            return await self.client.get(f"/tournaments/{tournament_id}")
+        if name == "PUT /matches/{id}/team-scores":
+            match_id = next(self.live_matches)
+            response = await self.client.put(
+                f"/matches/{match_id}/team-scores",
+                params={"team_to_upvote_score": self.trailing_team[match_id]},
+                headers=self.auth,
+            )
+            if response.is_success:
+                match = response.json()
+                self.trailing_team[match_id] = (
+                    "team1" if match["team1_score"] <= match["team2_score"] else "team2"
+                )
+            return response
+        if name == "POST /users/login":
+            return await self.client.post(
+                "/users/login",
+                data={"username": self.email, "password": self.password},
+            )
+        if name == "PUT /players/{id}":
+            player_id = rng.choice(self.targets.player_ids)
+            return await self.client.put(
+                f"/players/{player_id}",
+                files={"avatar": ("avatar.png", self.avatar, "image/png")},
+                headers=self.auth,
+            )
+        raise ValueError(f"Unknown action {name}")
+
+    async def virtual_user(self, deadline: float, seed: int) -> None:
+        """
+        Run actions back to back until the deadline.
+
+        Args:
+            deadline (float): The perf_counter value at which to stop.
+            seed (int): The seed of this user's random generator.
+        """
+        rng = random.Random(seed)
+        actions = self.available_actions()
+        names, weights = list(actions), list(actions.values())
+
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            stats = self.stats[name]
+            started = time.perf_counter()
+            try:
+                response = await self.request(name, rng)
+                failed = not response.is_success
+            except httpx.HTTPError:
+                failed = True
+            stats.latencies.append((time.perf_counter() - started) * 1000)
+            stats.errors += failed
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """
+    Discover the targets, run the virtual users and summarize the results.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        dict: The run metadata and the statistics per endpoint.
+    """
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        targets = await discover(client, args.email, args.password)
+        match_day = MatchDay(client, targets, args.email, args.password)
+        skipped = set(MIX) - set(match_day.available_actions())
+        for name in sorted(skipped):
+            print(f"Skipping {name}: no targets found", file=sys.stderr)
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                match_day.virtual_user(deadline, args.seed + user)
+                for user in range(args.users)
+            )
+        )
+        duration = time.perf_counter() - started
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "users": args.users,
+            "duration_s": round(duration, 3),
+        },
+        "endpoints": {
+            name: stats.summary(duration)
+            for name, stats in match_day.stats.items()
+            if name not in skipped
+        },
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--base-url", default=os.getenv("LOADTEST_BASE_URL", DEFAULT_BASE_URL)
+    )
+    parser.add_argument(
+        "--email",
+        default=os.getenv("LOADTEST_EMAIL"),
+        help="director account used for logins, score updates and uploads",
+    )
+    parser.add_argument("--password", default=os.getenv("LOADTEST_PASSWORD"))
+    parser.add_argument("--users", type=int, default=50, help="virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--timeout", type=float, default=30, help="seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="file to write the JSON results to")
+    args = parser.parse_args(argv)
+
+    if not args.email or not args.password:
+        parser.error("--email and --password (or LOADTEST_EMAIL/PASSWORD) required")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(run(args))
+
+    print(
+        f"{'endpoint':<32}{'requests':>10}{'rps':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>9}"
+    )
+    for name, stats in results["endpoints"].items():
+        print(
+            f"{name:<32}{stats['requests']:>10}{stats['rps']:>10.1f}"
+            f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+            f"{stats['p99_ms']:>10.1f}{stats['error_rate']:>9.2%}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+Benchmarks for the hot CRUD paths.
+
+Seeds a fresh database per data size, times every case and writes the
+results as JSON. When a baseline file is given, the run fails if any case
+got slower than the allowed tolerance.
+
+Usage (from the backend directory):
+    python -m benchmarks.run --sizes 50,500 --output bench.json
+    python -m benchmarks.run --baseline bench.json --tolerance 0.25
+
+The database defaults to an in-memory SQLite database; pass a PostgreSQL
+URL with --database-url (or BENCHMARK_DATABASE_URL) for realistic numbers.
+The target database is dropped and recreated, never point it at real data.
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable
+
+from benchmarks.seed import SeedResult, seed_database
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.crud import (
+    match as crud_match,
+    player as crud_player,
+    team as crud_team,
+    tournament as crud_tournament,
+)
+from src.models import Base
+from src.models.enums import Role, TournamentFormat
+from src.schemas.tournament import TournamentCreate
+from src.schemas.user import UserResponse
+from src.utils.pagination import PaginationParams
+
+DEFAULT_DATABASE_URL = "sqlite://"
+PAGE = PaginationParams(offset=0, limit=100)
+
+
+def build_cases(seed: SeedResult) -> dict[str, Callable[[Session, int], object]]:
+    """
+    Build the benchmark cases for a seeded database.
+
+    Every case receives a fresh session and the index of the current
+    repetition, so that writing cases can vary their input.
+
+    Args:
+        seed (SeedResult): Identifiers of the seeded rows.
+
+    Returns:
+        dict[str, Callable[[Session, int], object]]: The cases by name.
+    """
+    director = UserResponse(
+        id=seed.director_id, email="kitten0@kitten.com", role=Role.DIRECTOR
+    )
+    busiest_team_id = seed.team_ids[-1]
+    live_match_id = seed.live_match_ids[0]
+
+    def create_tournament(db: Session, repetition: int):
+        tournament = TournamentCreate(
+            title=f"Benchmark Cup {repetition}",
+            tournament_format=TournamentFormat.ROUND_ROBIN,
+            start_date=datetime.now(timezone.utc) + timedelta(days=2),
+            team_names=[f"Bench {repetition} {i}" for i in range(4)],
+            prize_pool=1000,
+        )
+        return crud_tournament.create_tournament(db, tournament, director)
+
+    def update_match_score(db: Session, repetition: int):
+        # Alternating the teams keeps the score level, so the match never ends
+        team = "team1" if repetition % 2 == 0 else "team2"
+        return crud_match.update_match_score(db, live_match_id, team, director)
+
+    return {
+        "get_all_matches": lambda db, _: crud_match.get_all_matches(db, PAGE),
+        "get_teams": lambda db, _: crud_team.get_teams(db, PAGE),
+        "get_players": lambda db, _: crud_player.get_players(db, PAGE),
+        "get_team": lambda db, _: crud_team.get_team(db, busiest_team_id),
+        "get_tournaments": lambda db, _: crud_tournament.get_tournaments(db, PAGE),
+        "update_match_score": update_match_score,
+        "create_tournament": create_tournament,
+    }
+
+
+def time_case(
+    session_factory: sessionmaker,
+    case: Callable[[Session, int], object],
+    repeat: int,
+    warmup: int,
+) -> dict:
+    """
+    Time a single case.
+
+    Args:
+        session_factory (sessionmaker): Creates a session per call.
+        case (Callable[[Session, int], object]): The case to time.
+        repeat (int): The number of timed calls.
+        warmup (int): The number of untimed calls made first.
+
+    Returns:
+        dict: The timing statistics in milliseconds.
+    """
+    timings = []
+    for repetition in range(warmup + repeat):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            case(db, repetition)
+            elapsed = (time.perf_counter() - started) * 1000
+        finally:
+            db.close()
+
+        if repetition >= warmup:
+            timings.append(elapsed)
+
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "repeat": repeat,
+    }
+
+
+def run_size(database_url: str, size: int, repeat: int, warmup: int) -> dict:
+    """
+    Recreate the schema, seed it for the given size and run every case.
+
+    Args:
+        database_url (str): The database to benchmark against.
+        size (int): The number of teams to seed.
+        repeat (int): The number of timed calls per case.
+        warmup (int): The number of untimed calls per case.
+
+    Returns:
+        dict: The row counts and the timing statistics per case.
+    """
+    engine_options = {}
+    if database_url.startswith("sqlite"):
+        # Share one connection so an in-memory database survives between sessions
+        engine_options = {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+    engine = create_engine(database_url, **engine_options)
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with session_factory() as db:
+        seed = seed_database(db, size)
+
+    cases = {
+        name: time_case(session_factory, case, repeat, warmup)
+        for name, case in build_cases(seed).items()
+    }
+
+    engine.dispose()
+    return {"rows": seed.counts, "cases": cases}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare median timings against a baseline run.
+
+    Args:
+        results (dict): The results of the current run.
+        baseline (dict): The results of the baseline run.
+        tolerance (float): The allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        list[str]: A description of every regression found.
+    """
+    regressions = []
+    for size, size_results in results["sizes"].items():
+        baseline_cases = baseline.get("sizes", {}).get(size, {}).get("cases", {})
+
+        for name, stats in size_results["cases"].items():
+            if name not in baseline_cases:
+                continue
+
+            previous = baseline_cases[name]["median_ms"]
+            current = stats["median_ms"]
+            if previous > 0 and current > previous * (1 + tolerance):
+                regressions.append(
+                    f"{name} (size {size}): {previous:.2f}ms -> {current:.2f}ms "
+                    f"(+{(current / previous - 1) * 100:.0f}%)"
+                )
+
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCHMARK_DATABASE_URL", DEFAULT_DATABASE_URL),
+        help="database to benchmark against (dropped and recreated)",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="50,500",
+        help="comma separated numbers of teams to seed",
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument("--baseline", help="JSON results of a previous run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown against the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    results = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": args.database_url.split("://")[0],
+            "python": platform.python_version(),
+            "repeat": args.repeat,
+        },
+        "sizes": {},
+    }
+    for size in sizes:
+        results["sizes"][str(size)] = run_size(
+            args.database_url, size, args.repeat, args.warmup
+        )
+
+        for name, stats in results["sizes"][str(size)]["cases"].items():
+            print(f"size={size:<8} {name:<20} median {stats['median_ms']:>10.3f}ms")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+
+        if regressions:
+            print("Regressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+
+        print("No regressions against the baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
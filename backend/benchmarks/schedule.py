@@ -0,0 +1,70 @@
+"""
+Benchmark for the match scheduling engine.
+
+Splits a round robin league into rounds with the circle method and books
+a start time for every match, in memory, and fails if the best run took
+longer than the budget.
+
+Usage (from the backend directory):
+    python -m benchmarks.schedule --teams 256 --venues 16 --budget 1.0
+"""
+
+import argparse
+from datetime import datetime, timezone
+import sys
+import time
+
+from src.crud import constants as c
+from src.utils.scheduling import SlotAllocator, round_robin_rounds, schedule_pairs
+
+
+def schedule_league(teams: int, venues: int, max_per_day: int, rest: int) -> int:
+    allocator = SlotAllocator(
+        datetime.now(timezone.utc),
+        match_minutes=c.MATCH_DURATION_PLUS_BUFFER,
+        start_hour=c.START_HOUR,
+        end_hour=c.END_HOUR,
+        max_matches_per_day=max_per_day,
+        venues=venues,
+        rest_minutes=rest,
+    )
+    rounds = round_robin_rounds(range(teams))
+    schedule = schedule_pairs(
+        (pair for round_pairs in rounds for pair in round_pairs), allocator
+    )
+    return len(schedule)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--teams", type=int, default=256)
+    parser.add_argument("--venues", type=int, default=16)
+    parser.add_argument("--max-per-day", type=int, default=64)
+    parser.add_argument("--rest", type=int, default=c.TEAM_REST_MINUTES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=1.0, help="Allowed seconds for the best run"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        matches = schedule_league(args.teams, args.venues, args.max_per_day, args.rest)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    print(f"{args.teams} teams, {matches} matches: best {best * 1000:.1f} ms")
+    if best > args.budget:
+        print(f"Slower than the budget of {args.budget:.2f} s")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""
+Concurrency stress test for match score updates.
+
+Many threads upvote the same live match at once, each with its own
+session, and the final state is checked for lost updates:
+
+- every accepted update must be reflected in the score, and
+- when the workers race to win another match, the teams' played games
+  must be incremented exactly once.
+
+Usage (from the backend directory):
+    python -m benchmarks.score_stress --database-url postgresql://... --workers 16
+
+Use PostgreSQL for meaningful results. SQLite serializes writers with a
+database lock, so there it only shows that nothing is lost, not that
+conflicting updates are detected and retried. The target database is
+dropped and recreated, never point it at real data.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import tempfile
+import threading
+from unittest.mock import patch
+
+from benchmarks.seed import seed_database
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src.crud import match as crud_match
+from src.models import Base, Match, Team
+from src.models.enums import Role
+from src.schemas.user import UserResponse
+
+# An MR12 match is won with 13 points, so rounds of at most 12 points per
+# team cannot finish it, whatever order the updates are applied in
+POINTS_PER_ROUND = 12
+
+
+def hammer(
+    session_factory: sessionmaker,
+    match_id,
+    director: UserResponse,
+    teams: list[str],
+    workers: int,
+) -> dict:
+    """
+    Send one score update per entry of teams, spread over the workers,
+    all released at the same moment.
+
+    Args:
+        session_factory (sessionmaker): Creates a session per update.
+        match_id (UUID): The ID of the match to update.
+        director (UserResponse): The director of the match's tournament.
+        teams (list[str]): The team to upvote in every update.
+        workers (int): The number of concurrent threads.
+
+    Returns:
+        dict: The number of accepted and rejected updates by outcome.
+    """
+    start = threading.Barrier(min(workers, len(teams)))
+    outcomes = {"accepted": 0}
+    lock = threading.Lock()
+
+    def update(index: int, team: str) -> None:
+        if index < start.parties:
+            start.wait()
+
+        with session_factory() as db:
+            try:
+                crud_match.update_match_score(db, match_id, team, director)
+                outcome = "accepted"
+            except HTTPException as e:
+                outcome = f"HTTP {e.status_code}"
+            except Exception as e:
+                outcome = type(e).__name__
+
+        with lock:
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [
+            executor.submit(update, index, team) for index, team in enumerate(teams)
+        ]:
+            future.result()
+
+    return outcomes
+
+
+def score_phase(
+    session_factory: sessionmaker,
+    match_id,
+    director: UserResponse,
+    workers: int,
+    updates: int,
+) -> list[str]:
+    """
+    Send level updates that never finish the match, nothing may be lost.
+    They run in rounds, the score is reset before the match could be won.
+
+    Args:
+        session_factory (sessionmaker): Creates a session per update.
+        match_id (UUID): The ID of the match to update.
+        director (UserResponse): The director of the match's tournament.
+        workers (int): The number of concurrent threads.
+        updates (int): The total number of updates.
+
+    Returns:
+        list[str]: A description of every inconsistency found.
+    """
+    problems = []
+    outcomes = {"accepted": 0}
+    for start in range(0, updates, 2 * POINTS_PER_ROUND):
+        size = min(2 * POINTS_PER_ROUND, updates - start)
+        teams = ["team1" if i % 2 == 0 else "team2" for i in range(size)]
+        round_outcomes = hammer(session_factory, match_id, director, teams, workers)
+        for outcome, count in round_outcomes.items():
+            outcomes[outcome] = outcomes.get(outcome, 0) + count
+
+        with session_factory() as db:
+            db_match = db.get(Match, match_id)
+            total = db_match.team1_score + db_match.team2_score
+            if total != round_outcomes["accepted"]:
+                problems.append(
+                    f"{round_outcomes['accepted']} accepted updates "
+                    f"but a total score of {total}"
+                )
+
+            db_match.team1_score, db_match.team2_score = 0, 0
+            db.commit()
+
+    print(f"score phase:  {outcomes}")
+    return problems
+
+
+def finish_phase(
+    session_factory: sessionmaker,
+    match_id,
+    director: UserResponse,
+    workers: int,
+) -> list[str]:
+    """
+    Leave team1 one point away from winning an untouched match, then let
+    every worker try to score the winning point.
+
+    Args:
+        session_factory (sessionmaker): Creates a session per update.
+        match_id (UUID): The ID of the match to finish.
+        director (UserResponse): The director of the match's tournament.
+        workers (int): The number of concurrent threads.
+
+    Returns:
+        list[str]: A description of every inconsistency found.
+    """
+    with session_factory() as db:
+        db_match = db.get(Match, match_id)
+        db_match.team1_score, db_match.team2_score = POINTS_PER_ROUND, 0
+        db.commit()
+        team_ids = (db_match.team1_id, db_match.team2_id)
+        played_before = {
+            team.id: team.played_games
+            for team in db.query(Team).filter(Team.id.in_(team_ids))
+        }
+
+    outcomes = hammer(session_factory, match_id, director, ["team1"] * workers, workers)
+    print(f"finish phase: {outcomes}")
+
+    problems = []
+    with session_factory() as db:
+        db_match = db.get(Match, match_id)
+        if outcomes["accepted"] != 1 or db_match.team1_score != POINTS_PER_ROUND + 1:
+            problems.append(
+                f"{outcomes['accepted']} winning points accepted, "
+                f"final score {db_match.team1_score}:{db_match.team2_score}"
+            )
+        for team in db.query(Team).filter(Team.id.in_(team_ids)):
+            if team.played_games != played_before[team.id] + 1:
+                problems.append(
+                    f"{team.name} played games went from "
+                    f"{played_before[team.id]} to {team.played_games}"
+                )
+
+    return problems
+
+
+def run(database_url: str, workers: int, updates: int) -> list[str]:
+    """
+    Seed a database and run both stress phases, each against its own
+    live match.
+
+    Args:
+        database_url (str): The database to stress.
+        workers (int): The number of concurrent threads.
+        updates (int): The number of updates in the score phase.
+
+    Returns:
+        list[str]: A description of every inconsistency found.
+    """
+    engine_options = {}
+    if database_url.startswith("sqlite"):
+        engine_options = {"connect_args": {"timeout": 60, "check_same_thread": False}}
+    engine = create_engine(database_url, pool_size=workers, **engine_options)
+
+    if engine.dialect.name == "sqlite":
+        # Take the write lock up front, otherwise two readers that both try
+        # to write deadlock and one of them fails with "database is locked"
+        @event.listens_for(engine, "connect")
+        def disable_implicit_begin(dbapi_connection, _):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def begin_immediate(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with session_factory() as db:
+        seed = seed_database(db, 8)
+    director = UserResponse(
+        id=seed.director_id, email="kitten0@kitten.com", role=Role.DIRECTOR
+    )
+    score_match_id, finish_match_id = seed.live_match_ids[:2]
+
+    problems = score_phase(session_factory, score_match_id, director, workers, updates)
+    problems += finish_phase(session_factory, finish_match_id, director, workers)
+
+    engine.dispose()
+    return problems
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCHMARK_DATABASE_URL"),
+        help="database to stress (dropped and recreated), "
+        "defaults to a temporary SQLite file",
+    )
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--updates", type=int, default=200)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{directory}/stress.db"
+
+        # Finishing a stage notifies players, which is not under test here
+        with patch("src.crud.match.send_email_notification"):
+            problems = run(database_url, args.workers, args.updates)
+
+    if problems:
+        print("Lost or duplicated updates:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+
+    print("No lost or duplicated updates.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import random
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from src.models import Match, Player, PrizeCut, Team, Tournament, User
+from src.models.enums import MatchFormat, Role, Stage, TournamentFormat
+
+# Same bcrypt hash as the accounts in scripts/fill_data_to_db.sql
+PASSWORD_HASH = "$2b$12$496sAD.GDbIGw2PJkL21H.GtTnry2/6LyxQZJZu7nOLMvTZGmJTcO"
+PLAYERS_PER_TEAM = 5
+TEAMS_PER_TOURNAMENT = 4
+BRACKET_STAGES = {8: Stage.QUARTER_FINAL, 4: Stage.SEMI_FINAL}
+COUNTRIES = ["Bulgaria", "Germany", "France", "Spain", "Sweden", "Denmark", "Brazil"]
+
+
+@dataclass
+class SeedResult:
+    """
+    Identifiers of seeded rows that the benchmarks need to reference.
+
+    Attributes:
+        director_id (uuid.UUID): The ID of the director owning every tournament.
+        team_ids (list[uuid.UUID]): The IDs of all seeded teams.
+        live_tournament_id (uuid.UUID): The ID of the round robin tournament
+        that is still in its group stage.
+        live_match_ids (list[uuid.UUID]): The IDs of its unfinished matches.
+        counts (dict): The number of seeded rows per table.
+    """
+
+    director_id: uuid.UUID
+    team_ids: list[uuid.UUID] = field(default_factory=list)
+    live_tournament_id: uuid.UUID | None = None
+    live_match_ids: list[uuid.UUID] = field(default_factory=list)
+    counts: dict = field(default_factory=dict)
+
+
+def winning_score(match_format: MatchFormat, rng: random.Random) -> tuple[int, int]:
+    """
+    Generate a final score that satisfies the MR12/MR15 win conditions.
+
+    Args:
+        match_format (MatchFormat): The format of the match.
+        rng (random.Random): The random generator to draw from.
+
+    Returns:
+        tuple[int, int]: The winner's and the loser's score.
+    """
+    regulation = 12 if match_format == MatchFormat.MR12 else 15
+
+    # Roughly one match in ten goes to overtime
+    if rng.random() < 0.1:
+        overtime = regulation + 4
+        return overtime, rng.randint(regulation, overtime - 2)
+
+    return regulation + 1, rng.randint(0, regulation - 1)
+
+
+def generate_users(count: int, rng: random.Random) -> list[dict]:
+    """
+    Generate user rows, the first of which is a director.
+
+    Args:
+        count (int): The number of users to generate.
+        rng (random.Random): The random generator to draw from.
+
+    Returns:
+        list[dict]: The user rows.
+    """
+    created_at = datetime(2024, 11, 27, 10, 0, 0)
+    return [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "email": f"kitten{i}@kitten.com",
+            "password_hash": PASSWORD_HASH,
+            "role": Role.DIRECTOR if i == 0 else Role.USER,
+            "created_at": created_at + timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def generate_teams(count: int, rng: random.Random) -> list[dict]:
+    """
+    Generate team rows.
+
+    Args:
+        count (int): The number of teams to generate.
+        rng (random.Random): The random generator to draw from.
+
+    Returns:
+        list[dict]: The team rows.
+    """
+    return [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "name": f"Team {i:07d}",
+            "logo": None,
+            "played_games": 0,
+            "won_games": 0,
+            "tournament_id": None,
+        }
+        for i in range(count)
+    ]
+
+
+def generate_players(
+    teams: list[dict], users: list[dict], rng: random.Random
+) -> list[dict]:
+    """
+    Generate a full roster of players for every team. Players are linked
+    to the non-director users until they run out.
+
+    Args:
+        teams (list[dict]): The team rows.
+        users (list[dict]): The user rows.
+        rng (random.Random): The random generator to draw from.
+
+    Returns:
+        list[dict]: The player rows.
+    """
+    players = []
+    free_users = iter(users[1:])
+    for team_index, team in enumerate(teams):
+        for slot in range(PLAYERS_PER_TEAM):
+            user = next(free_users, None)
+            players.append(
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                    "username": f"p{team_index:07d}_{slot}",
+                    "first_name": "Whiskers",
+                    "last_name": "Pawson",
+                    "country": rng.choice(COUNTRIES),
+                    "avatar": None,
+                    "played_games": 0,
+                    "won_games": 0,
+                    "user_id": user["id"] if user else None,
+                    "team_id": team["id"],
+                }
+            )
+    return players
+
+
+def generate_finished_tournament(
+    index: int,
+    tournament_format: TournamentFormat,
+    teams: list[dict],
+    director_id: uuid.UUID,
+    start_date: datetime,
+    rng: random.Random,
+) -> tuple[dict, list[dict], list[dict]]:
+    """
+    Generate a finished tournament together with its full match history
+    and awarded prize cuts. Team statistics are updated in place.
+
+    Args:
+        index (int): A running number used to keep the title unique.
+        tournament_format (TournamentFormat): Round robin or single elimination.
+        teams (list[dict]): The participating team rows, four of them
+        for round robin and four or eight for single elimination.
+        director_id (uuid.UUID): The ID of the directing user.
+        start_date (datetime): The start date of the tournament.
+        rng (random.Random): The random generator to draw from.
+
+    Returns:
+        tuple[dict, list[dict], list[dict]]: The tournament row,
+        its match rows and its prize cut rows.
+    """
+    tournament_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+    prize_pool = rng.randrange(1000, 20000, 500)
+    matches = []
+    current_time = start_date.replace(hour=11, minute=0, second=0, microsecond=0)
+
+    def play(team1: dict, team2: dict, stage: Stage, match_format: MatchFormat):
+        nonlocal current_time
+        winner_score, loser_score = winning_score(match_format, rng)
+        team1_wins = rng.random() < 0.5
+        winner, loser = (team1, team2) if team1_wins else (team2, team1)
+        winner["played_games"] += 1
+        winner["won_games"] += 1
+        loser["played_games"] += 1
+        matches.append(
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                "match_format": match_format,
+                "start_time": current_time,
+                "is_finished": True,
+                "stage": stage,
+                "team1_id": team1["id"],
+                "team2_id": team2["id"],
+                "team1_score": winner_score if team1_wins else loser_score,
+                "team2_score": loser_score if team1_wins else winner_score,
+                "winner_team_id": winner["id"],
+                "tournament_id": tournament_id,
+            }
+        )
+        current_time += timedelta(hours=3)
+        if current_time.hour > 20:
+            current_time = (current_time + timedelta(days=1)).replace(hour=11)
+        return winner, loser
+
+    if tournament_format == TournamentFormat.ROUND_ROBIN:
+        points = {team["id"]: 0 for team in teams}
+        for i, team1 in enumerate(teams):
+            for team2 in teams[i + 1 :]:
+                winner, _ = play(team1, team2, Stage.GROUP_STAGE, MatchFormat.MR12)
+                points[winner["id"]] += 2
+        finalists = sorted(teams, key=lambda t: points[t["id"]], reverse=True)[:2]
+    else:
+        finalists = list(teams)
+        while len(finalists) > 2:
+            stage = BRACKET_STAGES[len(finalists)]
+            finalists = [
+                play(finalists[i], finalists[i + 1], stage, MatchFormat.MR15)[0]
+                for i in range(0, len(finalists), 2)
+            ]
+
+    champion, runner_up = play(*finalists, Stage.FINAL, MatchFormat.MR15)
+
+    tournament = {
+        "id": tournament_id,
+        "title": f"Kitten Cup {index:07d}",
+        "tournament_format": tournament_format,
+        "start_date": start_date,
+        "end_date": current_time.replace(hour=23, minute=59, second=59),
+        "prize_pool": prize_pool,
+        "current_stage": Stage.FINISHED,
+        "director_id": director_id,
+    }
+    prize_cuts = [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "place": place,
+            "prize_cut": round(share * prize_pool),
+            "tournament_id": tournament_id,
+            "team_id": team["id"],
+        }
+        for place, share, team in ((1, 0.7, champion), (2, 0.3, runner_up))
+    ]
+    return tournament, matches, prize_cuts
+
+
+def seed_database(db: Session, size: int, seed: int = 42) -> SeedResult:
+    """
+    Fill an empty database with a synthetic data set shaped like
+    scripts/fill_data_to_db.sql, scaled to the given number of teams.
+
+    Every team gets a full roster, the teams play size // 2 finished
+    tournaments (alternating round robin and single elimination) and
+    four of them are left in a live round robin group stage.
+
+    Args:
+        db (Session): The database session.
+        size (int): The number of teams to generate (at least 8).
+        seed (int): The seed of the random generator.
+
+    Returns:
+        SeedResult: Identifiers of the rows the benchmarks reference.
+    """
+    rng = random.Random(seed)
+    size = max(size, 2 * TEAMS_PER_TOURNAMENT)
+
+    users = generate_users(size * PLAYERS_PER_TEAM // 2 + 1, rng)
+    teams = generate_teams(size, rng)
+    players = generate_players(teams, users, rng)
+    director_id = users[0]["id"]
+
+    tournaments, matches, prize_cuts = [], [], []
+    start_date = datetime(2023, 1, 2)
+    for index in range(size // 2):
+        tournament_format = (
+            TournamentFormat.ROUND_ROBIN
+            if index % 2 == 0
+            else TournamentFormat.SINGLE_ELIMINATION
+        )
+        tournament, tournament_matches, tournament_prizes = (
+            generate_finished_tournament(
+                index,
+                tournament_format,
+                rng.sample(teams, TEAMS_PER_TOURNAMENT),
+                director_id,
+                start_date,
+                rng,
+            )
+        )
+        tournaments.append(tournament)
+        matches.extend(tournament_matches)
+        prize_cuts.extend(tournament_prizes)
+        start_date += timedelta(days=3)
+
+    # A round robin tournament in progress, used by the score update benchmark
+    live_tournament_id = uuid.uuid4()
+    live_start = datetime.now().replace(hour=11, minute=0, second=0, microsecond=0)
+    live_teams = teams[:TEAMS_PER_TOURNAMENT]
+    tournaments.append(
+        {
+            "id": live_tournament_id,
+            "title": "Kitten Cup Live",
+            "tournament_format": TournamentFormat.ROUND_ROBIN,
+            "start_date": live_start,
+            "end_date": live_start + timedelta(days=2),
+            "prize_pool": 10000,
+            "current_stage": Stage.GROUP_STAGE,
+            "director_id": director_id,
+        }
+    )
+    live_match_ids = []
+    for i, team1 in enumerate(live_teams):
+        team1["tournament_id"] = live_tournament_id
+        for team2 in live_teams[i + 1 :]:
+            match_id = uuid.uuid4()
+            live_match_ids.append(match_id)
+            matches.append(
+                {
+                    "id": match_id,
+                    "match_format": MatchFormat.MR12,
+                    "start_time": live_start,
+                    "is_finished": False,
+                    "stage": Stage.GROUP_STAGE,
+                    "team1_id": team1["id"],
+                    "team2_id": team2["id"],
+                    "team1_score": 0,
+                    "team2_score": 0,
+                    "winner_team_id": None,
+                    "tournament_id": live_tournament_id,
+                }
+            )
+    prize_cuts.extend(
+        {
+            "id": uuid.uuid4(),
+            "place": place,
+            "prize_cut": share,
+            "tournament_id": live_tournament_id,
+            "team_id": None,
+        }
+        for place, share in ((1, 7000), (2, 3000))
+    )
+
+    # Teams reference tournaments, so they are inserted detached and linked later
+    team_tournaments = {team["id"]: team.pop("tournament_id") for team in teams}
+
+    for model, rows in (
+        (User, users),
+        (Team, teams),
+        (Player, players),
+        (Tournament, tournaments),
+        (Match, matches),
+        (PrizeCut, prize_cuts),
+    ):
+        if rows:
+            db.execute(insert(model), rows)
+
+    for team in live_teams:
+        db.query(Team).filter(Team.id == team["id"]).update(
+            {Team.tournament_id: team_tournaments[team["id"]]}
+        )
+
+    db.commit()
+
+    return SeedResult(
+        director_id=director_id,
+        team_ids=[team["id"] for team in teams],
+        live_tournament_id=live_tournament_id,
+        live_match_ids=live_match_ids,
+        counts={
+            "users": len(users),
+            "teams": len(teams),
+            "players": len(players),
+            "tournaments": len(tournaments),
+            "matches": len(matches),
+            "prize_cuts": len(prize_cuts),
+        },
+    )
@@ -0,0 +1,208 @@
+"""
+Benchmark for serializing tournament detail responses.
+
+Builds a TournamentDetailResponse with many matches and serves it from two
+endpoints of an in-process app: one returning the model through its
+response_model, which FastAPI validates again before encoding it, and one
+returning a ModelResponse, which encodes the model once. Fails if the
+ModelResponse is not faster by the given factor.
+
+Usage (from the backend directory):
+    python -m benchmarks.serialization --matches 100
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import sys
+import time
+import uuid
+
+from fastapi import FastAPI
+from src.models.enums import MatchFormat, Stage, TournamentFormat
+from src.schemas.match import MatchResponse
+from src.schemas.player import PlayerListResponse
+from src.schemas.prize_cut import PrizeCutResponse
+from src.schemas.team import TeamListResponse
+from src.schemas.tournament import TournamentDetailResponse
+from src.utils.responses import ModelResponse
+
+
+def build_tournament(
+    matches: int, teams: int, players: int
+) -> TournamentDetailResponse:
+    start = datetime(2030, 1, 1, 11)
+    tournament_id = uuid.uuid4()
+    db_teams = [
+        TeamListResponse(
+            id=uuid.uuid4(),
+            name=f"Bench Team {i}",
+            logo=f"https://example.com/logos/{i}.png",
+            game_win_ratio="50%",
+            players=[
+                PlayerListResponse(
+                    id=uuid.uuid4(),
+                    username=f"player{i}_{j}",
+                    first_name="Kitten",
+                    last_name="Player",
+                    country="Bulgaria",
+                    avatar=None,
+                    user_email=f"player{i}_{j}@example.com",
+                    team_name=f"Bench Team {i}",
+                    game_win_ratio="50%",
+                )
+                for j in range(players)
+            ],
+        )
+        for i in range(teams)
+    ]
+
+    return TournamentDetailResponse(
+        id=tournament_id,
+        title="Bench Cup",
+        tournament_format=TournamentFormat.ROUND_ROBIN,
+        start_date=start,
+        end_date=start + timedelta(days=30),
+        current_stage=Stage.GROUP_STAGE,
+        number_of_teams=teams,
+        director_id=uuid.uuid4(),
+        matches_of_current_stage=[
+            MatchResponse(
+                id=uuid.uuid4(),
+                match_format=MatchFormat.MR12,
+                start_time=start + timedelta(hours=i),
+                is_finished=i % 2 == 0,
+                stage=Stage.GROUP_STAGE,
+                team1_id=db_teams[i % teams].id,
+                team2_id=db_teams[(i + 1) % teams].id,
+                team1_score=12,
+                team2_score=i % 12,
+                team1_name=db_teams[i % teams].name,
+                team1_logo=db_teams[i % teams].logo,
+                team2_name=db_teams[(i + 1) % teams].name,
+                team2_logo=db_teams[(i + 1) % teams].logo,
+                winner_id=db_teams[i % teams].id,
+                tournament_id=tournament_id,
+                tournament_title="Bench Cup",
+            )
+            for i in range(matches)
+        ],
+        teams=db_teams,
+        prizes=[
+            PrizeCutResponse(
+                id=uuid.uuid4(),
+                place=place,
+                prize_cut=1000 / place,
+                tournament_id=tournament_id,
+                tournament_name="Bench Cup",
+                team_id=None,
+                team_name=None,
+                team_logo=None,
+            )
+            for place in (1, 2, 3)
+        ],
+    )
+
+
+def build_app(tournament: TournamentDetailResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/validated", response_model=TournamentDetailResponse)
+    def validated():
+        return tournament
+
+    @app.get("/direct", response_model=TournamentDetailResponse)
+    def direct():
+        return ModelResponse(tournament)
+
+    return app
+
+
+async def get(app: FastAPI, path: str) -> bytes:
+    # Call the app directly, an HTTP client would take longer than the
+    # serialization being measured
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("bench", 1234),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def time_path(app: FastAPI, path: str, repeat: int) -> tuple[float, bytes]:
+    body = await get(app, path)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await get(app, path)
+        timings.append(time.perf_counter() - started)
+
+    return min(timings), body
+
+
+async def compare(app: FastAPI, repeat: int) -> tuple[float, bytes, float, bytes]:
+    return *await time_path(app, "/validated", repeat), *await time_path(
+        app, "/direct", repeat
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--teams", type=int, default=16)
+    parser.add_argument("--players", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument(
+        "--min-speedup",
+        type=float,
+        default=1.0,
+        help="Required ratio of the validated time to the direct time",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    tournament = build_tournament(args.matches, args.teams, args.players)
+    validated, validated_body, direct, direct_body = asyncio.run(
+        compare(build_app(tournament), args.repeat)
+    )
+
+    if validated_body != direct_body:
+        print("The two endpoints returned different JSON")
+        return 1
+
+    speedup = validated / direct
+    print(
+        f"{args.matches} matches, {len(direct_body)} bytes: "
+        f"response_model {validated * 1000:.2f} ms, "
+        f"ModelResponse {direct * 1000:.2f} ms, {speedup:.2f}x"
+    )
+    if speedup < args.min_speedup:
+        print(f"Slower than the required speedup of {args.min_speedup:.2f}x")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
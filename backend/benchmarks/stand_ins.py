@@ -0,0 +1,213 @@
+"""
+Local stand-ins for the SMTP server and the S3 bucket.
+
+Both sinks accept everything and keep nothing but a counter, so load tests
+exercise the full avatar upload and notification code paths without
+touching real infrastructure or sending real emails.
+
+Usage (from the backend directory):
+    python -m benchmarks.stand_ins --smtp-port 2525 --s3-port 9000
+
+Then start the API with:
+    SMTP_SERVER=localhost SMTP_PORT=2525 SMTP_USE_TLS=false
+    AWS_ENDPOINT_URL=http://localhost:9000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import sys
+
+SMTP_REPLIES = {
+    b"HELO": b"250 stand-in\r\n",
+    b"MAIL": b"250 OK\r\n",
+    b"RCPT": b"250 OK\r\n",
+    b"RSET": b"250 OK\r\n",
+    b"NOOP": b"250 OK\r\n",
+    b"AUTH": b"235 Authentication successful\r\n",
+}
+HTTP_REASONS = {200: "OK", 204: "No Content", 405: "Method Not Allowed"}
+
+
+class SmtpSink:
+    """
+    An SMTP server that accepts any login and discards every message.
+
+    Attributes:
+        messages (int): The number of messages received so far.
+    """
+
+    def __init__(self):
+        self.messages = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve a single SMTP connection until the client quits.
+
+        Args:
+            reader (asyncio.StreamReader): The client's input stream.
+            writer (asyncio.StreamWriter): The client's output stream.
+        """
+        writer.write(b"220 stand-in ESMTP\r\n")
+        try:
+            while line := await reader.readline():
+                command = line[:4].upper()
+
+                if command == b"EHLO":
+                    writer.write(b"250-stand-in\r\n250 AUTH PLAIN LOGIN\r\n")
+                elif command == b"DATA":
+                    writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    await reader.readuntil(b"\r\n.\r\n")
+                    self.messages += 1
+                    writer.write(b"250 OK\r\n")
+                elif command == b"QUIT":
+                    writer.write(b"221 Bye\r\n")
+                    break
+                else:
+                    writer.write(
+                        SMTP_REPLIES.get(command, b"502 Command not implemented\r\n")
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class S3Sink:
+    """
+    An HTTP server answering the S3 object calls made by S3Service.
+
+    PUT requests are acknowledged with an ETag of the body and DELETE
+    requests always succeed. Connections are kept alive, as boto3 expects.
+
+    Attributes:
+        uploads (int): The number of objects uploaded so far.
+        deletes (int): The number of objects deleted so far.
+    """
+
+    def __init__(self):
+        self.uploads = 0
+        self.deletes = 0
+
+    @staticmethod
+    async def read_body(reader: asyncio.StreamReader, headers: dict) -> bytes:
+        """
+        Read a request body sent either with a length or in chunks.
+
+        Args:
+            reader (asyncio.StreamReader): The client's input stream.
+            headers (dict): The request headers, with lowercase names.
+
+        Returns:
+            bytes: The request body.
+        """
+        if headers.get("transfer-encoding", "").lower() != "chunked":
+            return await reader.readexactly(int(headers.get("content-length", 0)))
+
+        body = b""
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # Skip the trailers up to the final empty line
+                while (await reader.readline()).strip():
+                    pass
+                return body
+            body += await reader.readexactly(size)
+            await reader.readline()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve HTTP requests on a single connection until the client closes it.
+
+        Args:
+            reader (asyncio.StreamReader): The client's input stream.
+            writer (asyncio.StreamWriter): The client's output stream.
+        """
+        try:
+            while request_line := await reader.readline():
+                method = request_line.split(b" ", 1)[0].decode()
+                headers = {}
+                while (line := await reader.readline()).strip():
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                if headers.get("expect", "").lower() == "100-continue":
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                    await writer.drain()
+                body = await self.read_body(reader, headers)
+
+                extra_headers = ""
+                if method == "PUT":
+                    self.uploads += 1
+                    status = 200
+                    extra_headers = f'ETag: "{hashlib.md5(body).hexdigest()}"\r\n'
+                elif method == "DELETE":
+                    self.deletes += 1
+                    status = 204
+                else:
+                    status = 405
+
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                        f"{extra_headers}"
+                        "Content-Length: 0\r\n"
+                        "\r\n"
+                    ).encode()
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str, smtp_port: int, s3_port: int) -> None:
+    """
+    Run both stand-ins until interrupted, printing their counters on exit.
+
+    Args:
+        host (str): The interface to listen on.
+        smtp_port (int): The port of the SMTP stand-in.
+        s3_port (int): The port of the S3 stand-in.
+    """
+    smtp, s3 = SmtpSink(), S3Sink()
+    smtp_server = await asyncio.start_server(smtp.handle, host, smtp_port)
+    s3_server = await asyncio.start_server(s3.handle, host, s3_port)
+    print(f"SMTP stand-in listening on {host}:{smtp_port}")
+    print(f"S3 stand-in listening on http://{host}:{s3_port}")
+
+    try:
+        async with smtp_server, s3_server:
+            await asyncio.gather(smtp_server.serve_forever(), s3_server.serve_forever())
+    finally:
+        print(
+            f"emails={smtp.messages} uploads={s3.uploads} deletes={s3.deletes}",
+            file=sys.stderr,
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--smtp-port", type=int, default=2525)
+    parser.add_argument("--s3-port", type=int, default=9000)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.smtp_port, args.s3_port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Benchmark for the tournament list page.
+
+Seeds tournaments with many matches each and times a page of the list,
+next to the previous query that joined every match of the page's
+tournaments, and fails if the best run took longer than the budget.
+
+Usage (from the backend directory):
+    python -m benchmarks.tournament_list --tournaments 500 --matches 120
+
+The database defaults to an in-memory SQLite database; pass a PostgreSQL
+URL with --database-url (or BENCHMARK_DATABASE_URL) for realistic numbers.
+The target database is dropped and recreated, never point it at real data.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import os
+import sys
+import time
+from typing import Callable
+import uuid
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, joinedload, sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.crud import tournament as crud_tournament
+from src.models import Base, Match, Team, Tournament, User
+from src.models.enums import MatchFormat, Role, Stage, TournamentFormat
+from src.utils.pagination import PaginationParams
+
+DEFAULT_DATABASE_URL = "sqlite://"
+TEAMS_PER_TOURNAMENT = 16
+
+
+def seed(db: Session, tournaments: int, matches: int) -> None:
+    director_id = uuid.uuid4()
+    db.execute(
+        insert(User.__table__),
+        [
+            {
+                "id": director_id,
+                "email": "director@kitten.com",
+                "password_hash": "hash",
+                "role": Role.DIRECTOR,
+            }
+        ],
+    )
+
+    start = datetime(2030, 1, 1, 11)
+    for number in range(tournaments):
+        tournament_id = uuid.uuid4()
+        team_ids = [uuid.uuid4() for _ in range(TEAMS_PER_TOURNAMENT)]
+        db.execute(
+            insert(Tournament.__table__),
+            [
+                {
+                    "id": tournament_id,
+                    "title": f"Bench Cup {number}",
+                    "tournament_format": TournamentFormat.ROUND_ROBIN,
+                    "start_date": start + timedelta(days=number),
+                    "end_date": start + timedelta(days=number + 30),
+                    "prize_pool": 1000,
+                    "current_stage": Stage.GROUP_STAGE,
+                    "director_id": director_id,
+                }
+            ],
+        )
+        db.execute(
+            insert(Team.__table__),
+            [
+                {
+                    "id": team_id,
+                    "name": f"Bench {number} {i}",
+                    "played_games": 0,
+                    "won_games": 0,
+                    "tournament_id": tournament_id,
+                }
+                for i, team_id in enumerate(team_ids)
+            ],
+        )
+        db.execute(
+            insert(Match.__table__),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "match_format": MatchFormat.MR12,
+                    "start_time": start + timedelta(days=number, hours=i),
+                    "is_finished": i < matches // 2,
+                    "stage": Stage.GROUP_STAGE,
+                    "team1_id": team_ids[i % TEAMS_PER_TOURNAMENT],
+                    "team2_id": team_ids[(i + 1) % TEAMS_PER_TOURNAMENT],
+                    "team1_score": 0,
+                    "team2_score": 0,
+                    "tournament_id": tournament_id,
+                }
+                for i in range(matches)
+            ],
+        )
+    db.commit()
+
+
+def joined_list(db: Session, page: PaginationParams) -> int:
+    # The previous query: every match of the page's tournaments and a lazy
+    # load of the teams of every tournament to count them
+    db_tournaments = (
+        db.query(Tournament)
+        .options(joinedload(Tournament.matches))
+        .order_by(Tournament.start_date.desc())
+        .offset(page.offset)
+        .limit(page.limit)
+        .all()
+    )
+    return sum(len(db_tournament.teams) for db_tournament in db_tournaments)
+
+
+def aggregated_list(db: Session, page: PaginationParams) -> int:
+    return sum(
+        tournament.number_of_teams
+        for tournament in crud_tournament.get_tournaments(db, page)
+    )
+
+
+def time_list(
+    session_factory: sessionmaker,
+    engine,
+    list_page: Callable[[Session, PaginationParams], int],
+    page: PaginationParams,
+    repeat: int,
+) -> tuple[float, int]:
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    timings = []
+    for _ in range(repeat):
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", count)
+        with session_factory() as db:
+            started = time.perf_counter()
+            list_page(db, page)
+            timings.append(time.perf_counter() - started)
+        event.remove(engine, "before_cursor_execute", count)
+
+    return min(timings), len(statements)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCHMARK_DATABASE_URL", DEFAULT_DATABASE_URL),
+        help="database to benchmark against (dropped and recreated)",
+    )
+    parser.add_argument("--tournaments", type=int, default=500)
+    parser.add_argument("--matches", type=int, default=120)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--budget", type=float, default=0.25, help="Allowed seconds for the best run"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    engine_options = {}
+    if args.database_url.startswith("sqlite"):
+        # Share one connection so an in-memory database survives between sessions
+        engine_options = {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+    engine = create_engine(args.database_url, **engine_options)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with session_factory() as db:
+        seed(db, args.tournaments, args.matches)
+
+    page = PaginationParams(offset=0, limit=args.page_size)
+    print(
+        f"{args.tournaments} tournaments of {args.matches} matches, "
+        f"pages of {args.page_size}"
+    )
+    results = {}
+    for name, list_page in (("joined", joined_list), ("aggregated", aggregated_list)):
+        results[name] = time_list(session_factory, engine, list_page, page, args.repeat)
+        best, statements = results[name]
+        print(f"{name:>10}: best {best * 1000:.1f} ms, {statements} statements")
+
+    engine.dispose()
+
+    best = results["aggregated"][0]
+    if best > args.budget:
+        print(f"Slower than the budget of {args.budget:.2f} s")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
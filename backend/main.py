@@ -7,9 +7,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from src.api.v1.routes import api_router
 from src.core.config import Settings, settings
 from src.database.session import init_db
+from src.utils.events import event_bus
 import uvicorn
 
 
@@ -35,6 +37,11 @@ class App:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        self.__app.add_middleware(
+            GZipMiddleware,
+            minimum_size=settings.GZIP_MINIMUM_SIZE,
+            compresslevel=settings.GZIP_COMPRESS_LEVEL,
+        )
 
     def __setup_routes(self, router: APIRouter, settings: Settings):
         self.__app.include_router(router, prefix=settings.API_V1_STR)
@@ -43,6 +50,7 @@ class App:
     async def lifespan(self, app: FastAPI):
         init_db()
         yield
+        event_bus.shutdown()
 
     def __call__(self):
         return self.__app
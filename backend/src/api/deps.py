@@ -3,7 +3,7 @@ from typing import Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from src.core.authentication import is_token_blacklisted
 from src.core.config import settings
 from src.crud.user import get_by_id
@@ -24,6 +24,14 @@ def get_db() -> Generator:
         db.close()
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    Get the session factory, for work that outlives the request's session,
+    such as streamed responses.
+    """
+    return SessionLocal
+
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/users/login")
 
 
@@ -1,16 +1,20 @@
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from src.api.deps import get_current_user, get_db
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+from src.api.deps import get_current_user, get_db, get_session_factory
 from src.crud import match as match_crud
 from src.models.enums import Stage
+from src.schemas.batch import BatchGetRequest
 from src.schemas.match import (
     MatchResponse,
     MatchUpdate,
 )
+from src.utils.idempotency import idempotency_store, request_fingerprint
 from src.utils.pagination import PaginationParams, get_pagination
+from src.utils.responses import ModelResponse
 
 router = APIRouter()
 
@@ -39,14 +43,75 @@ def read_matches(
         list[MatchResponse]: A list of match responses matching the filters.
     """
 
-    return match_crud.get_all_matches(
+    return ModelResponse(
+        match_crud.get_all_matches(
+            db,
+            pagination,
+            tournament_title,
+            stage,
+            is_finished,
+            team_name,
+        )
+    )
+
+
+@router.get("/export")
+def export_matches(
+    db: Session = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    file_format: Literal["csv", "ndjson"] = Query("ndjson", alias="format"),
+    tournament_title: str | None = None,
+    stage: Stage | None = None,
+    is_finished: bool | None = None,
+    team_name: str | None = None,
+):
+    """
+    Stream the full match history as CSV or NDJSON, with the same
+    filters as the match list.
+
+    Args:
+        db (Session): Database session dependency.
+        session_factory (sessionmaker): Creates the export's session.
+        file_format (Literal["csv", "ndjson"]): The format of the export.
+        tournament_title (str | None): Optional filter by tournament title.
+        stage (Stage | None): Optional filter by match stage.
+        is_finished (bool | None): Optional filter by match completion status.
+        team_name (str | None): Optional filter by team name.
+
+    Returns:
+        StreamingResponse: The exported matches, newest first.
+    """
+    rows = match_crud.export_matches(
         db,
-        pagination,
+        session_factory,
+        file_format,
         tournament_title,
         stage,
         is_finished,
         team_name,
     )
+    return StreamingResponse(
+        rows,
+        media_type="text/csv" if file_format == "csv" else "application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="matches.{file_format}"'
+        },
+    )
+
+
+@router.post("/batch-get", response_model=list[MatchResponse])
+def read_matches_by_ids(batch: BatchGetRequest, db: Session = Depends(get_db)):
+    """
+    Retrieve several matches by their IDs in one request.
+
+    Args:
+        batch (BatchGetRequest): The IDs of the matches.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[MatchResponse]: The match responses, in the order of their IDs.
+    """
+    return ModelResponse(match_crud.get_matches_by_ids(db, batch.ids))
 
 
 @router.get("/{match_id}", response_model=MatchResponse)
@@ -61,7 +126,7 @@ def read_match(match_id: UUID, db: Session = Depends(get_db)):
     Returns:
         MatchResponse: The match response object.
     """
-    return match_crud.get_match(db, match_id)
+    return ModelResponse(match_crud.get_match(db, match_id))
 
 
 @router.put("/{match_id}", response_model=MatchResponse)
@@ -92,6 +157,8 @@ def update_match_score(
     team_to_upvote_score: Literal["team1", "team2"],
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
+    idempotency_key: str | None = Header(None, max_length=255),
+    fingerprint: str = Depends(request_fingerprint),
 ):
     """
     Update the score of a match by its ID.
@@ -102,10 +169,18 @@ def update_match_score(
         The team whose score should be upvoted.
         db (Session): Database session dependency.
         current_user: The current authenticated user.
+        idempotency_key (str | None): Optional key making retries of the request safe.
+        fingerprint (str): The hash of the request the key is used for.
 
     Returns:
         MatchResponse: The updated match response object.
     """
-    return match_crud.update_match_score(
-        db, match_id, team_to_upvote_score, current_user
+    return idempotency_store.run(
+        db,
+        idempotency_key,
+        f"{current_user.id} PUT /matches/{match_id}/team-scores",
+        fingerprint,
+        lambda db: match_crud.update_match_score(
+            db, match_id, team_to_upvote_score, current_user
+        ),
     )
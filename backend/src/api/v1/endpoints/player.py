@@ -1,10 +1,12 @@
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, UploadFile
-from sqlalchemy.orm import Session
-from src.api.deps import get_current_user, get_db
+from fastapi import APIRouter, Depends, File, Header, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+from src.api.deps import get_current_user, get_db, get_session_factory
 from src.crud import player as player_crud
+from src.schemas.batch import BatchGetRequest
 from src.schemas.player import (
     PlayerCreate,
     PlayerDetailResponse,
@@ -12,7 +14,9 @@ from src.schemas.player import (
     PlayerUpdate,
 )
 from src.schemas.user import UserResponse
+from src.utils.idempotency import idempotency_store, request_fingerprint
 from src.utils.pagination import PaginationParams, get_pagination
+from src.utils.responses import ModelResponse
 
 router = APIRouter()
 
@@ -23,6 +27,8 @@ def create_player(
     avatar: UploadFile | None = File(None),
     db: Session = Depends(get_db),
     current_user: UserResponse = Depends(get_current_user),
+    idempotency_key: str | None = Header(None, max_length=255),
+    fingerprint: str = Depends(request_fingerprint),
 ):
     """
     Create a new player.
@@ -32,14 +38,50 @@ def create_player(
         avatar (UploadFile | None): Optional avatar file for the player.
         db (Session): Database session dependency.
         current_user (UserResponse): The current authenticated user.
+        idempotency_key (str | None): Optional key making retries of the request safe.
+        fingerprint (str): The hash of the request the key is used for.
 
     Returns:
         PlayerListResponse: The created player response object.
     """
-    return player_crud.create_player(db, player, avatar, current_user)
+    return idempotency_store.run(
+        db,
+        idempotency_key,
+        f"{current_user.id} POST /players",
+        fingerprint,
+        lambda db: player_crud.create_player(db, player, avatar, current_user),
+    )
+
+
+@router.post("/import")
+def import_players(
+    file: UploadFile = File(...),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """
+    Import players in bulk from a CSV or NDJSON file with the player fields per row.
+
+    Args:
+        file (UploadFile): The CSV or NDJSON file to import.
+        session_factory (sessionmaker): Creates the import's session.
+        current_user (UserResponse): The current authenticated user.
+
+    Returns:
+        StreamingResponse: NDJSON progress and per-row error events,
+        ending with a "completed" or "failed" summary.
+    """
+    events = player_crud.import_players(
+        session_factory,
+        file.file.read(),
+        file.filename,
+        file.content_type,
+        current_user,
+    )
+    return StreamingResponse(events, media_type="application/x-ndjson")
 
 
-@router.get("/")
+@router.get("/", response_model=list[PlayerListResponse])
 def get_players(
     db: Session = Depends(get_db),
     pagination: PaginationParams = Depends(get_pagination),
@@ -63,7 +105,9 @@ def get_players(
     Returns:
         list[PlayerListResponse]: A list of player responses matching the filters.
     """
-    return player_crud.get_players(db, pagination, search, team, country, sort_by)
+    return ModelResponse(
+        player_crud.get_players(db, pagination, search, team, country, sort_by)
+    )
 
 
 @router.get("/users", response_model=PlayerDetailResponse)
@@ -84,6 +128,22 @@ def get_players_by_user(
     return player_crud.get_player_by_user_id(db, current_user)
 
 
+@router.post("/batch-get", response_model=list[PlayerDetailResponse])
+def get_players_by_ids(batch: BatchGetRequest, db: Session = Depends(get_db)):
+    """
+    Retrieve several players by their IDs in one request.
+
+    Args:
+        batch (BatchGetRequest): The IDs of the players.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[PlayerDetailResponse]: The player details, in the order of their
+        IDs.
+    """
+    return ModelResponse(player_crud.get_players_by_ids(db, batch.ids))
+
+
 @router.get("/{player_id}", response_model=PlayerDetailResponse)
 def get_player(player_id: UUID, db: Session = Depends(get_db)):
     """
@@ -96,7 +156,7 @@ def get_player(player_id: UUID, db: Session = Depends(get_db)):
     Returns:
         PlayerDetailResponse: The player details response object.
     """
-    return player_crud.get_player(db, player_id)
+    return ModelResponse(player_crud.get_player(db, player_id))
 
 
 @router.put("/{player_id}", response_model=PlayerListResponse)
@@ -1,10 +1,12 @@
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, UploadFile
-from sqlalchemy.orm import Session
-from src.api.deps import get_current_user, get_db
+from fastapi import APIRouter, Depends, File, Header, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+from src.api.deps import get_current_user, get_db, get_session_factory
 from src.crud import team as team_crud
+from src.schemas.batch import BatchGetRequest
 from src.schemas.team import (
     TeamCreate,
     TeamDetailedResponse,
@@ -12,12 +14,15 @@ from src.schemas.team import (
     TeamUpdate,
 )
 from src.schemas.user import UserResponse
+from src.utils.fields import Fields, sparse_fields
+from src.utils.idempotency import idempotency_store, request_fingerprint
 from src.utils.pagination import PaginationParams, get_pagination
+from src.utils.responses import ModelResponse
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=list[TeamListResponse])
 def get_teams(
     db: Session = Depends(get_db),
     pagination: PaginationParams = Depends(get_pagination),
@@ -25,6 +30,8 @@ def get_teams(
     is_available: Literal["true", "false"] | None = None,
     has_space: Literal["true", "false"] | None = None,
     sort_by: Literal["asc", "desc"] = "asc",
+    include_emails: bool = True,
+    fields: Fields | None = Depends(sparse_fields(TeamListResponse)),
 ):
     """
     Retrieve a list of teams with optional filtering and sorting parameters.
@@ -38,26 +45,66 @@ def get_teams(
         has_space (Literal["true", "false"] | None):
         Optional filter by space availability.
         sort_by (Literal["asc", "desc"]): Sort order, either ascending or descending.
+        include_emails (bool): Whether players come with their user's email,
+        false for lighter player summaries.
+        fields (Fields | None): The fields to return, every field by default.
 
     Returns:
         list[TeamListResponse]: A list of team responses matching the filters.
     """
-    return team_crud.get_teams(db, pagination, search, is_available, has_space, sort_by)
+    return ModelResponse(
+        team_crud.get_teams(
+            db,
+            pagination,
+            search,
+            is_available,
+            has_space,
+            sort_by,
+            include_emails,
+            fields,
+        ),
+        fields,
+    )
+
+
+@router.post("/batch-get", response_model=list[TeamDetailedResponse])
+def get_teams_by_ids(
+    batch: BatchGetRequest,
+    db: Session = Depends(get_db),
+    fields: Fields | None = Depends(sparse_fields(TeamDetailedResponse)),
+):
+    """
+    Retrieve several teams by their IDs in one request.
+
+    Args:
+        batch (BatchGetRequest): The IDs of the teams.
+        db (Session): Database session dependency.
+        fields (Fields | None): The fields to return, every field by default.
+
+    Returns:
+        list[TeamDetailedResponse]: The team details, in the order of their IDs.
+    """
+    return ModelResponse(team_crud.get_teams_by_ids(db, batch.ids, fields), fields)
 
 
 @router.get("/{team_id}", response_model=TeamDetailedResponse)
-def get_team(team_id: UUID, db: Session = Depends(get_db)):
+def get_team(
+    team_id: UUID,
+    db: Session = Depends(get_db),
+    fields: Fields | None = Depends(sparse_fields(TeamDetailedResponse)),
+):
     """
     Retrieve a team by its ID.
 
     Args:
         team_id (UUID): The unique identifier of the team.
         db (Session): Database session dependency.
+        fields (Fields | None): The fields to return, every field by default.
 
     Returns:
         TeamDetailedResponse: The team details response object.
     """
-    return team_crud.get_team(db, team_id)
+    return ModelResponse(team_crud.get_team(db, team_id, fields), fields)
 
 
 @router.post("/", response_model=TeamListResponse, status_code=201)
@@ -66,6 +113,8 @@ def create_team(
     logo: UploadFile | None = File(None),
     db: Session = Depends(get_db),
     current_user: UserResponse = Depends(get_current_user),
+    idempotency_key: str | None = Header(None, max_length=255),
+    fingerprint: str = Depends(request_fingerprint),
 ):
     """
     Create a new team.
@@ -75,11 +124,47 @@ def create_team(
         logo (UploadFile | None): Optional logo file for the team.
         db (Session): Database session dependency.
         current_user (UserResponse): The current authenticated user.
+        idempotency_key (str | None): Optional key making retries of the request safe.
+        fingerprint (str): The hash of the request the key is used for.
 
     Returns:
         TeamListResponse: The created team response object.
     """
-    return team_crud.create_team(db, team, logo, current_user)
+    return idempotency_store.run(
+        db,
+        idempotency_key,
+        f"{current_user.id} POST /teams",
+        fingerprint,
+        lambda db: team_crud.create_team(db, team, logo, current_user),
+    )
+
+
+@router.post("/import")
+def import_teams(
+    file: UploadFile = File(...),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """
+    Import teams in bulk from a CSV or NDJSON file with a name per row.
+
+    Args:
+        file (UploadFile): The CSV or NDJSON file to import.
+        session_factory (sessionmaker): Creates the import's session.
+        current_user (UserResponse): The current authenticated user.
+
+    Returns:
+        StreamingResponse: NDJSON progress and per-row error events,
+        ending with a "completed" or "failed" summary.
+    """
+    events = team_crud.import_teams(
+        session_factory,
+        file.file.read(),
+        file.filename,
+        file.content_type,
+        current_user,
+    )
+    return StreamingResponse(events, media_type="application/x-ndjson")
 
 
 @router.put("/{team_id}", response_model=TeamListResponse)
@@ -1,19 +1,29 @@
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.orm import Session
 from src.api.deps import get_current_user, get_db
-from src.crud import tournament as tournament_crud
+from src.crud import (
+    season as season_crud,
+    tournament as tournament_crud,
+    tournament_standing as tournament_standing_crud,
+)
 from src.models.enums import TournamentFormat
 from src.schemas.tournament import (
+    SeasonSchedule,
+    SeasonScheduleResponse,
     TournamentCreate,
     TournamentDetailResponse,
     TournamentListResponse,
     TournamentUpdate,
 )
+from src.schemas.tournament_standing import TournamentStandingResponse
 from src.schemas.user import UserResponse
+from src.utils.fields import Fields, sparse_fields
+from src.utils.idempotency import idempotency_store, request_fingerprint
 from src.utils.pagination import PaginationParams, get_pagination
+from src.utils.responses import ModelResponse
 
 router = APIRouter()
 
@@ -48,30 +58,54 @@ def read_tournaments(
         list[TournamentListResponse]: A list of tournament
         responses matching the filters.
     """
-    return tournament_crud.get_tournaments(
-        db,
-        pagination,
-        period,
-        status,
-        tournament_format,
-        search,
-        author_id,
+    return ModelResponse(
+        tournament_crud.get_tournaments(
+            db,
+            pagination,
+            period,
+            status,
+            tournament_format,
+            search,
+            author_id,
+        )
     )
 
 
 @router.get("/{tournament_id}", response_model=TournamentDetailResponse)
-def read_tournament(tournament_id: UUID, db: Session = Depends(get_db)):
+def read_tournament(
+    tournament_id: UUID,
+    db: Session = Depends(get_db),
+    fields: Fields | None = Depends(sparse_fields(TournamentDetailResponse)),
+):
     """
     Retrieve a tournament by its ID.
 
     Args:
         tournament_id (UUID): The unique identifier of the tournament.
         db (Session): Database session dependency.
+        fields (Fields | None): The fields to return, every field by default.
 
     Returns:
         TournamentDetailResponse: The tournament details response object.
     """
-    return tournament_crud.get_tournament(db, tournament_id)
+    return ModelResponse(tournament_crud.get_tournament(db, tournament_id), fields)
+
+
+@router.get(
+    "/{tournament_id}/standings", response_model=list[TournamentStandingResponse]
+)
+def read_tournament_standings(tournament_id: UUID, db: Session = Depends(get_db)):
+    """
+    Retrieve the live round-robin group table of a tournament.
+
+    Args:
+        tournament_id (UUID): The unique identifier of the tournament.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[TournamentStandingResponse]: The standings ordered by place.
+    """
+    return ModelResponse(tournament_standing_crud.get_standings(db, tournament_id))
 
 
 @router.post("/", response_model=TournamentDetailResponse, status_code=201)
@@ -79,6 +113,8 @@ def create_tournament(
     tournament: TournamentCreate = Depends(),
     db: Session = Depends(get_db),
     current_user: UserResponse = Depends(get_current_user),
+    idempotency_key: str | None = Header(None, max_length=255),
+    fingerprint: str = Depends(request_fingerprint),
 ):
     """
     Create a new tournament.
@@ -87,11 +123,41 @@ def create_tournament(
         tournament (TournamentCreate): The tournament creation data.
         db (Session): Database session dependency.
         current_user (UserResponse): The current authenticated user.
+        idempotency_key (str | None): Optional key making retries of the request safe.
+        fingerprint (str): The hash of the request the key is used for.
 
     Returns:
         TournamentDetailResponse: The created tournament response object.
     """
-    return tournament_crud.create_tournament(db, tournament, current_user)
+    return idempotency_store.run(
+        db,
+        idempotency_key,
+        f"{current_user.id} POST /tournaments",
+        fingerprint,
+        lambda db: tournament_crud.create_tournament(db, tournament, current_user),
+    )
+
+
+@router.post("/season-schedule", response_model=SeasonScheduleResponse)
+def schedule_season(
+    season: SeasonSchedule,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """
+    Reschedule the upcoming matches of several tournaments at once, so that
+    no team, director or broadcast slot is double booked.
+
+    Args:
+        season (SeasonSchedule): The tournaments to schedule.
+        db (Session): Database session dependency.
+        current_user (UserResponse): The current authenticated user.
+
+    Returns:
+        SeasonScheduleResponse: The number of scheduled matches and the
+        matches that were moved.
+    """
+    return season_crud.schedule_season(db, season, current_user)
 
 
 @router.put("/{tournament_id}", response_model=TournamentDetailResponse)
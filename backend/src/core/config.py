@@ -30,6 +30,10 @@ class Settings(BaseSettings):
 
     DEBUG: bool = os.getenv("DEBUG", "false").lower() in ["true", "1"]
 
+    # Responses smaller than this many bytes are sent uncompressed
+    GZIP_MINIMUM_SIZE: int = 1000
+    GZIP_COMPRESS_LEVEL: int = 6
+
     @field_validator("CORS_ALLOWED_HOSTS", check_fields=False)
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         if isinstance(v, str) and not v.startswith("["):
@@ -45,6 +49,13 @@ class Settings(BaseSettings):
     EMAIL_SENDER: str
     EMAIL_PASSWORD: str
     SMTP_SERVER: str
+    SMTP_PORT: int = 587
+    SMTP_USE_TLS: bool = True
+
+    # Worker threads running event handlers, e.g. emails, after commits
+    EVENT_WORKERS: int = 4
+    # Handler calls queued or running before publishers are held back
+    EVENT_MAX_PENDING: int = 1000
 
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
@@ -54,6 +65,8 @@ class Settings(BaseSettings):
     AWS_SECRET_KEY: str
     AWS_BUCKET_NAME: str
     AWS_REGION: str
+    # Only set when targeting an S3 compatible stand-in, e.g. for load tests
+    AWS_ENDPOINT_URL: str | None = None
 
     @field_validator("DATABASE_URL", check_fields=False)
     def normalize_database_url(cls, v: str) -> str:
@@ -0,0 +1,226 @@
+from datetime import datetime, timedelta
+import uuid
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from src.crud import constants as c
+from src.models import BracketNode, Match, Team, Tournament
+from src.models.enums import MatchFormat, Stage
+from src.utils.bracket import plan_bracket
+from src.utils.scheduling import SlotAllocator
+
+
+def create_bracket(db: Session, db_tournament: Tournament) -> list[Match]:
+    """
+    Create the whole bracket of a single elimination tournament.
+
+    The teams are seeded by their win ratio. Every node of the bracket is
+    inserted at once, along with the matches whose teams are already
+    known: the first round and the second round matches of teams with a
+    bye. The other matches are created as the winners move on.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+
+    Returns:
+        list[Match]: The created matches.
+    """
+    teams = sorted(db_tournament.teams, key=_seed_key)
+    rounds = plan_bracket(teams)
+    start_times = get_round_start_times(
+        db_tournament.start_date, [len(round_slots) for round_slots in rounds]
+    )
+
+    node_ids = {
+        (slot.round_number, slot.position): uuid.uuid4()
+        for round_slots in rounds
+        for slot in round_slots
+    }
+    matches = []
+    nodes = []
+
+    # Every node is inserted after the node its winner moves on to
+    for round_slots, round_times in reversed(list(zip(rounds, start_times))):
+        for slot, start_time in zip(round_slots, round_times):
+            team1_id = slot.team1.id if slot.team1 is not None else None
+            team2_id = slot.team2.id if slot.team2 is not None else None
+
+            match_id = None
+            if team1_id is not None and team2_id is not None:
+                match = _new_match(
+                    db_tournament.id, slot.stage, start_time, team1_id, team2_id
+                )
+                matches.append(match)
+                match_id = match.id
+
+            nodes.append(
+                {
+                    "id": node_ids[(slot.round_number, slot.position)],
+                    "round_number": slot.round_number,
+                    "position": slot.position,
+                    "stage": slot.stage,
+                    "start_time": start_time,
+                    "team1_id": team1_id,
+                    "team2_id": team2_id,
+                    "match_id": match_id,
+                    "next_node_id": node_ids.get(
+                        (slot.round_number + 1, slot.position // 2)
+                    ),
+                    "tournament_id": db_tournament.id,
+                }
+            )
+
+    db.bulk_save_objects(matches)
+    if nodes:
+        db.execute(insert(BracketNode.__table__), nodes)
+
+    return matches
+
+
+def get_round_start_times(
+    start_date: datetime, match_counts: list[int]
+) -> list[list[datetime]]:
+    """
+    Schedule the rounds of a bracket, every round starting on the day
+    after the previous round ends.
+
+    Args:
+        start_date (datetime): The day of the first round.
+        match_counts (list[int]): The number of matches of every round.
+
+    Returns:
+        list[list[datetime]]: The start times of the matches of every round.
+    """
+    start_times = []
+    day = start_date
+    for count in match_counts:
+        allocator = SlotAllocator(
+            day,
+            match_minutes=c.MATCH_DURATION_PLUS_BUFFER,
+            start_hour=c.START_HOUR,
+            end_hour=c.END_HOUR,
+            max_matches_per_day=c.MAX_MATCHES_PER_DAY,
+            venues=c.MATCH_VENUES,
+        )
+        # Every team plays at most once per round, so no two matches clash
+        round_times = [allocator.allocate(match, match) for match in range(count)]
+        start_times.append(round_times)
+        day = round_times[-1] + timedelta(days=1)
+
+    return start_times
+
+
+def get_bracket_days(start_date: datetime, team_count: int) -> int:
+    """
+    Get the number of days from the first round of a bracket to its final.
+
+    Args:
+        start_date (datetime): The day of the first round.
+        team_count (int): The number of teams.
+
+    Returns:
+        int: The number of days after the first day.
+    """
+    rounds = plan_bracket(range(team_count))
+    start_times = get_round_start_times(
+        start_date, [len(round_slots) for round_slots in rounds]
+    )
+
+    return (start_times[-1][-1].date() - start_date.date()).days
+
+
+def get_match_node(db: Session, match_id: UUID) -> BracketNode | None:
+    """
+    Retrieve the bracket node of a match.
+
+    Args:
+        db (Session): The database session.
+        match_id (UUID): The match ID.
+
+    Returns:
+        BracketNode | None: The node, None if the match is not in a bracket.
+    """
+    return db.query(BracketNode).filter(BracketNode.match_id == match_id).first()
+
+
+def advance_winner(
+    db: Session, node: BracketNode, winner_team_id: UUID
+) -> Match | None:
+    """
+    Move the winner of a bracket match on to its next match, and create
+    that match once both of its teams are known.
+
+    Args:
+        db (Session): The database session.
+        node (BracketNode): The node of the finished match.
+        winner_team_id (UUID): The ID of the winning team.
+
+    Returns:
+        Match | None: The created match, None if the opponent is not known
+        yet or the finished match was the final.
+
+    Raises:
+        StaleDataError: If the other match leading to the same node
+        finished concurrently.
+    """
+    if node.next_node_id is None:
+        return None
+
+    next_node = db.get(BracketNode, node.next_node_id)
+    if node.position % 2 == 0:
+        next_node.team1_id = winner_team_id
+    else:
+        next_node.team2_id = winner_team_id
+
+    if next_node.team1_id is None or next_node.team2_id is None:
+        db.flush()
+        return None
+
+    match = _new_match(
+        next_node.tournament_id,
+        next_node.stage,
+        next_node.start_time,
+        next_node.team1_id,
+        next_node.team2_id,
+    )
+    db.add(match)
+    db.flush()
+
+    next_node.match_id = match.id
+    db.flush()
+
+    return match
+
+
+def _new_match(
+    tournament_id: UUID,
+    stage: Stage,
+    start_time: datetime,
+    team1_id: UUID,
+    team2_id: UUID,
+) -> Match:
+    return Match(
+        id=uuid.uuid4(),
+        match_format=MatchFormat.MR15,
+        start_time=start_time,
+        stage=stage,
+        team1_id=team1_id,
+        team2_id=team2_id,
+        tournament_id=tournament_id,
+    )
+
+
+def _seed_key(team: Team) -> tuple:
+    """
+    Order teams by win ratio, then by wins, best first.
+
+    Args:
+        team (Team): The team object.
+
+    Returns:
+        tuple: The sort key of the team.
+    """
+    win_ratio = team.won_games / team.played_games if team.played_games else 0.0
+    return -win_ratio, -team.won_games, team.name
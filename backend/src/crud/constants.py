@@ -5,7 +5,27 @@ MAX_MATCHES_PER_DAY = 4
 START_HOUR = 11
 END_HOUR = 20
 
-SINGLE_ELIMINATION_TEAMS = [4, 8]
+# Matches played (and streamed) at the same time, and the rest a team gets
+# after a match on top of the buffer
+MATCH_VENUES = 1
+TEAM_REST_MINUTES = 0
+
+# Matches of all tournaments that can be broadcast at the same time
+BROADCAST_SLOTS = 4
+
+# Attempts at a score update that lost a race with a concurrent update
+MAX_SCORE_UPDATE_ATTEMPTS = 3
+
+MAX_TEAM_PLAYERS = 10
+
+# IDs resolved by a single batch get
+MAX_BATCH_SIZE = 100
+
+# Matches fetched from the cursor and written out at a time by the export
+EXPORT_BATCH_SIZE = 1000
+
+# Byes fill the bracket up to the next power of two, up to a round of 64
+SINGLE_ELIMINATION_TEAMS = range(3, 65)
 ROUND_ROBIN_TEAMS = [4, 5]
 ONE_OFF_MATCH_TEAMS = [2]
 
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Type
 
 from src.models import Match, Player, PrizeCut, Team, Tournament
@@ -5,7 +6,8 @@ from src.schemas.match import MatchResponse
 from src.schemas.player import PlayerDetailResponse, PlayerListResponse
 from src.schemas.prize_cut import PrizeCutResponse
 from src.schemas.team import TeamDetailedResponse, TeamListResponse
-from src.schemas.tournament import TournamentDetailResponse, TournamentListResponse
+from src.schemas.tournament import TournamentListResponse
+from src.utils.fields import Fields, wants
 
 
 def convert_db_to_match_list_response(
@@ -31,9 +33,11 @@ def convert_db_to_match_list_response(
     )
 
 
-def convert_db_to_player_list_response(db_player: Type[Player]) -> PlayerListResponse:
+def convert_db_to_player_list_response(
+    db_player: Type[Player], include_email: bool = True
+) -> PlayerListResponse:
     team_name = db_player.team.name if db_player.team else None
-    user_email = db_player.user.email if db_player.user else None
+    user_email = db_player.user.email if include_email and db_player.user else None
     return PlayerListResponse(
         id=db_player.id,
         username=db_player.username,
@@ -93,26 +97,48 @@ def convert_db_to_prize_cut_response(
 
 
 def convert_db_to_team_detailed_response(
-    db_team: Type[Team], matches: list[Type[Match]], stats: dict
+    db_team: Type[Team],
+    matches: list[Type[Match]],
+    stats: dict,
+    fields: Fields | None = None,
 ) -> TeamDetailedResponse:
+    # Lists left out of a sparse fieldset are neither loaded nor converted
     return TeamDetailedResponse(
         id=db_team.id,
         name=db_team.name,
         logo=db_team.logo,
-        players=[
-            convert_db_to_player_list_response(player) for player in db_team.players
-        ],
+        players=(
+            [
+                convert_db_to_player_list_response(
+                    player, wants(fields, "players.user_email")
+                )
+                for player in db_team.players
+            ]
+            if wants(fields, "players")
+            else []
+        ),
         tournament_id=db_team.tournament_id,
-        matches=[convert_db_to_match_list_response(match) for match in matches],
-        prize_cuts=[
-            convert_db_to_prize_cut_response(prize_cut)
-            for prize_cut in db_team.prize_cuts
-        ],
+        matches=(
+            [convert_db_to_match_list_response(match) for match in matches]
+            if wants(fields, "matches")
+            else []
+        ),
+        prize_cuts=(
+            [
+                convert_db_to_prize_cut_response(prize_cut)
+                for prize_cut in db_team.prize_cuts
+            ]
+            if wants(fields, "prize_cuts")
+            else []
+        ),
         team_stats=stats,
     )
 
 
-def convert_db_to_team_list_response(db_team: Type[Team]) -> TeamListResponse:
+def convert_db_to_team_list_response(
+    db_team: Type[Team], include_emails: bool = True, fields: Fields | None = None
+) -> TeamListResponse:
+    include_emails = include_emails and wants(fields, "players.user_email")
     return TeamListResponse(
         id=db_team.id,
         name=db_team.name,
@@ -122,14 +148,23 @@ def convert_db_to_team_list_response(db_team: Type[Team]) -> TeamListResponse:
             if db_team.played_games > 0
             else "0%"
         ),
-        players=[
-            convert_db_to_player_list_response(player) for player in db_team.players
-        ],
+        players=(
+            [
+                convert_db_to_player_list_response(player, include_emails)
+                for player in db_team.players
+            ]
+            if wants(fields, "players")
+            else []
+        ),
     )
 
 
 def convert_db_to_tournament_list_response(
     db_tournament: Tournament | Type[Tournament],
+    number_of_teams: int,
+    number_of_matches: int,
+    finished_matches: int,
+    next_match_time: datetime | None,
 ) -> TournamentListResponse:
 
     return TournamentListResponse(
@@ -139,34 +174,9 @@ def convert_db_to_tournament_list_response(
         start_date=db_tournament.start_date,
         end_date=db_tournament.end_date,
         current_stage=db_tournament.current_stage,
-        number_of_teams=len(db_tournament.teams),
-        director_id=db_tournament.director_id,
-    )
-
-
-def convert_db_to_tournament_response(
-    db_tournament: Tournament | Type[Tournament],
-) -> TournamentDetailResponse:
-
-    return TournamentDetailResponse(
-        id=db_tournament.id,
-        title=db_tournament.title,
-        tournament_format=db_tournament.tournament_format,
-        start_date=db_tournament.start_date,
-        end_date=db_tournament.end_date,
-        current_stage=db_tournament.current_stage,
-        number_of_teams=len(db_tournament.teams),
+        number_of_teams=number_of_teams,
         director_id=db_tournament.director_id,
-        matches_of_current_stage=[
-            convert_db_to_match_list_response(db_match)
-            for db_match in db_tournament.matches
-            if db_match.stage == db_tournament.current_stage
-        ],
-        teams=[
-            convert_db_to_team_list_response(db_team) for db_team in db_tournament.teams
-        ],
-        prizes=[
-            convert_db_to_prize_cut_response(db_prize)
-            for db_prize in db_tournament.prize_cuts
-        ],
+        number_of_matches=number_of_matches,
+        finished_matches=finished_matches,
+        next_match_time=next_match_time,
     )
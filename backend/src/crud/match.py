@@ -1,15 +1,28 @@
+import csv
 from datetime import datetime, timedelta, timezone
+import io
+import json
+import operator
 import random
-from typing import Literal, Type
+from typing import Iterator, Literal, Type
+import uuid
 
 from fastapi import HTTPException
-from sqlalchemy import UUID, or_
-from sqlalchemy.orm import Session
-from src.crud import constants as c, team as crud_team
+from sqlalchemy import UUID, exists, or_
+from sqlalchemy.orm import Query, Session, aliased, sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+from src.crud import (
+    bracket as crud_bracket,
+    constants as c,
+    prize_cut as crud_prize_cut,
+    team as crud_team,
+    tournament_standing as crud_tournament_standing,
+    tournament_view as crud_tournament_view,
+)
 from src.crud.convert_db_to_response import (
     convert_db_to_match_list_response,
 )
-from src.models import Team, Tournament
+from src.models import BracketNode, Team, Tournament
 from src.models.enums import MatchFormat, Role, Stage, TournamentFormat
 from src.models.match import Match
 from src.schemas.match import (
@@ -17,9 +30,21 @@ from src.schemas.match import (
     MatchUpdate,
 )
 from src.utils import validators as v
+from src.utils.events import (
+    MatchFinished,
+    MatchRescheduled,
+    MatchScheduled,
+    ScoreChanged,
+    TeamReplaced,
+    TournamentStageAdvanced,
+    event_bus,
+    publish,
+)
+from src.utils.loader_plan import loader_options
 from src.utils.notifications import send_email_notification
 from src.utils.pagination import PaginationParams
-from starlette.status import HTTP_400_BAD_REQUEST
+from src.utils.scheduling import SlotAllocator, round_robin_rounds, schedule_pairs
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_409_CONFLICT
 
 
 def get_all_matches(
@@ -44,11 +69,168 @@ def get_all_matches(
     Returns:
         list[MatchResponse]: List of match responses.
     """
+    if team_name:
+        v.team_exists(db, team_name=team_name)
+
     query = db.query(Match).order_by(Match.start_time.desc())
+    query = _filter_matches(db, query, tournament_title, stage, is_finished, team_name)
+
+    query = query.offset(pagination.offset).limit(pagination.limit)
+
+    db_matches = query.all()
+
+    return [convert_db_to_match_list_response(db_match) for db_match in db_matches]
+
+
+def export_matches(
+    db: Session,
+    session_factory: sessionmaker,
+    file_format: Literal["csv", "ndjson"],
+    tournament_title: str | None = None,
+    stage: Stage | None = None,
+    is_finished: bool | None = None,
+    team_name: str | None = None,
+) -> Iterator[str]:
+    """
+    Export the full match history, with the filters of get_all_matches.
+
+    The filters are validated right away, the rows are streamed later
+    from their own session, so memory use does not grow with the
+    number of matches.
+
+    Args:
+        db (Session): The database session.
+        session_factory (sessionmaker): Creates the export's session.
+        file_format (Literal["csv", "ndjson"]): The format of the export.
+        tournament_title (str, optional): Filter by tournament title.
+        stage (Stage, optional): Filter by stage.
+        is_finished (bool, optional): Filter by match completion status.
+        team_name (str, optional): Filter by team name.
 
+    Returns:
+        Iterator[str]: The exported matches, in chunks of text.
+    """
+    if team_name:
+        v.team_exists(db, team_name=team_name)
+
+    return _stream_matches(
+        session_factory, file_format, tournament_title, stage, is_finished, team_name
+    )
+
+
+def _stream_matches(
+    session_factory: sessionmaker,
+    file_format: Literal["csv", "ndjson"],
+    tournament_title: str | None,
+    stage: Stage | None,
+    is_finished: bool | None,
+    team_name: str | None,
+) -> Iterator[str]:
+    """
+    Stream matches joined with their team and tournament names. Only
+    columns are selected and they are fetched in batches from a server
+    side cursor, so no Match objects are kept in the session.
+
+    Args:
+        session_factory (sessionmaker): Creates the export's session.
+        file_format (Literal["csv", "ndjson"]): The format of the export.
+        tournament_title (str | None): Filter by tournament title.
+        stage (Stage | None): Filter by stage.
+        is_finished (bool | None): Filter by match completion status.
+        team_name (str | None): Filter by team name.
+
+    Yields:
+        str: A batch of CSV or NDJSON lines.
+    """
+    team1 = aliased(Team)
+    team2 = aliased(Team)
+
+    with session_factory() as db:
+        query = (
+            db.query(
+                Match.id,
+                Match.match_format,
+                Match.start_time,
+                Match.stage,
+                Match.is_finished,
+                Match.team1_id,
+                team1.name.label("team1_name"),
+                Match.team1_score,
+                Match.team2_id,
+                team2.name.label("team2_name"),
+                Match.team2_score,
+                Match.winner_team_id.label("winner_id"),
+                Match.tournament_id,
+                Tournament.title.label("tournament_title"),
+            )
+            .join(team1, Match.team1_id == team1.id)
+            .join(team2, Match.team2_id == team2.id)
+            .join(Tournament, Match.tournament_id == Tournament.id)
+            .order_by(Match.start_time.desc())
+        )
+        query = _filter_matches(
+            db, query, tournament_title, stage, is_finished, team_name
+        )
+        columns = [column["name"] for column in query.column_descriptions]
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if file_format == "csv":
+            writer.writerow(columns)
+
+        for count, row in enumerate(query.yield_per(c.EXPORT_BATCH_SIZE), start=1):
+            values = [_export_value(value) for value in row]
+            if file_format == "csv":
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(columns, values))) + "\n")
+
+            if count % c.EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue()
+
+
+# Exported values by exact type, so that the per-value lookup stays cheap
+_EXPORT_FORMATTERS = {
+    uuid.UUID: str,
+    datetime: datetime.isoformat,
+    Stage: operator.attrgetter("value"),
+    MatchFormat: operator.attrgetter("value"),
+}
+
+
+def _export_value(value):
+    formatter = _EXPORT_FORMATTERS.get(type(value))
+    return value if formatter is None else formatter(value)
+
+
+def _filter_matches(
+    db: Session,
+    query: Query,
+    tournament_title: str | None,
+    stage: Stage | None,
+    is_finished: bool | None,
+    team_name: str | None,
+) -> Query:
+    """
+    Apply the match list filters to a query over matches.
+
+    Args:
+        db (Session): The database session.
+        query (Query): The query to filter.
+        tournament_title (str | None): Filter by tournament title.
+        stage (Stage | None): Filter by stage.
+        is_finished (bool | None): Filter by match completion status.
+        team_name (str | None): Filter by team name.
+
+    Returns:
+        Query: The filtered query.
+    """
     filters = []
     if tournament_title:
-        filters.append(Tournament.title.ilike(f"%{tournament_title}%"))
         db_tournament = (
             db.query(Tournament)
             .filter(Tournament.title.ilike(f"%{tournament_title}%"))
@@ -61,26 +243,16 @@ def get_all_matches(
     if is_finished is not None:
         filters.append(Match.is_finished == is_finished)
     if team_name:
-        v.team_exists(db, team_name=team_name)
         query = (
             query.join(Team, or_(Match.team1_id == Team.id, Match.team2_id == Team.id))
-            .filter(
-                or_(
-                    Team.name == team_name,  # Check team1
-                    Team.name == team_name,  # Check team2
-                )
-            )
+            .filter(Team.name == team_name)
             .distinct()
         )  # Add distinct to avoid duplicates
 
     if filters:
         query = query.filter(*filters)
 
-    query = query.offset(pagination.offset).limit(pagination.limit)
-
-    db_matches = query.all()
-
-    return [convert_db_to_match_list_response(db_match) for db_match in db_matches]
+    return query
 
 
 def get_match(db: Session, match_id: UUID) -> MatchResponse:
@@ -99,16 +271,54 @@ def get_match(db: Session, match_id: UUID) -> MatchResponse:
     return convert_db_to_match_list_response(db_match)
 
 
+def get_matches_by_ids(db: Session, match_ids: list[UUID]) -> list[MatchResponse]:
+    """
+    Retrieve several matches at once, with one query for the matches and one
+    per relationship they are converted with.
+
+    Args:
+        db (Session): The database session.
+        match_ids (list[UUID]): The IDs of the matches to retrieve.
+
+    Returns:
+        list[MatchResponse]: The match responses, in the order of their IDs.
+
+    Raises:
+        HTTPException: If any of the matches is not found.
+    """
+    db_matches = v.all_exist(db, Match, match_ids, loader_options(Match, MatchResponse))
+
+    return [convert_db_to_match_list_response(match) for match in db_matches]
+
+
 def generate_matches(db: Session, db_tournament: Tournament) -> None:
     """
     Generate matches for a tournament.
 
+    A new single elimination tournament gets its whole bracket at once.
+    Other tournaments, and single elimination tournaments created before
+    brackets, get the matches of their current stage.
+
     Args:
         db (Session): The database session.
         db_tournament (Tournament): The tournament object.
     """
+    if (
+        db_tournament.tournament_format == TournamentFormat.SINGLE_ELIMINATION
+        and not db_tournament.matches
+    ):
+        teams = {team.id: team for team in db_tournament.teams}
+        for match in crud_bracket.create_bracket(db, db_tournament):
+            _notify_match_created(
+                db,
+                db_tournament,
+                teams[match.team1_id],
+                teams[match.team2_id],
+                match.start_time,
+            )
+        return
+
     matches = []
-    time_format = "%B %d, %Y at %H:%M"
 
     # Get the team pairs and the first match datetime
     if (
@@ -116,60 +326,154 @@ def generate_matches(db: Session, db_tournament: Tournament) -> None:
         and db_tournament.current_stage == Stage.GROUP_STAGE
     ):
         team_pairs, first_match_datetime = _get_pairs_robin_round(db_tournament)
+        crud_tournament_standing.create_standings(db, db_tournament)
     else:
         team_pairs, first_match_datetime = _get_pairs_single_elimination(db_tournament)
 
-    # Generate the matches and the start times
-    current_time = first_match_datetime
-    for i, (team1, team2) in enumerate(team_pairs):
-
-        if current_time.hour > c.END_HOUR:
-            current_time = (current_time + timedelta(days=1)).replace(hour=11, minute=0)
-
+    # Book the start times of the matches
+    allocator = SlotAllocator(
+        first_match_datetime,
+        match_minutes=c.MATCH_DURATION_PLUS_BUFFER,
+        start_hour=c.START_HOUR,
+        end_hour=c.END_HOUR,
+        max_matches_per_day=c.MAX_MATCHES_PER_DAY,
+        venues=c.MATCH_VENUES,
+        rest_minutes=c.TEAM_REST_MINUTES,
+    )
+    for team1, team2, start_time in schedule_pairs(team_pairs, allocator):
         match = Match(
             match_format=(
                 MatchFormat.MR12
                 if db_tournament.current_stage == Stage.GROUP_STAGE
                 else MatchFormat.MR15
             ),
-            start_time=current_time,
+            start_time=start_time,
             stage=db_tournament.current_stage,
             team1_id=team1.id,
             team2_id=team2.id,
             tournament_id=db_tournament.id,
         )
         matches.append(match)
-
-        for player in team1.players:
-            if player.user_id is not None:
-                send_email_notification(
-                    email=player.user.email,
-                    subject="Match Created",
-                    message=f"Your match for the '{db_tournament.title}' "
-                    f"tournament has been scheduled. "
-                    f"You will be playing against {team2.name} "
-                    f"on {current_time.strftime(time_format)}.",
-                )
-
-        for player in team2.players:
-            if player.user_id is not None:
-                send_email_notification(
-                    email=player.user.email,
-                    subject="Match Created",
-                    message=f"Your match for the '{db_tournament.title}' "
-                    f"tournament has been scheduled. "
-                    f"You will be playing against {team1.name} "
-                    f"on {current_time.strftime(time_format)}.",
-                )
-
-        current_time += timedelta(minutes=c.MATCH_DURATION_PLUS_BUFFER)
+        _notify_match_created(db, db_tournament, team1, team2, start_time)
 
     db.bulk_save_objects(matches)
 
 
+def _notify_match_created(
+    db: Session,
+    db_tournament: Tournament,
+    team1: Team,
+    team2: Team,
+    start_time: datetime,
+) -> None:
+    """
+    Notify the players of both teams that their match has been scheduled,
+    once the transaction creating it has committed.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+        team1 (Team): The first team.
+        team2 (Team): The second team.
+        start_time (datetime): The start time of the match.
+    """
+    publish(
+        db,
+        MatchScheduled(
+            tournament_title=db_tournament.title,
+            start_time=start_time,
+            team1_name=team1.name,
+            team1_emails=_player_emails(team1),
+            team2_name=team2.name,
+            team2_emails=_player_emails(team2),
+        ),
+    )
+
+
+def _player_emails(team: Team) -> tuple[str, ...]:
+    """
+    Get the emails of the players of a team linked to a user.
+
+    Args:
+        team (Team): The team object.
+
+    Returns:
+        tuple[str, ...]: The emails.
+    """
+    return tuple(
+        player.user.email for player in team.players if player.user_id is not None
+    )
+
+
+@event_bus.subscribe(MatchScheduled)
+def notify_match_scheduled(event: MatchScheduled) -> None:
+    """
+    Email the players of both teams of a new match about it.
+
+    Args:
+        event (MatchScheduled): The event.
+    """
+    time_format = "%B %d, %Y at %H:%M"
+
+    for emails, opponent_name in (
+        (event.team1_emails, event.team2_name),
+        (event.team2_emails, event.team1_name),
+    ):
+        for email in emails:
+            send_email_notification(
+                email=email,
+                subject="Match Created",
+                message=f"Your match for the '{event.tournament_title}' "
+                f"tournament has been scheduled. "
+                f"You will be playing against {opponent_name} "
+                f"on {event.start_time.strftime(time_format)}.",
+            )
+
+
+@event_bus.subscribe(MatchRescheduled)
+def notify_match_rescheduled(event: MatchRescheduled) -> None:
+    """
+    Email the director of a tournament about a match moved to another time.
+
+    Args:
+        event (MatchRescheduled): The event.
+    """
+    time_format = "%B %d, %Y at %H:%M"
+
+    send_email_notification(
+        email=event.director_email,
+        subject="Match Updated",
+        message=f"Match's date has been updated "
+        f"from {event.previous_start_time.strftime(time_format)} "
+        f"to {event.start_time.strftime(time_format)}",
+    )
+
+
+@event_bus.subscribe(TeamReplaced)
+def notify_team_replaced(event: TeamReplaced) -> None:
+    """
+    Email the players of a team that took another team's place in a match.
+
+    Args:
+        event (TeamReplaced): The event.
+    """
+    time_format = "%B %d, %Y at %H:%M"
+
+    for email in event.team_emails:
+        send_email_notification(
+            email=email,
+            subject="Match Updated",
+            message=f"Your match for the '{event.tournament_title}' "
+            f"tournament has been scheduled. "
+            f"You will be playing against {event.opponent_name} "
+            f"on {event.start_time.strftime(time_format)}.",
+        )
+
+
 def _get_pairs_robin_round(db_tournament: Tournament) -> tuple:
     """
-    Get team pairs for a round-robin tournament.
+    Get team pairs for a round-robin tournament, round after round, so
+    that every team plays once per round before anyone plays again.
 
     Args:
         db_tournament (Tournament): The tournament object.
@@ -177,12 +481,11 @@ def _get_pairs_robin_round(db_tournament: Tournament) -> tuple:
     Returns:
         tuple: A tuple containing team pairs and the first match datetime.
     """
-    teams = db_tournament.teams
-    team_pairs = []
-
-    for i, team1 in enumerate(teams):
-        for team2 in teams[i + 1 :]:
-            team_pairs.append((team1, team2))
+    team_pairs = [
+        pair
+        for round_pairs in round_robin_rounds(db_tournament.teams)
+        for pair in round_pairs
+    ]
 
     stage_date = (
         db_tournament.start_date
@@ -241,14 +544,10 @@ def update_match(
     Returns:
         MatchResponse: The updated match response.
     """
-    time_format = "%B %d, %Y at %H:%M"
-
     try:
-        db.begin_nested()
-
         db_match = _validate_match_update(db, match_id, current_user)
         if match.start_time is not None:
-            _validate_and_update_start_time(db_match, match, time_format)
+            _validate_and_update_start_time(db, db_match, match)
             db_match.start_time = match.start_time
 
         if match.stage is not None:
@@ -257,15 +556,17 @@ def update_match(
         if match.team1_name is not None:
             db_team1 = v.team_exists(db, team_name=match.team1_name)
             _update_team_and_notify_players(
-                db, db_match, db_team1.id, db_match.team2, time_format, True
+                db, db_match, db_team1.id, db_match.team2, True
             )
 
         if match.team2_name is not None:
             db_team2 = v.team_exists(db, team_name=match.team2_name)
             _update_team_and_notify_players(
-                db, db_match, db_team2.id, db_match.team1, time_format, False
+                db, db_match, db_team2.id, db_match.team1, False
             )
 
+        # A replaced team also leaves or joins the tournament's teams
+        crud_tournament_view.refresh_view(db, db_match.tournament)
         db.commit()
         db.refresh(db_match)
         return convert_db_to_match_list_response(db_match)
@@ -296,14 +597,14 @@ def _validate_match_update(db: Session, match_id: UUID, current_user) -> Type[Ma
     return db_match
 
 
-def _validate_and_update_start_time(db_match, match, time_format) -> None:
+def _validate_and_update_start_time(db, db_match, match) -> None:
     """
     Validate and update the match start time.
 
     Args:
+        db (Session): The database session.
         db_match (Match): The match object.
         match (MatchUpdate): The match update data.
-        time_format (str): The time format string.
     """
     match_start_time = match.start_time.replace(tzinfo=timezone.utc)
     tournament_start_date = db_match.tournament.start_date.replace(tzinfo=timezone.utc)
@@ -319,17 +620,19 @@ def _validate_and_update_start_time(db_match, match, time_format) -> None:
                 status_code=HTTP_400_BAD_REQUEST, detail="Invalid start time"
             )
 
-        send_email_notification(
-            email=db_match.tournament.director.email,
-            subject="Match Updated",
-            message=f"Match's date has been updated "
-            f"from {db_match.start_time.strftime(time_format)} "
-            f"to {match.start_time.strftime(time_format)}",
+        publish(
+            db,
+            MatchRescheduled(
+                match_id=db_match.id,
+                director_email=db_match.tournament.director.email,
+                previous_start_time=db_match.start_time,
+                start_time=match.start_time,
+            ),
         )
 
 
 def _update_team_and_notify_players(
-    db, db_match, team_id, opponent_team, time_format, is_team1=True
+    db, db_match, team_id, opponent_team, is_team1=True
 ) -> None:
     """
     Update the team and notify players.
@@ -339,31 +642,34 @@ def _update_team_and_notify_players(
         db_match (Match): The match object.
         team_id (UUID): The team ID.
         opponent_team (Team): The opponent team object.
-        time_format (str): The time format string.
         is_team1 (bool, optional): Whether the team is team1. Defaults to True.
     """
     if team_id:
-        v.team_exists(db, team_id)
+        new_team = v.team_exists(db, team_id)
         old_team = db_match.team1 if is_team1 else db_match.team2
         old_team.tournament_id = None
-        new_team = db.query(Team).filter(Team.id == team_id).first()
         new_team.tournament_id = db_match.tournament_id
 
+        if db_match.stage == Stage.GROUP_STAGE:
+            crud_tournament_standing.replace_team(
+                db, db_match.tournament_id, old_team.id, new_team.id
+            )
+
         if is_team1:
             db_match.team1 = new_team
         else:
             db_match.team2 = new_team
 
-        for player in new_team.players:
-            if player.user_id:
-                send_email_notification(
-                    email=player.user.email,
-                    subject="Match Updated",
-                    message=f"Your match for the '{db_match.tournament.title}' "
-                    f"tournament has been scheduled. "
-                    f"You will be playing against {opponent_team.name} "
-                    f"on {db_match.start_time.strftime(time_format)}.",
-                )
+        publish(
+            db,
+            TeamReplaced(
+                match_id=db_match.id,
+                tournament_title=db_match.tournament.title,
+                start_time=db_match.start_time,
+                opponent_name=opponent_team.name,
+                team_emails=_player_emails(new_team),
+            ),
+        )
 
 
 def update_match_score(
@@ -375,6 +681,9 @@ def update_match_score(
     """
     Update the score of a match.
 
+    The match row is versioned, so an update that raced with a concurrent
+    update of the same match is rolled back and replayed on fresh data.
+
     Args:
         db (Session): The database session.
         match_id (UUID): The match ID.
@@ -384,10 +693,51 @@ def update_match_score(
 
     Returns:
         MatchResponse: The updated match response.
+
+    Raises:
+        HTTPException: If the update kept losing to concurrent updates.
     """
-    try:
-        db.begin_nested()
+    for _ in range(c.MAX_SCORE_UPDATE_ATTEMPTS):
+        try:
+            return _apply_match_score_update(
+                db, match_id, team_to_upvote_score, current_user
+            )
+        except StaleDataError:
+            continue
+
+    raise HTTPException(
+        status_code=HTTP_409_CONFLICT,
+        detail="The match is being updated concurrently, please try again",
+    )
+
+
+def _apply_match_score_update(
+    db: Session,
+    match_id: UUID,
+    team_to_upvote_score: Literal["team1", "team2"],
+    current_user,
+) -> MatchResponse:
+    """
+    Apply a single score update attempt.
+
+    The score, the stage advancement and the matches it creates are one
+    unit of work: nothing below commits, the single commit here does, and
+    the emails about new matches are only sent after it.
+
+    Args:
+        db (Session): The database session.
+        match_id (UUID): The match ID.
+        team_to_upvote_score (Literal["team1", "team2"]):
+        The team to upvote the score for.
+        current_user: The current user performing the update.
 
+    Returns:
+        MatchResponse: The updated match response.
+
+    Raises:
+        StaleDataError: If the match was changed by a concurrent update.
+    """
+    try:
         db_match = _validate_match_score_update(db, match_id, current_user)
         _update_score(db_match, team_to_upvote_score)
 
@@ -402,8 +752,31 @@ def update_match_score(
         db.flush()
         db.refresh(db_match)
 
-        _handle_finished_match(db, db_match, losing_team)
-        _check_tournament_progress(db, db_match)
+        publish(
+            db,
+            ScoreChanged(
+                match_id=db_match.id,
+                tournament_id=db_match.tournament_id,
+                team1_score=db_match.team1_score,
+                team2_score=db_match.team2_score,
+            ),
+        )
+
+        # Stage advancement can only be due when this point finished the match
+        if db_match.is_finished:
+            publish(
+                db,
+                MatchFinished(
+                    match_id=db_match.id,
+                    tournament_id=db_match.tournament_id,
+                    winner_team_id=db_match.winner_team_id,
+                ),
+            )
+            _handle_finished_match(db, db_match, losing_team)
+            _check_tournament_progress(db, db_match)
+            crud_tournament_view.refresh_view(db, db_match.tournament)
+        else:
+            crud_tournament_view.refresh_view_match(db, db_match)
 
         db.commit()
         db.refresh(db_match)
@@ -469,7 +842,9 @@ def _handle_finished_match(db: Session, db_match: Match, losing_team: Team) -> N
         losing_team (Team): The losing team object.
     """
     if db_match.is_finished:
-        if db_match.stage == Stage.FINAL:
+        if db_match.stage == Stage.GROUP_STAGE:
+            crud_tournament_standing.record_match_result(db, db_match)
+        elif db_match.stage == Stage.FINAL:
             _match_team_prizes(db, db_match)
         elif db_match.tournament.tournament_format != TournamentFormat.ROUND_ROBIN:
             losing_team.tournament_id = None
@@ -483,12 +858,68 @@ def _check_tournament_progress(db: Session, db_match: Match) -> None:
         db (Session): The database session.
         db_match (Match): The match object.
     """
-    if all(match.is_finished for match in db_match.tournament.matches):
+    if db_match.tournament.current_stage == Stage.FINISHED:
+        return
+
+    node = None
+    if db_match.tournament.tournament_format == TournamentFormat.SINGLE_ELIMINATION:
+        node = crud_bracket.get_match_node(db, db_match.id)
+
+    if node is not None:
+        _advance_bracket(db, db_match, node)
+        return
+
+    if not _has_unfinished_matches(db, db_match.tournament_id):
+        _update_current_stage(db, db_match.tournament.id)
+
         if db_match.tournament.current_stage != Stage.FINISHED:
-            _update_current_stage(db, db_match.tournament.id)
+            generate_matches(db, db_match.tournament)
 
-            if db_match.tournament.current_stage != Stage.FINISHED:
-                generate_matches(db, db_match.tournament)
+
+def _advance_bracket(db: Session, db_match: Match, node: BracketNode) -> None:
+    """
+    Move the winner of a bracket match on, and advance the tournament's
+    stage once the last match of the current stage is finished.
+
+    Args:
+        db (Session): The database session.
+        db_match (Match): The finished match.
+        node (BracketNode): The bracket node of the match.
+    """
+    next_match = crud_bracket.advance_winner(db, node, db_match.winner_team_id)
+    if next_match is not None:
+        _notify_match_created(
+            db,
+            db_match.tournament,
+            db.get(Team, next_match.team1_id),
+            db.get(Team, next_match.team2_id),
+            next_match.start_time,
+        )
+
+    current_stage = db_match.tournament.current_stage
+    if not _has_unfinished_matches(db, db_match.tournament_id, current_stage):
+        _update_current_stage(db, db_match.tournament_id)
+
+
+def _has_unfinished_matches(
+    db: Session, tournament_id: UUID, stage: Stage | None = None
+) -> bool:
+    """
+    Check whether a tournament still has matches to play, without loading them.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The tournament ID.
+        stage (Stage | None): Only check the matches of this stage.
+
+    Returns:
+        bool: True if at least one match of the tournament is not finished.
+    """
+    conditions = [Match.tournament_id == tournament_id, Match.is_finished.is_(False)]
+    if stage is not None:
+        conditions.append(Match.stage == stage)
+
+    return db.query(exists().where(*conditions)).scalar()
 
 
 def _update_current_stage(db: Session, tournament_id: UUID) -> None:
@@ -499,8 +930,6 @@ def _update_current_stage(db: Session, tournament_id: UUID) -> None:
         db (Session): The database session.
         tournament_id (UUID): The tournament ID.
     """
-    db.begin_nested()
-
     db_tournament = v.tournament_exists(db, tournament_id)
 
     # If tournament is robin round,
@@ -515,30 +944,27 @@ def _update_current_stage(db: Session, tournament_id: UUID) -> None:
     db.flush()
     db.refresh(db_tournament)
 
+    publish(
+        db,
+        TournamentStageAdvanced(
+            tournament_id=db_tournament.id, stage=db_tournament.current_stage
+        ),
+    )
+
 
 def _match_team_prizes(db: Session, db_match: Match) -> None:
     """
-    Assign prizes to the winning teams.
+    Assign the prizes of the tournament once its final is finished, and
+    release the finalists from the tournament.
 
     Args:
         db (Session): The database session.
-        db_match (Match): The match object.
+        db_match (Match): The final.
     """
-    for prize in db_match.tournament.prize_cuts:
-        if prize.place == 1:
-            prize.team_id = db_match.winner_team_id
+    crud_prize_cut.award_prizes(db, db_match.tournament, db_match)
 
-        elif prize.place == 2:
-            prize.team_id = (
-                db_match.team1_id
-                if db_match.team2_id == db_match.winner_team_id
-                else db_match.team2_id
-            )
-
-        prize.team.tournament_id = None
-        db.commit()
-        db.refresh(prize)
-        db.refresh(prize.team)
+    db_match.team1.tournament_id = None
+    db_match.team2.tournament_id = None
 
 
 def _check_for_winner_for_mr15(db: Session, db_match: Match | Type[Match]) -> Team:
@@ -1,12 +1,16 @@
+from typing import Iterator
 from uuid import UUID
 
 from fastapi import UploadFile
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, sessionmaker
+from src.crud import tournament_view as crud_tournament_view
+from src.crud.constants import MAX_TEAM_PLAYERS
 from src.crud.convert_db_to_response import (
     convert_db_to_player_detail_response,
     convert_db_to_player_list_response,
 )
-from src.models import Player
+from src.models import Player, Team
 from src.schemas.player import (
     PlayerCreate,
     PlayerDetailResponse,
@@ -14,7 +18,9 @@ from src.schemas.player import (
     PlayerUpdate,
 )
 from src.schemas.user import UserResponse
-from src.utils import validators as v
+from src.utils import bulk_import, validators as v
+from src.utils.conflicts import unique_conflicts
+from src.utils.loader_plan import loader_options
 from src.utils.pagination import PaginationParams
 from src.utils.s3 import s3_service
 
@@ -37,33 +43,162 @@ def create_player(
     Returns:
         PlayerListResponse: The response schema for the created player.
     """
-    v.player_username_unique(db, username=player.username)
     v.director_or_admin(current_user)
 
     if player.team_name:
         db_team = v.team_exists(db, team_name=player.team_name)
         v.team_player_limit_reached(db_team)
 
-    avatar_url = None
-    if avatar is not None:
-        avatar_url = s3_service.upload_file(avatar, "players")
-
     db_player = Player(
         username=player.username,
         first_name=player.first_name,
         last_name=player.last_name,
         country=player.country,
-        avatar=avatar_url,
         team_id=db_team.id if player.team_name else None,
     )
 
-    db.add(db_player)
+    # The avatar is uploaded once the username is known to be free
+    with unique_conflicts(
+        db, lambda: v.player_username_unique(db, username=player.username)
+    ):
+        db.add(db_player)
+        db.flush()
+
+    if avatar is not None:
+        db_player.avatar = s3_service.upload_file(avatar, "players")
+
+    if player.team_name:
+        crud_tournament_view.refresh_view_team(db, db_team)
     db.commit()
     db.refresh(db_player)
 
     return convert_db_to_player_list_response(db_player)
 
 
+def import_players(
+    session_factory: sessionmaker,
+    content: bytes,
+    filename: str | None,
+    content_type: str | None,
+    current_user: UserResponse,
+) -> Iterator[str]:
+    """
+    Import players from a CSV or NDJSON file with the fields of
+    PlayerCreate per row.
+
+    Usernames and teams are checked with one query per batch and the
+    players are inserted in a single transaction, nothing is imported if
+    any row is rejected.
+
+    Args:
+        session_factory (sessionmaker): Creates the import's session.
+        content (bytes): The content of the uploaded file.
+        filename (str | None): The name of the uploaded file.
+        content_type (str | None): The content type of the uploaded file.
+        current_user (UserResponse): The current user importing the players.
+
+    Returns:
+        Iterator[str]: The NDJSON progress and error events of the import.
+    """
+    v.director_or_admin(current_user)
+    file_format = bulk_import.get_file_format(filename, content_type)
+    seen_usernames = set()
+    # Team name -> [team ID, number of players], counting imported players
+    teams = {}
+    imported_team_ids = set()
+
+    def check_batch(
+        db: Session, batch: list[tuple[int, PlayerCreate]]
+    ) -> tuple[list[dict], dict[int, str]]:
+        errors = bulk_import.duplicates_in_batch(
+            batch, lambda player: player.username, seen_usernames
+        )
+        existing_usernames = {
+            username
+            for (username,) in db.query(Player.username).filter(
+                Player.username.in_([player.username for _, player in batch])
+            )
+        }
+
+        # Teams are counted the first time they appear, before any of
+        # the imported players is assigned to them
+        new_team_names = {
+            player.team_name
+            for _, player in batch
+            if player.team_name and player.team_name not in teams
+        }
+        if new_team_names:
+            teams.update(
+                (name, [team_id, player_count])
+                for team_id, name, player_count in db.query(
+                    Team.id, Team.name, func.count(Player.id)
+                )
+                .outerjoin(Player, Player.team_id == Team.id)
+                .filter(Team.name.in_(new_team_names))
+                .group_by(Team.id, Team.name)
+            )
+
+        records = []
+        for number, player in batch:
+            if number in errors:
+                continue
+            if player.username in existing_usernames:
+                errors[number] = "Player with this username already exists"
+                continue
+
+            team = teams.get(player.team_name) if player.team_name else None
+            if player.team_name and team is None:
+                errors[number] = f"Team '{player.team_name}' not found"
+                continue
+            if team is not None:
+                if team[1] >= MAX_TEAM_PLAYERS:
+                    errors[number] = "Team has reached the player limit"
+                    continue
+                team[1] += 1
+                imported_team_ids.add(team[0])
+
+            records.append(
+                {
+                    "username": player.username,
+                    "first_name": player.first_name,
+                    "last_name": player.last_name,
+                    "country": player.country,
+                    "team_id": team[0] if team else None,
+                }
+            )
+
+        return records, errors
+
+    return bulk_import.stream_import(
+        session_factory,
+        lambda db: bulk_import.import_rows(
+            db,
+            bulk_import.read_rows(content, file_format),
+            PlayerCreate,
+            Player,
+            check_batch,
+            lambda db: _refresh_team_views(db, imported_team_ids),
+        ),
+    )
+
+
+def _refresh_team_views(db: Session, team_ids: set[UUID]) -> None:
+    """
+    Refresh the teams with imported players in the views of their tournaments.
+
+    Args:
+        db (Session): The database session.
+        team_ids (set[UUID]): The IDs of the teams with imported players.
+    """
+    if not team_ids:
+        return
+
+    for db_team in db.query(Team).filter(
+        Team.id.in_(team_ids), Team.tournament_id.isnot(None)
+    ):
+        crud_tournament_view.refresh_view_team(db, db_team)
+
+
 def get_players(
     db: Session,
     pagination: PaginationParams,
@@ -87,7 +222,11 @@ def get_players(
     Returns:
         list[PlayerListResponse]: A list of player response objects.
     """
-    query = db.query(Player).order_by(Player.username.asc())
+    query = (
+        db.query(Player)
+        .options(*loader_options(Player, PlayerListResponse))
+        .order_by(Player.username.asc())
+    )
 
     filters = []
     if search:
@@ -128,11 +267,7 @@ def get_player(db: Session, player_id: UUID) -> PlayerDetailResponse:
     """
     db_player = v.player_exists(db, player_id)
 
-    tournament_title = None
-    if db_player.team_id and db_player.team.tournament_id:
-        tournament_title = db_player.team.tournament.title
-
-    return convert_db_to_player_detail_response(db_player, tournament_title)
+    return _convert_db_to_player_detail_response(db_player)
 
 
 def get_player_by_user_id(
@@ -151,6 +286,35 @@ def get_player_by_user_id(
     v.user_associated_with_player(current_user)
     db_player = db.query(Player).filter(Player.user_id == current_user.id).first()
 
+    return _convert_db_to_player_detail_response(db_player)
+
+
+def get_players_by_ids(
+    db: Session, player_ids: list[UUID]
+) -> list[PlayerDetailResponse]:
+    """
+    Retrieve the details of several players at once, with one query for the
+    players and one per relationship they are converted with.
+
+    Args:
+        db (Session): The database session.
+        player_ids (list[UUID]): The IDs of the players to retrieve.
+
+    Returns:
+        list[PlayerDetailResponse]: The detailed responses of the players, in
+        the order of their IDs.
+
+    Raises:
+        HTTPException: If any of the players is not found.
+    """
+    db_players = v.all_exist(
+        db, Player, player_ids, loader_options(Player, PlayerDetailResponse)
+    )
+
+    return [_convert_db_to_player_detail_response(player) for player in db_players]
+
+
+def _convert_db_to_player_detail_response(db_player: Player) -> PlayerDetailResponse:
     tournament_title = None
     if db_player.team_id and db_player.team.tournament_id:
         tournament_title = db_player.team.tournament.title
@@ -186,18 +350,24 @@ def update_player(
         v.director_or_admin(current_user)
 
     if player.username is not None:
-        v.player_username_unique(db, username=player.username)
         db_player.username = player.username
+        with unique_conflicts(
+            db, lambda: v.player_username_unique(db, username=player.username)
+        ):
+            db.flush()
     if player.first_name is not None:
         db_player.first_name = player.first_name
     if player.last_name is not None:
         db_player.last_name = player.last_name
     if player.country is not None:
         db_player.country = player.country
+    # The teams shown in the views of their tournaments, before and after
+    db_teams = {db_player.team}
     if player.team_name is not None:
         team = v.team_exists(db, team_name=player.team_name)
         v.team_player_limit_reached(team)
-        db_player.team_id = team.id
+        db_player.team = team
+        db_teams.add(team)
 
     if avatar is not None:
         if db_player.avatar:
@@ -206,6 +376,8 @@ def update_player(
         avatar_url = s3_service.upload_file(avatar, "players")
         db_player.avatar = avatar_url
 
+    for db_team in db_teams:
+        crud_tournament_view.refresh_view_team(db, db_team)
     db.commit()
     db.refresh(db_player)
 
@@ -1,9 +1,24 @@
+from collections import defaultdict
 from uuid import UUID
 
-from src.models import PrizeCut
+from sqlalchemy import case, func, inspect, update
+from sqlalchemy.orm import Session
+from src.crud import tournament_standing as crud_tournament_standing
+from src.models import Match, PrizeCut, Tournament
+from src.models.enums import Payout, Stage, TournamentFormat
+from src.utils.bracket import ROUND_STAGES
+from src.utils.prizes import PAYOUT_TEMPLATES, PayoutTemplate, rank_placements
 
+# The number of teams entering every knockout stage
+STAGE_TEAMS = {stage: teams for teams, stage in ROUND_STAGES.items()}
 
-def create_prize_cuts_for_tournament(db, db_tournament, new_prize_pool: int) -> None:
+
+def create_prize_cuts_for_tournament(
+    db,
+    db_tournament,
+    new_prize_pool: int,
+    template: PayoutTemplate = PAYOUT_TEMPLATES[Payout.TOP_TWO],
+) -> None:
     """
     Create prize cuts for a tournament.
 
@@ -11,15 +26,14 @@ def create_prize_cuts_for_tournament(db, db_tournament, new_prize_pool: int) ->
         db (Session): The database session.
         db_tournament (Tournament): The tournament object.
         new_prize_pool (int): The new prize pool amount.
+        template (PayoutTemplate): How the prize pool is split, 70/30 between
+        the first two places by default.
 
     Returns:
         None
     """
-    prize_cut1 = _create_prize_cut(1, round(0.7 * new_prize_pool), db_tournament.id)
-    prize_cut2 = _create_prize_cut(2, round(0.3 * new_prize_pool), db_tournament.id)
-
-    db.add(prize_cut1)
-    db.add(prize_cut2)
+    for place, amount in enumerate(template.amounts(new_prize_pool), start=1):
+        db.add(_create_prize_cut(place, amount, db_tournament.id))
 
 
 def delete_prize_cuts_for_tournament(db, db_tournament) -> None:
@@ -36,6 +50,128 @@ def delete_prize_cuts_for_tournament(db, db_tournament) -> None:
     db.query(PrizeCut).filter(PrizeCut.tournament_id == db_tournament.id).delete()
 
 
+def get_payout_template(
+    payout: Payout | None = None,
+    prize_amounts: list[int] | None = None,
+    db_tournament: Tournament | None = None,
+) -> PayoutTemplate:
+    """
+    Get the payout template of a tournament: fixed prize amounts if given,
+    otherwise a named template, otherwise the split of the tournament's
+    current prize cuts.
+
+    Args:
+        payout (Payout | None): The name of a template.
+        prize_amounts (list[int] | None): The amount of every place.
+        db_tournament (Tournament | None): The tournament whose prize cuts
+        keep their split when neither is given.
+
+    Returns:
+        PayoutTemplate: The payout template, 70/30 by default.
+    """
+    if prize_amounts:
+        return PayoutTemplate(tuple(prize_amounts), fixed=True)
+    if payout is not None:
+        return PAYOUT_TEMPLATES[payout]
+
+    if db_tournament is not None and db_tournament.prize_cuts:
+        prize_cuts = sorted(db_tournament.prize_cuts, key=lambda cut: cut.place)
+        return PayoutTemplate.from_amounts([cut.prize_cut for cut in prize_cuts])
+
+    return PAYOUT_TEMPLATES[Payout.TOP_TWO]
+
+
+def award_prizes(db: Session, db_tournament: Tournament, db_final: Match) -> None:
+    """
+    Assign the prize cuts of a tournament to its final placements, all of
+    them with a single UPDATE in the caller's transaction.
+
+    The final decides the first two places. In a single elimination the
+    rest follow by the round they were knocked out in, the closest defeats
+    first; in a round robin by the group standings.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+        db_final (Match): The finished final of the tournament.
+
+    Returns:
+        None
+    """
+    places = (
+        db.query(func.max(PrizeCut.place))
+        .filter(PrizeCut.tournament_id == db_tournament.id)
+        .scalar()
+    )
+    if not places:
+        return
+
+    eliminated = []
+    if places > 2:
+        if db_tournament.tournament_format == TournamentFormat.SINGLE_ELIMINATION:
+            eliminated = _get_knocked_out_team_ids(db, db_tournament.id)
+        elif db_tournament.tournament_format == TournamentFormat.ROUND_ROBIN:
+            eliminated = [
+                crud_tournament_standing.get_ordered_team_ids(db, db_tournament)
+            ]
+
+    winner_id = db_final.winner_team_id
+    runner_up_id = (
+        db_final.team2_id if db_final.team1_id == winner_id else db_final.team1_id
+    )
+    placements = rank_placements(winner_id, runner_up_id, eliminated, places)
+    team_ids = dict(enumerate(placements, start=1))
+
+    db.execute(
+        update(PrizeCut)
+        .where(
+            PrizeCut.tournament_id == db_tournament.id,
+            PrizeCut.place.in_(team_ids),
+        )
+        .values(team_id=case(team_ids, value=PrizeCut.place))
+        .execution_options(synchronize_session=False)
+    )
+
+    # Prizes already loaded would still show no team
+    if "prize_cuts" not in inspect(db_tournament).unloaded:
+        for prize in db_tournament.prize_cuts:
+            db.expire(prize, ["team_id", "team"])
+
+
+def _get_knocked_out_team_ids(db: Session, tournament_id: UUID) -> list[list[UUID]]:
+    """
+    Get the teams knocked out of a single elimination before the final.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The ID of the tournament.
+
+    Returns:
+        list[list[UUID]]: The IDs of the teams knocked out in every round,
+        the semi finals first and the closest defeats first within a round.
+    """
+    rounds = defaultdict(list)
+    for stage, team1_id, team2_id, winner_id, team1_score, team2_score in db.query(
+        Match.stage,
+        Match.team1_id,
+        Match.team2_id,
+        Match.winner_team_id,
+        Match.team1_score,
+        Match.team2_score,
+    ).filter(
+        Match.tournament_id == tournament_id,
+        Match.is_finished.is_(True),
+        Match.stage != Stage.FINAL,
+    ):
+        loser_id = team2_id if team1_id == winner_id else team1_id
+        rounds[stage].append((abs(team1_score - team2_score), loser_id))
+
+    return [
+        [loser_id for _, loser_id in sorted(rounds[stage])]
+        for stage in sorted(rounds, key=lambda stage: STAGE_TEAMS.get(stage, 0))
+    ]
+
+
 def _create_prize_cut(place: int, prize_cut: float, tournament_id: UUID) -> PrizeCut:
     """
     Create a prize cut object.
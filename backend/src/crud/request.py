@@ -5,9 +5,11 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy import asc, desc
 from sqlalchemy.orm import Session
+from src.crud import tournament_view as crud_tournament_view
 from src.models import Player, Request, User
 from src.models.enums import RequestStatus, RequestType, Role
 from src.schemas.request import RequestListResponse, ResponseRequest
+from src.utils.events import RequestResolved, event_bus, publish
 from src.utils.notifications import send_email_notification
 from src.utils.pagination import PaginationParams
 from src.utils.validators import (
@@ -256,19 +258,11 @@ def get_director_requests(
     user = user_exists(db, user_id)
 
     if status == RequestStatus.ACCEPTED:
-        send_email_notification(
-            email=user.email,
-            subject="Request Accepted",
-            message="Your request to be promoted to director has been accepted.",
-        )
+        _publish_request_resolved(db, request, user, RequestStatus.ACCEPTED)
         return accept_director_request(db, admin, user, request)
 
     elif status == RequestStatus.REJECTED:
-        send_email_notification(
-            email=user.email,
-            subject="Request Rejected",
-            message="Your request to be promoted to director has been rejected.",
-        )
+        _publish_request_resolved(db, request, user, RequestStatus.REJECTED)
         return reject_director_request(db, admin, request)
 
 
@@ -364,21 +358,11 @@ def get_link_to_player_requests(
         ResponseRequest: The response request object with the updated status.
     """
     if status == RequestStatus.ACCEPTED:
-        send_email_notification(
-            email=user.email,
-            subject="Request Accepted",
-            message=f"Your request to be linked "
-            f"to the player '{player.username}' has been accepted.",
-        )
+        _publish_request_resolved(db, request, user, RequestStatus.ACCEPTED, player)
         return accept_link_to_player_request(db, admin, user, request, player)
 
     elif status == RequestStatus.REJECTED:
-        send_email_notification(
-            email=user.email,
-            subject="Request Rejected",
-            message=f"Your request to be linked "
-            f"to the player '{player.username}' has been rejected.",
-        )
+        _publish_request_resolved(db, request, user, RequestStatus.REJECTED, player)
         return reject_link_to_player_request(db, admin, request)
 
 
@@ -403,6 +387,7 @@ def accept_link_to_player_request(
     request.response_date = datetime.now()
     player.user_id = request.user_id
     user.role = Role.PLAYER
+    crud_tournament_view.refresh_view_team(db, player.team)
     db.commit()
     db.refresh(request)
     db.refresh(player)
@@ -439,3 +424,58 @@ def reject_link_to_player_request(db, admin: User, request: Request) -> Response
         status=request.status,
         response_date=request.response_date,
     )
+
+
+def _publish_request_resolved(
+    db: Session,
+    request: Request,
+    user: User,
+    status: RequestStatus,
+    player: Player | None = None,
+) -> None:
+    """
+    Publish the resolution of a request, for the user to be emailed once
+    it is committed.
+
+    Args:
+        db (Session): The database session.
+        request (Request): The request object.
+        user (User): The user who made the request.
+        status (RequestStatus): Whether the request was accepted or rejected.
+        player (Player | None): The player the user asked to be linked to.
+    """
+    publish(
+        db,
+        RequestResolved(
+            request_id=request.id,
+            request_type=request.request_type,
+            status=status,
+            email=user.email,
+            player_username=player.username if player is not None else None,
+        ),
+    )
+
+
+@event_bus.subscribe(RequestResolved)
+def notify_request_resolved(event: RequestResolved) -> None:
+    """
+    Email the user whose request was accepted or rejected.
+
+    Args:
+        event (RequestResolved): The event.
+    """
+    if event.request_type == RequestType.PROMOTE_USER_TO_DIRECTOR:
+        message = (
+            f"Your request to be promoted to director has been {event.status.value}."
+        )
+    else:
+        message = (
+            f"Your request to be linked to the player "
+            f"'{event.player_username}' has been {event.status.value}."
+        )
+
+    send_email_notification(
+        email=event.email,
+        subject=f"Request {event.status.value.capitalize()}",
+        message=message,
+    )
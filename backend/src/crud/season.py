@@ -0,0 +1,440 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from src.crud import (
+    constants as c,
+    tournament_view as crud_tournament_view,
+)
+from src.models import BracketNode, Match, Tournament
+from src.models.enums import Role
+from src.schemas.tournament import (
+    RescheduledMatchResponse,
+    SeasonSchedule,
+    SeasonScheduleResponse,
+)
+from src.schemas.user import UserResponse
+from src.utils import validators as v
+from src.utils.events import TournamentRescheduled, event_bus, publish
+from src.utils.intervals import IntervalIndex
+from src.utils.notifications import send_email_notification
+from src.utils.scheduling import to_naive_utc
+from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
+
+# The resource of the broadcast schedule, shared by all tournaments
+BROADCAST = "broadcast"
+
+MATCH_DURATION = timedelta(minutes=c.MATCH_DURATION_PLUS_BUFFER)
+TEAM_REST = timedelta(minutes=c.TEAM_REST_MINUTES)
+
+
+def schedule_season(
+    db: Session, season: SeasonSchedule, current_user: UserResponse
+) -> SeasonScheduleResponse:
+    """
+    Reschedule the upcoming matches of several tournaments at once.
+
+    Every other scheduled match is indexed first, then the upcoming
+    matches of the tournaments, and the bracket matches still waiting for
+    their teams, are booked in order, earliest tournament first. A match
+    keeps its start time unless it would double book one of its teams,
+    the director, or the broadcast slots shared by all tournaments, and
+    otherwise moves to the next free slot. Matches never move earlier or
+    ahead of the matches before them in their tournament.
+
+    Args:
+        db (Session): The database session.
+        season (SeasonSchedule): The tournaments to schedule.
+        current_user (UserResponse): The current user scheduling the season.
+
+    Returns:
+        SeasonScheduleResponse: The number of scheduled matches and the
+        matches that were moved.
+
+    Raises:
+        HTTPException: If a tournament does not exist or the user is not
+        allowed to schedule it.
+    """
+    try:
+        tournaments = _get_season_tournaments(db, season.tournament_ids, current_user)
+        broadcast_slots = season.broadcast_slots or c.BROADCAST_SLOTS
+        now = to_naive_utc(datetime.now(timezone.utc))
+
+        tournament_ids = [db_tournament.id for db_tournament in tournaments]
+        index, day_counts = _index_fixed_matches(db, tournament_ids, now)
+
+        scheduled = 0
+        rescheduled = []
+        for db_tournament in tournaments:
+            matches, moved = _schedule_tournament(
+                db, index, day_counts, db_tournament, now, broadcast_slots
+            )
+            scheduled += matches
+            rescheduled.extend(moved)
+
+        db.commit()
+
+        return SeasonScheduleResponse(
+            scheduled_matches=scheduled, rescheduled_matches=rescheduled
+        )
+
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def _schedule_tournament(
+    db: Session,
+    index: IntervalIndex,
+    day_counts: Counter,
+    db_tournament: Tournament,
+    now: datetime,
+    broadcast_slots: int,
+) -> tuple[int, list[RescheduledMatchResponse]]:
+    """
+    Book the upcoming matches of a tournament, in order, and notify the
+    director once committed if any of them moved.
+
+    Args:
+        db (Session): The database session.
+        index (IntervalIndex): The booked intervals.
+        day_counts (Counter): The number of matches per tournament and day.
+        db_tournament (Tournament): The tournament object.
+        now (datetime): The current time, in UTC.
+        broadcast_slots (int): The matches that can be broadcast at once.
+
+    Returns:
+        tuple[int, list[RescheduledMatchResponse]]: The number of scheduled
+        matches and the matches that were moved.
+    """
+    scheduled = 0
+    rescheduled = []
+    previous = now
+
+    items = _get_pending_items(db, db_tournament.id, now)
+    for item in items:
+        start_time = _book_slot(
+            index,
+            day_counts,
+            item,
+            db_tournament.director_id,
+            max(to_naive_utc(item.start_time), previous),
+            broadcast_slots,
+        )
+        previous = start_time
+
+        is_match = isinstance(item, Match)
+        if is_match:
+            scheduled += 1
+        if start_time == to_naive_utc(item.start_time):
+            continue
+
+        if is_match:
+            rescheduled.append(
+                RescheduledMatchResponse(
+                    id=item.id,
+                    tournament_id=item.tournament_id,
+                    stage=item.stage,
+                    previous_start_time=item.start_time,
+                    start_time=start_time,
+                )
+            )
+        item.start_time = start_time
+
+    if items:
+        _extend_end_date(db_tournament, previous)
+        crud_tournament_view.refresh_view(
+            db,
+            db_tournament,
+            crud_tournament_view.SUMMARY,
+            crud_tournament_view.MATCHES,
+        )
+
+    if rescheduled:
+        publish(
+            db,
+            TournamentRescheduled(
+                tournament_id=db_tournament.id,
+                tournament_title=db_tournament.title,
+                director_email=db_tournament.director.email,
+                rescheduled_matches=len(rescheduled),
+            ),
+        )
+
+    return scheduled, rescheduled
+
+
+def _get_season_tournaments(
+    db: Session, tournament_ids: list[UUID], current_user: UserResponse
+) -> list[Tournament]:
+    """
+    Retrieve the tournaments of a season, earliest first.
+
+    Args:
+        db (Session): The database session.
+        tournament_ids (list[UUID]): The IDs of the tournaments.
+        current_user (UserResponse): The current user scheduling the season.
+
+    Returns:
+        list[Tournament]: The tournaments ordered by start date.
+
+    Raises:
+        HTTPException: If a tournament does not exist, or if the user is a
+        director who does not run all of them.
+    """
+    v.director_or_admin(current_user)
+
+    tournaments = (
+        db.query(Tournament)
+        .filter(Tournament.id.in_(set(tournament_ids)))
+        .order_by(Tournament.start_date, Tournament.id)
+        .all()
+    )
+    if len(tournaments) != len(set(tournament_ids)):
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND, detail="Tournament not found"
+        )
+
+    if current_user.role == Role.DIRECTOR and any(
+        db_tournament.director_id != current_user.id for db_tournament in tournaments
+    ):
+        raise HTTPException(
+            status_code=HTTP_403_FORBIDDEN,
+            detail="You are not authorized to perform this action",
+        )
+
+    return tournaments
+
+
+def _index_fixed_matches(
+    db: Session, tournament_ids: list[UUID], now: datetime
+) -> tuple[IntervalIndex, Counter]:
+    """
+    Index the matches that stay where they are: the upcoming matches of
+    other tournaments, including their bracket matches waiting for teams,
+    and the matches being played right now.
+
+    Args:
+        db (Session): The database session.
+        tournament_ids (list[UUID]): The IDs of the tournaments to schedule.
+        now (datetime): The current time, in UTC.
+
+    Returns:
+        tuple[IntervalIndex, Counter]: The booked intervals, and the number
+        of matches per tournament and day.
+    """
+    matches = (
+        db.query(
+            Match.start_time,
+            Match.team1_id,
+            Match.team2_id,
+            Match.tournament_id,
+            Tournament.director_id,
+        )
+        .join(Tournament, Tournament.id == Match.tournament_id)
+        .filter(
+            Match.is_finished.is_(False),
+            Match.start_time > now - MATCH_DURATION,
+            or_(Match.tournament_id.notin_(tournament_ids), Match.start_time <= now),
+        )
+    )
+    nodes = (
+        db.query(
+            BracketNode.start_time,
+            BracketNode.team1_id,
+            BracketNode.team2_id,
+            BracketNode.tournament_id,
+            Tournament.director_id,
+        )
+        .join(Tournament, Tournament.id == BracketNode.tournament_id)
+        .filter(
+            BracketNode.match_id.is_(None),
+            BracketNode.start_time > now,
+            BracketNode.tournament_id.notin_(tournament_ids),
+        )
+    )
+
+    index = IntervalIndex()
+    day_counts = Counter()
+    for start_time, team1_id, team2_id, tournament_id, director_id in (
+        matches.order_by(Match.start_time).all()
+        + nodes.order_by(BracketNode.start_time).all()
+    ):
+        _book(
+            index,
+            day_counts,
+            to_naive_utc(start_time),
+            tournament_id,
+            director_id,
+            [team_id for team_id in (team1_id, team2_id) if team_id is not None],
+        )
+
+    return index, day_counts
+
+
+def _get_pending_items(
+    db: Session, tournament_id: UUID, now: datetime
+) -> list[Match | BracketNode]:
+    """
+    Retrieve the upcoming matches of a tournament and its bracket matches
+    still waiting for their teams, in schedule order.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The tournament ID.
+        now (datetime): The current time, in UTC.
+
+    Returns:
+        list[Match | BracketNode]: The items to schedule.
+    """
+    matches = (
+        db.query(Match)
+        .filter(
+            Match.tournament_id == tournament_id,
+            Match.is_finished.is_(False),
+            Match.start_time > now,
+        )
+        .all()
+    )
+    nodes = (
+        db.query(BracketNode)
+        .filter(
+            BracketNode.tournament_id == tournament_id,
+            BracketNode.match_id.is_(None),
+        )
+        .all()
+    )
+
+    return sorted([*matches, *nodes], key=lambda item: to_naive_utc(item.start_time))
+
+
+def _book_slot(
+    index: IntervalIndex,
+    day_counts: Counter,
+    item: Match | BracketNode,
+    director_id: UUID,
+    earliest: datetime,
+    broadcast_slots: int,
+) -> datetime:
+    """
+    Book the first free slot of a match, starting with the earliest time.
+
+    Args:
+        index (IntervalIndex): The booked intervals.
+        day_counts (Counter): The number of matches per tournament and day.
+        item (Match | BracketNode): The match to book.
+        director_id (UUID): The ID of the tournament's director.
+        earliest (datetime): The earliest start time of the match.
+        broadcast_slots (int): The matches that can be broadcast at once.
+
+    Returns:
+        datetime: The booked start time.
+    """
+    team_ids = [
+        team_id for team_id in (item.team1_id, item.team2_id) if team_id is not None
+    ]
+
+    for start_time in _candidate_slots(earliest):
+        end_time = start_time + MATCH_DURATION
+        if (
+            day_counts[(item.tournament_id, start_time.date())] >= c.MAX_MATCHES_PER_DAY
+            or index.count_overlaps(BROADCAST, start_time, end_time) >= broadcast_slots
+            or index.count_overlaps(("director", director_id), start_time, end_time)
+            >= c.MATCH_VENUES
+            or any(
+                index.count_overlaps(
+                    ("team", team_id), start_time, end_time + TEAM_REST
+                )
+                for team_id in team_ids
+            )
+        ):
+            continue
+
+        _book(index, day_counts, start_time, item.tournament_id, director_id, team_ids)
+        return start_time
+
+
+def _candidate_slots(earliest: datetime) -> Iterator[datetime]:
+    """
+    Generate the start times a match can move to: the earliest time
+    itself, then every slot of the match days after it.
+
+    Args:
+        earliest (datetime): The earliest start time.
+
+    Yields:
+        datetime: The candidate start times, in order.
+    """
+    yield earliest
+
+    day = earliest.replace(hour=c.START_HOUR, minute=0, second=0, microsecond=0)
+    slots_per_day = (c.END_HOUR - c.START_HOUR) * 60 // c.MATCH_DURATION_PLUS_BUFFER + 1
+    while True:
+        for slot in range(slots_per_day):
+            start_time = day + slot * MATCH_DURATION
+            if start_time > earliest:
+                yield start_time
+        day += timedelta(days=1)
+
+
+def _book(
+    index: IntervalIndex,
+    day_counts: Counter,
+    start_time: datetime,
+    tournament_id: UUID,
+    director_id: UUID,
+    team_ids: list[UUID],
+) -> None:
+    """
+    Book a match for the broadcast schedule, its director and its teams,
+    who also get their rest after it.
+
+    Args:
+        index (IntervalIndex): The booked intervals.
+        day_counts (Counter): The number of matches per tournament and day.
+        start_time (datetime): The start time of the match.
+        tournament_id (UUID): The ID of the match's tournament.
+        director_id (UUID): The ID of the tournament's director.
+        team_ids (list[UUID]): The IDs of the teams known so far.
+    """
+    end_time = start_time + MATCH_DURATION
+    index.add(BROADCAST, start_time, end_time)
+    index.add(("director", director_id), start_time, end_time)
+    for team_id in team_ids:
+        index.add(("team", team_id), start_time, end_time + TEAM_REST)
+    day_counts[(tournament_id, start_time.date())] += 1
+
+
+def _extend_end_date(db_tournament: Tournament, last_start_time: datetime) -> None:
+    """
+    Move the end date of a tournament to the day of its last match, if
+    the match was moved past it.
+
+    Args:
+        db_tournament (Tournament): The tournament object.
+        last_start_time (datetime): The start time of its last match.
+    """
+    last_day = last_start_time.replace(hour=23, minute=59, second=59, microsecond=0)
+    if to_naive_utc(db_tournament.end_date) < last_day:
+        db_tournament.end_date = last_day
+
+
+@event_bus.subscribe(TournamentRescheduled)
+def notify_tournament_rescheduled(event: TournamentRescheduled) -> None:
+    """
+    Email the director of a tournament whose matches were moved.
+
+    Args:
+        event (TournamentRescheduled): The event.
+    """
+    send_email_notification(
+        email=event.director_email,
+        subject="Tournament Rescheduled",
+        message=f"{event.rescheduled_matches} matches of the "
+        f"'{event.tournament_title}' tournament have been rescheduled "
+        f"for the season.",
+    )
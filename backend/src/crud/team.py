@@ -1,15 +1,21 @@
-from typing import Literal
+from typing import Iterator, Literal
 from uuid import UUID
 
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, insert
+from sqlalchemy.orm import Session, sessionmaker
+from src.crud import (
+    tournament_standing as crud_tournament_standing,
+    tournament_view as crud_tournament_view,
+)
+from src.crud.constants import MAX_TEAM_PLAYERS
 from src.crud.convert_db_to_response import (
     convert_db_to_team_detailed_response,
     convert_db_to_team_list_response,
 )
 from src.models import Match, Player, Team, Tournament
 from src.models.enums import Stage
+from src.schemas.match import MatchResponse
 from src.schemas.team import (
     TeamCreate,
     TeamDetailedResponse,
@@ -17,10 +23,13 @@ from src.schemas.team import (
     TeamUpdate,
 )
 from src.schemas.user import UserResponse
-from src.utils import validators as v
+from src.utils import bulk_import, validators as v
+from src.utils.conflicts import unique_conflicts
+from src.utils.fields import Fields, wants
+from src.utils.loader_plan import loader_options
 from src.utils.pagination import PaginationParams
 from src.utils.s3 import s3_service
-from starlette.status import HTTP_400_BAD_REQUEST
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_409_CONFLICT
 
 
 def get_teams(
@@ -30,6 +39,8 @@ def get_teams(
     is_available: Literal["true", "false"] | None = None,
     has_space: Literal["true", "false"] | None = None,
     sort_by: Literal["asc", "desc"] = "asc",
+    include_emails: bool = True,
+    fields: Fields | None = None,
 ) -> list[TeamListResponse]:
     """
     Retrieve a list of teams with optional filters and sorting.
@@ -41,6 +52,10 @@ def get_teams(
         is_available (Literal["true", "false"] | None): Filter teams by availability.
         has_space (Literal["true", "false"] | None): Filter teams by player space.
         sort_by (Literal["asc", "desc"]): Sort order for the teams.
+        include_emails (bool): Whether the players come with their user's
+        email, without them the users are not loaded at all.
+        fields (Fields | None): The fields to return, None for every field.
+        Players are only loaded when they are returned.
 
     Returns:
         list[TeamListResponse]: A list of team responses.
@@ -55,42 +70,44 @@ def get_teams(
     elif is_available == "false":
         query = query.filter(Team.tournament_id.isnot(None))
 
-    db_results = query.all()
-
     if has_space:
         player_counts = (
             db.query(Player.team_id, func.count(Player.id).label("count"))
             .group_by(Player.team_id)
-            .all()
+            .subquery()
+        )
+        player_count = func.coalesce(player_counts.c.count, 0)
+        query = query.outerjoin(
+            player_counts, player_counts.c.team_id == Team.id
+        ).filter(
+            player_count < MAX_TEAM_PLAYERS
+            if has_space == "true"
+            else player_count >= MAX_TEAM_PLAYERS
         )
 
-        team_player_counts = dict(player_counts)
-
-        filtered_teams = []
-        for team in db_results:
-            player_count = team_player_counts.get(team.id, 0)
-
-            if has_space == "true" and player_count < 10:
-                filtered_teams.append(team)
-            elif has_space == "false" and player_count >= 10:
-                filtered_teams.append(team)
-
-        db_results = filtered_teams
+    if not wants(fields, "players"):
+        without = ("players",)
+    elif not (include_emails and wants(fields, "players.user_email")):
+        without = ("players.user",)
+    else:
+        without = ()
 
-    sorted_teams = sorted(
-        db_results,
-        key=lambda team: (
-            team.won_games / team.played_games if team.played_games > 0 else 0
-        ),
-        reverse=(sort_by == "desc"),
+    win_ratio = case(
+        (Team.played_games > 0, Team.won_games / Team.played_games), else_=0
+    )
+    db_teams = (
+        query.options(*loader_options(Team, TeamListResponse, without))
+        .order_by(win_ratio.desc() if sort_by == "desc" else win_ratio.asc(), Team.name)
+        .offset(pagination.offset)
+        .limit(pagination.limit)
+        .all()
     )
 
-    sorted_teams = sorted_teams[
-        pagination.offset : pagination.offset + pagination.limit
+    return [
+        convert_db_to_team_list_response(team, include_emails, fields)
+        for team in db_teams
     ]
 
-    return [convert_db_to_team_list_response(team) for team in sorted_teams]
-
 
 def create_team(
     db: Session, team: TeamCreate, logo: UploadFile | None, current_user: UserResponse
@@ -109,37 +126,174 @@ def create_team(
     """
     v.director_or_admin(current_user)
 
-    v.team_name_unique(db, team_name=team.name)
+    db_team = Team(name=team.name)
 
-    logo_url = None
-    if logo is not None:
-        logo_url = s3_service.upload_file(logo, "teams")
+    # The logo is uploaded once the name is known to be free
+    with unique_conflicts(db, lambda: v.team_name_unique(db, team_name=team.name)):
+        db.add(db_team)
+        db.flush()
 
-    db_team = Team(
-        name=team.name,
-        logo=logo_url,
-    )
+    if logo is not None:
+        db_team.logo = s3_service.upload_file(logo, "teams")
 
-    db.add(db_team)
     db.commit()
     db.refresh(db_team)
 
     return convert_db_to_team_list_response(db_team)
 
 
-def get_team(db: Session, team_id: UUID) -> TeamDetailedResponse:
+def import_teams(
+    session_factory: sessionmaker,
+    content: bytes,
+    filename: str | None,
+    content_type: str | None,
+    current_user: UserResponse,
+) -> Iterator[str]:
+    """
+    Import teams from a CSV or NDJSON file with a name per row.
+
+    Names are checked for uniqueness with one query per batch and the
+    teams are inserted in a single transaction, nothing is imported if
+    any row is rejected.
+
+    Args:
+        session_factory (sessionmaker): Creates the import's session.
+        content (bytes): The content of the uploaded file.
+        filename (str | None): The name of the uploaded file.
+        content_type (str | None): The content type of the uploaded file.
+        current_user (UserResponse): The current user importing the teams.
+
+    Returns:
+        Iterator[str]: The NDJSON progress and error events of the import.
+    """
+    v.director_or_admin(current_user)
+    file_format = bulk_import.get_file_format(filename, content_type)
+    seen_names = set()
+
+    def check_batch(
+        db: Session, batch: list[tuple[int, TeamCreate]]
+    ) -> tuple[list[dict], dict[int, str]]:
+        errors = bulk_import.duplicates_in_batch(
+            batch, lambda team: team.name, seen_names
+        )
+        existing_names = {
+            name
+            for (name,) in db.query(Team.name).filter(
+                Team.name.in_([team.name for _, team in batch])
+            )
+        }
+
+        records = []
+        for number, team in batch:
+            if number in errors:
+                continue
+            if team.name in existing_names:
+                errors[number] = f"Team '{team.name}' already exists"
+                continue
+            records.append({"name": team.name})
+
+        return records, errors
+
+    return bulk_import.stream_import(
+        session_factory,
+        lambda db: bulk_import.import_rows(
+            db,
+            bulk_import.read_rows(content, file_format),
+            TeamCreate,
+            Team,
+            check_batch,
+        ),
+    )
+
+
+def get_team(
+    db: Session, team_id: UUID, fields: Fields | None = None
+) -> TeamDetailedResponse:
     """
     Retrieve detailed information about a team, including statistics.
 
     Args:
         db (Session): The database session.
         team_id (UUID): The ID of the team to retrieve.
+        fields (Fields | None): The fields to return, None for every field.
 
     Returns:
         TeamDetailedResponse: The detailed response of the team.
     """
     db_team = v.team_exists(db, team_id=team_id)
 
+    matches = (
+        db.query(Match)
+        .filter((Match.team1_id == team_id) | (Match.team2_id == team_id))
+        .all()
+    )
+
+    return convert_db_to_team_detailed_response(
+        db_team, matches, _get_team_stats(db_team, matches), fields
+    )
+
+
+def get_teams_by_ids(
+    db: Session, team_ids: list[UUID], fields: Fields | None = None
+) -> list[TeamDetailedResponse]:
+    """
+    Retrieve the details of several teams at once, with one query for the
+    teams and one for all of their matches, whatever the number of teams.
+
+    Args:
+        db (Session): The database session.
+        team_ids (list[UUID]): The IDs of the teams to retrieve.
+        fields (Fields | None): The fields to return, None for every field.
+
+    Returns:
+        list[TeamDetailedResponse]: The detailed responses of the teams, in
+        the order of their IDs.
+
+    Raises:
+        HTTPException: If any of the teams is not found.
+    """
+    without = [name for name in ("players", "prize_cuts") if not wants(fields, name)]
+    db_teams = v.all_exist(
+        db,
+        Team,
+        team_ids,
+        loader_options(Team, TeamDetailedResponse, without=without),
+    )
+
+    team_matches = {db_team.id: [] for db_team in db_teams}
+    for match in (
+        db.query(Match)
+        .options(*loader_options(Match, MatchResponse))
+        .filter(Match.team1_id.in_(team_matches) | Match.team2_id.in_(team_matches))
+        .order_by(Match.start_time)
+    ):
+        for team_id in (match.team1_id, match.team2_id):
+            if team_id in team_matches:
+                team_matches[team_id].append(match)
+
+    return [
+        convert_db_to_team_detailed_response(
+            db_team,
+            team_matches[db_team.id],
+            _get_team_stats(db_team, team_matches[db_team.id]),
+            fields,
+        )
+        for db_team in db_teams
+    ]
+
+
+def _get_team_stats(db_team: Team, matches: list[Match]) -> dict:
+    """
+    Compute the statistics of a team from its matches.
+
+    Args:
+        db_team (Team): The team.
+        matches (list[Match]): The matches the team played in.
+
+    Returns:
+        dict: The statistics of the team.
+    """
+    team_id = db_team.id
     stats = {
         "tournaments_played": 0,
         "tournaments_won": 0,
@@ -152,14 +306,8 @@ def get_team(db: Session, team_id: UUID) -> TeamDetailedResponse:
         "worst_opponent": None,
     }
 
-    matches = (
-        db.query(Match)
-        .filter((Match.team1_id == team_id) | (Match.team2_id == team_id))
-        .all()
-    )
-
     if not matches:
-        return convert_db_to_team_detailed_response(db_team, matches, stats)
+        return stats
 
     opponent_stats = {}
     tournaments_played = set()
@@ -231,7 +379,7 @@ def get_team(db: Session, team_id: UUID) -> TeamDetailedResponse:
         else "0%"
     )
 
-    return convert_db_to_team_detailed_response(db_team, matches, stats)
+    return stats
 
 
 def update_team(
@@ -258,8 +406,9 @@ def update_team(
     v.director_or_admin(current_user)
 
     if team.name:
-        v.team_name_unique(db, team_name=team.name)
         db_team.name = team.name
+        with unique_conflicts(db, lambda: v.team_name_unique(db, team_name=team.name)):
+            db.flush()
 
     if logo is not None:
         if db_team.logo:
@@ -268,6 +417,7 @@ def update_team(
         logo_url = s3_service.upload_file(logo, "teams")
         db_team.logo = logo_url
 
+    crud_tournament_view.refresh_team_views(db, db_team.id)
     db.commit()
     db.refresh(db_team)
 
@@ -287,35 +437,56 @@ def create_teams_lst_for_tournament(
         tournament_id (UUID): The ID of the tournament.
 
     Raises:
-        HTTPException: If a team already participates in another tournament.
+        HTTPException: If a team already participates in another tournament,
+        or joins one while the teams are being added.
     """
-    teams = []
-    for name in team_names:
-        db_team = db.query(Team).filter(Team.name == name).first()
-
-        if db_team is None:
-            v.team_name_unique(db, team_name=name)
-            new_team = Team(name=name)
-            db.add(new_team)
-            db.flush()
-            teams.append(new_team)
-        else:
-            if db_team.tournament_id is not None:
-                raise HTTPException(
-                    status_code=HTTP_400_BAD_REQUEST,
-                    detail=f"Team '{db_team.name}' already "
-                    f"participates in another tournament",
-                )
-
-            teams.append(db_team)
+    db_teams = (
+        db.query(Team.id, Team.name, Team.tournament_id)
+        .filter(Team.name.in_(team_names))
+        .all()
+    )
 
-    for db_team in teams:
-        db_team.tournament_id = tournament_id
+    for db_team in db_teams:
+        if db_team.tournament_id is not None:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=f"Team '{db_team.name}' already "
+                f"participates in another tournament",
+            )
+
+    # New teams are created in the tournament with one multi-row INSERT
+    existing_names = {db_team.name for db_team in db_teams}
+    new_teams = [
+        {"name": name, "tournament_id": tournament_id}
+        for name in team_names
+        if name not in existing_names
+    ]
+    if new_teams:
+        db.execute(insert(Team), new_teams)
+
+    # Existing teams join with one UPDATE, which only takes teams that are
+    # still free, in case another tournament claimed one in the meantime
+    if db_teams:
+        assigned = (
+            db.query(Team)
+            .filter(
+                Team.id.in_([db_team.id for db_team in db_teams]),
+                Team.tournament_id.is_(None),
+            )
+            .update({Team.tournament_id: tournament_id})
+        )
+        if assigned != len(db_teams):
+            raise HTTPException(
+                status_code=HTTP_409_CONFLICT,
+                detail="A team joined another tournament at the same time, "
+                "please try again",
+            )
 
 
 def leave_top_teams_from_robin_round(db, db_tournament: Tournament) -> None:
     """
     Retain the top two teams from a round-robin tournament and remove the rest.
+    The ordering is read from the incrementally maintained standings.
 
     Args:
         db (Session): The database session.
@@ -324,41 +495,12 @@ def leave_top_teams_from_robin_round(db, db_tournament: Tournament) -> None:
     Returns:
         None
     """
-    team_stats = {}
-    for team in db_tournament.teams:
-        team_stats[team] = {
-            "points": 0,
-            "wins": 0,
-            "score_difference": 0,
-            "total_score": 0,
-        }
-
-    for match in db_tournament.matches:
-        team1 = match.team1
-        team2 = match.team2
-
-        team_stats[team1]["total_score"] += match.team1_score
-        team_stats[team2]["total_score"] += match.team2_score
-
-        team_stats[team1]["score_difference"] += match.team1_score - match.team2_score
-        team_stats[team2]["score_difference"] += match.team2_score - match.team1_score
-
-        winner = team1 if match.winner_team_id == team1.id else team2
-        team_stats[winner]["points"] += 2
-        team_stats[winner]["wins"] += 1
-
-    sorted_teams = sorted(
-        team_stats.keys(),
-        key=lambda t: (
-            team_stats[t]["points"],
-            team_stats[t]["wins"],
-            team_stats[t]["score_difference"],
-            team_stats[t]["total_score"],
-        ),
-        reverse=True,
+    top_team_ids = set(
+        crud_tournament_standing.get_ordered_team_ids(db, db_tournament)[:2]
     )
 
-    for team in sorted_teams[2:]:
-        team.tournament_id = None
+    for team in db_tournament.teams:
+        if team.id not in top_team_ids:
+            team.tournament_id = None
 
     db.flush()
@@ -4,19 +4,18 @@ from typing import Literal
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Subquery, and_, case, func, or_
+from sqlalchemy.orm import Session, raiseload
 from src.crud import (
+    bracket as crud_bracket,
     constants as c,
     match as crud_match,
     prize_cut as crud_prize_cut,
     team as crud_team,
+    tournament_view as crud_tournament_view,
 )
-from src.crud.convert_db_to_response import (
-    convert_db_to_tournament_list_response,
-    convert_db_to_tournament_response,
-)
-from src.models import Tournament
+from src.crud.convert_db_to_response import convert_db_to_tournament_list_response
+from src.models import Match, Team, Tournament
 from src.models.enums import Role, Stage, TournamentFormat
 from src.schemas.tournament import (
     TournamentCreate,
@@ -26,9 +25,14 @@ from src.schemas.tournament import (
 )
 from src.schemas.user import UserResponse
 from src.utils import validators as v
+from src.utils.bracket import first_stage
+from src.utils.conflicts import unique_conflicts
 from src.utils.pagination import PaginationParams
 from starlette.status import HTTP_400_BAD_REQUEST
 
+# Latest first, the ID keeps pages stable between tournaments starting together
+TOURNAMENT_ORDER = (Tournament.start_date.desc(), Tournament.id)
+
 
 def get_tournaments(
     db: Session,
@@ -57,8 +61,6 @@ def get_tournaments(
     Returns:
         list[TournamentListResponse]: A list of tournament responses.
     """
-    query = db.query(Tournament)
-
     filters = []
     filters.extend(_get_period_filter(period))
     filters.extend(_get_status_filter(status))
@@ -66,22 +68,104 @@ def get_tournaments(
     filters.extend(_get_search_filter(search))
     filters.extend(_get_author_filter(author_id))
 
+    # Tournaments are paginated on their own, and only the tournaments of
+    # the page have their matches and teams counted
+    page = db.query(Tournament.id)
     if filters:
-        query = query.filter(*filters)
-    else:
-        query = query.options(joinedload(Tournament.matches))
-
-    query = query.order_by(Tournament.start_date.desc())
-    query = query.offset(pagination.offset).limit(pagination.limit)
-
-    db_tournaments = query.all()
+        page = page.filter(*filters)
+    page = (
+        page.order_by(*TOURNAMENT_ORDER)
+        .offset(pagination.offset)
+        .limit(pagination.limit)
+        .subquery()
+    )
+
+    match_stats = _get_match_stats(db, page)
+    team_stats = _get_team_stats(db, page)
+
+    rows = (
+        db.query(
+            Tournament,
+            func.coalesce(team_stats.c.number_of_teams, 0),
+            func.coalesce(match_stats.c.number_of_matches, 0),
+            func.coalesce(match_stats.c.finished_matches, 0),
+            match_stats.c.next_match_time,
+        )
+        .join(page, page.c.id == Tournament.id)
+        .outerjoin(match_stats, match_stats.c.tournament_id == Tournament.id)
+        .outerjoin(team_stats, team_stats.c.tournament_id == Tournament.id)
+        # The list needs none of the relationships, loading one is a bug
+        .options(raiseload("*"))
+        .order_by(*TOURNAMENT_ORDER)
+        .all()
+    )
 
     return [
-        convert_db_to_tournament_list_response(db_tournament)
-        for db_tournament in db_tournaments
+        convert_db_to_tournament_list_response(
+            db_tournament,
+            number_of_teams,
+            number_of_matches,
+            finished_matches,
+            next_match_time,
+        )
+        for (
+            db_tournament,
+            number_of_teams,
+            number_of_matches,
+            finished_matches,
+            next_match_time,
+        ) in rows
     ]
 
 
+def _get_match_stats(db: Session, page: Subquery) -> Subquery:
+    """
+    Count the matches of a page of tournaments and find their next match.
+
+    Args:
+        db (Session): The database session.
+        page (Subquery): The IDs of the tournaments of the page.
+
+    Returns:
+        Subquery: The number of matches, the number of finished matches and
+        the start time of the first unfinished match, per tournament.
+    """
+    return (
+        db.query(
+            Match.tournament_id,
+            func.count(Match.id).label("number_of_matches"),
+            func.count(case((Match.is_finished.is_(True), Match.id))).label(
+                "finished_matches"
+            ),
+            func.min(case((Match.is_finished.is_(False), Match.start_time))).label(
+                "next_match_time"
+            ),
+        )
+        .join(page, page.c.id == Match.tournament_id)
+        .group_by(Match.tournament_id)
+        .subquery()
+    )
+
+
+def _get_team_stats(db: Session, page: Subquery) -> Subquery:
+    """
+    Count the teams of a page of tournaments.
+
+    Args:
+        db (Session): The database session.
+        page (Subquery): The IDs of the tournaments of the page.
+
+    Returns:
+        Subquery: The number of teams per tournament.
+    """
+    return (
+        db.query(Team.tournament_id, func.count(Team.id).label("number_of_teams"))
+        .join(page, page.c.id == Team.tournament_id)
+        .group_by(Team.tournament_id)
+        .subquery()
+    )
+
+
 def _get_period_filter(period: Literal["past", "present", "future"] | None) -> list:
     """
     Generate a filter for tournaments based on the specified period.
@@ -189,27 +273,18 @@ def _get_author_filter(author_id: UUID | None) -> list:
     return [Tournament.director_id == author_id]
 
 
-def get_tournament(db: Session, tournament_id: UUID) -> TournamentListResponse:
+def get_tournament(db: Session, tournament_id: UUID) -> TournamentDetailResponse:
     """
-    Retrieve a tournament by its ID and gather its participants.
+    Retrieve a tournament by its ID from its precomputed view.
 
     Args:
         db (Session): The database session.
         tournament_id (UUID): The ID of the tournament to retrieve.
 
     Returns:
-        TournamentListResponse: The detailed response of the tournament.
+        TournamentDetailResponse: The detailed response of the tournament.
     """
-    db_tournament = v.tournament_exists(db, tournament_id)
-
-    participants = []
-    for db_match in db_tournament.matches:
-        if db_match.team1_id not in participants:
-            participants.append(db_match.team1)
-        if db_match.team2_id not in participants:
-            participants.append(db_match.team2)
-
-    return convert_db_to_tournament_response(db_tournament)
+    return crud_tournament_view.get_tournament_view(db, tournament_id)
 
 
 def create_tournament(
@@ -232,9 +307,13 @@ def create_tournament(
 
         # Validating the tournament data
         v.unique_teams_in_tournament(tournament.team_names)
-        v.tournament_title_unique(db, tournament.title)
         v.director_or_admin(current_user)
         v.validate_start_date(tournament.start_date)
+        payout = crud_prize_cut.get_payout_template(
+            tournament.payout, tournament.prize_amounts
+        )
+        v.payout_within_prize_pool(payout, tournament.prize_pool)
+        v.payout_places_within_teams(payout, len(tournament.team_names))
         tournament.start_date = tournament.start_date.replace(
             hour=11, minute=0, second=0, microsecond=0, tzinfo=timezone.utc
         )
@@ -264,11 +343,14 @@ def create_tournament(
             director_id=current_user.id,
         )
 
-        db.add(db_tournament)
-        db.flush()
+        with unique_conflicts(
+            db, lambda: v.tournament_title_unique(db, tournament.title)
+        ):
+            db.add(db_tournament)
+            db.flush()
 
         crud_prize_cut.create_prize_cuts_for_tournament(
-            db, db_tournament, db_tournament.prize_pool
+            db, db_tournament, db_tournament.prize_pool, payout
         )
         crud_team.create_teams_lst_for_tournament(
             db, tournament.team_names, db_tournament.id
@@ -277,7 +359,8 @@ def create_tournament(
         db.flush()
 
         crud_match.generate_matches(db, db_tournament)
-        tournament = convert_db_to_tournament_response(db_tournament)
+        db_view = crud_tournament_view.refresh_view(db, db_tournament)
+        tournament = TournamentDetailResponse.model_validate(db_view.payload)
         db.commit()
 
         return tournament
@@ -311,13 +394,11 @@ def _get_tournament_current_stage(
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST,
                 detail="Invalid number of teams for single elimination "
-                "- must be 4, 8 or 16",
+                f"- must be between {c.SINGLE_ELIMINATION_TEAMS.start} "
+                f"and {c.SINGLE_ELIMINATION_TEAMS.stop - 1}",
             )
 
-        if number_of_teams == 4:
-            return Stage.SEMI_FINAL
-        elif number_of_teams == 8:
-            return Stage.QUARTER_FINAL
+        return first_stage(number_of_teams)
 
     elif tournament_format == TournamentFormat.ROUND_ROBIN:
         if number_of_teams not in c.ROUND_ROBIN_TEAMS:
@@ -358,6 +439,8 @@ def _calculate_tournament_end_date(
     if tournament_format == TournamentFormat.ROUND_ROBIN:
         total_matches = total_teams * (total_teams - 1) // 2
         required_days = math.ceil((total_matches - 1) / c.MAX_MATCHES_PER_DAY) + 1
+    elif tournament_format == TournamentFormat.SINGLE_ELIMINATION:
+        required_days = crud_bracket.get_bracket_days(start_date, total_teams)
     else:
         required_days = c.STAGE_DAYS[current_stage]
 
@@ -406,27 +489,62 @@ def update_tournament(
                 raise HTTPException(
                     status_code=HTTP_400_BAD_REQUEST, detail="Title must not be empty"
                 )
-            v.tournament_title_unique(db, tournament.title)
             db_tournament.title = tournament.title
+            with unique_conflicts(
+                db, lambda: v.tournament_title_unique(db, tournament.title)
+            ):
+                db.flush()
 
         if tournament.end_date is not None:
             v.validate_old_vs_new_end_date(db_tournament.end_date, tournament.end_date)
             db_tournament.end_date = tournament.end_date
 
-        if tournament.prize_pool is not None:
-            crud_prize_cut.delete_prize_cuts_for_tournament(db, db_tournament)
-            db_tournament.prize_pool = tournament.prize_pool
+        if (
+            tournament.prize_pool is not None
+            or tournament.payout is not None
+            or tournament.prize_amounts is not None
+        ):
+            # A new prize pool alone keeps the split of the current prizes
+            payout = crud_prize_cut.get_payout_template(
+                tournament.payout, tournament.prize_amounts, db_tournament
+            )
+            prize_pool = tournament.prize_pool or db_tournament.prize_pool
+            v.payout_within_prize_pool(payout, prize_pool)
+            v.payout_places_within_teams(payout, _count_teams(db_tournament))
 
-        if tournament.prize_pool:
+            crud_prize_cut.delete_prize_cuts_for_tournament(db, db_tournament)
+            db_tournament.prize_pool = prize_pool
             crud_prize_cut.create_prize_cuts_for_tournament(
-                db, db_tournament, int(tournament.prize_pool)
+                db, db_tournament, prize_pool, payout
             )
 
+        # The title and the prizes show up all over the view
+        db_view = crud_tournament_view.refresh_view(db, db_tournament)
+        tournament = TournamentDetailResponse.model_validate(db_view.payload)
         db.commit()
-        db.refresh(db_tournament)
 
-        return convert_db_to_tournament_response(db_tournament)
+        return tournament
 
     except Exception as e:
         db.rollback()
         raise e
+
+
+def _count_teams(db_tournament: Tournament) -> int:
+    """
+    Count the teams of a tournament, including the ones already knocked out.
+
+    Eliminated teams leave the tournament, so they are counted from the
+    matches they played.
+
+    Args:
+        db_tournament (Tournament): The tournament object.
+
+    Returns:
+        int: The number of teams.
+    """
+    team_ids = {team.id for team in db_tournament.teams}
+    for match in db_tournament.matches:
+        team_ids.update((match.team1_id, match.team2_id))
+
+    return len(team_ids)
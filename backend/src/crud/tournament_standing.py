@@ -0,0 +1,296 @@
+from uuid import UUID
+
+from sqlalchemy import exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from src.models import Match, Team, Tournament, TournamentStanding
+from src.models.enums import Stage, TournamentFormat
+from src.schemas.tournament_standing import TournamentStandingResponse
+from src.utils import validators as v
+
+# Points, then wins, then score difference, then total score decide the place
+STANDING_ORDER = (
+    TournamentStanding.points.desc(),
+    TournamentStanding.wins.desc(),
+    TournamentStanding.score_difference.desc(),
+    TournamentStanding.total_score.desc(),
+    Team.name,
+)
+
+
+def get_standings(db: Session, tournament_id: UUID) -> list[TournamentStandingResponse]:
+    """
+    Retrieve the round-robin group table of a tournament.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The ID of the tournament.
+
+    Returns:
+        list[TournamentStandingResponse]: The standings ordered by place,
+        empty for single elimination tournaments.
+    """
+    db_tournament = v.tournament_exists(db, tournament_id)
+    if _ensure_standings(db, db_tournament):
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another request built the standings at the same time
+            db.rollback()
+
+    rows = (
+        db.query(TournamentStanding, Team.name, Team.logo)
+        .join(Team, Team.id == TournamentStanding.team_id)
+        .filter(TournamentStanding.tournament_id == tournament_id)
+        .order_by(*STANDING_ORDER)
+        .all()
+    )
+
+    return [
+        TournamentStandingResponse(
+            place=place,
+            team_id=standing.team_id,
+            team_name=team_name,
+            team_logo=team_logo,
+            played_games=standing.played_games,
+            wins=standing.wins,
+            losses=standing.losses,
+            points=standing.points,
+            score_difference=standing.score_difference,
+            total_score=standing.total_score,
+        )
+        for place, (standing, team_name, team_logo) in enumerate(rows, start=1)
+    ]
+
+
+def get_ordered_team_ids(db: Session, db_tournament: Tournament) -> list[UUID]:
+    """
+    Retrieve the IDs of the teams in a round-robin group, best placed first.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+
+    Returns:
+        list[UUID]: The ordered team IDs.
+    """
+    _ensure_standings(db, db_tournament)
+
+    rows = (
+        db.query(TournamentStanding.team_id)
+        .join(Team, Team.id == TournamentStanding.team_id)
+        .filter(TournamentStanding.tournament_id == db_tournament.id)
+        .order_by(*STANDING_ORDER)
+        .all()
+    )
+
+    return [team_id for (team_id,) in rows]
+
+
+def create_standings(db: Session, db_tournament: Tournament) -> None:
+    """
+    Create an empty standing row for every team of a round-robin group.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+
+    Returns:
+        None
+    """
+    db.add_all(
+        TournamentStanding(tournament_id=db_tournament.id, team_id=team.id)
+        for team in db_tournament.teams
+    )
+
+
+def record_match_result(db: Session, db_match: Match) -> None:
+    """
+    Add the result of a finished group stage match to the standings.
+
+    The counters are incremented in the database, so concurrent results
+    of different matches never overwrite each other.
+
+    Args:
+        db (Session): The database session.
+        db_match (Match): The finished match object.
+
+    Returns:
+        None
+    """
+    if not _has_standings(db, db_match.tournament_id):
+        # The match is already flushed as finished, so it is counted here
+        rebuild_standings(db, db_match.tournament_id)
+        return
+
+    for team_id, scored, conceded in (
+        (db_match.team1_id, db_match.team1_score, db_match.team2_score),
+        (db_match.team2_id, db_match.team2_score, db_match.team1_score),
+    ):
+        won = int(team_id == db_match.winner_team_id)
+        updated = (
+            db.query(TournamentStanding)
+            .filter(
+                TournamentStanding.tournament_id == db_match.tournament_id,
+                TournamentStanding.team_id == team_id,
+            )
+            .update(
+                {
+                    TournamentStanding.played_games: TournamentStanding.played_games
+                    + 1,
+                    TournamentStanding.wins: TournamentStanding.wins + won,
+                    TournamentStanding.losses: TournamentStanding.losses + 1 - won,
+                    TournamentStanding.points: TournamentStanding.points + 2 * won,
+                    TournamentStanding.score_difference: (
+                        TournamentStanding.score_difference + scored - conceded
+                    ),
+                    TournamentStanding.total_score: TournamentStanding.total_score
+                    + scored,
+                },
+                synchronize_session=False,
+            )
+        )
+
+        # A team swapped into the group after the standings were created
+        if not updated:
+            db.add(
+                TournamentStanding(
+                    tournament_id=db_match.tournament_id,
+                    team_id=team_id,
+                    played_games=1,
+                    wins=won,
+                    losses=1 - won,
+                    points=2 * won,
+                    score_difference=scored - conceded,
+                    total_score=scored,
+                )
+            )
+
+    db.flush()
+
+
+def replace_team(
+    db: Session, tournament_id: UUID, old_team_id: UUID, new_team_id: UUID
+) -> None:
+    """
+    Hand the standing row of a team that left the group over to its replacement.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The ID of the tournament.
+        old_team_id (UUID): The ID of the team that left.
+        new_team_id (UUID): The ID of the team that joined.
+
+    Returns:
+        None
+    """
+    query = db.query(TournamentStanding).filter(
+        TournamentStanding.tournament_id == tournament_id
+    )
+    if query.filter(TournamentStanding.team_id == new_team_id).first() is None:
+        query.filter(TournamentStanding.team_id == old_team_id).update(
+            {TournamentStanding.team_id: new_team_id}, synchronize_session=False
+        )
+
+
+def rebuild_standings(db: Session, tournament_id: UUID) -> None:
+    """
+    Recompute the standings of a tournament from its finished group stage
+    matches, e.g. for a group that started before the standings existed.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The ID of the tournament.
+
+    Returns:
+        None
+    """
+    db.query(TournamentStanding).filter(
+        TournamentStanding.tournament_id == tournament_id
+    ).delete(synchronize_session=False)
+
+    group_matches = (
+        db.query(
+            Match.team1_id,
+            Match.team2_id,
+            Match.team1_score,
+            Match.team2_score,
+            Match.winner_team_id,
+            Match.is_finished,
+        )
+        .filter(
+            Match.tournament_id == tournament_id,
+            Match.stage == Stage.GROUP_STAGE,
+        )
+        .all()
+    )
+
+    standings = {}
+    for match in group_matches:
+        for team_id, scored, conceded in (
+            (match.team1_id, match.team1_score, match.team2_score),
+            (match.team2_id, match.team2_score, match.team1_score),
+        ):
+            standing = standings.setdefault(
+                team_id,
+                TournamentStanding(
+                    tournament_id=tournament_id,
+                    team_id=team_id,
+                    played_games=0,
+                    wins=0,
+                    losses=0,
+                    points=0,
+                    score_difference=0,
+                    total_score=0,
+                ),
+            )
+            if not match.is_finished:
+                continue
+
+            won = int(team_id == match.winner_team_id)
+            standing.played_games += 1
+            standing.wins += won
+            standing.losses += 1 - won
+            standing.points += 2 * won
+            standing.score_difference += scored - conceded
+            standing.total_score += scored
+
+    db.add_all(standings.values())
+    db.flush()
+
+
+def _has_standings(db: Session, tournament_id: UUID) -> bool:
+    """
+    Check whether the standings of a tournament have been created.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The ID of the tournament.
+
+    Returns:
+        bool: True if at least one standing row exists.
+    """
+    return db.query(
+        exists().where(TournamentStanding.tournament_id == tournament_id)
+    ).scalar()
+
+
+def _ensure_standings(db: Session, db_tournament: Tournament) -> bool:
+    """
+    Rebuild the standings of a round-robin tournament that has none yet.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+
+    Returns:
+        bool: True if the standings were rebuilt and need to be committed.
+    """
+    if db_tournament.tournament_format != TournamentFormat.ROUND_ROBIN:
+        return False
+
+    if _has_standings(db, db_tournament.id):
+        return False
+
+    rebuild_standings(db, db_tournament.id)
+    return True
@@ -0,0 +1,356 @@
+from datetime import datetime
+import json
+from typing import Any, Callable
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import JSON, Text, cast, func, or_
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, array
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.exc import StaleDataError
+from src.crud.convert_db_to_response import (
+    convert_db_to_match_list_response,
+    convert_db_to_prize_cut_response,
+    convert_db_to_team_list_response,
+)
+from src.models import Match, PrizeCut, Team, Tournament, TournamentView
+from src.schemas.team import TeamListResponse
+from src.schemas.tournament import TournamentBaseResponse, TournamentDetailResponse
+from src.utils import validators as v
+from src.utils.loader_plan import loader_options
+from src.utils.scheduling import to_naive_utc
+
+# Bumped whenever the layout of the payload changes, older views are rebuilt
+SCHEMA_VERSION = 1
+
+# The sections of a view, rebuilt separately
+SUMMARY = "summary"
+MATCHES = "matches"
+TEAMS = "teams"
+PRIZES = "prizes"
+
+
+def get_tournament_view(db: Session, tournament_id: UUID) -> TournamentDetailResponse:
+    """
+    Retrieve the detail response of a tournament from its view.
+
+    A tournament without an up to date view, e.g. one created before
+    views existed, gets its view built and stored on the first read.
+
+    Args:
+        db (Session): The database session.
+        tournament_id (UUID): The ID of the tournament.
+
+    Returns:
+        TournamentDetailResponse: The detailed response of the tournament.
+    """
+    db_view = db.get(TournamentView, tournament_id)
+    if db_view is not None and db_view.schema_version == SCHEMA_VERSION:
+        return TournamentDetailResponse.model_validate(db_view.payload)
+
+    db_tournament = v.tournament_exists(db, tournament_id)
+    payload = refresh_view(db, db_tournament).payload
+    try:
+        db.commit()
+    except (IntegrityError, StaleDataError):
+        # Another request built the view at the same time
+        db.rollback()
+
+    return TournamentDetailResponse.model_validate(payload)
+
+
+def refresh_view(
+    db: Session, db_tournament: Tournament, *sections: str
+) -> TournamentView:
+    """
+    Rebuild sections of the view of a tournament, creating the view if
+    there is none yet.
+
+    The view row is locked and read again first, so concurrent rebuilds of
+    the same tournament wait for each other and build on the committed
+    view instead of failing on its version.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+        *sections (str): The sections to rebuild, all of them if none
+        are given or the view is out of date.
+
+    Returns:
+        TournamentView: The refreshed view.
+    """
+    # The sections are read with queries, which have to see pending changes
+    db.flush()
+
+    db_view = (
+        db.query(TournamentView)
+        .filter(TournamentView.id == db_tournament.id)
+        .with_for_update()
+        .populate_existing()
+        .one_or_none()
+    )
+    if db_view is None:
+        db_view = TournamentView(id=db_tournament.id, payload={})
+        db.add(db_view)
+
+    if not sections or db_view.schema_version != SCHEMA_VERSION:
+        sections = tuple(SECTION_BUILDERS)
+
+    payload = dict(db_view.payload)
+    for section in sections:
+        payload.update(SECTION_BUILDERS[section](db, db_tournament))
+
+    db_view.payload = payload
+    db_view.schema_version = SCHEMA_VERSION
+
+    return db_view
+
+
+def refresh_view_match(db: Session, db_match: Match) -> None:
+    """
+    Replace a match in the view of its tournament, e.g. after its score
+    changed, without rebuilding the other matches.
+
+    Args:
+        db (Session): The database session.
+        db_match (Match): The match object.
+    """
+    db_tournament = db_match.tournament
+    if db_match.stage != db_tournament.current_stage:
+        return
+
+    _replace_entry(
+        db,
+        db_tournament,
+        MATCHES,
+        "matches_of_current_stage",
+        _to_json(convert_db_to_match_list_response(db_match)),
+    )
+
+
+def refresh_view_team(db: Session, db_team: Team | None) -> None:
+    """
+    Replace a team in the view of its tournament, e.g. after one of its
+    players changed, without rebuilding the other teams.
+
+    Args:
+        db (Session): The database session.
+        db_team (Team | None): The team object, None for players
+        without a team.
+    """
+    if db_team is None or db_team.tournament is None:
+        return
+
+    # Players join and leave by their team ID, so the team's are reloaded
+    db.flush()
+    db.expire(db_team, ["players"])
+
+    _replace_entry(
+        db,
+        db_team.tournament,
+        TEAMS,
+        "teams",
+        _to_json(convert_db_to_team_list_response(db_team)),
+    )
+
+
+def refresh_team_views(db: Session, team_id: UUID) -> None:
+    """
+    Rebuild the views of every tournament showing a team, after its name
+    or logo changed.
+
+    Args:
+        db (Session): The database session.
+        team_id (UUID): The ID of the team.
+    """
+    tournament_ids = {
+        tournament_id
+        for query in (
+            db.query(Team.tournament_id).filter(Team.id == team_id),
+            db.query(Match.tournament_id).filter(
+                or_(Match.team1_id == team_id, Match.team2_id == team_id)
+            ),
+            db.query(PrizeCut.tournament_id).filter(PrizeCut.team_id == team_id),
+        )
+        for (tournament_id,) in query.distinct()
+        if tournament_id is not None
+    }
+    if not tournament_ids:
+        return
+
+    for db_tournament in db.query(Tournament).filter(Tournament.id.in_(tournament_ids)):
+        refresh_view(db, db_tournament)
+
+
+def _replace_entry(
+    db: Session, db_tournament: Tournament, section: str, key: str, entry: dict
+) -> None:
+    """
+    Replace the entry with the same ID in a list of a view, rebuilding the
+    section if the entry is not in it yet.
+
+    The entry is patched in place by a single UPDATE rather than by
+    rewriting the payload, so that concurrent updates of different
+    entries, e.g. the scores of different matches, do not conflict.
+
+    Args:
+        db (Session): The database session.
+        db_tournament (Tournament): The tournament object.
+        section (str): The section the list belongs to.
+        key (str): The key of the list in the payload.
+        entry (dict): The JSON of the new entry.
+    """
+    db_view = db.get(TournamentView, db_tournament.id)
+    if db_view is None or db_view.schema_version != SCHEMA_VERSION:
+        refresh_view(db, db_tournament)
+        return
+
+    entries = db_view.payload[key]
+    positions = [i for i, old in enumerate(entries) if old["id"] == entry["id"]]
+    if not positions:
+        refresh_view(db, db_tournament, section)
+        return
+
+    # Changes of the view made in this session go first
+    db.flush()
+
+    path = (key, positions[0])
+    patched = (
+        db.query(TournamentView)
+        .filter(
+            TournamentView.id == db_tournament.id,
+            TournamentView.payload[(*path, "id")].as_string() == entry["id"],
+        )
+        .update(
+            {
+                TournamentView.payload: _json_set(
+                    db, TournamentView.payload, path, entry
+                ),
+                # Rebuilding a section still conflicts with the patch
+                TournamentView.version_id: TournamentView.version_id + 1,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.expire(db_view)
+
+    if not patched:
+        # The section was rebuilt with the entry moved in the meantime
+        refresh_view(db, db_tournament, section)
+
+
+def _json_set(db: Session, column: Any, path: tuple, value: dict) -> Any:
+    """
+    Build the SQL setting a value in a JSON column.
+
+    Args:
+        db (Session): The database session.
+        column (Any): The JSON column.
+        path (tuple): The keys and list indexes leading to the value.
+        value (dict): The JSON of the value.
+
+    Returns:
+        Any: The SQL expression of the updated JSON.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        json_path = "$" + "".join(
+            f"[{step}]" if isinstance(step, int) else f".{step}" for step in path
+        )
+        return func.json_set(column, json_path, func.json(json.dumps(value)))
+
+    return cast(
+        func.jsonb_set(
+            cast(column, JSONB),
+            cast(array([str(step) for step in path]), ARRAY(Text)),
+            cast(value, JSONB),
+        ),
+        JSON,
+    )
+
+
+def _build_summary(db: Session, db_tournament: Tournament) -> dict:
+    summary = _to_json(TournamentBaseResponse.model_validate(db_tournament))
+    del summary["number_of_teams"]
+    return summary
+
+
+def _build_matches(db: Session, db_tournament: Tournament) -> dict:
+    db_matches = (
+        db.query(Match)
+        .options(joinedload(Match.team1), joinedload(Match.team2))
+        .filter(
+            Match.tournament_id == db_tournament.id,
+            Match.stage == db_tournament.current_stage,
+        )
+        .order_by(Match.start_time, Match.id)
+        .all()
+    )
+
+    return {
+        "matches_of_current_stage": [
+            _to_json(convert_db_to_match_list_response(db_match))
+            for db_match in db_matches
+        ]
+    }
+
+
+def _build_teams(db: Session, db_tournament: Tournament) -> dict:
+    db_teams = (
+        db.query(Team)
+        .options(*loader_options(Team, TeamListResponse))
+        .filter(Team.tournament_id == db_tournament.id)
+        .order_by(Team.name)
+        .all()
+    )
+
+    return {
+        "number_of_teams": len(db_teams),
+        "teams": [
+            _to_json(convert_db_to_team_list_response(db_team)) for db_team in db_teams
+        ],
+    }
+
+
+def _build_prizes(db: Session, db_tournament: Tournament) -> dict:
+    db_prizes = (
+        db.query(PrizeCut)
+        .options(joinedload(PrizeCut.team))
+        .filter(PrizeCut.tournament_id == db_tournament.id)
+        .order_by(PrizeCut.place)
+        .all()
+    )
+
+    return {
+        "prizes": [
+            _to_json(convert_db_to_prize_cut_response(db_prize))
+            for db_prize in db_prizes
+        ]
+    }
+
+
+SECTION_BUILDERS: dict[str, Callable[[Session, Tournament], dict]] = {
+    SUMMARY: _build_summary,
+    MATCHES: _build_matches,
+    TEAMS: _build_teams,
+    PRIZES: _build_prizes,
+}
+
+
+def _to_json(response: BaseModel) -> dict:
+    """
+    Encode a response for a view, with its dates in naive UTC like the
+    database returns them, whether or not the object was just created.
+
+    Args:
+        response (BaseModel): The response.
+
+    Returns:
+        dict: The JSON of the response.
+    """
+    dates = {
+        name: to_naive_utc(value)
+        for name, value in response
+        if isinstance(value, datetime)
+    }
+    return response.model_copy(update=dates).model_dump(mode="json")
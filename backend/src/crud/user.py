@@ -3,8 +3,11 @@ from typing import Type
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from src.core.security import get_password_hash
+from src.crud import tournament_view as crud_tournament_view
 from src.models.user import User
 from src.schemas.user import UserCreate, UserResponse
+from src.utils.conflicts import unique_conflicts
+from src.utils.events import UserEmailChanged, UserRegistered, event_bus, publish
 from src.utils.notifications import send_email_notification
 from src.utils.validators import user_email_exists
 
@@ -20,21 +23,17 @@ def create_user(user: UserCreate, db: Session) -> User:
     Returns:
         User: The created user object.
     """
-    user_email_exists(db, user.email)
     hashed_password = get_password_hash(user.password)
     db_user = User(
         email=user.email,
         password_hash=hashed_password,
     )
-    db.add(db_user)
-    db.commit()
+    with unique_conflicts(db, lambda: user_email_exists(db, user.email)):
+        db.add(db_user)
+        publish(db, UserRegistered(email=user.email))
+        db.commit()
     db.refresh(db_user)
 
-    send_email_notification(
-        email=user.email,
-        subject="Account Created",
-        message=f"Your account has been created with email {user.email}",
-    )
     return db_user
 
 
@@ -72,27 +71,52 @@ def update_email(db: Session, email: str, current_user: User) -> dict:
     Returns:
         dict: A message indicating the email update was successful.
     """
-    user_email_exists(db, email)
     user = db.query(User).filter(User.id == current_user.id).first()
     old_email = user.email
 
     user.email = email
-    db.commit()
+    publish(db, UserEmailChanged(old_email=old_email, new_email=email))
+    # Refreshing the view flushes the new email, which may already be taken
+    with unique_conflicts(db, lambda: user_email_exists(db, email)):
+        if user.player is not None:
+            crud_tournament_view.refresh_view_team(db, user.player.team)
+        db.commit()
     db.refresh(user)
 
-    send_email_notification(
-        email=old_email,
-        subject="Email Updated",
-        message=f"Your email has been changed from {old_email} to {email}",
-    )
-
-    send_email_notification(
-        email=email,
-        subject="Email Updated",
-        message=f"Your email has been changed from {old_email} to {email}",
-    )
     return {"message": "Email updated successfully."}
 
 
 def convert_db_to_user_response(user: User) -> UserResponse:
     return UserResponse(id=user.id, email=user.email, role=user.role)
+
+
+@event_bus.subscribe(UserRegistered)
+def notify_user_registered(event: UserRegistered) -> None:
+    """
+    Email a new user that their account was created.
+
+    Args:
+        event (UserRegistered): The event.
+    """
+    send_email_notification(
+        email=event.email,
+        subject="Account Created",
+        message=f"Your account has been created with email {event.email}",
+    )
+
+
+@event_bus.subscribe(UserEmailChanged)
+def notify_user_email_changed(event: UserEmailChanged) -> None:
+    """
+    Email both the old and the new address of a user about the change.
+
+    Args:
+        event (UserEmailChanged): The event.
+    """
+    for email in (event.old_email, event.new_email):
+        send_email_notification(
+            email=email,
+            subject="Email Updated",
+            message=f"Your email has been changed "
+            f"from {event.old_email} to {event.new_email}",
+        )
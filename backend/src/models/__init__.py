@@ -1,19 +1,27 @@
 from src.models.base import Base
+from src.models.bracket_node import BracketNode
+from src.models.idempotency_key import IdempotencyKey
 from src.models.match import Match
 from src.models.player import Player
 from src.models.prize_cut import PrizeCut
 from src.models.request import Request
 from src.models.team import Team
 from src.models.tournament import Tournament
+from src.models.tournament_standing import TournamentStanding
+from src.models.tournament_view import TournamentView
 from src.models.user import User
 
 __all__ = [
     "Base",
+    "BracketNode",
+    "IdempotencyKey",
     "Match",
     "Player",
     "PrizeCut",
     "Request",
     "Team",
     "Tournament",
+    "TournamentStanding",
+    "TournamentView",
     "User",
 ]
@@ -0,0 +1,63 @@
+from sqlalchemy import (
+    UUID,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import relationship
+from src.models.base import Base, BaseMixin
+from src.models.enums import Stage
+
+
+class BracketNode(Base, BaseMixin):
+    """
+    Database model representing "bracketnode" table in the database.
+    UUID and table name are inherited from BaseMixin.
+
+    Holds one match of a single elimination bracket. The whole bracket is
+    created with the tournament, and the winner of every match is moved
+    into the node it leads to. The node's match is created as soon as both
+    of its teams are known.
+
+    Attributes:
+        round_number (int): The round of the match, 0 for the first round.
+        position (int): The position of the match within its round.
+        stage (Stage): The stage of the round.
+        start_time (datetime): The scheduled start time of the match.
+        team1_id (UUID): The ID of the first team, None until it is known.
+        team2_id (UUID): The ID of the second team, None until it is known.
+        match_id (UUID): The ID of the match, None until both teams are known.
+        next_node_id (UUID): The ID of the node the winner moves on to,
+        None for the final.
+        tournament_id (UUID): The ID of the associated tournament.
+        tournament (Tournament): The associated tournament object.
+        version_id (int): Incremented on every update, so that both semi
+        finals finishing at once cannot each miss the other's winner.
+    """
+
+    round_number = Column(Integer, nullable=False)
+    position = Column(Integer, nullable=False)
+    stage = Column(Enum(Stage), nullable=False)
+    start_time = Column(DateTime, nullable=False)
+
+    team1_id = Column(UUID(as_uuid=True), ForeignKey("team.id"), nullable=True)
+    team2_id = Column(UUID(as_uuid=True), ForeignKey("team.id"), nullable=True)
+    match_id = Column(
+        UUID(as_uuid=True), ForeignKey("match.id"), nullable=True, unique=True
+    )
+    next_node_id = Column(
+        UUID(as_uuid=True), ForeignKey("bracketnode.id"), nullable=True
+    )
+
+    tournament_id = Column(
+        UUID(as_uuid=True), ForeignKey("tournament.id"), nullable=False
+    )
+    tournament = relationship("Tournament", back_populates="bracket_nodes")
+
+    version_id = Column(Integer, nullable=False, server_default="1")
+
+    __table_args__ = (UniqueConstraint("tournament_id", "round_number", "position"),)
+    __mapper_args__ = {"version_id_col": version_id}
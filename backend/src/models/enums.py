@@ -14,6 +14,9 @@ class MatchFormat(str, Enum):
 
 class Stage(str, Enum):
     GROUP_STAGE = "group stage"  # For Round Robin - MR12
+    ROUND_OF_64 = "round of 64"  # For Single Elimination - MR15
+    ROUND_OF_32 = "round of 32"  # For Single Elimination - MR15
+    ROUND_OF_16 = "round of 16"  # For Single Elimination - MR15
     QUARTER_FINAL = "quarter final"  # For Single Elimination - MR15
     SEMI_FINAL = "semi final"  # For Single Elimination - MR15
     FINAL = "final"  # For all formats - MR15
@@ -23,6 +26,15 @@ class Stage(str, Enum):
         if self == Stage.GROUP_STAGE:
             return Stage.FINAL
 
+        if self == Stage.ROUND_OF_64:
+            return Stage.ROUND_OF_32
+
+        if self == Stage.ROUND_OF_32:
+            return Stage.ROUND_OF_16
+
+        if self == Stage.ROUND_OF_16:
+            return Stage.QUARTER_FINAL
+
         if self == Stage.QUARTER_FINAL:
             return Stage.SEMI_FINAL
 
@@ -51,3 +63,10 @@ class RequestStatus(str, Enum):
 class RequestType(str, Enum):
     LINK_USER_TO_PLAYER = "link user to player"
     PROMOTE_USER_TO_DIRECTOR = "promote user to director"
+
+
+class Payout(str, Enum):
+    WINNER_TAKES_ALL = "winner takes all"
+    TOP_TWO = "top two"
+    TOP_THREE = "top three"
+    TOP_FOUR = "top four"
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, String, Text, UniqueConstraint, func
+from src.models.base import Base, BaseMixin
+
+
+class IdempotencyKey(Base, BaseMixin):
+    """
+    Database model representing "idempotencykey" table in the database.
+    UUID and table name are inherited from BaseMixin.
+
+    Attributes:
+        key (str): The value of the client's Idempotency-Key header.
+        scope (str): The user and the endpoint the key was used for.
+        fingerprint (str): The hash of the method, path, query and body of
+        the request the key was used for.
+        response (str): The JSON encoded response, stored in the
+        transaction of the request itself.
+        created_at (datetime): The date and time the key was first used.
+    """
+
+    key = Column(String(255), nullable=False)
+    scope = Column(String(255), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    response = Column(Text, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), default=func.now(), nullable=False, index=True
+    )
+
+    # A key can only be claimed once per user and endpoint
+    __table_args__ = (UniqueConstraint("scope", "key"),)
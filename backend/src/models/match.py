@@ -1,4 +1,13 @@
-from sqlalchemy import UUID, Boolean, Column, DateTime, Enum, ForeignKey, Integer
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+)
 from sqlalchemy.orm import relationship
 from src.models.base import Base, BaseMixin
 from src.models.enums import MatchFormat, Stage
@@ -20,6 +29,8 @@ class Match(Base, BaseMixin):
         team2_score (int): The score of the second team.
         winner_team_id (UUID): The ID of the winning team.
         tournament_id (UUID): The ID of the tournament.
+        version_id (int): Incremented on every update, so that concurrent
+        updates of the same match are detected instead of overwriting each other.
     """
 
     match_format = Column(Enum(MatchFormat), nullable=False)
@@ -49,3 +60,11 @@ class Match(Base, BaseMixin):
         UUID(as_uuid=True), ForeignKey("tournament.id"), nullable=False
     )
     tournament = relationship("Tournament", back_populates="matches")
+
+    version_id = Column(Integer, nullable=False, server_default="1")
+
+    # Serves the "does this tournament still have unfinished matches" check
+    __table_args__ = (
+        Index("ix_match_tournament_id_is_finished", "tournament_id", "is_finished"),
+    )
+    __mapper_args__ = {"version_id_col": version_id}
@@ -20,6 +20,7 @@ class Team(Base, BaseMixin):
         prize_cuts (list[PrizeCut]): The list of prize cuts associated with the team.
         tournament (Tournament): The associated tournament object.
         wins (list[Match]): The list of matches the team has won.
+        standings (list[TournamentStanding]): The team's round-robin group rows.
     """
 
     name = Column(String(45), nullable=False, unique=True)
@@ -44,3 +45,4 @@ class Team(Base, BaseMixin):
     wins = relationship(
         "Match", foreign_keys="[Match.winner_team_id]", back_populates="winner_team"
     )
+    standings = relationship("TournamentStanding", back_populates="team")
@@ -21,6 +21,9 @@ class Tournament(Base, BaseMixin):
         matches (list[Match]): The list of matches in the tournament.
         prize_cuts (list[PrizeCut]): The list of prize cuts in the tournament.
         teams (list[Team]): The list of teams in the tournament.
+        standings (list[TournamentStanding]): The round-robin group table.
+        bracket_nodes (list[BracketNode]): The single elimination bracket.
+        view (TournamentView): The precomputed detail response.
     """
 
     title = Column(String(45), unique=True, nullable=False)
@@ -36,3 +39,6 @@ class Tournament(Base, BaseMixin):
     matches = relationship("Match", back_populates="tournament")
     prize_cuts = relationship("PrizeCut", back_populates="tournament")
     teams = relationship("Team", back_populates="tournament")
+    standings = relationship("TournamentStanding", back_populates="tournament")
+    bracket_nodes = relationship("BracketNode", back_populates="tournament")
+    view = relationship("TournamentView", back_populates="tournament", uselist=False)
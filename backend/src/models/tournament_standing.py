@@ -0,0 +1,43 @@
+from sqlalchemy import UUID, Column, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import relationship
+from src.models.base import Base, BaseMixin
+
+
+class TournamentStanding(Base, BaseMixin):
+    """
+    Database model representing "tournamentstanding" table in the database.
+    UUID and table name are inherited from BaseMixin.
+
+    Holds the round-robin group table of a tournament, one row per team,
+    updated incrementally every time a group stage match finishes.
+
+    Attributes:
+        played_games (int): The number of group stage matches played.
+        wins (int): The number of group stage matches won.
+        losses (int): The number of group stage matches lost.
+        points (int): The number of points, two per win.
+        score_difference (int): The rounds won minus the rounds lost.
+        total_score (int): The total number of rounds won.
+        tournament_id (UUID): The ID of the associated tournament.
+        tournament (Tournament): The associated tournament object.
+        team_id (UUID): The ID of the associated team.
+        team (Team): The associated team object.
+    """
+
+    played_games = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    points = Column(Integer, nullable=False, default=0)
+    score_difference = Column(Integer, nullable=False, default=0)
+    total_score = Column(Integer, nullable=False, default=0)
+
+    tournament_id = Column(
+        UUID(as_uuid=True), ForeignKey("tournament.id"), nullable=False
+    )
+    tournament = relationship("Tournament", back_populates="standings")
+
+    team_id = Column(UUID(as_uuid=True), ForeignKey("team.id"), nullable=False)
+    team = relationship("Team", back_populates="standings")
+
+    # One row per team in a tournament, also used to look the rows up
+    __table_args__ = (UniqueConstraint("tournament_id", "team_id"),)
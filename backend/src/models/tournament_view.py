@@ -0,0 +1,39 @@
+from sqlalchemy import JSON, UUID, Column, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+from src.models.base import Base, BaseMixin
+
+
+class TournamentView(Base, BaseMixin):
+    """
+    Database model representing "tournamentview" table in the database.
+    The table name is inherited from BaseMixin, the ID is the ID of the
+    tournament, so that a view is read with a single primary key lookup.
+
+    Holds the detail page of a tournament as ready-made JSON, rebuilt
+    section by section as its matches, teams and prizes change.
+
+    Attributes:
+        payload (dict): The JSON of the tournament's detail response.
+        schema_version (int): The version of the payload's layout, a view
+        built for another layout is rebuilt when it is read.
+        tournament (Tournament): The associated tournament object.
+        version_id (int): Incremented on every update, so that concurrent
+        rebuilds of different sections cannot overwrite each other. Single
+        entries, e.g. the score of a match, are patched in place without
+        checking it.
+    """
+
+    id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("tournament.id"),
+        primary_key=True,
+        nullable=False,
+    )
+    payload = Column(JSON, nullable=False)
+    schema_version = Column(Integer, nullable=False)
+
+    tournament = relationship("Tournament", back_populates="view")
+
+    version_id = Column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version_id}
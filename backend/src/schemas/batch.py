@@ -0,0 +1,9 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+from src.crud.constants import MAX_BATCH_SIZE
+
+
+# Batch schemas
+class BatchGetRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
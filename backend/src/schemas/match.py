@@ -1,8 +1,10 @@
 from datetime import datetime
+from typing import ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel
 from src.models.enums import MatchFormat, Stage
+from src.utils.loader_plan import LoaderPlan
 
 
 # Base configs
@@ -29,6 +31,13 @@ class MatchResponse(BaseConfig):
     tournament_id: UUID
     tournament_title: str
 
+    # Relationships read by the converters, loaded up front by the queries
+    loader_plan: ClassVar[LoaderPlan] = {
+        "team1": None,
+        "team2": None,
+        "tournament": None,
+    }
+
 
 class MatchUpdate(BaseConfig):
     start_time: datetime | None = None
@@ -1,6 +1,8 @@
+from typing import ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
+from src.utils.loader_plan import LoaderPlan
 
 
 # Base configs
@@ -18,6 +20,9 @@ class PlayerBaseResponse(BaseConfig):
     team_name: str | None = None
     avatar: str | None
 
+    # Relationships read by the converters, loaded up front by the queries
+    loader_plan: ClassVar[LoaderPlan] = {"team": None, "user": None}
+
 
 # Player schemas
 class PlayerListResponse(PlayerBaseResponse):
@@ -29,6 +34,9 @@ class PlayerDetailResponse(PlayerListResponse):
     current_tournament_title: str | None
     current_tournament_id: UUID | None
 
+    # Relationships read by the converters, loaded up front by the queries
+    loader_plan: ClassVar[LoaderPlan] = {"team": {"tournament": None}, "user": None}
+
 
 class PlayerCreate(BaseConfig):
     username: str = Field(
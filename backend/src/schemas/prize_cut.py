@@ -1,6 +1,8 @@
+from typing import ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel
+from src.utils.loader_plan import LoaderPlan
 
 
 # Base configs
@@ -19,6 +21,9 @@ class PrizeCutResponse(BaseConfig):
     team_name: str | None
     team_logo: str | None
 
+    # Relationships read by the converters, loaded up front by the queries
+    loader_plan: ClassVar[LoaderPlan] = {"team": None, "tournament": None}
+
 
 class PrizeCutUpdate(BaseConfig):
     team_id: UUID
@@ -1,9 +1,11 @@
+from typing import ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 from src.schemas.match import MatchResponse
 from src.schemas.player import PlayerBaseResponse
 from src.schemas.prize_cut import PrizeCutResponse
+from src.utils.loader_plan import LoaderPlan
 
 
 # Base configs
@@ -19,6 +21,9 @@ class TeamListResponse(BaseConfig):
     game_win_ratio: str | None
     players: list[PlayerBaseResponse]
 
+    # Relationships read by the converters, loaded up front by the queries
+    loader_plan: ClassVar[LoaderPlan] = {"players": PlayerBaseResponse}
+
 
 class TeamDetailedResponse(BaseConfig):
     id: UUID
@@ -30,6 +35,12 @@ class TeamDetailedResponse(BaseConfig):
     prize_cuts: list["PrizeCutResponse"]
     team_stats: dict
 
+    # Relationships read by the converters, loaded up front by the queries
+    loader_plan: ClassVar[LoaderPlan] = {
+        "players": PlayerBaseResponse,
+        "prize_cuts": PrizeCutResponse,
+    }
+
 
 class TeamCreate(BaseConfig):
     name: str = Field(
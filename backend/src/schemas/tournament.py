@@ -2,8 +2,9 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveInt
 from src.models.enums import (
+    Payout,
     Stage,
     TournamentFormat,
 )
@@ -18,7 +19,7 @@ class BaseConfig(BaseModel):
 
 
 # Tournament schemas
-class TournamentListResponse(BaseConfig):
+class TournamentBaseResponse(BaseConfig):
     id: UUID
     title: str
     tournament_format: TournamentFormat
@@ -29,7 +30,13 @@ class TournamentListResponse(BaseConfig):
     director_id: UUID
 
 
-class TournamentDetailResponse(TournamentListResponse):
+class TournamentListResponse(TournamentBaseResponse):
+    number_of_matches: int = 0
+    finished_matches: int = 0
+    next_match_time: datetime | None = None
+
+
+class TournamentDetailResponse(TournamentBaseResponse):
     matches_of_current_stage: list[MatchResponse]
     teams: list[TeamListResponse]
     prizes: list["PrizeCutResponse"]
@@ -43,6 +50,10 @@ class TournamentCreate(BaseConfig):
     start_date: datetime
     team_names: List[str]
     prize_pool: int = Field(ge=1, examples=[1000])
+    payout: Payout = Payout.TOP_TWO
+    prize_amounts: list[PositiveInt] | None = Field(
+        default=None, min_length=1, examples=[[500, 300, 200]]
+    )
 
 
 class TournamentUpdate(BaseConfig):
@@ -51,3 +62,25 @@ class TournamentUpdate(BaseConfig):
     )
     end_date: datetime | None = None
     prize_pool: int | None = Field(default=None, ge=1, examples=[1000])
+    payout: Payout | None = None
+    prize_amounts: list[PositiveInt] | None = Field(
+        default=None, min_length=1, examples=[[500, 300, 200]]
+    )
+
+
+class SeasonSchedule(BaseConfig):
+    tournament_ids: list[UUID] = Field(min_length=1)
+    broadcast_slots: int | None = Field(default=None, ge=1, examples=[4])
+
+
+class RescheduledMatchResponse(BaseConfig):
+    id: UUID
+    tournament_id: UUID
+    stage: Stage
+    previous_start_time: datetime
+    start_time: datetime
+
+
+class SeasonScheduleResponse(BaseConfig):
+    scheduled_matches: int
+    rescheduled_matches: list[RescheduledMatchResponse]
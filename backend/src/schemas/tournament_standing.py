@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+# Base configs
+class BaseConfig(BaseModel):
+    model_config = {"from_attributes": True}
+
+
+# TournamentStanding schemas
+class TournamentStandingResponse(BaseConfig):
+    place: int
+    team_id: UUID
+    team_name: str
+    team_logo: str | None
+    played_games: int
+    wins: int
+    losses: int
+    points: int
+    score_difference: int
+    total_score: int
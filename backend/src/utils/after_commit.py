@@ -0,0 +1,83 @@
+from typing import Any, Callable
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import Session, SessionTransaction
+
+# The key of the pending hooks in `Session.info`
+HOOKS_KEY = "after_commit_hooks"
+
+
+def after_commit(db: Session, hook: Callable[..., Any], *args, **kwargs) -> None:
+    """
+    Run a side effect once the current transaction has committed, e.g. an
+    email about a match created while scoring. Slow calls then run after
+    the row locks of the transaction are released, and nothing is sent
+    about changes that end up rolled back.
+
+    Hooks run in the order they were added, and are dropped if the
+    transaction is rolled back. Without a transaction in progress the hook
+    runs right away. A session joined to a transaction of its connection
+    keeps its hooks until whoever owns that transaction has committed it
+    and calls `_run_hooks`. Arguments are taken as they are when the hook is
+    added, since the objects of the session are expired by the commit.
+
+    Args:
+        db (Session): The database session.
+        hook (Callable[..., Any]): The side effect to run.
+        *args: The positional arguments of the hook.
+        **kwargs: The keyword arguments of the hook.
+    """
+    if not db.in_transaction() and not _in_joined_transaction(db):
+        hook(*args, **kwargs)
+        return
+
+    db.info.setdefault(HOOKS_KEY, []).append((hook, args, kwargs))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_hooks(db: Session) -> None:
+    """
+    Run the hooks of the transaction that just committed.
+
+    Args:
+        db (Session): The database session.
+    """
+    if _in_joined_transaction(db):
+        # Only a savepoint was released, the changes are not committed yet
+        return
+
+    for hook, args, kwargs in db.info.pop(HOOKS_KEY, []):
+        # The data is committed already, a failing hook must not fail the request
+        try:
+            hook(*args, **kwargs)
+        except Exception as e:
+            print(f"Error running after commit hook: {e}")
+
+
+def _in_joined_transaction(db: Session) -> bool:
+    """
+    Check whether the session is joined to a transaction of its connection
+    that is still in progress.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        bool: True if the changes of the session are not committed yet.
+    """
+    bind = db.get_bind()
+    return isinstance(bind, Connection) and bind.in_transaction()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_hooks(db: Session, previous_transaction: SessionTransaction) -> None:
+    """
+    Drop the hooks of a transaction that was rolled back.
+
+    Args:
+        db (Session): The database session.
+        previous_transaction (SessionTransaction): The transaction that was
+        rolled back.
+    """
+    if previous_transaction.parent is None:
+        db.info.pop(HOOKS_KEY, None)
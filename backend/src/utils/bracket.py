@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from typing import Generic, Sequence, TypeVar
+
+from src.models.enums import Stage
+
+T = TypeVar("T")
+
+# The stage of a bracket round, by the number of teams entering it
+ROUND_STAGES = {
+    2: Stage.FINAL,
+    4: Stage.SEMI_FINAL,
+    8: Stage.QUARTER_FINAL,
+    16: Stage.ROUND_OF_16,
+    32: Stage.ROUND_OF_32,
+    64: Stage.ROUND_OF_64,
+}
+
+
+@dataclass
+class BracketSlot(Generic[T]):
+    """
+    A match of a single elimination bracket.
+
+    The winner of the match at a position moves on to the match at half
+    that position in the next round, as its first team from an even
+    position and as its second team from an odd one.
+
+    Attributes:
+        round_number (int): The round of the match, 0 for the first round.
+        position (int): The position of the match within its round.
+        stage (Stage): The stage of the round.
+        team1 (T | None): The first team, None until it is known.
+        team2 (T | None): The second team, None until it is known.
+    """
+
+    round_number: int
+    position: int
+    stage: Stage
+    team1: T | None = None
+    team2: T | None = None
+
+
+def bracket_size(team_count: int) -> int:
+    """
+    Get the number of places in a bracket, the smallest power of two that
+    fits all teams.
+
+    Args:
+        team_count (int): The number of teams.
+
+    Returns:
+        int: The number of places in the bracket.
+    """
+    return 1 << max(team_count - 1, 1).bit_length()
+
+
+def seed_order(size: int) -> list[int]:
+    """
+    Order the seeds of a bracket so that the higher seeds meet as late as
+    possible: 0 and 1 only in the final, 0 to 3 only in the semi finals,
+    and so on.
+
+    Args:
+        size (int): The number of places in the bracket, a power of two.
+
+    Returns:
+        list[int]: The seed at every place, 0 being the best seed.
+    """
+    order = [0]
+    while len(order) < size:
+        places = len(order) * 2
+        order = [seed for top in order for seed in (top, places - 1 - top)]
+
+    return order
+
+
+def first_stage(team_count: int) -> Stage:
+    """
+    Get the stage of the first round of a bracket.
+
+    Args:
+        team_count (int): The number of teams.
+
+    Returns:
+        Stage: The stage of the first round.
+    """
+    return ROUND_STAGES[bracket_size(team_count)]
+
+
+def plan_bracket(teams: Sequence[T]) -> list[list[BracketSlot[T]]]:
+    """
+    Lay out the whole bracket of a single elimination tournament.
+
+    Teams are placed by seed, best first. When the number of teams is not
+    a power of two, the best seeds get a bye: they skip the first round
+    and are placed straight into their second round match, so the first
+    round only holds the matches that are actually played.
+
+    Args:
+        teams (Sequence[T]): The teams, ordered by seed.
+
+    Returns:
+        list[list[BracketSlot[T]]]: The matches of every round, no rounds
+        with fewer than two teams.
+    """
+    if len(teams) < 2:
+        return []
+
+    size = bracket_size(len(teams))
+    rounds = []
+    teams_in_round = size
+    while teams_in_round > 1:
+        rounds.append(
+            [
+                BracketSlot(len(rounds), position, ROUND_STAGES[teams_in_round])
+                for position in range(teams_in_round // 2)
+            ]
+        )
+        teams_in_round //= 2
+
+    order = seed_order(size)
+    for slot in rounds[0]:
+        top, bottom = order[2 * slot.position], order[2 * slot.position + 1]
+        slot.team1 = teams[top]
+        if bottom < len(teams):
+            slot.team2 = teams[bottom]
+            continue
+
+        # The better seed is always on top, so only it can get a bye
+        winner_slot = rounds[1][slot.position // 2]
+        if slot.position % 2 == 0:
+            winner_slot.team1 = slot.team1
+        else:
+            winner_slot.team2 = slot.team1
+
+    rounds[0] = [slot for slot in rounds[0] if slot.team2 is not None]
+
+    return rounds
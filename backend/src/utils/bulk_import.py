@@ -0,0 +1,295 @@
+import csv
+import io
+import json
+import os
+from typing import Any, Callable, Iterable, Iterator
+import uuid
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.status import HTTP_400_BAD_REQUEST
+
+# Rows validated and inserted at a time, big enough to amortize the
+# uniqueness query and the COPY round trip
+IMPORT_BATCH_SIZE = 5000
+
+FILE_FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+# A row parsed from the uploaded file: its number and either
+# its fields or the reason it could not be parsed
+ParsedRow = tuple[int, dict | str]
+
+# Checks a batch of validated rows against the database and returns the
+# records to insert and the errors of the rejected rows, by row number
+BatchCheck = Callable[
+    [Session, list[tuple[int, BaseModel]]], tuple[list[dict], dict[int, str]]
+]
+
+
+def get_file_format(filename: str | None, content_type: str | None) -> str:
+    """
+    Determine the format of an uploaded import file.
+
+    Args:
+        filename (str | None): The name of the uploaded file.
+        content_type (str | None): The content type of the uploaded file.
+
+    Returns:
+        str: Either "csv" or "ndjson".
+
+    Raises:
+        HTTPException: If the file is neither CSV nor NDJSON.
+    """
+    extension = os.path.splitext(filename or "")[1].lower()
+    file_format = FILE_FORMATS.get(extension) or FILE_FORMATS.get(content_type)
+    if file_format is None:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="Unsupported file format. Upload a CSV or NDJSON file",
+        )
+
+    return file_format
+
+
+def read_rows(content: bytes, file_format: str) -> Iterator[ParsedRow]:
+    """
+    Parse the rows of a CSV file with a header line, or of an NDJSON file
+    with one JSON object per line. Empty CSV cells are left out, so that
+    optional fields fall back to their defaults.
+
+    Args:
+        content (bytes): The UTF-8 encoded file content.
+        file_format (str): Either "csv" or "ndjson".
+
+    Yields:
+        ParsedRow: The number of every row and its fields or parse error.
+    """
+    text = io.StringIO(content.decode("utf-8-sig", errors="replace"), newline="")
+
+    if file_format == "csv":
+        for number, row in enumerate(csv.DictReader(text), start=1):
+            yield number, {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key is not None and value
+            }
+        return
+
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+
+        number += 1
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, f"Invalid JSON: {e.msg}"
+            continue
+
+        if not isinstance(row, dict):
+            yield number, "Expected a JSON object"
+            continue
+
+        yield number, row
+
+
+def insert_records(db: Session, model: type, records: list[dict]) -> None:
+    """
+    Insert records in the current transaction, with COPY on PostgreSQL
+    and a single executemany INSERT elsewhere.
+
+    Args:
+        db (Session): The database session.
+        model (type): The model of the table to insert into.
+        records (list[dict]): The column values of every new row.
+    """
+    if not records:
+        return
+
+    if db.get_bind().dialect.name != "postgresql":
+        db.execute(insert(model.__table__), records)
+        return
+
+    # COPY skips the Python side column defaults, so fill them in here
+    defaults = {
+        column.key: column.default.arg
+        for column in model.__table__.columns
+        if column.default is not None and column.default.is_scalar
+    }
+    records = [{**defaults, **record} for record in records]
+    columns = list(records[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        writer.writerow(
+            None if record[column] is None else str(record[column])
+            for column in columns
+        )
+    buffer.seek(0)
+
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            f'COPY "{model.__tablename__}" ({", ".join(columns)}) '
+            f"FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+
+def import_rows(
+    db: Session,
+    rows: Iterable[ParsedRow],
+    schema: type[BaseModel],
+    model: type,
+    check_batch: BatchCheck,
+    before_commit: Callable[[Session], None] | None = None,
+) -> Iterator[dict]:
+    """
+    Validate and insert imported rows in batches, in a single transaction.
+
+    Every row is validated with the schema and every batch is checked
+    against the database by check_batch. The import is all or nothing:
+    after the first rejected row nothing more is inserted, the remaining
+    rows are only validated so that all errors are reported at once, and
+    the transaction is rolled back.
+
+    Args:
+        db (Session): The database session.
+        rows (Iterable[ParsedRow]): The parsed rows of the uploaded file.
+        schema (type[BaseModel]): The schema every row must match.
+        model (type): The model of the table to insert into.
+        check_batch (BatchCheck): Checks a batch of rows against the database.
+        before_commit (Callable[[Session], None], optional): Runs in the
+        import's transaction once every row is inserted.
+
+    Yields:
+        dict: An "error" event per rejected row, a "progress" event per
+        batch and a final "completed" or "failed" event.
+    """
+    summary = {"processed": 0, "imported": 0, "failed": 0}
+    batch = []
+
+    try:
+        for number, row in rows:
+            summary["processed"] += 1
+            validated = _validate(row, schema)
+            if isinstance(validated, str):
+                summary["failed"] += 1
+                yield {"event": "error", "row": number, "detail": validated}
+                continue
+
+            batch.append((number, validated))
+
+            if len(batch) == IMPORT_BATCH_SIZE:
+                yield from _flush(db, batch, model, check_batch, summary)
+
+        if batch:
+            yield from _flush(db, batch, model, check_batch, summary)
+    except Exception:
+        db.rollback()
+        raise
+
+    if summary["failed"]:
+        db.rollback()
+        yield {"event": "failed", **summary, "imported": 0}
+        return
+
+    try:
+        if before_commit is not None:
+            before_commit(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    yield {"event": "completed", **summary}
+
+
+def stream_import(
+    session_factory: sessionmaker, run: Callable[[Session], Iterator[dict]]
+) -> Iterator[str]:
+    """
+    Run an import in its own session and encode its events as NDJSON.
+
+    The request's session is closed before a streamed response is sent,
+    so the import cannot use it.
+
+    Args:
+        session_factory (sessionmaker): Creates the import's session.
+        run (Callable[[Session], Iterator[dict]]): Runs the import.
+
+    Yields:
+        str: One JSON encoded event per line.
+    """
+    with session_factory() as db:
+        for event in run(db):
+            yield json.dumps(event) + "\n"
+
+
+def duplicates_in_batch(
+    batch: list[tuple[int, Any]], key: Callable[[Any], str], seen: set[str]
+) -> dict[int, str]:
+    """
+    Find the rows of a batch repeating a value of an earlier row.
+
+    Args:
+        batch (list[tuple[int, Any]]): The numbered rows of the batch.
+        key (Callable[[Any], str]): Returns the value that must be unique.
+        seen (set[str]): The values of all earlier rows, updated in place.
+
+    Returns:
+        dict[int, str]: The error of every repeating row, by row number.
+    """
+    errors = {}
+    for number, row in batch:
+        value = key(row)
+        if value in seen:
+            errors[number] = f"'{value}' appears more than once in the file"
+        seen.add(value)
+
+    return errors
+
+
+def _flush(
+    db: Session,
+    batch: list[tuple[int, BaseModel]],
+    model: type,
+    check_batch: BatchCheck,
+    summary: dict,
+) -> Iterator[dict]:
+    records, errors = check_batch(db, batch)
+    for number in sorted(errors):
+        summary["failed"] += 1
+        yield {"event": "error", "row": number, "detail": errors[number]}
+
+    # Once a row is rejected the import is rolled back, stop inserting
+    if not summary["failed"]:
+        for record in records:
+            record.setdefault("id", uuid.uuid4())
+        insert_records(db, model, records)
+        summary["imported"] += len(records)
+
+    batch.clear()
+    yield {"event": "progress", **summary}
+
+
+def _validate(row: dict | str, schema: type[BaseModel]) -> BaseModel | str:
+    if isinstance(row, str):
+        return row
+
+    try:
+        return schema.model_validate(row)
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+            for detail in e.errors()
+        )
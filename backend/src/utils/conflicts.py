@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+@contextmanager
+def unique_conflicts(db: Session, *checks: Callable[[], None]) -> Iterator[None]:
+    """
+    Write unique values relying on the unique constraints of the database,
+    instead of querying for duplicates before writing. That takes one round
+    trip less and leaves no window for a concurrent request to write the
+    same value in between.
+
+    A flush or commit in the block that violates a constraint rolls the
+    session back, then the checks run to raise the HTTP error of the
+    duplicate. Only writes that conflict pay for the checks' queries.
+    Conflicts that none of the checks explains are raised as they are.
+
+    Args:
+        db (Session): The database session.
+        *checks (Callable[[], None]): The validators of the unique values
+        written, e.g. `lambda: v.team_name_unique(db, name)`.
+
+    Yields:
+        None
+
+    Raises:
+        HTTPException: If a check finds a duplicate.
+        IntegrityError: If no check explains the conflict.
+    """
+    try:
+        yield
+    except IntegrityError:
+        db.rollback()
+        for check in checks:
+            check()
+        raise
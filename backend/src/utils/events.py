@@ -0,0 +1,202 @@
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from threading import BoundedSemaphore
+from typing import Callable, TypeVar
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+from src.core.config import settings
+from src.models.enums import RequestStatus, RequestType, Stage
+from src.utils.after_commit import after_commit
+
+E = TypeVar("E")
+
+
+@dataclass(frozen=True)
+class ScoreChanged:
+    """A point was scored in a match."""
+
+    match_id: UUID
+    tournament_id: UUID
+    team1_score: int
+    team2_score: int
+
+
+@dataclass(frozen=True)
+class MatchFinished:
+    """A match was won."""
+
+    match_id: UUID
+    tournament_id: UUID
+    winner_team_id: UUID
+
+
+@dataclass(frozen=True)
+class MatchScheduled:
+    """A match was created, with the emails of the players of both teams."""
+
+    tournament_title: str
+    start_time: datetime
+    team1_name: str
+    team1_emails: tuple[str, ...]
+    team2_name: str
+    team2_emails: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class MatchRescheduled:
+    """A match was moved to another start time."""
+
+    match_id: UUID
+    director_email: str
+    previous_start_time: datetime
+    start_time: datetime
+
+
+@dataclass(frozen=True)
+class TeamReplaced:
+    """A team took another team's place in a match, with its players' emails."""
+
+    match_id: UUID
+    tournament_title: str
+    start_time: datetime
+    opponent_name: str
+    team_emails: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class TournamentStageAdvanced:
+    """A tournament moved on to its next stage."""
+
+    tournament_id: UUID
+    stage: Stage
+
+
+@dataclass(frozen=True)
+class TournamentRescheduled:
+    """Matches of a tournament were moved while scheduling a season."""
+
+    tournament_id: UUID
+    tournament_title: str
+    director_email: str
+    rescheduled_matches: int
+
+
+@dataclass(frozen=True)
+class RequestResolved:
+    """An admin accepted or rejected a request of a user."""
+
+    request_id: UUID
+    request_type: RequestType
+    status: RequestStatus
+    email: str
+    player_username: str | None = None
+
+
+@dataclass(frozen=True)
+class UserRegistered:
+    """A user created an account."""
+
+    email: str
+
+
+@dataclass(frozen=True)
+class UserEmailChanged:
+    """A user changed their email address."""
+
+    old_email: str
+    new_email: str
+
+
+class EventBus:
+    """
+    Dispatches domain events to their handlers once the transaction that
+    raised them has committed, so requests only wait for the database work.
+
+    Handlers run on a small pool of worker threads. At most `max_pending`
+    handler calls are queued or running, publishers of more are held back
+    until one finishes, so a slow mail server cannot pile up work without
+    bound. Events carry plain values only, handlers never share the session
+    of the request that raised them.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self._handlers: dict[type, list[Callable]] = defaultdict(list)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="events"
+        )
+        self._slots = BoundedSemaphore(max_pending)
+
+    def subscribe(self, event_type: type[E]) -> Callable:
+        """
+        Register the decorated function as a handler of an event type.
+
+        Args:
+            event_type (type[E]): The event type.
+
+        Returns:
+            Callable: The decorator, returning the handler as it is.
+        """
+
+        def decorator(handler: Callable[[E], None]) -> Callable[[E], None]:
+            self._handlers[event_type].append(handler)
+            return handler
+
+        return decorator
+
+    def publish(self, db: Session, event) -> None:
+        """
+        Dispatch an event once the current transaction has committed.
+        Events nobody handles are not queued at all.
+
+        Args:
+            db (Session): The database session.
+            event: The event.
+        """
+        if self._handlers.get(type(event)):
+            after_commit(db, self.dispatch, event)
+
+    def dispatch(self, event) -> None:
+        """
+        Hand an event to its handlers on the worker pool.
+
+        Args:
+            event: The event.
+        """
+        for handler in self._handlers.get(type(event), []):
+            self._slots.acquire()
+            future = self._executor.submit(handler, event)
+            future.add_done_callback(self._release)
+
+    def shutdown(self) -> None:
+        """Wait for the handlers in progress, e.g. when the app stops."""
+        self._executor.shutdown(wait=True)
+
+    def _release(self, future: Future) -> None:
+        """
+        Free the slot of a finished handler call and report its failure.
+
+        Args:
+            future (Future): The handler call.
+        """
+        self._slots.release()
+        if future.exception() is not None:
+            print(f"Error handling event: {future.exception()}")
+
+
+event_bus = EventBus(
+    max_workers=settings.EVENT_WORKERS, max_pending=settings.EVENT_MAX_PENDING
+)
+
+
+def publish(db: Session, event) -> None:
+    """
+    Publish an event on the app's event bus, see `EventBus.publish`.
+
+    Args:
+        db (Session): The database session.
+        event: The event.
+    """
+    event_bus.publish(db, event)
@@ -0,0 +1,130 @@
+from types import UnionType
+from typing import Any, Callable, Union, get_args, get_origin
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from starlette.status import HTTP_400_BAD_REQUEST
+
+# The fields of a response to serialize, in pydantic's include format
+Fields = dict[str, Any]
+
+
+def parse_fields(response: type[BaseModel], fields: str | None) -> Fields | None:
+    """
+    Parse a sparse fieldset, e.g. "id,name,players.username", into the
+    fields of a response to serialize.
+
+    Args:
+        response (type[BaseModel]): The response the fields belong to.
+        fields (str | None): Comma separated field names, nested fields of
+        nested responses joined with dots, None for every field.
+
+    Returns:
+        Fields | None: The fields to serialize, None for every field.
+
+    Raises:
+        HTTPException: If a field does not exist in the response.
+    """
+    if not fields:
+        return None
+
+    include: Fields = {}
+    for path in filter(None, (path.strip() for path in fields.split(","))):
+        model, node = response, include
+        *parents, name = path.split(".")
+        for parent in parents:
+            nested, is_list = _nested_response(_field_annotation(model, parent, path))
+            if nested is None:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail=f"Field '{parent}' in '{path}' has no nested fields",
+                )
+            if node.get(parent) is True:
+                break
+
+            child = node.setdefault(parent, {"__all__": {}} if is_list else {})
+            model, node = nested, child["__all__"] if is_list else child
+        else:
+            _field_annotation(model, name, path)
+            node[name] = True
+
+    return include
+
+
+def wants(fields: Fields | None, path: str) -> bool:
+    """
+    Check whether a field, e.g. "players" or "players.user_email", is
+    serialized, so that converters can skip the work for those that are not.
+
+    Args:
+        fields (Fields | None): The fields to serialize, None for every field.
+        path (str): The field, nested fields joined with dots.
+
+    Returns:
+        bool: Whether the field is serialized.
+    """
+    node = fields
+    for name in path.split("."):
+        if node is None or node is True:
+            return True
+        node = node.get("__all__", node).get(name)
+        if node is None:
+            return False
+
+    return True
+
+
+def sparse_fields(response: type[BaseModel]) -> Callable[..., Fields | None]:
+    """
+    Create a dependency reading the sparse fieldset of a response from the
+    `fields` query parameter.
+
+    Args:
+        response (type[BaseModel]): The response the fields belong to.
+
+    Returns:
+        Callable[..., Fields | None]: The dependency.
+    """
+
+    def get_fields(
+        fields: str | None = Query(
+            default=None,
+            description="Comma separated fields to return, e.g. id,name,players.id",
+        )
+    ) -> Fields | None:
+        return parse_fields(response, fields)
+
+    return get_fields
+
+
+def _field_annotation(model: type[BaseModel], name: str, path: str) -> Any:
+    if name not in model.model_fields:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field '{name}' in '{path}'",
+        )
+
+    return model.model_fields[name].annotation
+
+
+def _nested_response(annotation: Any) -> tuple[type[BaseModel] | None, bool]:
+    """
+    Find the response nested in a field, e.g. the player of `list[Player]`.
+
+    Args:
+        annotation (Any): The annotation of the field.
+
+    Returns:
+        tuple[type[BaseModel] | None, bool]: The nested response, None if the
+        field holds none, and whether the field is a list of them.
+    """
+    is_list = get_origin(annotation) is list
+    if is_list:
+        annotation = get_args(annotation)[0]
+    if get_origin(annotation) in (Union, UnionType):
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, is_list
+
+    return None, is_list
@@ -0,0 +1,333 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import threading
+from typing import Any, Callable
+import uuid
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from src.models import IdempotencyKey
+from src.utils.after_commit import _run_hooks
+from starlette.datastructures import UploadFile
+from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
+
+# Content types whose body is parsed as a form, e.g. for avatar uploads
+FORM_CONTENT_TYPES = ("multipart/form-data", "application/x-www-form-urlencoded")
+
+
+async def request_fingerprint(request: Request) -> str:
+    """
+    Hash the method, path, query and body of a request, so that a key
+    reused for a different request can be told apart from a retry.
+
+    Args:
+        request (Request): The request.
+
+    Returns:
+        str: The hex encoded SHA-256 digest of the request, empty for
+        requests sent without an Idempotency-Key.
+    """
+    if "idempotency-key" not in request.headers:
+        return ""
+
+    digest = hashlib.sha256(f"{request.method} {request.url.path}".encode())
+    for name, value in sorted(request.query_params.multi_items()):
+        digest.update(f"\0{name}={value}".encode())
+
+    digest.update(b"\0\0")
+    if request.headers.get("content-type", "").startswith(FORM_CONTENT_TYPES):
+        # The body stream is consumed by the form already parsed for the route
+        form = await request.form()
+        for name, value in sorted(form.multi_items(), key=lambda item: item[0]):
+            digest.update(f"\0{name}=".encode())
+            if isinstance(value, UploadFile):
+                digest.update(f"{value.filename}:".encode())
+                digest.update(await value.read())
+                await value.seek(0)
+            else:
+                digest.update(value.encode())
+    else:
+        digest.update(await request.body())
+
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Remembers the responses of mutating requests sent with an
+    Idempotency-Key header, so that a retried request returns the original
+    response instead of being applied again.
+
+    A key is stored with a fingerprint of its request, and reusing it for
+    a different request is rejected. The key and the response are stored
+    in the transaction of the operation, so a request is either applied
+    with its response remembered or not applied at all, even if the worker
+    dies halfway. Completed responses are kept in a small in-process LRU
+    cache in front of the idempotencykey table, which is shared by all
+    workers. Keys expire after TTL and expired rows are purged periodically.
+    """
+
+    TTL = timedelta(hours=24)
+    MAX_CACHED = 1024
+    PURGE_INTERVAL = timedelta(minutes=10)
+
+    def __init__(self):
+        self._cache: OrderedDict[tuple[str, str], tuple[datetime, str, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._last_purge = datetime.min.replace(tzinfo=timezone.utc)
+
+    def run(
+        self,
+        db: Session,
+        key: str | None,
+        scope: str,
+        fingerprint: str,
+        operation: Callable[[Session], Any],
+    ) -> Any:
+        """
+        Run a mutating operation at most once per key and scope.
+
+        Args:
+            db (Session): The database session.
+            key (str | None): The Idempotency-Key header, None to always run.
+            scope (str): The user and endpoint the key applies to.
+            fingerprint (str): The hash of the request, see
+            `request_fingerprint`.
+            operation (Callable[[Session], Any]): Performs the request with
+            the given session and returns its response.
+
+        Returns:
+            Any: The response of the operation, or the JSON encoded response
+            of the first request made with the same key.
+
+        Raises:
+            HTTPException: If the key was used for a different request.
+        """
+        if key is None:
+            return operation(db)
+
+        cached = self._get_cached(scope, key, fingerprint)
+        if cached is not None:
+            return cached
+
+        self._purge_expired(db)
+
+        db_key = self._get_stored(db, scope, key)
+        if db_key is not None:
+            return self._replay(scope, key, fingerprint, db_key)
+
+        try:
+            response, payload = self._run_once(db, key, scope, fingerprint, operation)
+        except IntegrityError:
+            # A concurrent request with the same key was committed first
+            db_key = self._get_stored(db, scope, key)
+            if db_key is None:
+                raise
+            return self._replay(scope, key, fingerprint, db_key)
+
+        self._put_cached(scope, key, fingerprint, payload)
+        return response
+
+    def _run_once(
+        self,
+        db: Session,
+        key: str,
+        scope: str,
+        fingerprint: str,
+        operation: Callable[[Session], Any],
+    ) -> tuple[Any, Any]:
+        """
+        Run the operation and store its key and response in one transaction.
+
+        The operation gets a session of its own, joined to that transaction:
+        its commits only release a savepoint, and its after commit hooks run
+        once the response is stored. A concurrent request with the same key
+        waits on the unique key until this transaction ends.
+
+        Args:
+            db (Session): The database session.
+            key (str): The Idempotency-Key header.
+            scope (str): The user and endpoint the key applies to.
+            fingerprint (str): The hash of the request.
+            operation (Callable[[Session], Any]): Performs the request.
+
+        Returns:
+            tuple[Any, Any]: The response and its JSON encoding.
+
+        Raises:
+            IntegrityError: If a concurrent request stored the key first.
+        """
+        with db.get_bind().connect() as connection:
+            transaction = connection.begin()
+            with Session(
+                bind=connection,
+                autoflush=False,
+                join_transaction_mode="create_savepoint",
+            ) as operation_db:
+                try:
+                    response, payload = self._store_response(
+                        operation_db, key, scope, fingerprint, operation
+                    )
+                    transaction.commit()
+                except Exception:
+                    # Failed requests store nothing, so the client can retry them
+                    transaction.rollback()
+                    raise
+
+                _run_hooks(operation_db)
+
+        return response, payload
+
+    def _store_response(
+        self,
+        db: Session,
+        key: str,
+        scope: str,
+        fingerprint: str,
+        operation: Callable[[Session], Any],
+    ) -> tuple[Any, Any]:
+        """
+        Claim the key, run the operation and store its response, without
+        committing the transaction they share.
+
+        Args:
+            db (Session): The session of the operation.
+            key (str): The Idempotency-Key header.
+            scope (str): The user and endpoint the key applies to.
+            fingerprint (str): The hash of the request.
+            operation (Callable[[Session], Any]): Performs the request.
+
+        Returns:
+            tuple[Any, Any]: The response and its JSON encoding.
+        """
+        # An expired key of the same request is replaced
+        db.query(IdempotencyKey).filter(
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.key == key,
+            IdempotencyKey.created_at < datetime.now(timezone.utc) - self.TTL,
+        ).delete(synchronize_session=False)
+
+        claim_id = uuid.uuid4()
+        db.add(
+            IdempotencyKey(id=claim_id, key=key, scope=scope, fingerprint=fingerprint)
+        )
+        db.commit()
+
+        response = operation(db)
+
+        payload = jsonable_encoder(response)
+        db.query(IdempotencyKey).filter(IdempotencyKey.id == claim_id).update(
+            {IdempotencyKey.response: json.dumps(payload)}
+        )
+        db.commit()
+
+        return response, payload
+
+    def _get_stored(self, db: Session, scope: str, key: str) -> IdempotencyKey | None:
+        """
+        Get the stored key of a completed request, unless it has expired.
+
+        Args:
+            db (Session): The database session.
+            scope (str): The user and endpoint the key applies to.
+            key (str): The Idempotency-Key header.
+
+        Returns:
+            IdempotencyKey | None: The stored key, None if there is none.
+        """
+        return (
+            db.query(IdempotencyKey)
+            .filter(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.created_at >= datetime.now(timezone.utc) - self.TTL,
+            )
+            .first()
+        )
+
+    def _replay(
+        self, scope: str, key: str, fingerprint: str, db_key: IdempotencyKey
+    ) -> Any:
+        """
+        Return the stored response of a completed request.
+
+        Args:
+            scope (str): The user and endpoint the key applies to.
+            key (str): The Idempotency-Key header.
+            fingerprint (str): The hash of the request.
+            db_key (IdempotencyKey): The stored key.
+
+        Returns:
+            Any: The JSON encoded response.
+
+        Raises:
+            HTTPException: If the key was used for a different request.
+        """
+        if db_key.fingerprint != fingerprint:
+            raise self._reused()
+
+        payload = json.loads(db_key.response)
+        self._put_cached(scope, key, fingerprint, payload)
+        return payload
+
+    def _get_cached(self, scope: str, key: str, fingerprint: str) -> Any | None:
+        with self._lock:
+            entry = self._cache.get((scope, key))
+            if entry is None:
+                return None
+
+            created_at, cached_fingerprint, payload = entry
+            if datetime.now(timezone.utc) - created_at > self.TTL:
+                del self._cache[(scope, key)]
+                return None
+
+            if cached_fingerprint != fingerprint:
+                raise self._reused()
+
+            self._cache.move_to_end((scope, key))
+            return payload
+
+    def _put_cached(self, scope: str, key: str, fingerprint: str, payload: Any) -> None:
+        with self._lock:
+            self._cache[(scope, key)] = (
+                datetime.now(timezone.utc),
+                fingerprint,
+                payload,
+            )
+            self._cache.move_to_end((scope, key))
+            while len(self._cache) > self.MAX_CACHED:
+                self._cache.popitem(last=False)
+
+    def _purge_expired(self, db: Session) -> None:
+        """
+        Delete expired keys, at most once per purge interval.
+
+        Args:
+            db (Session): The database session.
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            if now - self._last_purge < self.PURGE_INTERVAL:
+                return
+            self._last_purge = now
+
+        db.query(IdempotencyKey).filter(
+            IdempotencyKey.created_at < now - self.TTL
+        ).delete(synchronize_session=False)
+        db.commit()
+
+    @staticmethod
+    def _reused() -> HTTPException:
+        return HTTPException(
+            status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="This Idempotency-Key was already used for a different request",
+        )
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,63 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Hashable
+
+
+class IntervalIndex:
+    """
+    Half-open time intervals grouped by resource, e.g. a team, a director
+    or the broadcast schedule, answering "what overlaps this interval".
+
+    The intervals of every resource are kept sorted by start. Since no
+    interval is longer than the longest one added, only those starting
+    less than that length before a queried interval can overlap it, so a
+    query is a binary search plus the overlapping intervals, O(log n + k),
+    as with an interval tree. Match slots all have about the same length,
+    which keeps that window small.
+    """
+
+    def __init__(self):
+        self._starts: dict[Hashable, list[datetime]] = {}
+        self._ends: dict[Hashable, list[datetime]] = {}
+        self._longest = timedelta(0)
+
+    def add(self, resource: Hashable, start: datetime, end: datetime) -> None:
+        """
+        Add an interval of a resource.
+
+        Args:
+            resource (Hashable): The resource the interval is booked for.
+            start (datetime): The start of the interval.
+            end (datetime): The end of the interval, excluded.
+        """
+        starts = self._starts.setdefault(resource, [])
+        ends = self._ends.setdefault(resource, [])
+        position = bisect_left(starts, start)
+        starts.insert(position, start)
+        ends.insert(position, end)
+        self._longest = max(self._longest, end - start)
+
+    def count_overlaps(self, resource: Hashable, start: datetime, end: datetime) -> int:
+        """
+        Count the intervals of a resource overlapping the given interval.
+
+        Args:
+            resource (Hashable): The resource to check.
+            start (datetime): The start of the interval.
+            end (datetime): The end of the interval, excluded.
+
+        Returns:
+            int: The number of overlapping intervals.
+        """
+        starts = self._starts.get(resource)
+        if not starts:
+            return 0
+
+        ends = self._ends[resource]
+        first = bisect_left(starts, start - self._longest)
+        last = bisect_left(starts, end)
+
+        return sum(1 for i in range(first, last) if ends[i] > start)
+
+    def __len__(self) -> int:
+        return sum(len(starts) for starts in self._starts.values())
@@ -0,0 +1,70 @@
+from typing import Iterable, Union
+
+from pydantic import BaseModel
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+# Relationships a response reads, by name, each with the response its related
+# objects are converted to, the plan of what is read of them, or None if
+# only their columns are read
+LoaderPlan = dict[str, Union[type[BaseModel], "LoaderPlan", None]]
+
+
+def loader_options(
+    model: type,
+    response: type[BaseModel] | LoaderPlan,
+    without: Iterable[str] = (),
+    parent: str | None = None,
+) -> list[LoaderOption]:
+    """
+    Build the loader options a query needs so that converting its results
+    to a response lazy-loads nothing.
+
+    Every response declares the relationships it reads as its `loader_plan`,
+    nested responses declare their own, so the plan of a team list follows
+    on to its players. Each relationship is loaded with one SELECT ... IN
+    per level, whatever the number of objects. The way back to the parent,
+    e.g. the team of a team's players, is skipped: those objects are already
+    in the session, where a many-to-one lazy load finds them without a query.
+
+    Args:
+        model (type): The model the query returns.
+        response (type[BaseModel] | LoaderPlan): The response the results
+        are converted to, or a plan of their own.
+        without (Iterable[str]): Dotted paths of relationships the caller
+        does not read, e.g. "players.user", left out of the plan.
+        parent (str | None): The relationship back to the objects the model
+        is loaded from, when planning a nested response.
+
+    Returns:
+        list[LoaderOption]: The loader options of the query.
+    """
+    if isinstance(response, dict):
+        plan = response
+    else:
+        plan = getattr(response, "loader_plan", {})
+    without = set(without)
+    options = []
+    for name, nested in plan.items():
+        if name in without or name == parent:
+            continue
+
+        relationship = getattr(model, name)
+        option = selectinload(relationship)
+        if nested is not None:
+            nested_without = {
+                path.removeprefix(f"{name}.")
+                for path in without
+                if path.startswith(f"{name}.")
+            }
+            option = option.options(
+                *loader_options(
+                    relationship.property.mapper.class_,
+                    nested,
+                    nested_without,
+                    relationship.property.back_populates,
+                )
+            )
+        options.append(option)
+
+    return options
@@ -64,10 +64,11 @@ def send_email_notification(email: str, subject: str, message: str) -> None:
 
         msg.attach(MIMEText(html_message, "html"))
 
-        server = smtplib.SMTP("smtp.gmail.com", 587)
-        server.ehlo()
-        server.starttls()
+        server = smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT)
         server.ehlo()
+        if settings.SMTP_USE_TLS:
+            server.starttls()
+            server.ehlo()
         server.login(sender_email, password)
         server.sendmail(sender_email, email, msg.as_string())
         server.quit()
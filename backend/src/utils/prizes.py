@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from math import floor
+from typing import Sequence, TypeVar
+
+from src.models.enums import Payout
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PayoutTemplate:
+    """
+    How the prize pool of a tournament is split between its best teams.
+
+    Attributes:
+        payouts (tuple[float, ...]): The payout of every place, first place
+        first.
+        fixed (bool): Whether the payouts are amounts, otherwise they are
+        percentages of the prize pool.
+    """
+
+    payouts: tuple[float, ...]
+    fixed: bool = False
+
+    @classmethod
+    def from_amounts(cls, amounts: Sequence[float]) -> "PayoutTemplate":
+        """
+        Create the percentage template that splits a prize pool the way the
+        given amounts split theirs, e.g. to keep the payouts of a tournament
+        when its prize pool changes.
+
+        Args:
+            amounts (Sequence[float]): The amount of every place.
+
+        Returns:
+            PayoutTemplate: The template.
+        """
+        total = sum(amounts)
+        return cls(tuple(amount * 100 / total for amount in amounts))
+
+    def amounts(self, prize_pool: int) -> list[int]:
+        """
+        Compute the amount of every place. Percentages are rounded so that
+        the amounts still add up to the prize pool, the places whose share
+        lost the most to rounding down getting the remaining units.
+
+        Args:
+            prize_pool (int): The prize pool.
+
+        Returns:
+            list[int]: The amount of every place, first place first.
+        """
+        if self.fixed:
+            return [round(payout) for payout in self.payouts]
+
+        shares = [prize_pool * payout / 100 for payout in self.payouts]
+        amounts = [floor(share) for share in shares]
+        remainder = round(sum(shares)) - sum(amounts)
+        by_rounding = sorted(
+            range(len(shares)), key=lambda place: amounts[place] - shares[place]
+        )
+        for place in by_rounding[:remainder]:
+            amounts[place] += 1
+
+        return amounts
+
+    def total(self, prize_pool: int) -> int:
+        """
+        Compute the amount paid out over all places.
+
+        Args:
+            prize_pool (int): The prize pool.
+
+        Returns:
+            int: The total of the amounts.
+        """
+        return sum(self.amounts(prize_pool))
+
+
+# The percentage of the prize pool paid to every place
+PAYOUT_TEMPLATES = {
+    Payout.WINNER_TAKES_ALL: PayoutTemplate((100,)),
+    Payout.TOP_TWO: PayoutTemplate((70, 30)),
+    Payout.TOP_THREE: PayoutTemplate((50, 30, 20)),
+    Payout.TOP_FOUR: PayoutTemplate((40, 30, 20, 10)),
+}
+
+
+def rank_placements(
+    winner: T, runner_up: T, eliminated: Sequence[Sequence[T]], places: int
+) -> list[T]:
+    """
+    Rank the teams of a finished tournament, for as many places as are paid.
+
+    Args:
+        winner (T): The winner of the final.
+        runner_up (T): The loser of the final.
+        eliminated (Sequence[Sequence[T]]): The other teams, in groups
+        eliminated together, the group that went furthest first and every
+        group ordered best first, e.g. the semi final losers by how close
+        their matches were.
+        places (int): The number of places to rank.
+
+    Returns:
+        list[T]: The teams, first place first, at most `places` of them.
+    """
+    placements = [winner, runner_up]
+    for group in eliminated:
+        placements.extend(team for team in group if team not in placements)
+
+    return placements[:places]
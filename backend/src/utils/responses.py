@@ -0,0 +1,43 @@
+from typing import Any, Sequence
+
+from pydantic import BaseModel
+import pydantic_core
+from src.utils.fields import Fields
+from starlette.responses import Response
+
+
+class ModelResponse(Response):
+    """
+    A JSON response for response models that are already built.
+
+    FastAPI validates whatever an endpoint returns against its
+    `response_model` again, dumping the models to dicts, validating those
+    and encoding the result. The converters in `crud` already build valid
+    responses, so this response serializes them once, straight to JSON
+    bytes with pydantic-core. Returning a response from an endpoint skips
+    FastAPI's own serialization, its `response_model` only documents it.
+
+    Args:
+        content (BaseModel | Sequence[BaseModel]): The model or models.
+        fields (Fields | None): The fields to serialize, of every model of
+        a list, None for every field.
+        **kwargs (Any): The other arguments of a response.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel | Sequence[BaseModel],
+        fields: Fields | None = None,
+        **kwargs: Any,
+    ):
+        self.fields = fields
+        super().__init__(content, **kwargs)
+
+    def render(self, content: BaseModel | Sequence[BaseModel]) -> bytes:
+        include = self.fields
+        if include is not None and not isinstance(content, BaseModel):
+            include = {"__all__": include}
+
+        return pydantic_core.to_json(content, include=include)
@@ -22,6 +22,7 @@ class S3Service:
             aws_access_key_id=settings.AWS_ACCESS_KEY,
             aws_secret_access_key=settings.AWS_SECRET_KEY,
             region_name=settings.AWS_REGION,
+            endpoint_url=settings.AWS_ENDPOINT_URL,
         )
 
     def validate_image(self, file: UploadFile) -> None:
@@ -0,0 +1,209 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Hashable, Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def round_robin_rounds(teams: Sequence[T]) -> list[list[tuple[T, T]]]:
+    """
+    Split a round robin into rounds with the circle method.
+
+    The first team stays in place while the others rotate around it, so
+    every round pairs each team at most once and every pair meets exactly
+    once. With an odd number of teams a bye is added and the team drawn
+    against it rests for the round. A round costs O(n), and each pair keeps
+    the order of its teams in the input.
+
+    Args:
+        teams (Sequence[T]): The teams of the league.
+
+    Returns:
+        list[list[tuple[T, T]]]: The pairs of every round.
+    """
+    circle: list[int | None] = list(range(len(teams)))
+    if len(circle) % 2:
+        circle.append(None)
+
+    size = len(circle)
+    rounds = []
+    for _ in range(size - 1):
+        pairs = []
+        for i in range(size // 2):
+            first, second = circle[i], circle[size - 1 - i]
+            if first is None or second is None:
+                continue
+            if first > second:
+                first, second = second, first
+            pairs.append((teams[first], teams[second]))
+
+        rounds.append(pairs)
+        circle.insert(1, circle.pop())
+
+    return rounds
+
+
+class SlotAllocator:
+    """
+    Assigns start times to matches, earliest slot first.
+
+    Every day has slots from the start hour up to and including the end
+    hour, one match duration apart, and every slot hosts as many matches
+    as there are venues (or streams). A slot is only given to a match if
+
+    - the day is below its cap on matches,
+    - a venue is free in the slot, and
+    - both teams had their rest since their previous match ended.
+
+    Slots and days are counted from the first day, so allocating a match
+    is amortized O(1) however many matches are already booked.
+    """
+
+    def __init__(
+        self,
+        first_day: datetime,
+        match_minutes: int,
+        start_hour: int,
+        end_hour: int,
+        max_matches_per_day: int | None = None,
+        venues: int = 1,
+        rest_minutes: int = 0,
+    ):
+        """
+        Args:
+            first_day (datetime): The day of the first slot.
+            match_minutes (int): The duration of a match and its buffer.
+            start_hour (int): The hour of the first slot of a day.
+            end_hour (int): The latest hour a match can start.
+            max_matches_per_day (int | None): The cap on matches per day.
+            venues (int): The matches that can be played at the same time.
+            rest_minutes (int): The rest a team needs between two matches.
+
+        Raises:
+            ValueError: If a day has no slots or no venue is available.
+        """
+        if end_hour < start_hour or match_minutes <= 0 or venues < 1:
+            raise ValueError("The schedule has no slots to allocate")
+
+        self.first_slot = first_day.replace(
+            hour=start_hour, minute=0, second=0, microsecond=0
+        )
+        self.match_minutes = match_minutes
+        self.slots_per_day = (end_hour - start_hour) * 60 // match_minutes + 1
+        self.venues = venues
+        self.rest_minutes = rest_minutes
+        self.day_capacity = self.slots_per_day * venues
+        if max_matches_per_day is not None:
+            self.day_capacity = min(self.day_capacity, max_matches_per_day)
+
+        self._slot_bookings: defaultdict[int, int] = defaultdict(int)
+        self._day_bookings: defaultdict[int, int] = defaultdict(int)
+        self._team_ready: dict[Hashable, int] = {}
+        # All slots before it are full, so the search for a slot starts there
+        self._first_open = 0
+
+    def allocate(self, team1: Hashable, team2: Hashable) -> datetime:
+        """
+        Book the earliest slot both teams can play in.
+
+        Args:
+            team1 (Hashable): The key of the first team.
+            team2 (Hashable): The key of the second team.
+
+        Returns:
+            datetime: The start time of the match.
+        """
+        slot = max(
+            self._first_open,
+            self._team_ready.get(team1, 0),
+            self._team_ready.get(team2, 0),
+        )
+        slot = self._next_open(slot)
+
+        self._slot_bookings[slot] += 1
+        self._day_bookings[slot // self.slots_per_day] += 1
+        ready = self._ready_slot(slot)
+        self._team_ready[team1] = ready
+        self._team_ready[team2] = ready
+        self._first_open = self._next_open(self._first_open)
+
+        return self._start_time(slot)
+
+    def _next_open(self, slot: int) -> int:
+        """
+        Find the first slot from the given one with a free venue on a day
+        below its cap.
+
+        Args:
+            slot (int): The index of the first slot to consider.
+
+        Returns:
+            int: The index of the open slot.
+        """
+        while True:
+            day = slot // self.slots_per_day
+            if self._day_bookings[day] >= self.day_capacity:
+                slot = (day + 1) * self.slots_per_day
+            elif self._slot_bookings[slot] >= self.venues:
+                slot += 1
+            else:
+                return slot
+
+    def _ready_slot(self, slot: int) -> int:
+        """
+        Find the first slot a team playing in the given slot can play in
+        again, after the match and the rest.
+
+        Args:
+            slot (int): The index of the slot the team plays in.
+
+        Returns:
+            int: The index of the first slot after the rest.
+        """
+        day, index = divmod(slot, self.slots_per_day)
+        ready = day * MINUTES_PER_DAY + (index + 1) * self.match_minutes
+        ready += self.rest_minutes
+
+        day, minutes = divmod(ready, MINUTES_PER_DAY)
+        index = -(-minutes // self.match_minutes)
+        if index >= self.slots_per_day:
+            day, index = day + 1, 0
+
+        return day * self.slots_per_day + index
+
+    def _start_time(self, slot: int) -> datetime:
+        day, index = divmod(slot, self.slots_per_day)
+        return self.first_slot + timedelta(days=day, minutes=index * self.match_minutes)
+
+
+def schedule_pairs(
+    pairs: Iterable[tuple[T, T]], allocator: SlotAllocator
+) -> list[tuple[T, T, datetime]]:
+    """
+    Assign start times to matches in order, e.g. round after round.
+
+    Args:
+        pairs (Iterable[tuple[T, T]]): The teams of every match.
+        allocator (SlotAllocator): Books the slots of the matches.
+
+    Returns:
+        list[tuple[T, T, datetime]]: The teams and start time of every match.
+    """
+    return [(team1, team2, allocator.allocate(team1, team2)) for team1, team2 in pairs]
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime to UTC without a timezone, as the database stores it.
+
+    Args:
+        value (datetime): The datetime, naive ones are taken to be in UTC.
+
+    Returns:
+        datetime: The naive UTC datetime.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
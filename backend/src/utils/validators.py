@@ -1,13 +1,14 @@
 from datetime import datetime, timedelta, timezone
-from typing import Type
+from typing import Iterable, Type
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from src.models import Match, Player, Request, Tournament, User
+from src.models import Base, Match, Player, Request, Tournament, User
 from src.models.enums import Role, Stage
 from src.models.team import Team
 from src.schemas.user import UserResponse
+from src.utils.prizes import PayoutTemplate
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
@@ -36,7 +37,7 @@ def tournament_exists(
 
     tournament = None
     if tournament_id:
-        tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+        tournament = _get_by_id(db, Tournament, tournament_id)
     elif tournament_title:
         tournament = (
             db.query(Tournament).filter(Tournament.title == tournament_title).first()
@@ -72,7 +73,7 @@ def team_exists(
 
     team = None
     if team_id:
-        team = db.query(Team).filter(Team.id == team_id).first()
+        team = _get_by_id(db, Team, team_id)
     elif team_name:
         team = db.query(Team).filter(Team.name == team_name).first()
 
@@ -96,13 +97,48 @@ def match_exists(db: Session, match_id: UUID) -> Type[Match]:
     Raises:
         HTTPException: If the match is not found.
     """
-    match = db.query(Match).filter(Match.id == match_id).first()
+    match = _get_by_id(db, Match, match_id)
     if not match:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Match not found")
 
     return match
 
 
+def all_exist(
+    db: Session, model: type[Base], ids: list[UUID], options: Iterable = ()
+) -> list:
+    """
+    Checks that every ID belongs to an object of a model, with a single query.
+
+    Args:
+        db (Session): The database session.
+        model (type[Base]): The model of the objects, e.g. Match.
+        ids (list[UUID]): The IDs of the objects, repeated IDs are ignored.
+        options (Iterable): Loader options of the query, e.g. to load the
+        relationships the objects are converted with.
+
+    Returns:
+        list: The objects, in the order of their IDs.
+
+    Raises:
+        HTTPException: If any of the objects is not found.
+    """
+    ids = list(dict.fromkeys(ids))
+    found = {
+        instance.id: instance
+        for instance in db.query(model).options(*options).filter(model.id.in_(ids))
+    }
+
+    missing = [str(id) for id in ids if id not in found]
+    if missing:
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND,
+            detail=f"{model.__name__} not found: {', '.join(missing)}",
+        )
+
+    return [found[id] for id in ids]
+
+
 def user_exists(
     db: Session,
     user_id: UUID | None = None,
@@ -176,7 +212,7 @@ def player_exists(
 
     player = None
     if player_id:
-        player = db.query(Player).filter(Player.id == player_id).first()
+        player = _get_by_id(db, Player, player_id)
     else:
         player = db.query(Player).filter(Player.username == username).first()
 
@@ -276,6 +312,22 @@ def tournament_title_unique(db: Session, title: str) -> None:
         )
 
 
+def _get_by_id(db: Session, model: type[Base], id: UUID) -> Base | None:
+    """
+    Get an object by its ID, from the session's identity map if it was
+    already loaded in the request, e.g. a tournament reached through a match.
+
+    Args:
+        db (Session): The database session.
+        model (type[Base]): The model of the object.
+        id (UUID): The ID of the object.
+
+    Returns:
+        Base | None: The object, None if it does not exist.
+    """
+    return db.get(model, id)
+
+
 # authorisation validators
 def director_or_admin(user: UserResponse) -> None:
     """
@@ -306,7 +358,7 @@ def is_author_of_tournament(db: Session, tournament_id: UUID, user_id: UUID) ->
     Raises:
         HTTPException: If the user is not the author of the tournament.
     """
-    db_tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    db_tournament = _get_by_id(db, Tournament, tournament_id)
     if db_tournament.director_id != user_id:
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
@@ -406,6 +458,43 @@ def validate_old_vs_new_end_date(old_end_date, new_end_date) -> None:
         )
 
 
+def payout_within_prize_pool(payout: PayoutTemplate, prize_pool: int) -> None:
+    """
+    Checks that the prizes of a payout template fit in the prize pool.
+
+    Args:
+        payout (PayoutTemplate): The payout template.
+        prize_pool (int): The prize pool of the tournament.
+
+    Raises:
+        HTTPException: If the prizes add up to more than the prize pool.
+    """
+    if payout.total(prize_pool) > prize_pool:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="Prize amounts exceed the prize pool",
+        )
+
+
+def payout_places_within_teams(payout: PayoutTemplate, teams: int) -> None:
+    """
+    Checks that a payout template pays no more places than there are teams,
+    so that every prize goes to a team once the tournament is finished.
+
+    Args:
+        payout (PayoutTemplate): The payout template.
+        teams (int): The number of teams of the tournament.
+
+    Raises:
+        HTTPException: If the template pays more places than there are teams.
+    """
+    if len(payout.payouts) > teams:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="The payout pays more places than the tournament has teams",
+        )
+
+
 def unique_teams_in_tournament(teams: list[str]) -> None:
     """
     Validates that there are no duplicate teams in the tournament list.
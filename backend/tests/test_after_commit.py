@@ -0,0 +1,116 @@
+from datetime import datetime
+from unittest.mock import MagicMock, call, patch
+
+from src.crud.match import generate_matches
+from src.models import Player, Team, Tournament, User
+from src.models.enums import Role, Stage, TournamentFormat
+from src.utils.after_commit import after_commit
+from src.utils.events import MatchScheduled, event_bus
+from tests.utils import SQLiteTestCase
+
+
+class AfterCommitShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database."""
+        super().setUp()
+        self.hook = MagicMock()
+
+    def test_run_hooks_after_commit(self):
+        """Test that hooks wait for the commit and run in order."""
+        self.db.add(Team(name="Team A"))
+        after_commit(self.db, self.hook, "first")
+        after_commit(self.db, self.hook, "second", urgent=True)
+
+        self.hook.assert_not_called()
+        self.db.commit()
+
+        self.assertEqual(
+            self.hook.call_args_list,
+            [call("first"), call("second", urgent=True)],
+        )
+
+    def test_drop_hooks_on_rollback(self):
+        """Test that hooks of a rolled back transaction never run."""
+        self.db.add(Team(name="Team A"))
+        after_commit(self.db, self.hook)
+        self.db.rollback()
+
+        self.db.add(Team(name="Team B"))
+        self.db.commit()
+
+        self.hook.assert_not_called()
+
+    def test_run_hooks_at_once_outside_a_transaction(self):
+        """Test that a hook without a transaction in progress runs right away."""
+        after_commit(self.db, self.hook)
+
+        self.hook.assert_called_once_with()
+
+    def test_failing_hook_does_not_fail_the_commit(self):
+        """Test that hooks after a failing one still run."""
+        self.db.add(Team(name="Team A"))
+        after_commit(self.db, MagicMock(side_effect=RuntimeError("SMTP down")))
+        after_commit(self.db, self.hook)
+
+        self.db.commit()
+
+        self.hook.assert_called_once_with()
+        self.assertEqual(self.db.query(Team).count(), 1)
+
+
+class MatchEmailsShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database with a round robin of two teams."""
+        super().setUp()
+
+        director = User(
+            email="director@example.com", password_hash="hash", role=Role.DIRECTOR
+        )
+        self.tournament = Tournament(
+            title="Spring Cup",
+            tournament_format=TournamentFormat.ROUND_ROBIN,
+            start_date=datetime(2030, 5, 1),
+            end_date=datetime(2030, 5, 10),
+            prize_pool=1000,
+            current_stage=Stage.GROUP_STAGE,
+            director=director,
+        )
+        for name in ("A", "B"):
+            user = User(
+                email=f"{name.lower()}@example.com",
+                password_hash="hash",
+                role=Role.PLAYER,
+            )
+            player = Player(
+                username=f"player{name}",
+                first_name="Kit",
+                last_name="Ten",
+                country="Bulgaria",
+                user=user,
+            )
+            self.tournament.teams.append(Team(name=f"Team {name}", players=[player]))
+        self.db.add(self.tournament)
+        self.db.commit()
+
+    @patch.object(event_bus, "dispatch")
+    def test_send_match_created_emails_after_commit(self, mock_dispatch):
+        """Test that players hear about their match only once it is saved."""
+        generate_matches(self.db, self.tournament)
+
+        mock_dispatch.assert_not_called()
+        self.db.commit()
+
+        event = mock_dispatch.call_args.args[0]
+        self.assertIsInstance(event, MatchScheduled)
+        self.assertEqual(
+            sorted(event.team1_emails + event.team2_emails),
+            ["a@example.com", "b@example.com"],
+        )
+
+    @patch.object(event_bus, "dispatch")
+    def test_send_no_emails_for_rolled_back_matches(self, mock_dispatch):
+        """Test that matches rolled back are never announced."""
+        generate_matches(self.db, self.tournament)
+        self.db.rollback()
+
+        mock_dispatch.assert_not_called()
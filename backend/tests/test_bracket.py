@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+from src.crud import bracket as crud_bracket
+from src.models import BracketNode, Match, Team, Tournament
+from src.models.enums import MatchFormat, Stage, TournamentFormat
+from src.utils.bracket import bracket_size, plan_bracket, seed_order
+
+
+class BracketPlanShould(unittest.TestCase):
+    def test_bracket_size_is_next_power_of_two(self):
+        """Test that brackets are filled up to a power of two."""
+        self.assertEqual(
+            [bracket_size(count) for count in (2, 3, 4, 5, 8, 9, 64)],
+            [2, 4, 4, 8, 8, 16, 64],
+        )
+
+    def test_seed_order_keeps_top_seeds_apart(self):
+        """Test that the two best seeds are in different halves."""
+        self.assertEqual(seed_order(8), [0, 7, 3, 4, 1, 6, 2, 5])
+
+    def test_plan_bracket_without_byes(self):
+        """Test that a full bracket pairs best against worst seeds."""
+        rounds = plan_bracket(list("ABCDEFGH"))
+
+        self.assertEqual([len(round_slots) for round_slots in rounds], [4, 2, 1])
+        self.assertEqual(
+            [(slot.team1, slot.team2) for slot in rounds[0]],
+            [("A", "H"), ("D", "E"), ("B", "G"), ("C", "F")],
+        )
+        self.assertEqual(
+            [slot.stage for slot in (rounds[0][0], rounds[1][0], rounds[2][0])],
+            [Stage.QUARTER_FINAL, Stage.SEMI_FINAL, Stage.FINAL],
+        )
+
+    def test_plan_bracket_gives_byes_to_best_seeds(self):
+        """Test that byes skip the first round and keep their positions."""
+        rounds = plan_bracket(list("ABCDE"))
+
+        self.assertEqual(
+            [(slot.position, slot.team1, slot.team2) for slot in rounds[0]],
+            [(1, "D", "E")],
+        )
+        self.assertEqual(
+            [(slot.team1, slot.team2) for slot in rounds[1]],
+            [("A", None), ("B", "C")],
+        )
+
+    def test_plan_bracket_needs_two_teams(self):
+        """Test that there is no bracket without an opponent."""
+        self.assertEqual(plan_bracket(["A"]), [])
+
+
+class BracketServiceShould(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.db = MagicMock(spec=Session)
+        self.tournament_id = uuid4()
+        self.start_date = datetime(2030, 5, 1, 11, tzinfo=timezone.utc)
+        self.teams = [
+            Team(id=uuid4(), name=f"Team {i}", played_games=4, won_games=i)
+            for i in range(6)
+        ]
+        self.tournament = Tournament(
+            id=self.tournament_id,
+            title="Bracket Cup",
+            tournament_format=TournamentFormat.SINGLE_ELIMINATION,
+            start_date=self.start_date,
+            current_stage=Stage.QUARTER_FINAL,
+            teams=self.teams,
+        )
+
+    def test_create_bracket_inserts_every_node_at_once(self):
+        """Test that the nodes are inserted in one statement, final first."""
+        matches = crud_bracket.create_bracket(self.db, self.tournament)
+
+        self.db.execute.assert_called_once()
+        nodes = self.db.execute.call_args[0][1]
+        self.assertEqual(len(nodes), 2 + 2 + 1)
+        self.assertEqual(nodes[0]["stage"], Stage.FINAL)
+        self.assertIsNone(nodes[0]["next_node_id"])
+
+        for index, node in enumerate(nodes[1:], start=1):
+            earlier = {earlier_node["id"] for earlier_node in nodes[:index]}
+            self.assertIn(node["next_node_id"], earlier)
+
+        self.db.bulk_save_objects.assert_called_once_with(matches)
+
+    def test_create_bracket_seeds_by_win_ratio(self):
+        """Test that the best teams get the byes."""
+        matches = crud_bracket.create_bracket(self.db, self.tournament)
+
+        quarter_finals = [m for m in matches if m.stage == Stage.QUARTER_FINAL]
+        playing = {m.team1_id for m in quarter_finals} | {
+            m.team2_id for m in quarter_finals
+        }
+        self.assertEqual(playing, {team.id for team in self.teams[:4]})
+        self.assertTrue(all(m.match_format == MatchFormat.MR15 for m in matches))
+        self.assertTrue(
+            all(m.start_time.date() == self.start_date.date() for m in matches)
+        )
+
+    def test_get_bracket_days_matches_round_count(self):
+        """Test that every round takes a day of its own."""
+        self.assertEqual(crud_bracket.get_bracket_days(self.start_date, 4), 1)
+        self.assertEqual(crud_bracket.get_bracket_days(self.start_date, 6), 2)
+        # The 16 round of 32 matches take four days and the round of 16 two
+        self.assertEqual(crud_bracket.get_bracket_days(self.start_date, 32), 8)
+
+    def test_advance_winner_waits_for_the_opponent(self):
+        """Test that the winner is placed without creating a match yet."""
+        next_node = BracketNode(id=uuid4(), tournament_id=self.tournament_id)
+        self.db.get.return_value = next_node
+        node = BracketNode(id=uuid4(), position=3, next_node_id=next_node.id)
+        winner_id = uuid4()
+
+        match = crud_bracket.advance_winner(self.db, node, winner_id)
+
+        self.assertIsNone(match)
+        self.assertEqual(next_node.team2_id, winner_id)
+        self.db.add.assert_not_called()
+
+    def test_advance_winner_creates_match_when_both_teams_are_known(self):
+        """Test that the next match is created once its second team arrives."""
+        start_time = self.start_date + timedelta(days=1)
+        next_node = BracketNode(
+            id=uuid4(),
+            stage=Stage.SEMI_FINAL,
+            start_time=start_time,
+            team2_id=uuid4(),
+            tournament_id=self.tournament_id,
+        )
+        self.db.get.return_value = next_node
+        node = BracketNode(id=uuid4(), position=0, next_node_id=next_node.id)
+        winner_id = uuid4()
+
+        match = crud_bracket.advance_winner(self.db, node, winner_id)
+
+        self.assertIsInstance(match, Match)
+        self.assertEqual(match.team1_id, winner_id)
+        self.assertEqual(match.team2_id, next_node.team2_id)
+        self.assertEqual(match.stage, Stage.SEMI_FINAL)
+        self.assertEqual(match.start_time, start_time)
+        self.assertEqual(next_node.match_id, match.id)
+        self.db.add.assert_called_once_with(match)
+
+    def test_advance_winner_of_final_does_nothing(self):
+        """Test that the final has nowhere to move its winner."""
+        node = BracketNode(id=uuid4(), position=0, next_node_id=None)
+
+        self.assertIsNone(crud_bracket.advance_winner(self.db, node, uuid4()))
+        self.db.get.assert_not_called()
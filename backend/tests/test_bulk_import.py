@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from src.models import Team
+from src.schemas.team import TeamCreate
+from src.utils import bulk_import
+from starlette.status import HTTP_400_BAD_REQUEST
+
+
+class BulkImportShould(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.db = MagicMock(spec=Session)
+        self.check_batch = MagicMock(
+            side_effect=lambda db, batch: (
+                [{"name": team.name} for _, team in batch],
+                {},
+            )
+        )
+
+    def test_get_file_format_from_extension_or_content_type(self):
+        """Test that CSV and NDJSON files are recognized."""
+        self.assertEqual(bulk_import.get_file_format("teams.CSV", None), "csv")
+        self.assertEqual(bulk_import.get_file_format("teams.jsonl", None), "ndjson")
+        self.assertEqual(
+            bulk_import.get_file_format("upload", "application/x-ndjson"), "ndjson"
+        )
+
+    def test_get_file_format_rejects_other_files(self):
+        """Test that unsupported files are rejected before the import starts."""
+        with self.assertRaises(HTTPException) as ctx:
+            bulk_import.get_file_format("teams.xlsx", "application/vnd.ms-excel")
+
+        self.assertEqual(ctx.exception.status_code, HTTP_400_BAD_REQUEST)
+
+    def test_read_rows_from_csv_skips_empty_cells(self):
+        """Test that CSV rows are numbered and empty cells left out."""
+        content = b"\xef\xbb\xbfusername,team_name\nkitten_one,\nkitten_two,Team A\n"
+
+        rows = list(bulk_import.read_rows(content, "csv"))
+
+        self.assertEqual(
+            rows,
+            [
+                (1, {"username": "kitten_one"}),
+                (2, {"username": "kitten_two", "team_name": "Team A"}),
+            ],
+        )
+
+    def test_read_rows_from_ndjson_reports_invalid_lines(self):
+        """Test that malformed NDJSON lines become row errors."""
+        content = b'{"name": "Team A"}\n\nnot json\n["Team B"]\n'
+
+        rows = list(bulk_import.read_rows(content, "ndjson"))
+
+        self.assertEqual(rows[0], (1, {"name": "Team A"}))
+        self.assertTrue(rows[1][1].startswith("Invalid JSON"))
+        self.assertEqual(rows[2], (3, "Expected a JSON object"))
+
+    def test_import_rows_inserts_batches_and_commits(self):
+        """Test that valid rows are inserted batch by batch in one transaction."""
+        rows = [(number, {"name": f"Team {number:03d}"}) for number in range(1, 6)]
+
+        with patch.object(bulk_import, "IMPORT_BATCH_SIZE", 2):
+            events = list(
+                bulk_import.import_rows(
+                    self.db, rows, TeamCreate, Team, self.check_batch
+                )
+            )
+
+        self.assertEqual(self.check_batch.call_count, 3)
+        self.assertEqual(self.db.execute.call_count, 3)
+        inserted = self.db.execute.call_args_list[0][0][1]
+        self.assertEqual(inserted[0]["name"], "Team 001")
+        self.assertIn("id", inserted[0])
+        self.assertEqual([event["event"] for event in events].count("progress"), 3)
+        self.assertEqual(
+            events[-1],
+            {"event": "completed", "processed": 5, "imported": 5, "failed": 0},
+        )
+        self.db.commit.assert_called_once()
+        self.db.rollback.assert_not_called()
+
+    def test_import_rows_rolls_back_when_any_row_is_rejected(self):
+        """Test that the import is all or nothing and reports every error."""
+        rows = [
+            (1, {"name": "Team 001"}),
+            (2, {"name": "Bad"}),
+            (3, "Invalid JSON: Expecting value"),
+            (4, {"name": "Team 004"}),
+        ]
+
+        events = list(
+            bulk_import.import_rows(self.db, rows, TeamCreate, Team, self.check_batch)
+        )
+
+        errors = [event for event in events if event["event"] == "error"]
+        self.assertEqual([error["row"] for error in errors], [2, 3])
+        self.assertIn("name", errors[0]["detail"])
+        self.assertEqual(
+            events[-1],
+            {"event": "failed", "processed": 4, "imported": 0, "failed": 2},
+        )
+        self.db.execute.assert_not_called()
+        self.db.rollback.assert_called_once()
+        self.db.commit.assert_not_called()
+
+    def test_duplicates_in_batch_remembers_earlier_batches(self):
+        """Test that values repeated across batches are found."""
+        seen = set()
+
+        first = bulk_import.duplicates_in_batch(
+            [(1, "Team A"), (2, "Team A")], lambda name: name, seen
+        )
+        second = bulk_import.duplicates_in_batch(
+            [(3, "Team B"), (4, "Team A")], lambda name: name, seen
+        )
+
+        self.assertEqual(list(first), [2])
+        self.assertEqual(list(second), [4])
@@ -0,0 +1,104 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from src.crud.team import create_team, update_team
+from src.crud.user import update_email
+from src.models import Player, Team, Tournament, User
+from src.models.enums import Role, Stage, TournamentFormat
+from src.schemas.team import TeamCreate, TeamUpdate
+from src.utils.conflicts import unique_conflicts
+from tests.utils import SQLiteTestCase
+
+
+class UniqueConflictsShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database with a team."""
+        super().setUp()
+
+        self.db.add_all([Team(name="Taken Team"), Team(name="Other Team")])
+        self.db.commit()
+        self.director = User(email="director@example.com", role=Role.DIRECTOR)
+
+        self.statements = self.count_statements()
+
+    def test_create_team_without_checking_first(self):
+        """Test that a team with a new name is created with a single INSERT."""
+        result = create_team(
+            self.db, TeamCreate(name="Fresh Team"), None, self.director
+        )
+
+        self.assertEqual(result.name, "Fresh Team")
+        # Nothing is read before the INSERT, only the refresh after the commit
+        self.assertTrue(self.statements[0].startswith("INSERT INTO team"))
+
+    @patch("src.utils.s3.s3_service.upload_file")
+    def test_create_team_duplicate_name(self, mock_upload_file):
+        """Test that a duplicate name fails before the logo is uploaded."""
+        with self.assertRaises(HTTPException) as context:
+            create_team(
+                self.db, TeamCreate(name="Taken Team"), MagicMock(), self.director
+            )
+
+        self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(context.exception.detail, "Team 'Taken Team' already exists")
+        mock_upload_file.assert_not_called()
+        self.assertEqual(self.db.query(Team).count(), 2)
+
+    def test_update_team_duplicate_name(self):
+        """Test that renaming a team to a taken name is rolled back."""
+        team = self.db.query(Team).filter(Team.name == "Other Team").one()
+
+        with self.assertRaises(HTTPException) as context:
+            update_team(
+                self.db, team.id, TeamUpdate(name="Taken Team"), None, self.director
+            )
+
+        self.assertEqual(context.exception.detail, "Team 'Taken Team' already exists")
+        self.assertEqual(
+            sorted(name for name, in self.db.query(Team.name)),
+            ["Other Team", "Taken Team"],
+        )
+
+    def test_unexplained_conflicts_are_raised(self):
+        """Test that conflicts none of the checks explains are raised."""
+        with self.assertRaises(IntegrityError):
+            with unique_conflicts(self.db, lambda: None):
+                self.db.add(Team(name="Taken Team"))
+                self.db.flush()
+
+    @patch("src.crud.user.publish")
+    def test_update_email_of_a_player_on_a_tournament_team(self, _):
+        """Test that a taken email is reported even when the view is refreshed."""
+        director = User(
+            email="director@example.com", password_hash="hash", role=Role.DIRECTOR
+        )
+        user = User(email="player@example.com", password_hash="hash")
+        team = self.db.query(Team).filter(Team.name == "Taken Team").one()
+        team.tournament = Tournament(
+            title="Spring Cup",
+            tournament_format=TournamentFormat.SINGLE_ELIMINATION,
+            start_date=datetime(2030, 5, 1),
+            end_date=datetime(2030, 5, 10),
+            prize_pool=1000,
+            current_stage=Stage.QUARTER_FINAL,
+            director=director,
+        )
+        self.db.add(
+            Player(
+                username="kitten",
+                first_name="Kit",
+                last_name="Ten",
+                country="Bulgaria",
+                user=user,
+                team=team,
+            )
+        )
+        self.db.commit()
+
+        with self.assertRaises(HTTPException) as context:
+            update_email(self.db, "director@example.com", user)
+
+        self.assertEqual(context.exception.detail, "Email already exists")
+        self.assertEqual(user.email, "player@example.com")
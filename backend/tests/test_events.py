@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from threading import Event, Thread
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException
+from src.crud.user import create_user
+from src.models import Team, User
+from src.schemas.user import UserCreate
+from src.utils.events import EventBus, UserRegistered, event_bus
+from tests.utils import SQLiteTestCase
+
+
+@dataclass(frozen=True)
+class Pinged:
+    name: str
+
+
+class EventBusShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database and a bus of one worker."""
+        super().setUp()
+
+        self.bus = EventBus(max_workers=1, max_pending=1)
+        self.addCleanup(self.bus.shutdown)
+        self.handled = []
+        self.done = Event()
+
+        @self.bus.subscribe(Pinged)
+        def handle(event):
+            self.handled.append(event)
+            self.done.set()
+
+    def test_dispatch_after_commit_on_a_worker(self):
+        """Test that handlers run once the transaction has committed."""
+        self.db.add(Team(name="Team A"))
+        self.bus.publish(self.db, Pinged("first"))
+        self.assertEqual(self.handled, [])
+
+        self.db.commit()
+
+        self.assertTrue(self.done.wait(timeout=5))
+        self.assertEqual(self.handled, [Pinged("first")])
+
+    def test_drop_events_on_rollback(self):
+        """Test that events of a rolled back transaction are never handled."""
+        self.db.add(Team(name="Team A"))
+        self.bus.publish(self.db, Pinged("first"))
+        self.db.rollback()
+        self.bus.shutdown()
+
+        self.assertEqual(self.handled, [])
+
+    def test_skip_events_nobody_handles(self):
+        """Test that events without handlers are not queued."""
+        self.db.add(Team(name="Team A"))
+        self.bus.publish(self.db, UserRegistered(email="user@example.com"))
+
+        self.assertNotIn("after_commit_hooks", self.db.info)
+
+    def test_failing_handler_frees_its_slot(self):
+        """Test that a failing handler does not hold back later events."""
+        bus = EventBus(max_workers=1, max_pending=1)
+        self.addCleanup(bus.shutdown)
+        handled = Event()
+        bus.subscribe(Pinged)(MagicMock(side_effect=RuntimeError("SMTP down")))
+        bus.subscribe(UserRegistered)(lambda event: handled.set())
+
+        bus.dispatch(Pinged("first"))
+        bus.dispatch(UserRegistered(email="user@example.com"))
+
+        self.assertTrue(handled.wait(timeout=5))
+
+    def test_hold_back_publishers_when_the_pool_is_busy(self):
+        """Test that no more than max_pending handler calls are in flight."""
+        bus = EventBus(max_workers=1, max_pending=1)
+        self.addCleanup(bus.shutdown)
+        release = Event()
+        bus.subscribe(Pinged)(lambda event: release.wait(timeout=5))
+
+        bus.dispatch(Pinged("first"))
+        second = Thread(target=bus.dispatch, args=(Pinged("second"),))
+        second.start()
+        second.join(timeout=0.2)
+        self.assertTrue(second.is_alive())
+
+        release.set()
+        second.join(timeout=5)
+        self.assertFalse(second.is_alive())
+
+
+class UserEventsShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database with a user."""
+        super().setUp()
+
+        self.db.add(User(email="taken@example.com", password_hash="hash"))
+        self.db.commit()
+
+    @patch.object(event_bus, "dispatch")
+    def test_welcome_new_users_after_commit(self, mock_dispatch):
+        """Test that a new user is welcomed once their account is saved."""
+        create_user(UserCreate(email="new@example.com", password="Secure@123"), self.db)
+
+        mock_dispatch.assert_called_once_with(UserRegistered(email="new@example.com"))
+
+    @patch.object(event_bus, "dispatch")
+    def test_no_welcome_for_duplicate_users(self, mock_dispatch):
+        """Test that an account rolled back as a duplicate is never announced."""
+        with self.assertRaises(HTTPException):
+            create_user(
+                UserCreate(email="taken@example.com", password="Secure@123"), self.db
+            )
+
+        mock_dispatch.assert_not_called()
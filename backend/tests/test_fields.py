@@ -0,0 +1,54 @@
+import unittest
+
+from fastapi import HTTPException
+from src.schemas.team import TeamDetailedResponse, TeamListResponse
+from src.utils.fields import parse_fields, wants
+from starlette.status import HTTP_400_BAD_REQUEST
+
+
+class FieldsShould(unittest.TestCase):
+    def test_parse_fields_returns_none_without_fields(self):
+        """Test that no fieldset means every field."""
+        self.assertIsNone(parse_fields(TeamListResponse, None))
+        self.assertIsNone(parse_fields(TeamListResponse, ""))
+
+    def test_parse_fields_nests_fields_of_lists(self):
+        """Test that nested fields of lists apply to every item."""
+        fields = parse_fields(
+            TeamListResponse, "id, name,players.username,players.user_email"
+        )
+
+        self.assertEqual(
+            fields,
+            {
+                "id": True,
+                "name": True,
+                "players": {"__all__": {"username": True, "user_email": True}},
+            },
+        )
+
+    def test_parse_fields_whole_field_wins_over_nested_fields(self):
+        """Test that a whole field is kept whatever else is asked of it."""
+        self.assertEqual(
+            parse_fields(TeamDetailedResponse, "matches.id,matches,matches.stage"),
+            {"matches": True},
+        )
+
+    def test_parse_fields_rejects_unknown_fields(self):
+        """Test that unknown and non nested fields are rejected."""
+        for fields in ("id,bogus", "players.bogus", "name.length"):
+            with self.subTest(fields=fields):
+                with self.assertRaises(HTTPException) as context:
+                    parse_fields(TeamListResponse, fields)
+
+                self.assertEqual(context.exception.status_code, HTTP_400_BAD_REQUEST)
+
+    def test_wants(self):
+        """Test which fields a fieldset serializes."""
+        fields = parse_fields(TeamDetailedResponse, "name,players.username,matches")
+
+        self.assertTrue(wants(None, "players.user_email"))
+        self.assertTrue(wants(fields, "players"))
+        self.assertTrue(wants(fields, "matches.team1_score"))
+        self.assertFalse(wants(fields, "players.user_email"))
+        self.assertFalse(wants(fields, "prize_cuts"))
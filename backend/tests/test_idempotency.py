@@ -0,0 +1,299 @@
+from datetime import datetime, timedelta, timezone
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from fastapi import Depends, FastAPI, File, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+from src.models import IdempotencyKey, Team
+from src.utils.after_commit import after_commit
+from src.utils.idempotency import IdempotencyStore, request_fingerprint
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY
+from tests.utils import SQLiteTestCase
+
+
+class IdempotencyStoreShould(SQLiteTestCase):
+    ON_DISK = True
+
+    def setUp(self):
+        """Set up a database file and an operation creating a team."""
+        super().setUp()
+
+        self.store = IdempotencyStore()
+        self.store._last_purge = datetime.now(timezone.utc)
+        self.scope = f"{uuid4()} POST /teams"
+        self.fingerprint = "a" * 64
+        self.operation = MagicMock(side_effect=self.create_team)
+
+    def configure_engine(self, engine: Engine) -> None:
+        """
+        Let SQLAlchemy begin transactions, so that savepoints work, and let
+        readers see the last commit while another session writes, like
+        PostgreSQL does.
+        """
+
+        @event.listens_for(engine, "connect")
+        def disable_implicit_begin(dbapi_connection, _):
+            dbapi_connection.isolation_level = None
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+        @event.listens_for(engine, "begin")
+        def begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
+    def create_team(self, db: Session) -> dict:
+        """Create a team the way the CRUD functions do, committing it."""
+        team = Team(name=f"Team {self.operation.call_count}")
+        db.add(team)
+        db.commit()
+        return {"id": team.id, "name": team.name}
+
+    def run_store(self, key: str | None, fingerprint: str | None = None):
+        """Send a request, with a session of its own."""
+        with self.session() as db:
+            return self.store.run(
+                db, key, self.scope, fingerprint or self.fingerprint, self.operation
+            )
+
+    def stored(self) -> tuple[list[str], list[IdempotencyKey]]:
+        """Get the names of the teams and the keys in the database."""
+        with self.session() as db:
+            return (
+                [team.name for team in db.query(Team).order_by(Team.name)],
+                db.query(IdempotencyKey).all(),
+            )
+
+    def test_run_without_key_always_runs_operation(self):
+        """Test that requests without a key are not deduplicated."""
+        self.run_store(None)
+        self.run_store(None)
+
+        self.assertEqual(self.operation.call_count, 2)
+        self.assertEqual(self.stored()[1], [])
+
+    def test_run_stores_response_and_replays_it_from_cache(self):
+        """Test that a repeated key returns the first response."""
+        first = self.run_store("key-1")
+        second = self.run_store("key-1")
+
+        self.assertEqual(second, {"id": str(first["id"]), "name": "Team 1"})
+        self.operation.assert_called_once()
+        teams, keys = self.stored()
+        self.assertEqual(teams, ["Team 1"])
+        self.assertEqual(json.loads(keys[0].response), second)
+        self.assertEqual(keys[0].fingerprint, self.fingerprint)
+
+    def test_run_replays_response_stored_by_another_worker(self):
+        """Test that a key completed elsewhere is served from the database."""
+        first = self.run_store("key-1")
+        self.store = IdempotencyStore()
+        self.store._last_purge = datetime.now(timezone.utc)
+
+        second = self.run_store("key-1")
+
+        self.assertEqual(second["id"], str(first["id"]))
+        self.operation.assert_called_once()
+
+    def test_run_commits_changes_and_response_together(self):
+        """Test that a request whose response was not stored is not applied."""
+        with (
+            patch(
+                "src.utils.idempotency.jsonable_encoder",
+                side_effect=RuntimeError("worker died"),
+            ),
+            self.assertRaises(RuntimeError),
+        ):
+            self.run_store("key-1")
+
+        self.assertEqual(self.stored(), ([], []))
+
+        self.run_store("key-1")
+        self.assertEqual(self.stored()[0], ["Team 2"])
+
+    def test_run_replays_key_stored_concurrently(self):
+        """Test that losing the race to store a key replays the winner."""
+        other_store = IdempotencyStore()
+        other_store._last_purge = datetime.now(timezone.utc)
+        get_stored = self.store._get_stored
+
+        def stored_by_the_other_request_first(db, scope, key):
+            if not other_store._cache:
+                # The other request commits after this one looked the key up
+                with self.session() as other_db:
+                    other_store.run(
+                        other_db, key, scope, self.fingerprint, self.operation
+                    )
+                return None
+            return get_stored(db, scope, key)
+
+        with patch.object(
+            self.store, "_get_stored", side_effect=stored_by_the_other_request_first
+        ):
+            result = self.run_store("key-1")
+
+        self.assertEqual(result["name"], "Team 1")
+        self.operation.assert_called_once()
+        self.assertEqual(self.stored()[0], ["Team 1"])
+
+    def test_run_rejects_key_reused_for_a_different_request(self):
+        """Test that a key sent again with another body is not replayed."""
+        self.run_store("key-1")
+
+        with self.assertRaises(HTTPException) as ctx:
+            self.run_store("key-1", "b" * 64)
+
+        self.assertEqual(ctx.exception.status_code, HTTP_422_UNPROCESSABLE_ENTITY)
+        self.operation.assert_called_once()
+
+    def test_run_rejects_key_stored_for_a_different_request(self):
+        """Test that a key completed elsewhere with another body is rejected."""
+        self.run_store("key-1")
+        self.store = IdempotencyStore()
+        self.store._last_purge = datetime.now(timezone.utc)
+
+        with self.assertRaises(HTTPException) as ctx:
+            self.run_store("key-1", "b" * 64)
+
+        self.assertEqual(ctx.exception.status_code, HTTP_422_UNPROCESSABLE_ENTITY)
+        self.operation.assert_called_once()
+
+    def test_run_replaces_expired_key(self):
+        """Test that an expired key is replaced and the request runs again."""
+        with self.session() as db:
+            db.add(
+                IdempotencyKey(
+                    key="key-1",
+                    scope=self.scope,
+                    fingerprint=self.fingerprint,
+                    response=json.dumps({"stale": True}),
+                    created_at=datetime.now(timezone.utc)
+                    - IdempotencyStore.TTL
+                    - timedelta(minutes=1),
+                )
+            )
+            db.commit()
+
+        result = self.run_store("key-1")
+
+        self.assertEqual(result["name"], "Team 1")
+        self.assertEqual(len(self.stored()[1]), 1)
+
+    def test_run_releases_key_when_operation_fails(self):
+        """Test that a failed request can be retried with the same key."""
+        self.operation.side_effect = HTTPException(
+            status_code=HTTP_400_BAD_REQUEST, detail="Team name is taken"
+        )
+
+        with self.assertRaises(HTTPException):
+            self.run_store("key-1")
+        self.assertEqual(self.stored(), ([], []))
+
+        self.operation.side_effect = self.create_team
+        self.run_store("key-1")
+        self.assertEqual(self.operation.call_count, 2)
+
+    def test_run_hooks_once_the_response_is_stored(self):
+        """Test that side effects of the operation wait for the real commit."""
+        seen = []
+
+        def create_team_and_notify(db):
+            after_commit(db, lambda: seen.append(self.stored()))
+            return self.create_team(db)
+
+        self.operation.side_effect = create_team_and_notify
+
+        self.run_store("key-1")
+
+        teams, keys = seen[0]
+        self.assertEqual(teams, ["Team 1"])
+        self.assertIsNotNone(keys[0].response)
+
+    def test_cache_evicts_least_recently_used_keys(self):
+        """Test that the in-process cache stays within its size limit."""
+        self.store.MAX_CACHED = 2
+
+        for key in ("key-1", "key-2", "key-3"):
+            self.run_store(key)
+
+        self.assertEqual(
+            list(self.store._cache), [(self.scope, "key-2"), (self.scope, "key-3")]
+        )
+        self.run_store("key-1")
+        self.assertEqual(self.operation.call_count, 3)
+
+    def test_run_purges_expired_keys_once_per_interval(self):
+        """Test that expired keys are deleted without purging on every request."""
+        self.store._last_purge = datetime.min.replace(tzinfo=timezone.utc)
+        expired = (
+            datetime.now(timezone.utc) - IdempotencyStore.TTL - timedelta(minutes=1)
+        )
+
+        for key in ("old-1", "old-2"):
+            with self.session() as db:
+                db.add(
+                    IdempotencyKey(
+                        key=key,
+                        scope=self.scope,
+                        fingerprint=self.fingerprint,
+                        response="{}",
+                        created_at=expired,
+                    )
+                )
+                db.commit()
+            self.run_store(f"new-{key}")
+
+        self.assertEqual(
+            sorted(db_key.key for db_key in self.stored()[1]),
+            ["new-old-1", "new-old-2", "old-2"],
+        )
+
+
+class RequestFingerprintShould(unittest.TestCase):
+    def setUp(self):
+        """Set up an app returning the fingerprint of its requests."""
+        app = FastAPI()
+
+        @app.put("/scores")
+        def update_score(
+            team: str, fingerprint: str = Depends(request_fingerprint)
+        ) -> str:
+            return fingerprint
+
+        @app.post("/avatars")
+        def upload_avatar(
+            avatar: UploadFile = File(...),
+            fingerprint: str = Depends(request_fingerprint),
+        ) -> str:
+            # The upload is left for the endpoint to read
+            return f"{fingerprint} {len(avatar.file.read())}"
+
+        self.client = TestClient(app, headers={"Idempotency-Key": "key-1"})
+
+    def test_match_retries_of_the_same_request(self):
+        """Test that a retry hashes the same, whatever the query order."""
+        first = self.client.put("/scores?team=team1&x=1").json()
+        retry = self.client.put("/scores?x=1&team=team1").json()
+
+        self.assertEqual(first, retry)
+
+    def test_tell_apart_different_requests(self):
+        """Test that the query and uploaded files are part of the hash."""
+        team1 = self.client.put("/scores", params={"team": "team1"}).json()
+        team2 = self.client.put("/scores", params={"team": "team2"}).json()
+        avatar1 = self.client.post("/avatars", files={"avatar": ("a.png", b"one")})
+        avatar2 = self.client.post("/avatars", files={"avatar": ("a.png", b"two")})
+
+        self.assertNotEqual(team1, team2)
+        self.assertNotEqual(avatar1.json(), avatar2.json())
+        self.assertTrue(avatar1.json().endswith(" 3"))
+
+    def test_skip_requests_without_a_key(self):
+        """Test that requests which are never deduplicated are not hashed."""
+        self.client.headers.pop("Idempotency-Key")
+
+        response = self.client.put("/scores", params={"team": "team1"})
+
+        self.assertEqual(response.json(), "")
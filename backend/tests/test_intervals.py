@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+import unittest
+
+from src.utils.intervals import IntervalIndex
+
+
+class IntervalIndexShould(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.index = IntervalIndex()
+        self.noon = datetime(2030, 5, 1, 12)
+
+    def at(self, hours: float) -> datetime:
+        return self.noon + timedelta(hours=hours)
+
+    def test_count_overlaps_of_half_open_intervals(self):
+        """Test that intervals touching at an end do not overlap."""
+        self.index.add("team", self.at(0), self.at(3))
+
+        self.assertEqual(self.index.count_overlaps("team", self.at(-3), self.at(0)), 0)
+        self.assertEqual(self.index.count_overlaps("team", self.at(3), self.at(6)), 0)
+        self.assertEqual(self.index.count_overlaps("team", self.at(2), self.at(5)), 1)
+        self.assertEqual(self.index.count_overlaps("team", self.at(1), self.at(2)), 1)
+
+    def test_count_overlaps_per_resource(self):
+        """Test that only the intervals of the queried resource count."""
+        self.index.add("team", self.at(0), self.at(3))
+        self.index.add(("director", 1), self.at(0), self.at(3))
+        self.index.add(("director", 1), self.at(1), self.at(4))
+
+        self.assertEqual(
+            self.index.count_overlaps(("director", 1), self.at(2), self.at(5)), 2
+        )
+        self.assertEqual(
+            self.index.count_overlaps(("director", 2), self.at(2), self.at(5)), 0
+        )
+        self.assertEqual(len(self.index), 3)
+
+    def test_count_overlaps_of_intervals_added_out_of_order(self):
+        """Test that a long interval starting well before still overlaps."""
+        self.index.add("broadcast", self.at(5), self.at(6))
+        self.index.add("broadcast", self.at(-10), self.at(10))
+        self.index.add("broadcast", self.at(1), self.at(2))
+
+        self.assertEqual(
+            self.index.count_overlaps("broadcast", self.at(7), self.at(8)), 1
+        )
+        self.assertEqual(
+            self.index.count_overlaps("broadcast", self.at(0), self.at(5.5)), 3
+        )
+
+    def test_count_overlaps_matches_a_linear_scan(self):
+        """Test the index against checking every interval."""
+        intervals = [
+            (self.at(i * 0.7 % 24), self.at(i * 0.7 % 24 + 1 + i % 4))
+            for i in range(200)
+        ]
+        for start, end in intervals:
+            self.index.add("broadcast", start, end)
+
+        for hours in range(-2, 30):
+            start, end = self.at(hours), self.at(hours + 1.5)
+            expected = sum(1 for s, e in intervals if s < end and start < e)
+            self.assertEqual(
+                self.index.count_overlaps("broadcast", start, end), expected
+            )
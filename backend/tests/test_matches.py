@@ -1,27 +1,47 @@
 from datetime import datetime, timedelta, timezone
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from src.crud import constants as c, match as crud_match
 from src.crud.match import (
+    export_matches,
     generate_matches,
     get_all_matches,
     get_match,
+    get_matches_by_ids,
     update_match,
     update_match_score,
 )
-from src.models import Match, Team, Tournament, User
+from src.models import Match, Player, Team, Tournament, User
 from src.models.enums import MatchFormat, Role, Stage, TournamentFormat
 from src.schemas.match import MatchUpdate
+from src.schemas.user import UserResponse
+from src.utils.after_commit import _run_hooks
+from src.utils.events import (
+    MatchFinished,
+    MatchRescheduled,
+    MatchScheduled,
+    ScoreChanged,
+    TeamReplaced,
+    TournamentStageAdvanced,
+)
 from src.utils.pagination import PaginationParams
-from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
+from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
+from tests.utils import SQLiteTestCase
 
 
 class MatchServiceShould(unittest.TestCase):
     def setUp(self):
         self.db = MagicMock(spec=Session)
+        # Hooks queued for after the commit are kept in the info
+        self.db.info = {}
+        # Commits run the hooks queued for after them, as real ones do
+        self.db.commit.side_effect = lambda: _run_hooks(self.db)
         self.user_id = uuid4()
         self.admin_id = uuid4()
         self.director_id = uuid4()
@@ -90,9 +110,29 @@ class MatchServiceShould(unittest.TestCase):
 
         self.pagination = PaginationParams(offset=0, limit=10)
 
+        # Events are checked as published, their handlers are tested on their own
+        publish_patcher = patch("src.crud.match.publish")
+        self.mock_publish = publish_patcher.start()
+        self.addCleanup(publish_patcher.stop)
+
+    def published_emails(self) -> list[str]:
+        return [
+            email
+            for published in self.mock_publish.call_args_list
+            if isinstance(event := published.args[1], MatchScheduled)
+            for email in event.team1_emails + event.team2_emails
+        ]
+
+    def published(self, event_type: type) -> list:
+        return [
+            published.args[1]
+            for published in self.mock_publish.call_args_list
+            if isinstance(published.args[1], event_type)
+        ]
+
     def test_get_match_success(self):
         """Test get_match successfully retrieves a match."""
-        self.db.query.return_value.filter.return_value.first.return_value = self.match
+        self.db.get.return_value = self.match
 
         result = get_match(self.db, self.match_id)
 
@@ -104,7 +144,7 @@ class MatchServiceShould(unittest.TestCase):
 
     def test_get_match_not_found(self):
         """Test get_match raises exception when match not found."""
-        self.db.query.return_value.filter.return_value.first.return_value = None
+        self.db.get.return_value = None
 
         with self.assertRaises(HTTPException) as context:
             get_match(self.db, uuid4())
@@ -112,6 +152,47 @@ class MatchServiceShould(unittest.TestCase):
         self.assertEqual(context.exception.status_code, HTTP_404_NOT_FOUND)
         self.assertEqual(context.exception.detail, "Match not found")
 
+    def test_get_matches_by_ids_in_order(self):
+        """Test get_matches_by_ids returns each match once, in the order asked."""
+        other_match = Match(
+            id=uuid4(),
+            match_format=MatchFormat.MR12,
+            start_time=self.match.start_time,
+            is_finished=False,
+            stage=Stage.GROUP_STAGE,
+            team1_id=self.team2_id,
+            team2_id=self.team1_id,
+            team1_score=0,
+            team2_score=0,
+            team1=self.team2,
+            team2=self.team1,
+            tournament_id=self.tournament_id,
+            tournament=self.match.tournament,
+        )
+        query = self.db.query.return_value.options.return_value
+        query.filter.return_value = [self.match, other_match]
+
+        result = get_matches_by_ids(
+            self.db, [other_match.id, self.match_id, other_match.id]
+        )
+
+        self.assertEqual(
+            [match.id for match in result], [other_match.id, self.match_id]
+        )
+        self.db.query.assert_called_once_with(Match)
+
+    def test_get_matches_by_ids_not_found(self):
+        """Test get_matches_by_ids names the matches that were not found."""
+        missing_id = uuid4()
+        query = self.db.query.return_value.options.return_value
+        query.filter.return_value = [self.match]
+
+        with self.assertRaises(HTTPException) as context:
+            get_matches_by_ids(self.db, [self.match_id, missing_id])
+
+        self.assertEqual(context.exception.status_code, HTTP_404_NOT_FOUND)
+        self.assertEqual(context.exception.detail, f"Match not found: {missing_id}")
+
     def test_get_all_matches_with_filters(self):
         """Test get_all_matches with various filters."""
         mock_base_query = MagicMock()
@@ -168,10 +249,8 @@ class MatchServiceShould(unittest.TestCase):
     @patch("src.utils.validators.match_is_finished")
     @patch("src.utils.validators.match_has_started")
     @patch("src.utils.validators.is_author_of_tournament")
-    @patch("src.crud.match.send_email_notification")
     def test_update_match_success(
         self,
-        mock_send_email,
         mock_is_author_of_tournament,
         mock_match_has_started,
         mock_match_is_finished,
@@ -184,7 +263,7 @@ class MatchServiceShould(unittest.TestCase):
         mock_match_is_finished.return_value = None
         mock_match_has_started.return_value = None
         mock_is_author_of_tournament.return_value = None
-        mock_send_email.return_value = None
+        previous_start_time = self.match.start_time
 
         new_start_time = datetime.now(timezone.utc) + timedelta(days=3)
         match_update = MatchUpdate(start_time=new_start_time, stage=Stage.SEMI_FINAL)
@@ -196,7 +275,17 @@ class MatchServiceShould(unittest.TestCase):
         self.db.commit.assert_called_once()
         self.db.refresh.assert_called_once()
 
-        mock_send_email.assert_called_once()
+        self.assertEqual(
+            self.published(MatchRescheduled),
+            [
+                MatchRescheduled(
+                    match_id=self.match_id,
+                    director_email=self.tournament.director.email,
+                    previous_start_time=previous_start_time,
+                    start_time=new_start_time,
+                )
+            ],
+        )
 
     @patch("src.utils.validators.director_or_admin")
     def test_update_match_not_authorized(self, mock_director_or_admin):
@@ -284,6 +373,73 @@ class MatchServiceShould(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].id, self.match_id)
 
+    def _export(self, file_format, rows, **filters):
+        query = self.db.query.return_value
+        query.join.return_value = query
+        query.order_by.return_value = query
+        query.filter.return_value = query
+        query.column_descriptions = [
+            {"name": name} for name in ("id", "start_time", "stage", "winner_id")
+        ]
+        query.yield_per.return_value = iter(rows)
+        session_factory = MagicMock()
+        session_factory.return_value.__enter__.return_value = self.db
+
+        return "".join(export_matches(None, session_factory, file_format, **filters))
+
+    def test_export_matches_as_ndjson(self):
+        """Test that exported matches are streamed as one JSON object per line."""
+        start_time = datetime(2025, 1, 1, 12, 0)
+
+        output = self._export(
+            "ndjson",
+            [(self.match_id, start_time, Stage.FINAL, None)],
+            stage=Stage.FINAL,
+        )
+
+        self.assertEqual(
+            [json.loads(line) for line in output.splitlines()],
+            [
+                {
+                    "id": str(self.match_id),
+                    "start_time": "2025-01-01T12:00:00",
+                    "stage": "final",
+                    "winner_id": None,
+                }
+            ],
+        )
+        self.db.query.return_value.filter.assert_called_once()
+
+    def test_export_matches_as_csv_in_batches(self):
+        """Test that a CSV export has a header and is yielded in batches."""
+        rows = [
+            (uuid4(), datetime(2025, 1, 1), Stage.GROUP_STAGE, self.team1_id)
+            for _ in range(5)
+        ]
+
+        with patch.object(c, "EXPORT_BATCH_SIZE", 2):
+            output = self._export("csv", rows)
+
+        lines = output.splitlines()
+        self.assertEqual(lines[0], "id,start_time,stage,winner_id")
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(lines[1].split(",")[2:], ["group stage", str(self.team1_id)])
+        self.db.query.return_value.yield_per.assert_called_once_with(2)
+
+    @patch(
+        "src.utils.validators.team_exists",
+        side_effect=HTTPException(status_code=404, detail="Team not found"),
+    )
+    def test_export_matches_validates_filters_before_streaming(self, _):
+        """Test that an unknown team fails the request instead of the stream."""
+        session_factory = MagicMock()
+
+        with self.assertRaises(HTTPException) as context:
+            export_matches(self.db, session_factory, "csv", team_name="Unknown")
+
+        self.assertEqual(context.exception.status_code, HTTP_404_NOT_FOUND)
+        session_factory.assert_not_called()
+
     @patch(
         "src.utils.validators.team_exists",
         side_effect=HTTPException(status_code=404, detail="Team not found"),
@@ -349,6 +505,11 @@ class MatchServiceShould(unittest.TestCase):
         self.assertTrue(result.is_finished)
         self.assertEqual(result.team1_score, 16)
         self.assertEqual(result.team2_score, 13)
+        events = [published.args[1] for published in self.mock_publish.call_args_list]
+        self.assertIn(ScoreChanged(self.match_id, self.tournament_id, 16, 13), events)
+        self.assertIn(
+            MatchFinished(self.match_id, self.tournament_id, self.team1_id), events
+        )
 
     @patch("src.utils.validators.director_or_admin")
     @patch("src.utils.validators.match_exists")
@@ -411,8 +572,7 @@ class MatchServiceShould(unittest.TestCase):
         self.assertFalse(result.is_finished)
         self.assertEqual(result.team1_score, 1)
 
-    @patch("src.crud.match.send_email_notification")
-    def test_generate_matches_round_robin_no_players(self, mock_send_email):
+    def test_generate_matches_round_robin_no_players(self):
         """Test generate_matches with ROUND_ROBIN format and no players."""
         self.tournament.tournament_format = TournamentFormat.ROUND_ROBIN
         self.tournament.current_stage = Stage.GROUP_STAGE
@@ -420,17 +580,16 @@ class MatchServiceShould(unittest.TestCase):
 
         generate_matches(self.db, self.tournament)
         self.db.bulk_save_objects.assert_called_once()
-        mock_send_email.assert_not_called()
+        self.assertEqual(self.published_emails(), [])
 
-    @patch("src.crud.match.send_email_notification")
-    def test_generate_matches_single_elimination_no_players(self, mock_send_email):
+    def test_generate_matches_single_elimination_no_players(self):
         """Test generate_matches SINGLE_ELIMINATION with no players."""
         self.tournament.tournament_format = TournamentFormat.SINGLE_ELIMINATION
         self.db.bulk_save_objects = MagicMock()
 
         generate_matches(self.db, self.tournament)
         self.db.bulk_save_objects.assert_called_once()
-        mock_send_email.assert_not_called()
+        self.assertEqual(self.published_emails(), [])
 
     @patch("src.crud.match.send_email_notification")
     @patch("src.utils.validators.director_or_admin")
@@ -493,34 +652,29 @@ class MatchServiceShould(unittest.TestCase):
                 current_user=self.director_user,
             )
 
-        self.db.begin_nested.assert_called_once()
-        self.db.commit.assert_called()
+        self.db.begin_nested.assert_not_called()
+        self.db.commit.assert_called_once()
         self.db.refresh.assert_called()
 
     def test_match_team_prizes_final(self):
-        """Test awarding prizes in _match_team_prizes when match is final."""
+        """Test _match_team_prizes awards the prizes and releases the finalists."""
         from src.crud.match import _mark_match_as_finished, _match_team_prizes
 
-        prize1 = MagicMock(place=1, team_id=None, team=MagicMock())
-        prize2 = MagicMock(place=2, team_id=None, team=MagicMock())
-        self.tournament.prize_cuts = [prize1, prize2]
-
         self.match.stage = Stage.FINAL
         self.match.is_finished = False
         self.match.team1_score = 16
         self.match.team2_score = 14
         self.match.winner_team_id = None
-
         self.db.commit = MagicMock()
-        self.db.refresh = MagicMock()
 
         _mark_match_as_finished(self.db, self.match, self.team1_id)
-        _match_team_prizes(self.db, self.match)
-
-        self.db.commit.assert_called()
-        self.db.refresh.assert_called()
+        with patch("src.crud.match.crud_prize_cut.award_prizes") as mock_award:
+            _match_team_prizes(self.db, self.match)
 
-        self.assertEqual(prize1.team_id, self.team1_id)
+        mock_award.assert_called_once_with(self.db, self.tournament, self.match)
+        self.db.commit.assert_not_called()
+        self.assertIsNone(self.team1.tournament_id)
+        self.assertIsNone(self.team2.tournament_id)
 
     def test_update_match_no_changes(self):
         """Test update_match when no changes are provided
@@ -629,15 +783,11 @@ class MatchServiceShould(unittest.TestCase):
 
         valid_start = self.tournament.start_date + timedelta(days=1)
         match_update = MatchUpdate(start_time=valid_start)
-        self.db.commit = MagicMock()
-        self.db.refresh = MagicMock()
 
-        with patch("src.crud.match.send_email_notification") as mock_send:
-            _validate_and_update_start_time(
-                self.match, match_update, "%B %d, %Y at %H:%M"
-            )
+        _validate_and_update_start_time(self.db, self.match, match_update)
 
-            mock_send.assert_called_once()
+        (event,) = self.published(MatchRescheduled)
+        self.assertEqual(event.start_time, valid_start)
 
     def test_check_for_winner_for_mr15_no_winner(self):
         """Test _check_for_winner_for_mr15 when no winner conditions are met."""
@@ -744,6 +894,101 @@ class MatchServiceShould(unittest.TestCase):
             mock_update_stage.assert_not_called()
             mock_generate.assert_not_called()
 
+    def test_check_tournament_progress_advances_when_no_unfinished_matches(self):
+        """Test _check_tournament_progress when the last match of a stage ends
+        in a single elimination tournament created without a bracket."""
+        from src.crud.match import _check_tournament_progress
+
+        self.tournament.current_stage = Stage.SEMI_FINAL
+        self.db.query.return_value.filter.return_value.first.return_value = None
+        self.db.query.return_value.scalar.return_value = False
+
+        with (
+            patch("src.crud.match._update_current_stage") as mock_update_stage,
+            patch("src.crud.match.generate_matches") as mock_generate,
+        ):
+            _check_tournament_progress(self.db, self.match)
+
+            mock_update_stage.assert_called_once_with(self.db, self.tournament_id)
+            mock_generate.assert_called_once_with(self.db, self.tournament)
+
+    def test_check_tournament_progress_advances_bracket_winner(self):
+        """Test that a bracket match moves its winner on and creates the next
+        match without waiting for the rest of the stage."""
+        from src.crud.match import _check_tournament_progress
+
+        node = MagicMock()
+        next_match = Match(
+            id=uuid4(),
+            start_time=datetime.now(timezone.utc),
+            team1_id=self.team1_id,
+            team2_id=self.team2_id,
+        )
+        self.match.winner_team_id = self.team1_id
+        self.db.query.return_value.scalar.return_value = True
+        self.db.get.side_effect = [self.team1, self.team2]
+
+        with (
+            patch("src.crud.bracket.get_match_node", return_value=node),
+            patch(
+                "src.crud.bracket.advance_winner", return_value=next_match
+            ) as mock_advance,
+            patch("src.crud.match._notify_match_created") as mock_notify,
+            patch("src.crud.match._update_current_stage") as mock_update_stage,
+            patch("src.crud.match.generate_matches") as mock_generate,
+        ):
+            _check_tournament_progress(self.db, self.match)
+
+            mock_advance.assert_called_once_with(self.db, node, self.team1_id)
+            mock_notify.assert_called_once_with(
+                self.db, self.tournament, self.team1, self.team2, next_match.start_time
+            )
+            mock_update_stage.assert_not_called()
+            mock_generate.assert_not_called()
+
+    @patch("src.crud.match._check_tournament_progress")
+    def test_update_match_score_skips_progress_check_for_unfinished_match(
+        self, mock_check_progress
+    ):
+        """Test that a point which does not end the match skips stage checks."""
+        self.match.match_format = MatchFormat.MR15
+        self.match.team1_score = 3
+        self.match.team2_score = 2
+        self.match.is_finished = False
+
+        with (
+            patch("src.utils.validators.director_or_admin", return_value=None),
+            patch("src.utils.validators.match_exists", return_value=self.match),
+            patch("src.utils.validators.match_is_finished", return_value=None),
+            patch("src.utils.validators.team_has_five_players", return_value=None),
+            patch("src.utils.validators.is_author_of_tournament", return_value=None),
+        ):
+            update_match_score(self.db, self.match_id, "team1", self.director_user)
+
+        mock_check_progress.assert_not_called()
+
+    @patch("src.crud.match._apply_match_score_update")
+    def test_update_match_score_retries_after_concurrent_update(self, mock_apply):
+        """Test that an update losing a race is replayed on fresh data."""
+        expected = MagicMock()
+        mock_apply.side_effect = [StaleDataError("stale match"), expected]
+
+        result = update_match_score(self.db, self.match_id, "team1", self.director_user)
+
+        self.assertIs(result, expected)
+        self.assertEqual(mock_apply.call_count, 2)
+
+    @patch("src.crud.match._apply_match_score_update")
+    def test_update_match_score_conflict_when_attempts_exhausted(self, mock_apply):
+        """Test that an update that keeps losing races is reported as a conflict."""
+        mock_apply.side_effect = StaleDataError("stale match")
+
+        with self.assertRaises(HTTPException) as ctx:
+            update_match_score(self.db, self.match_id, "team1", self.director_user)
+
+        self.assertEqual(ctx.exception.status_code, HTTP_409_CONFLICT)
+        self.assertEqual(mock_apply.call_count, c.MAX_SCORE_UPDATE_ATTEMPTS)
+
     def test_update_current_stage_group_stage(self):
         """Test _update_current_stage when current_stage is GROUP_STAGE."""
         from src.crud.match import _update_current_stage
@@ -763,34 +1008,17 @@ class MatchServiceShould(unittest.TestCase):
             _update_current_stage(self.db, self.tournament_id)
 
             mock_leave_top.assert_called_once()
-            self.db.begin_nested.assert_called_once()
+            self.mock_publish.assert_called_once_with(
+                self.db,
+                TournamentStageAdvanced(
+                    self.tournament_id, self.tournament.current_stage
+                ),
+            )
+            self.db.begin_nested.assert_not_called()
             self.db.flush.assert_called()
 
             self.db.refresh.assert_called()
 
-    def test_match_team_prizes_unknown_place(self):
-        """Test _match_team_prizes with a prize having place not 1 or 2."""
-        from src.crud.match import _mark_match_as_finished, _match_team_prizes
-
-        prize_unknown = MagicMock(place=3, team_id=None, team=MagicMock())
-        self.tournament.prize_cuts.append(prize_unknown)
-
-        self.match.stage = Stage.FINAL
-        self.match.is_finished = False
-        self.match.team1_score = 16
-        self.match.team2_score = 14
-        self.match.winner_team_id = None
-
-        self.db.commit = MagicMock()
-        self.db.refresh = MagicMock()
-
-        _mark_match_as_finished(self.db, self.match, self.team1_id)
-        _match_team_prizes(self.db, self.match)
-
-        self.db.commit.assert_called()
-        self.db.refresh.assert_called()
-        self.assertIsNone(prize_unknown.team_id)
-
     def test_update_score_else_team2(self):
         """Test _update_score else part by incrementing team2 score."""
         from src.crud.match import _update_score
@@ -837,6 +1065,7 @@ class MatchServiceShould(unittest.TestCase):
         """Test update_match when team2_name is provided to cover that if condition."""
 
         mock_player = MagicMock(user_id=uuid4())
+        mock_player.user.email = "player@example.com"
         self.team2.players.append(mock_player)
 
         with (
@@ -846,7 +1075,6 @@ class MatchServiceShould(unittest.TestCase):
             patch("src.utils.validators.match_has_started", return_value=None),
             patch("src.utils.validators.is_author_of_tournament", return_value=None),
             patch("src.utils.validators.team_exists", return_value=self.team2),
-            patch("src.crud.match.send_email_notification") as mock_send,
         ):
             mock_query = MagicMock()
             self.db.query.return_value = mock_query
@@ -857,7 +1085,6 @@ class MatchServiceShould(unittest.TestCase):
             self.team2.logo = "team2_logo.png"
 
             match_update = MatchUpdate(team2_name="Team 2")
-            self.db.commit = MagicMock()
             self.db.refresh = MagicMock()
 
             result = update_match(
@@ -868,7 +1095,9 @@ class MatchServiceShould(unittest.TestCase):
             self.db.commit.assert_called_once()
             self.db.refresh.assert_called()
 
-            mock_send.assert_called()
+            (event,) = self.published(TeamReplaced)
+            self.assertEqual(event.team_emails, ("player@example.com",))
+            self.assertEqual(event.opponent_name, self.team1.name)
 
     def test_get_pairs_robin_round_multiple_teams(self):
         """Test _get_pairs_robin_round with more than 2
@@ -899,12 +1128,10 @@ class MatchServiceShould(unittest.TestCase):
         self.tournament.current_stage = Stage.GROUP_STAGE
 
         self.db.bulk_save_objects = MagicMock()
-        with patch("src.crud.match.send_email_notification") as mock_send:
-            generate_matches(self.db, self.tournament)
-
-            self.db.bulk_save_objects.assert_called_once()
+        generate_matches(self.db, self.tournament)
 
-            mock_send.assert_not_called()
+        self.db.bulk_save_objects.assert_called_once()
+        self.assertEqual(self.published_emails(), [])
 
     def test_check_for_winner_mr12_team1_wins_with_exact_score(self):
         """Test _check_for_winner_for_mr12 when team1 wins with exactly 13 points."""
@@ -957,6 +1184,7 @@ class MatchServiceShould(unittest.TestCase):
         """Test update_match when updating team1."""
 
         mock_player = MagicMock(user_id=uuid4())
+        mock_player.user.email = "player@example.com"
 
         new_team = Team(
             id=uuid4(),
@@ -980,7 +1208,6 @@ class MatchServiceShould(unittest.TestCase):
             patch("src.utils.validators.match_has_started", return_value=None),
             patch("src.utils.validators.is_author_of_tournament", return_value=None),
             patch("src.utils.validators.team_exists", return_value=new_team),
-            patch("src.crud.match.send_email_notification") as mock_send,
         ):
             match_update = MatchUpdate(team1_name="New Team 1")
 
@@ -1004,7 +1231,9 @@ class MatchServiceShould(unittest.TestCase):
             )
 
             self.assertEqual(result.team1_name, "New Team 1")
-            mock_send.assert_called()
+            (event,) = self.published(TeamReplaced)
+            self.assertEqual(event.team_emails, ("player@example.com",))
+            self.assertEqual(event.opponent_name, "Team 2")
             self.db.commit.assert_called_once()
 
     def test_get_pairs_single_elimination_even_teams(self):
@@ -1041,18 +1270,13 @@ class MatchServiceShould(unittest.TestCase):
         self.tournament.tournament_format = TournamentFormat.SINGLE_ELIMINATION
         self.tournament.current_stage = Stage.QUARTER_FINAL
 
-        with patch(
-            "src.crud.match.send_email_notification", return_value=None
-        ) as mock_send:
-            generate_matches(self.db, self.tournament)
-            mock_send.assert_called()
-
-            matches = self.db.query(Match).all()
-            for match in matches:
-                self.assertEqual(match.start_time.hour, c.START_HOUR)
-                self.assertTrue(
-                    match.start_time.date() > self.tournament.start_date.date()
-                )
+        generate_matches(self.db, self.tournament)
+        self.assertIn("test@example.com", self.published_emails())
+
+        matches = self.db.query(Match).all()
+        for match in matches:
+            self.assertEqual(match.start_time.hour, c.START_HOUR)
+            self.assertTrue(match.start_time.date() > self.tournament.start_date.date())
 
     def test_generate_matches_with_player_notifications(self):
         """Test generate_matches with players having user_ids for notifications."""
@@ -1069,13 +1293,96 @@ class MatchServiceShould(unittest.TestCase):
         self.team1.players = [mock_player]
         self.team2.players = [mock_player]
 
-        with patch("src.crud.match.send_email_notification") as mock_send:
-            generate_matches(self.db, self.tournament)
+        generate_matches(self.db, self.tournament)
+
+        self.assertEqual(
+            self.published_emails(), ["player@example.com", "player@example.com"]
+        )
+
+    @patch("src.crud.match.send_email_notification")
+    def test_notify_match_scheduled(self, mock_send):
+        """Test that the players of both teams hear about their opponent."""
+        from src.crud.match import notify_match_scheduled
+
+        notify_match_scheduled(
+            MatchScheduled(
+                tournament_title="Test Tournament",
+                start_time=datetime(2030, 5, 1, 11, 0),
+                team1_name="Team 1",
+                team1_emails=("one@example.com",),
+                team2_name="Team 2",
+                team2_emails=("two@example.com",),
+            )
+        )
+
+        self.assertEqual(
+            [
+                (sent.kwargs["email"], sent.kwargs["message"])
+                for sent in mock_send.call_args_list
+            ],
+            [
+                (
+                    "one@example.com",
+                    "Your match for the 'Test Tournament' tournament has been "
+                    "scheduled. You will be playing against Team 2 "
+                    "on May 01, 2030 at 11:00.",
+                ),
+                (
+                    "two@example.com",
+                    "Your match for the 'Test Tournament' tournament has been "
+                    "scheduled. You will be playing against Team 1 "
+                    "on May 01, 2030 at 11:00.",
+                ),
+            ],
+        )
+        self.assertEqual(mock_send.call_args.kwargs["subject"], "Match Created")
+
+    @patch("src.crud.match.send_email_notification")
+    def test_notify_match_rescheduled(self, mock_send):
+        """Test that the director hears the old and new start time."""
+        from src.crud.match import notify_match_rescheduled
 
-            self.assertEqual(mock_send.call_count, 2)
-            first_call = mock_send.call_args_list[0]
-            self.assertEqual(first_call.kwargs["email"], "player@example.com")
-            self.assertEqual(first_call.kwargs["subject"], "Match Created")
+        notify_match_rescheduled(
+            MatchRescheduled(
+                match_id=self.match_id,
+                director_email="director@example.com",
+                previous_start_time=datetime(2030, 5, 1, 11, 0),
+                start_time=datetime(2030, 5, 2, 14, 0),
+            )
+        )
+
+        mock_send.assert_called_once_with(
+            email="director@example.com",
+            subject="Match Updated",
+            message="Match's date has been updated "
+            "from May 01, 2030 at 11:00 to May 02, 2030 at 14:00",
+        )
+
+    @patch("src.crud.match.send_email_notification")
+    def test_notify_team_replaced(self, mock_send):
+        """Test that every player of the new team hears about their opponent."""
+        from src.crud.match import notify_team_replaced
+
+        notify_team_replaced(
+            TeamReplaced(
+                match_id=self.match_id,
+                tournament_title="Test Tournament",
+                start_time=datetime(2030, 5, 1, 11, 0),
+                opponent_name="Team 2",
+                team_emails=("one@example.com", "two@example.com"),
+            )
+        )
+
+        self.assertEqual(
+            [sent.kwargs["email"] for sent in mock_send.call_args_list],
+            ["one@example.com", "two@example.com"],
+        )
+        self.assertEqual(
+            mock_send.call_args.kwargs["message"],
+            "Your match for the 'Test Tournament' tournament has been "
+            "scheduled. You will be playing against Team 2 "
+            "on May 01, 2030 at 11:00.",
+        )
 
     def test_check_for_winner_mr12_team1_wins_overtime(self):
         """Test _check_for_winner_for_mr12 when team1 wins in overtime (>=16 points)."""
@@ -1117,22 +1424,21 @@ class MatchServiceShould(unittest.TestCase):
         self.tournament.start_date = start_time
         self.tournament.end_date = start_time + timedelta(days=5)
 
-        with patch("src.crud.match.send_email_notification"):
-            generate_matches(self.db, self.tournament)
+        generate_matches(self.db, self.tournament)
 
-            saved_matches = self.db.bulk_save_objects.call_args[0][0]
+        saved_matches = self.db.bulk_save_objects.call_args[0][0]
 
-            next_day_match = None
-            for match in saved_matches:
-                if match.start_time.day > start_time.day:
-                    next_day_match = match
-                    break
+        next_day_match = None
+        for match in saved_matches:
+            if match.start_time.day > start_time.day:
+                next_day_match = match
+                break
 
-            self.assertIsNotNone(
-                next_day_match, "Should have a match scheduled for next day"
-            )
-            self.assertEqual(next_day_match.start_time.hour, 11)
-            self.assertEqual(next_day_match.start_time.day, start_time.day + 1)
+        self.assertIsNotNone(
+            next_day_match, "Should have a match scheduled for next day"
+        )
+        self.assertEqual(next_day_match.start_time.hour, 11)
+        self.assertEqual(next_day_match.start_time.day, start_time.day + 1)
 
     def test_update_match_score_tie_game(self):
         """Test updating match score when game is tied."""
@@ -1164,3 +1470,82 @@ class MatchServiceShould(unittest.TestCase):
         _handle_finished_match(self.db, self.match, losing_team)
 
         self.assertIsNotNone(losing_team.tournament_id)
+
+
+class ConcurrentScoreUpdatesShould(SQLiteTestCase):
+    ON_DISK = True
+
+    def setUp(self):
+        """Set up a database file with a live match of two full teams."""
+        super().setUp()
+
+        director = User(
+            email="director@example.com", password_hash="hash", role=Role.DIRECTOR
+        )
+        start_date = datetime(2030, 5, 1, 11)
+        teams = [
+            Team(
+                name=f"Team {name}",
+                players=[
+                    Player(
+                        username=f"player{name}{i}",
+                        first_name="Kit",
+                        last_name="Ten",
+                        country="Bulgaria",
+                    )
+                    for i in range(5)
+                ],
+            )
+            for name in ("A", "B")
+        ]
+        match = Match(
+            match_format=MatchFormat.MR12,
+            start_time=start_date,
+            stage=Stage.GROUP_STAGE,
+            team1=teams[0],
+            team2=teams[1],
+            tournament=Tournament(
+                title="Race Cup",
+                tournament_format=TournamentFormat.ROUND_ROBIN,
+                start_date=start_date,
+                end_date=start_date + timedelta(days=2),
+                prize_pool=1000,
+                current_stage=Stage.GROUP_STAGE,
+                director=director,
+                teams=teams,
+            ),
+        )
+        with self.session() as db:
+            db.add(match)
+            db.commit()
+            self.match_id = match.id
+            self.director = UserResponse(
+                id=director.id, email=director.email, role=Role.DIRECTOR
+            )
+
+    def test_update_losing_a_race_is_retried(self):
+        """Test that a point scored from another session in between is kept."""
+        update_score = crud_match._update_score
+        calls = []
+
+        def score_from_another_session_first(db_match, team):
+            calls.append(team)
+            if len(calls) == 1:
+                # The other request commits after this one has read the match
+                with self.session() as other:
+                    update_match_score(other, self.match_id, "team2", self.director)
+            update_score(db_match, team)
+
+        with (
+            self.session() as db,
+            patch(
+                "src.crud.match._update_score",
+                side_effect=score_from_another_session_first,
+            ),
+        ):
+            result = update_match_score(db, self.match_id, "team1", self.director)
+
+        self.assertEqual((result.team1_score, result.team2_score), (1, 1))
+        self.assertEqual(calls, ["team1", "team2", "team1"])
+        with self.session() as db:
+            self.assertEqual(db.get(Match, self.match_id).version_id, 3)
@@ -1,4 +1,5 @@
 from datetime import datetime
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
@@ -10,6 +11,7 @@ from src.crud.player import (
     get_player,
     get_player_by_user_id,
     get_players,
+    import_players,
     update_player,
 )
 from src.models import Player, Team, Tournament, User
@@ -81,6 +83,9 @@ class PlayerServiceShould(unittest.TestCase):
             patch("src.utils.validators.team_exists", return_value=self.team),
             patch("src.utils.validators.team_player_limit_reached", return_value=None),
             patch("src.utils.s3.s3_service.upload_file", return_value="avatar_url"),
+            patch(
+                "src.crud.player.crud_tournament_view.refresh_view_team"
+            ) as mock_refresh_view_team,
         ):
             player_create = PlayerCreate(
                 username="newplayer",
@@ -110,6 +115,7 @@ class PlayerServiceShould(unittest.TestCase):
             self.db.add.assert_called_once()
             self.db.commit.assert_called_once()
             self.db.refresh.assert_called_once()
+            mock_refresh_view_team.assert_called_once_with(self.db, self.team)
             self.assertEqual(result.username, "newplayer")
             self.assertEqual(result.avatar, "avatar_url")
             self.assertEqual(result.team_name, "Test Team")
@@ -171,7 +177,7 @@ class PlayerServiceShould(unittest.TestCase):
                 with self.assertRaises(HTTPException) as context:
                     create_player(self.db, player_create, None, self.current_user)
 
-                mock_username.assert_called_once()
+                mock_username.assert_not_called()
                 mock_auth.assert_called_once_with(self.current_user)
 
                 self.assertEqual(
@@ -185,6 +191,7 @@ class PlayerServiceShould(unittest.TestCase):
     def test_get_players_with_filters(self):
         """Test getting players with various filters."""
         mock_query = MagicMock()
+        mock_query.options.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.filter.return_value = mock_query
         mock_query.offset.return_value = mock_query
@@ -208,6 +215,7 @@ class PlayerServiceShould(unittest.TestCase):
     def test_get_players_with_team_filter(self):
         """Test getting players with team filter."""
         mock_query = MagicMock()
+        mock_query.options.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.filter.return_value = mock_query
         mock_query.offset.return_value = mock_query
@@ -218,7 +226,11 @@ class PlayerServiceShould(unittest.TestCase):
         mock_team = MagicMock()
         mock_team.ilike = MagicMock()
 
-        with patch("src.models.Player.team", mock_team):
+        # The mocked relationship cannot be loaded, nor needs to be
+        with (
+            patch("src.models.Player.team", mock_team),
+            patch("src.crud.player.loader_options", return_value=[]),
+        ):
             result = get_players(
                 self.db,
                 self.pagination,
@@ -233,6 +245,7 @@ class PlayerServiceShould(unittest.TestCase):
     def test_get_players_no_filters(self):
         """Test getting players without any filters."""
         mock_query = MagicMock()
+        mock_query.options.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
@@ -312,6 +325,7 @@ class PlayerServiceShould(unittest.TestCase):
             patch("src.utils.validators.team_player_limit_reached", return_value=None),
             patch("src.utils.s3.s3_service.delete_file", return_value=None),
             patch("src.utils.s3.s3_service.upload_file", return_value="new_avatar_url"),
+            patch("src.crud.player.crud_tournament_view.refresh_view_team"),
         ):
             player_update = PlayerUpdate(
                 username="updatedplayer",
@@ -339,6 +353,7 @@ class PlayerServiceShould(unittest.TestCase):
             patch("src.utils.validators.player_exists", return_value=self.player),
             patch("src.utils.validators.director_or_admin", return_value=None),
             patch("src.utils.validators.player_username_unique", return_value=None),
+            patch("src.crud.player.crud_tournament_view.refresh_view_team"),
         ):
             player_update = PlayerUpdate(username="updatedplayer")
 
@@ -373,7 +388,10 @@ class PlayerServiceShould(unittest.TestCase):
 
     def test_update_player_no_changes(self):
         """Test updating a player with no changes provided."""
-        with patch("src.utils.validators.player_exists", return_value=self.player):
+        with (
+            patch("src.utils.validators.player_exists", return_value=self.player),
+            patch("src.crud.player.crud_tournament_view.refresh_view_team"),
+        ):
             player_update = PlayerUpdate()
 
             result = update_player(
@@ -407,3 +425,82 @@ class PlayerServiceShould(unittest.TestCase):
 
             self.assertEqual(result.username, "notournament")
             self.assertIsNone(result.current_tournament_title)
+
+    def _import_players(self, content: bytes, user: User) -> list[dict]:
+        session_factory = MagicMock()
+        session_factory.return_value.__enter__.return_value = self.db
+        lines = import_players(session_factory, content, "players.ndjson", None, user)
+        return [json.loads(line) for line in lines]
+
+    def test_import_players_resolves_team_names(self):
+        """Test that imported players are assigned to their team by name."""
+        query = self.db.query.return_value
+        query.filter.return_value.__iter__.return_value = iter([])
+        query.outerjoin.return_value.filter.return_value.group_by.return_value = [
+            (self.team_id, "Test Team", 9)
+        ]
+        content = (
+            b'{"username": "kitten_one", "first_name": "kit", '
+            b'"last_name": "ten", "country": "france", "team_name": "Test Team"}\n'
+            b'{"username": "kitten_two", "first_name": "kit", '
+            b'"last_name": "ten", "country": "france"}\n'
+        )
+
+        events = self._import_players(content, self.director_user)
+
+        records = self.db.execute.call_args[0][1]
+        self.assertEqual(records[0]["team_id"], self.team_id)
+        self.assertEqual(records[0]["first_name"], "Kit")
+        self.assertIsNone(records[1]["team_id"])
+        self.assertEqual(events[-1]["event"], "completed")
+        self.assertEqual(events[-1]["imported"], 2)
+        self.db.commit.assert_called_once()
+
+    def test_import_players_rejects_unknown_and_full_teams(self):
+        """Test that teams are checked before anything is imported."""
+        query = self.db.query.return_value
+        query.filter.return_value.__iter__.return_value = iter([("kitten_one",)])
+        query.outerjoin.return_value.filter.return_value.group_by.return_value = [
+            (self.team_id, "Test Team", 9)
+        ]
+        rows = [
+            ("kitten_one", "Test Team"),
+            ("kitten_two", "Test Team"),
+            ("kitten_three", "Test Team"),
+            ("kitten_four", "Missing Team"),
+        ]
+        content = "".join(
+            json.dumps(
+                {
+                    "username": username,
+                    "first_name": "Kit",
+                    "last_name": "Ten",
+                    "country": "France",
+                    "team_name": team_name,
+                }
+            )
+            + "\n"
+            for username, team_name in rows
+        ).encode()
+
+        events = self._import_players(content, self.director_user)
+
+        errors = {event["row"]: event["detail"] for event in events[:-2]}
+        self.assertEqual(
+            errors,
+            {
+                1: "Player with this username already exists",
+                3: "Team has reached the player limit",
+                4: "Team 'Missing Team' not found",
+            },
+        )
+        self.assertEqual(events[-1]["event"], "failed")
+        self.db.execute.assert_not_called()
+        self.db.rollback.assert_called_once()
+
+    def test_import_players_not_authorized(self):
+        """Test that only directors and admins can import players."""
+        with self.assertRaises(HTTPException) as context:
+            import_players(MagicMock(), b"", "players.csv", None, self.current_user)
+
+        self.assertEqual(context.exception.status_code, status.HTTP_403_FORBIDDEN)
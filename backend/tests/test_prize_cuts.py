@@ -5,10 +5,22 @@ from uuid import uuid4
 
 from sqlalchemy.orm import Session
 from src.crud.prize_cut import (
+    award_prizes,
     create_prize_cuts_for_tournament,
     delete_prize_cuts_for_tournament,
+    get_payout_template,
 )
-from src.models import PrizeCut, Tournament
+from src.models import (
+    Match,
+    PrizeCut,
+    Team,
+    Tournament,
+    TournamentStanding,
+    User,
+)
+from src.models.enums import MatchFormat, Payout, Role, Stage, TournamentFormat
+from src.utils.prizes import PAYOUT_TEMPLATES
+from tests.utils import SQLiteTestCase
 
 
 class PrizeCutServiceShould(unittest.TestCase):
@@ -127,3 +139,141 @@ class PrizeCutServiceShould(unittest.TestCase):
 
                 self.assertAlmostEqual(actual_first_proportion, 0.7, places=2)
                 self.assertAlmostEqual(actual_second_proportion, 0.3, places=2)
+
+    def test_create_prize_cuts_from_template(self):
+        """Test creating a prize cut for every place of a payout template."""
+        create_prize_cuts_for_tournament(
+            self.db, self.tournament, 1000, PAYOUT_TEMPLATES[Payout.TOP_FOUR]
+        )
+
+        prizes = [call[0][0] for call in self.db.add.call_args_list]
+        self.assertEqual([prize.place for prize in prizes], [1, 2, 3, 4])
+        self.assertEqual([prize.prize_cut for prize in prizes], [400, 300, 200, 100])
+
+    def test_get_payout_template(self):
+        """Test that fixed amounts win over a template and keep the order."""
+        fixed = get_payout_template(Payout.TOP_THREE, [500, 200])
+        named = get_payout_template(Payout.TOP_THREE)
+        self.tournament.prize_cuts = [
+            PrizeCut(place=2, prize_cut=2500),
+            PrizeCut(place=1, prize_cut=7500),
+        ]
+        current = get_payout_template(db_tournament=self.tournament)
+
+        self.assertEqual(fixed.amounts(10000), [500, 200])
+        self.assertEqual(named, PAYOUT_TEMPLATES[Payout.TOP_THREE])
+        self.assertEqual(current.amounts(2000), [1500, 500])
+
+
+class PrizeAwardShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database with a tournament of eight teams."""
+        super().setUp()
+
+        self.teams = [Team(name=f"Team {name}") for name in "ABCDEFGH"]
+        self.db.add_all(self.teams)
+        self.director = User(
+            email="director@example.com", password_hash="hash", role=Role.DIRECTOR
+        )
+        self.db.flush()
+
+    def create_tournament(
+        self, tournament_format: TournamentFormat, payout: Payout
+    ) -> Tournament:
+        db_tournament = Tournament(
+            title="Prize Cup",
+            tournament_format=tournament_format,
+            start_date=datetime(2030, 5, 1),
+            end_date=datetime(2030, 5, 10),
+            prize_pool=1000,
+            current_stage=Stage.FINAL,
+            director=self.director,
+        )
+        self.db.add(db_tournament)
+        self.db.flush()
+        create_prize_cuts_for_tournament(
+            self.db, db_tournament, 1000, PAYOUT_TEMPLATES[payout]
+        )
+        return db_tournament
+
+    def play(self, db_tournament, stage, winner, loser, loser_score) -> Match:
+        db_match = Match(
+            match_format=MatchFormat.MR15,
+            start_time=datetime(2030, 5, 1),
+            is_finished=True,
+            stage=stage,
+            team1=winner,
+            team2=loser,
+            team1_score=16,
+            team2_score=loser_score,
+            winner_team_id=winner.id,
+            tournament=db_tournament,
+        )
+        self.db.add(db_match)
+        self.db.flush()
+        return db_match
+
+    def prize_team_names(self, db_tournament) -> list[str | None]:
+        return [
+            prize.team.name if prize.team else None
+            for prize in sorted(db_tournament.prize_cuts, key=lambda p: p.place)
+        ]
+
+    def test_award_prizes_of_a_single_elimination(self):
+        """Test that the semi final losers follow the finalists."""
+        a, b, c, d, e, f, g, h = self.teams
+        db_tournament = self.create_tournament(
+            TournamentFormat.SINGLE_ELIMINATION, Payout.TOP_FOUR
+        )
+        for winner, loser in ((a, h), (d, e), (b, g), (c, f)):
+            self.play(db_tournament, Stage.QUARTER_FINAL, winner, loser, 2)
+        self.play(db_tournament, Stage.SEMI_FINAL, a, d, 3)
+        self.play(db_tournament, Stage.SEMI_FINAL, b, c, 14)
+        final = self.play(db_tournament, Stage.FINAL, b, a, 10)
+        # The prizes are already loaded, so the UPDATE has to refresh them
+        self.assertEqual(self.prize_team_names(db_tournament), [None] * 4)
+        statements = self.count_statements()
+
+        award_prizes(self.db, db_tournament, final)
+
+        self.assertEqual(
+            self.prize_team_names(db_tournament),
+            ["Team B", "Team A", "Team C", "Team D"],
+        )
+        updates = [s for s in statements if s.startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn("prizecut", updates[0])
+
+    def test_award_prizes_of_a_round_robin(self):
+        """Test that the group standings rank the teams after the final."""
+        a, b, c, d = self.teams[:4]
+        db_tournament = self.create_tournament(
+            TournamentFormat.ROUND_ROBIN, Payout.TOP_THREE
+        )
+        for points, team in enumerate((c, a, d, b)):
+            self.db.add(
+                TournamentStanding(
+                    tournament=db_tournament, team=team, points=points * 3
+                )
+            )
+        final = self.play(db_tournament, Stage.FINAL, d, b, 12)
+
+        award_prizes(self.db, db_tournament, final)
+
+        self.assertEqual(
+            self.prize_team_names(db_tournament), ["Team D", "Team B", "Team A"]
+        )
+
+    def test_award_prizes_with_more_places_than_teams(self):
+        """Test that places nobody reached keep no team."""
+        a, b = self.teams[:2]
+        db_tournament = self.create_tournament(
+            TournamentFormat.ONE_OFF_MATCH, Payout.TOP_THREE
+        )
+        final = self.play(db_tournament, Stage.FINAL, a, b, 5)
+
+        award_prizes(self.db, db_tournament, final)
+
+        self.assertEqual(
+            self.prize_team_names(db_tournament), ["Team A", "Team B", None]
+        )
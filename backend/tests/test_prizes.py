@@ -0,0 +1,53 @@
+import unittest
+
+from src.models.enums import Payout
+from src.utils.prizes import PAYOUT_TEMPLATES, PayoutTemplate, rank_placements
+
+
+class PayoutTemplateShould(unittest.TestCase):
+    def test_percentages_add_up_to_the_prize_pool(self):
+        """Test that rounded percentages never lose or add a unit."""
+        for payout, template in PAYOUT_TEMPLATES.items():
+            for prize_pool in (1, 7, 999, 1000, 9999, 123457):
+                with self.subTest(payout=payout, prize_pool=prize_pool):
+                    self.assertEqual(sum(template.amounts(prize_pool)), prize_pool)
+
+    def test_rounding_favours_the_largest_remainders(self):
+        """Test that the units left by rounding down go where most was lost."""
+        self.assertEqual(PAYOUT_TEMPLATES[Payout.TOP_TWO].amounts(9999), [6999, 3000])
+        self.assertEqual(PAYOUT_TEMPLATES[Payout.TOP_THREE].amounts(101), [51, 30, 20])
+
+    def test_fixed_amounts_ignore_the_prize_pool(self):
+        """Test that fixed payouts are paid as they are."""
+        template = PayoutTemplate((500, 300, 200), fixed=True)
+
+        self.assertEqual(template.amounts(5000), [500, 300, 200])
+        self.assertEqual(template.total(5000), 1000)
+
+    def test_from_amounts_keeps_the_split(self):
+        """Test that a template made from prizes scales them to a new pool."""
+        template = PayoutTemplate.from_amounts([600, 300, 100])
+
+        self.assertEqual(template.amounts(2000), [1200, 600, 200])
+
+
+class RankPlacementsShould(unittest.TestCase):
+    def test_finalists_come_first(self):
+        """Test that the final decides the first two places."""
+        self.assertEqual(rank_placements("A", "B", [["C", "D"]], 2), ["A", "B"])
+
+    def test_eliminated_teams_follow_in_order(self):
+        """Test that eliminated teams are ranked by group, then within it."""
+        placements = rank_placements("A", "B", [["C", "D"], ["E", "F"]], 5)
+
+        self.assertEqual(placements, ["A", "B", "C", "D", "E"])
+
+    def test_finalists_are_skipped_in_the_standings(self):
+        """Test that finalists listed among the others are not ranked twice."""
+        placements = rank_placements("B", "A", [["A", "C", "B", "D"]], 4)
+
+        self.assertEqual(placements, ["B", "A", "C", "D"])
+
+    def test_fewer_teams_than_places(self):
+        """Test that places without a team are left out."""
+        self.assertEqual(rank_placements("A", "B", [], 4), ["A", "B"])
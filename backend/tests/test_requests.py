@@ -11,6 +11,7 @@ from src.crud.request import (
     check_valid_request,
     get_all,
     get_current_user_request,
+    notify_request_resolved,
     send_director_request,
     send_link_to_player_request,
     update_request,
@@ -18,6 +19,7 @@ from src.crud.request import (
 from src.models import Request, User
 from src.models.enums import RequestStatus, RequestType, Role
 from src.schemas.request import RequestListResponse
+from src.utils.events import RequestResolved
 from src.utils.pagination import PaginationParams
 
 load_dotenv()
@@ -227,7 +229,7 @@ class RequestServiceShould(unittest.TestCase):
         )
         mock_player_already_linked.assert_not_called()
 
-    @patch("src.crud.request.send_email_notification")
+    @patch("src.crud.request.publish")
     @patch("src.crud.request.check_request_status")
     @patch("src.crud.request.user_exists")
     @patch("src.crud.request.request_exists")
@@ -238,7 +240,7 @@ class RequestServiceShould(unittest.TestCase):
         mock_request_exists,
         mock_user_exists,
         mock_check_request_status,
-        mock_send_email_notification,
+        mock_publish,
     ):
         """Test update_request accepts a director promotion request."""
         # Mock the validators and dependencies
@@ -268,11 +270,15 @@ class RequestServiceShould(unittest.TestCase):
             request_id=request_id,
         )
 
-        # Assert email notification is sent
-        mock_send_email_notification.assert_called_with(
-            email=self.current_user.email,
-            subject="Request Accepted",
-            message="Your request to be promoted to director has been accepted.",
+        # Assert the user is emailed once the request is committed
+        mock_publish.assert_called_once_with(
+            self.db,
+            RequestResolved(
+                request_id=request_id,
+                request_type=RequestType.PROMOTE_USER_TO_DIRECTOR,
+                status=RequestStatus.ACCEPTED,
+                email=self.current_user.email,
+            ),
         )
         # Assert database operations are performed
         self.db.commit.assert_called()
@@ -493,10 +499,12 @@ class RequestServiceShould(unittest.TestCase):
     @patch("src.crud.request.request_exists")
     @patch("src.crud.request.user_exists")
     @patch("src.crud.request.check_request_status")
-    @patch("src.crud.request.send_email_notification")
+    @patch("src.crud.request.publish")
+    @patch("src.crud.request.crud_tournament_view.refresh_view_team")
     def test_update_request_link_user_to_player_accepted(
         self,
-        mock_send_email_notification,
+        mock_refresh_view_team,
+        mock_publish,
         mock_check_request_status,
         mock_user_exists,
         mock_request_exists,
@@ -533,7 +541,8 @@ class RequestServiceShould(unittest.TestCase):
             request_id=request_id,
         )
 
-        mock_send_email_notification.assert_called_once()
+        self.assertEqual(mock_publish.call_args.args[1].player_username, "test_player")
+        mock_refresh_view_team.assert_called_once_with(self.db, player.team)
         self.db.commit.assert_called()
         self.assertEqual(response.status, RequestStatus.ACCEPTED)
 
@@ -542,10 +551,10 @@ class RequestServiceShould(unittest.TestCase):
     @patch("src.crud.request.request_exists")
     @patch("src.crud.request.user_exists")
     @patch("src.crud.request.check_request_status")
-    @patch("src.crud.request.send_email_notification")
+    @patch("src.crud.request.publish")
     def test_update_request_link_user_to_player_rejected(
         self,
-        mock_send_email_notification,
+        mock_publish,
         mock_check_request_status,
         mock_user_exists,
         mock_request_exists,
@@ -582,11 +591,11 @@ class RequestServiceShould(unittest.TestCase):
             request_id=request_id,
         )
 
-        mock_send_email_notification.assert_called_once()
+        mock_publish.assert_called_once()
         self.db.commit.assert_called()
         self.assertEqual(response.status, RequestStatus.REJECTED)
 
-    @patch("src.crud.request.send_email_notification")
+    @patch("src.crud.request.publish")
     @patch("src.crud.request.check_request_status")
     @patch("src.crud.request.user_exists")
     @patch("src.crud.request.request_exists")
@@ -597,7 +606,7 @@ class RequestServiceShould(unittest.TestCase):
         mock_request_exists,
         mock_user_exists,
         mock_check_request_status,
-        mock_send_email_notification,
+        mock_publish,
     ):
         """Test update_request rejects a director request."""
         mock_user_role_is_admin.return_value = None
@@ -625,7 +634,7 @@ class RequestServiceShould(unittest.TestCase):
             request_id=request_id,
         )
 
-        mock_send_email_notification.assert_called_once()
+        mock_publish.assert_called_once()
         self.db.commit.assert_called()
         self.assertEqual(response.status, RequestStatus.REJECTED)
 
@@ -659,3 +668,41 @@ class RequestServiceShould(unittest.TestCase):
                 self.assertIsNone(response)
                 self.db.commit.assert_not_called()
                 self.db.refresh.assert_not_called()
+
+    @patch("src.crud.request.send_email_notification")
+    def test_notify_request_resolved_director(self, mock_send_email_notification):
+        """Test that a resolved director request is emailed to the user."""
+        notify_request_resolved(
+            RequestResolved(
+                request_id=uuid4(),
+                request_type=RequestType.PROMOTE_USER_TO_DIRECTOR,
+                status=RequestStatus.ACCEPTED,
+                email="user@example.com",
+            )
+        )
+
+        mock_send_email_notification.assert_called_once_with(
+            email="user@example.com",
+            subject="Request Accepted",
+            message="Your request to be promoted to director has been accepted.",
+        )
+
+    @patch("src.crud.request.send_email_notification")
+    def test_notify_request_resolved_link_to_player(self, mock_send_email_notification):
+        """Test that a resolved link request names the player."""
+        notify_request_resolved(
+            RequestResolved(
+                request_id=uuid4(),
+                request_type=RequestType.LINK_USER_TO_PLAYER,
+                status=RequestStatus.REJECTED,
+                email="user@example.com",
+                player_username="test_player",
+            )
+        )
+
+        mock_send_email_notification.assert_called_once_with(
+            email="user@example.com",
+            subject="Request Rejected",
+            message="Your request to be linked "
+            "to the player 'test_player' has been rejected.",
+        )
@@ -0,0 +1,59 @@
+from datetime import datetime
+import json
+import unittest
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from src.models.enums import MatchFormat, Stage
+from src.schemas.match import MatchResponse
+from src.utils.responses import ModelResponse
+
+
+class ModelResponseShould(unittest.TestCase):
+    def setUp(self):
+        """Set up a match response to serialize."""
+        self.match = MatchResponse(
+            id=uuid4(),
+            match_format=MatchFormat.MR12,
+            start_time=datetime(2030, 5, 1, 11, 30),
+            is_finished=False,
+            stage=Stage.GROUP_STAGE,
+            team1_id=uuid4(),
+            team2_id=uuid4(),
+            team1_score=3,
+            team2_score=5,
+            team1_name="Team One",
+            team1_logo=None,
+            team2_name="Team Two",
+            team2_logo="logo.png",
+            tournament_id=uuid4(),
+            tournament_title="Test Tournament",
+        )
+
+    def test_render_model_as_fastapi_would(self):
+        """Test that a model is encoded like FastAPI encodes it."""
+        response = ModelResponse(self.match)
+
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(json.loads(response.body), jsonable_encoder(self.match))
+
+    def test_render_list_of_models(self):
+        """Test that a list of models is encoded as a JSON array."""
+        response = ModelResponse([self.match, self.match])
+
+        self.assertEqual(
+            json.loads(response.body), jsonable_encoder([self.match, self.match])
+        )
+        self.assertEqual(json.loads(ModelResponse([]).body), [])
+
+    def test_render_only_requested_fields(self):
+        """Test that a sparse fieldset applies to a model and to every model
+        of a list."""
+        fields = {"id": True, "team1_score": True}
+
+        single = ModelResponse(self.match, fields)
+        many = ModelResponse([self.match], fields)
+
+        expected = {"id": str(self.match.id), "team1_score": 3}
+        self.assertEqual(json.loads(single.body), expected)
+        self.assertEqual(json.loads(many.body), [expected])
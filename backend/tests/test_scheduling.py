@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta, timezone
+from itertools import combinations
+import unittest
+
+from src.utils.scheduling import SlotAllocator, round_robin_rounds, schedule_pairs
+
+
+class SchedulingShould(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.first_day = datetime(2030, 5, 1, 9, 30, tzinfo=timezone.utc)
+        self.day_start = self.first_day.replace(hour=11, minute=0)
+
+    def allocator(self, **kwargs) -> SlotAllocator:
+        return SlotAllocator(
+            self.first_day,
+            match_minutes=180,
+            start_hour=11,
+            end_hour=20,
+            **kwargs,
+        )
+
+    def test_round_robin_rounds_pair_every_team_once(self):
+        """Test that every pair meets once and no team plays twice a round."""
+        for count in (2, 3, 4, 5, 16, 17):
+            teams = [f"Team {i}" for i in range(count)]
+
+            rounds = round_robin_rounds(teams)
+
+            self.assertEqual(len(rounds), count - 1 if count % 2 == 0 else count)
+            pairs = [pair for round_pairs in rounds for pair in round_pairs]
+            self.assertCountEqual(pairs, list(combinations(teams, 2)))
+            for round_pairs in rounds:
+                playing = [team for pair in round_pairs for team in pair]
+                self.assertEqual(len(playing), len(set(playing)))
+
+    def test_allocator_fills_a_day_then_moves_to_the_next(self):
+        """Test that slots run from the start hour up to the end hour."""
+        allocator = self.allocator()
+
+        times = [allocator.allocate(f"A{i}", f"B{i}") for i in range(5)]
+
+        self.assertEqual([time.hour for time in times], [11, 14, 17, 20, 11])
+        self.assertEqual(times[0], self.day_start)
+        self.assertEqual(times[4], self.day_start + timedelta(days=1))
+
+    def test_allocator_respects_daily_cap(self):
+        """Test that a day never gets more matches than its cap."""
+        allocator = self.allocator(max_matches_per_day=2, venues=4)
+
+        times = [allocator.allocate(f"A{i}", f"B{i}") for i in range(5)]
+
+        days = [(time - self.day_start).days for time in times]
+        self.assertEqual(days, [0, 0, 1, 1, 2])
+
+    def test_allocator_plays_matches_in_parallel_on_free_venues(self):
+        """Test that venues share a slot but a team is never booked twice."""
+        allocator = self.allocator(venues=2)
+
+        first = allocator.allocate("A", "B")
+        second = allocator.allocate("C", "D")
+        third = allocator.allocate("A", "C")
+
+        self.assertEqual(first, second)
+        self.assertEqual(third, first + timedelta(minutes=180))
+
+    def test_allocator_keeps_rest_between_matches_of_a_team(self):
+        """Test that a team's next match waits for its rest."""
+        allocator = self.allocator(venues=2, rest_minutes=180)
+
+        first = allocator.allocate("A", "B")
+        other = allocator.allocate("C", "D")
+        rested = allocator.allocate("A", "C")
+        unrelated = allocator.allocate("E", "F")
+
+        self.assertEqual(first, other)
+        self.assertEqual(rested, first + timedelta(minutes=360))
+        self.assertEqual(unrelated, first + timedelta(minutes=180))
+
+    def test_allocator_moves_rest_past_the_end_of_the_day(self):
+        """Test that a match in the last slot pushes the team to the next day."""
+        allocator = self.allocator(rest_minutes=180)
+        for i in range(3):
+            allocator.allocate(f"A{i}", f"B{i}")
+
+        late = allocator.allocate("A", "B")
+        again = allocator.allocate("A", "C")
+
+        self.assertEqual(late.hour, 20)
+        self.assertEqual(again, self.day_start + timedelta(days=1))
+
+    def test_allocator_rejects_schedule_without_slots(self):
+        """Test that impossible slot settings are rejected."""
+        with self.assertRaises(ValueError):
+            SlotAllocator(self.first_day, 180, start_hour=20, end_hour=11)
+
+    def test_schedule_pairs_books_large_league(self):
+        """Test that a 256-team league is scheduled within every constraint."""
+        teams = list(range(256))
+        allocator = self.allocator(max_matches_per_day=64, venues=16)
+
+        schedule = schedule_pairs(
+            (pair for round_pairs in round_robin_rounds(teams) for pair in round_pairs),
+            allocator,
+        )
+
+        self.assertEqual(len(schedule), 256 * 255 // 2)
+        per_day, per_slot, team_slots = {}, {}, set()
+        for team1, team2, start_time in schedule:
+            per_day[start_time.date()] = per_day.get(start_time.date(), 0) + 1
+            per_slot[start_time] = per_slot.get(start_time, 0) + 1
+            for team in (team1, team2):
+                self.assertNotIn((team, start_time), team_slots)
+                team_slots.add((team, start_time))
+        self.assertLessEqual(max(per_day.values()), 64)
+        self.assertLessEqual(max(per_slot.values()), 16)
@@ -0,0 +1,222 @@
+from collections import Counter
+from datetime import datetime, timedelta
+import unittest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from src.crud import season as crud_season
+from src.models import BracketNode, Match, Tournament, User
+from src.models.enums import MatchFormat, Role, Stage, TournamentFormat
+from src.schemas.tournament import SeasonSchedule
+from src.schemas.user import UserResponse
+from src.utils.events import TournamentRescheduled
+from src.utils.intervals import IntervalIndex
+from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
+
+
+class SeasonSchedulerShould(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.db = MagicMock(spec=Session)
+        self.now = datetime(2030, 5, 1, 9)
+        self.day = datetime(2030, 5, 2, 11)
+        self.director = User(id=uuid4(), email="director@test.com")
+        self.current_user = UserResponse(
+            id=self.director.id, email=self.director.email, role=Role.DIRECTOR
+        )
+        self.tournament = Tournament(
+            id=uuid4(),
+            title="Season Cup",
+            tournament_format=TournamentFormat.ROUND_ROBIN,
+            start_date=self.day,
+            end_date=self.day.replace(hour=23, minute=59, second=59),
+            director_id=self.director.id,
+            director=self.director,
+        )
+        self.index = IntervalIndex()
+        self.day_counts = Counter()
+
+    def match(self, start_time: datetime, team1_id=None, team2_id=None) -> Match:
+        return Match(
+            id=uuid4(),
+            match_format=MatchFormat.MR15,
+            start_time=start_time,
+            stage=Stage.GROUP_STAGE,
+            team1_id=team1_id or uuid4(),
+            team2_id=team2_id or uuid4(),
+            tournament_id=self.tournament.id,
+        )
+
+    def book_other(self, start_time: datetime, director_id=None, team_ids=()):
+        crud_season._book(
+            self.index,
+            self.day_counts,
+            start_time,
+            uuid4(),
+            director_id or uuid4(),
+            list(team_ids),
+        )
+
+    def schedule(self, items, broadcast_slots=4):
+        with (
+            patch("src.crud.season._get_pending_items", return_value=items),
+            patch("src.crud.season.publish") as mock_publish,
+            patch("src.crud.season.crud_tournament_view.refresh_view"),
+        ):
+            scheduled, moved = crud_season._schedule_tournament(
+                self.db,
+                self.index,
+                self.day_counts,
+                self.tournament,
+                self.now,
+                broadcast_slots,
+            )
+        return scheduled, moved, mock_publish
+
+    def test_get_season_tournaments_not_found(self):
+        """Test that every tournament of the season has to exist."""
+        query = self.db.query.return_value.filter.return_value.order_by.return_value
+        query.all.return_value = [self.tournament]
+
+        with self.assertRaises(HTTPException) as context:
+            crud_season._get_season_tournaments(
+                self.db, [self.tournament.id, uuid4()], self.current_user
+            )
+
+        self.assertEqual(context.exception.status_code, HTTP_404_NOT_FOUND)
+
+    def test_get_season_tournaments_of_another_director(self):
+        """Test that a director can only schedule their own tournaments."""
+        self.tournament.director_id = uuid4()
+        query = self.db.query.return_value.filter.return_value.order_by.return_value
+        query.all.return_value = [self.tournament]
+
+        with self.assertRaises(HTTPException) as context:
+            crud_season._get_season_tournaments(
+                self.db, [self.tournament.id], self.current_user
+            )
+
+        self.assertEqual(context.exception.status_code, HTTP_403_FORBIDDEN)
+
+    def test_schedule_season_rolls_back_on_error(self):
+        """Test that nothing is rescheduled when a tournament is missing."""
+        query = self.db.query.return_value.filter.return_value.order_by.return_value
+        query.all.return_value = []
+
+        with self.assertRaises(HTTPException):
+            crud_season.schedule_season(
+                self.db,
+                SeasonSchedule(tournament_ids=[self.tournament.id]),
+                self.current_user,
+            )
+
+        self.db.rollback.assert_called_once()
+        self.db.commit.assert_not_called()
+
+    def test_schedule_tournament_keeps_free_slots(self):
+        """Test that matches without conflicts keep their start times."""
+        matches = [self.match(self.day), self.match(self.day + timedelta(hours=3))]
+
+        scheduled, moved, mock_publish = self.schedule(matches)
+
+        self.assertEqual(scheduled, 2)
+        self.assertEqual(moved, [])
+        self.assertEqual(
+            [m.start_time for m in matches], [self.day, matches[1].start_time]
+        )
+        mock_publish.assert_not_called()
+
+    def test_schedule_tournament_moves_director_conflicts(self):
+        """Test that a director never runs two matches at once."""
+        self.book_other(self.day, director_id=self.director.id)
+        match = self.match(self.day)
+
+        scheduled, moved, mock_publish = self.schedule([match])
+
+        self.assertEqual(match.start_time, self.day + timedelta(hours=3))
+        self.assertEqual(len(moved), 1)
+        self.assertEqual(moved[0].previous_start_time, self.day)
+        mock_publish.assert_called_once_with(
+            self.db,
+            TournamentRescheduled(
+                tournament_id=self.tournament.id,
+                tournament_title="Season Cup",
+                director_email="director@test.com",
+                rescheduled_matches=1,
+            ),
+        )
+
+    @patch("src.crud.season.send_email_notification")
+    def test_notify_tournament_rescheduled(self, mock_email):
+        """Test that the director is told how many matches moved."""
+        crud_season.notify_tournament_rescheduled(
+            TournamentRescheduled(
+                tournament_id=self.tournament.id,
+                tournament_title="Season Cup",
+                director_email="director@test.com",
+                rescheduled_matches=3,
+            )
+        )
+
+        mock_email.assert_called_once_with(
+            email="director@test.com",
+            subject="Tournament Rescheduled",
+            message="3 matches of the 'Season Cup' tournament "
+            "have been rescheduled for the season.",
+        )
+
+    def test_schedule_tournament_moves_team_conflicts(self):
+        """Test that a team never plays two matches at once."""
+        team_id = uuid4()
+        self.book_other(self.day + timedelta(hours=1), team_ids=[team_id])
+        match = self.match(self.day, team1_id=team_id)
+
+        self.schedule([match])
+
+        self.assertEqual(match.start_time, self.day + timedelta(hours=6))
+
+    def test_schedule_tournament_respects_broadcast_slots(self):
+        """Test that no more matches than broadcast slots run at once."""
+        self.book_other(self.day)
+        self.book_other(self.day)
+        match = self.match(self.day)
+
+        self.schedule([match], broadcast_slots=2)
+
+        self.assertEqual(match.start_time, self.day + timedelta(hours=3))
+
+    def test_schedule_tournament_keeps_match_order(self):
+        """Test that a moved match pushes the following ones back."""
+        self.book_other(self.day, director_id=self.director.id)
+        matches = [self.match(self.day), self.match(self.day + timedelta(hours=3))]
+        node = BracketNode(
+            id=uuid4(),
+            start_time=self.day + timedelta(hours=6),
+            tournament_id=self.tournament.id,
+        )
+
+        scheduled, moved, _ = self.schedule([*matches, node])
+
+        self.assertEqual(
+            [item.start_time for item in (*matches, node)],
+            [self.day + timedelta(hours=hours) for hours in (3, 6, 9)],
+        )
+        # The bracket match waiting for its teams moves without being reported
+        self.assertEqual(scheduled, 2)
+        self.assertEqual(len(moved), 2)
+
+    def test_schedule_tournament_extends_end_date(self):
+        """Test that the tournament ends on the day of its last match."""
+        for hours in (0, 3, 6, 9):
+            self.book_other(self.day + timedelta(hours=hours), self.director.id)
+        match = self.match(self.day)
+
+        self.schedule([match])
+
+        next_day = self.day + timedelta(days=1)
+        self.assertEqual(match.start_time, next_day)
+        self.assertEqual(
+            self.tournament.end_date, next_day.replace(hour=23, minute=59, second=59)
+        )
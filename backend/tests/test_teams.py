@@ -1,4 +1,5 @@
 from datetime import datetime
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
@@ -10,13 +11,17 @@ from src.crud.team import (
     create_teams_lst_for_tournament,
     get_team,
     get_teams,
+    get_teams_by_ids,
+    import_teams,
     leave_top_teams_from_robin_round,
     update_team,
 )
-from src.models import Match, Team, Tournament, User
-from src.models.enums import MatchFormat, Role, Stage
-from src.schemas.team import TeamCreate, TeamUpdate
+from src.models import Match, Player, Team, Tournament, User
+from src.models.enums import MatchFormat, Role, Stage, TournamentFormat
+from src.schemas.team import TeamCreate, TeamListResponse, TeamUpdate
+from src.utils.fields import parse_fields
 from src.utils.pagination import PaginationParams
+from tests.utils import SQLiteTestCase
 
 
 class TeamServiceShould(unittest.TestCase):
@@ -58,53 +63,6 @@ class TeamServiceShould(unittest.TestCase):
 
         self.pagination = PaginationParams(offset=0, limit=10)
 
-    def test_get_teams_with_all_filters(self):
-        """Test get_teams with all filters applied."""
-
-        mock_team_query = MagicMock()
-        mock_team_query.filter.return_value = mock_team_query
-        mock_team_query.all.return_value = [self.team]
-
-        mock_player_query = MagicMock()
-        mock_player_query.group_by.return_value = mock_player_query
-        mock_player_query.all.return_value = [(self.team_id, 5)]
-
-        call_count = 0
-
-        def side_effect(*args):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return mock_team_query
-            return mock_player_query
-
-        self.db.query.side_effect = side_effect
-
-        result = get_teams(
-            self.db,
-            self.pagination,
-            search="Test",
-            is_available="false",
-            has_space="true",
-            sort_by="desc",
-        )
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].name, "Test Team")
-        mock_team_query.filter.assert_called()
-        self.assertEqual(call_count, 2)
-
-    def test_get_teams_no_filters(self):
-        """Test get_teams without any filters."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = [self.team]
-        self.db.query.return_value = mock_query
-
-        result = get_teams(self.db, self.pagination)
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].name, "Test Team")
-
     @patch("src.utils.validators.director_or_admin")
     @patch("src.utils.validators.team_name_unique")
     @patch("src.utils.s3.s3_service.upload_file")
@@ -238,41 +196,34 @@ class TeamServiceShould(unittest.TestCase):
         team_names = ["Team 1", "Team 2"]
 
         mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-
-        mock_query.first.side_effect = [
-            None,
-            None,
-            None,
-            None,
-        ]
+        mock_query.filter.return_value.all.return_value = []
         self.db.query.return_value = mock_query
 
         create_teams_lst_for_tournament(self.db, team_names, self.tournament_id)
 
-        self.assertEqual(self.db.add.call_count, 2)
-
-        self.db.flush.assert_called()
-        mock_query.filter.call_count >= 2
-
-        calls = self.db.add.call_args_list
-        for call in calls:
-            created_team = call[0][0]
-            self.assertIsInstance(created_team, Team)
-            self.assertEqual(created_team.tournament_id, self.tournament_id)
-            self.assertIn(created_team.name, team_names)
+        self.db.query.assert_called_once()
+        self.db.execute.assert_called_once()
+        new_teams = self.db.execute.call_args[0][1]
+        self.assertEqual(
+            new_teams,
+            [
+                {"name": "Team 1", "tournament_id": self.tournament_id},
+                {"name": "Team 2", "tournament_id": self.tournament_id},
+            ],
+        )
+        mock_query.update.assert_not_called()
+        self.db.add.assert_not_called()
+        self.db.flush.assert_not_called()
 
     def test_create_teams_lst_existing_team_in_tournament(self):
         """Test creating teams list fails when team is in another tournament."""
-        existing_team = Team(
-            id=uuid4(),
-            name="Existing Team",
-            tournament_id=uuid4(),  # Already in a tournament
+        existing_team = MagicMock(
+            id=uuid4(), tournament_id=uuid4()  # Already in a tournament
         )
+        existing_team.name = "Existing Team"
 
         mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = existing_team
+        mock_query.filter.return_value.all.return_value = [existing_team]
         self.db.query.return_value = mock_query
 
         with self.assertRaises(HTTPException) as context:
@@ -284,6 +235,24 @@ class TeamServiceShould(unittest.TestCase):
         self.assertIn(
             "already participates in another tournament", context.exception.detail
         )
+        self.db.execute.assert_not_called()
+
+    def test_create_teams_lst_existing_team_claimed_concurrently(self):
+        """Test creating teams list fails when a team is taken during the update."""
+        existing_team = MagicMock(id=uuid4(), tournament_id=None)
+        existing_team.name = "Existing Team"
+
+        mock_query = MagicMock()
+        mock_query.filter.return_value.all.return_value = [existing_team]
+        mock_query.filter.return_value.update.return_value = 0
+        self.db.query.return_value = mock_query
+
+        with self.assertRaises(HTTPException) as context:
+            create_teams_lst_for_tournament(
+                self.db, ["Existing Team"], self.tournament_id
+            )
+
+        self.assertEqual(context.exception.status_code, status.HTTP_409_CONFLICT)
 
     def test_leave_top_teams_from_robin_round(self):
         """Test leave_top_teams_from_robin_round successful execution."""
@@ -322,8 +291,13 @@ class TeamServiceShould(unittest.TestCase):
         self.tournament.teams = [team1, team2, team3]
         self.tournament.matches = [match1, match2, match3]
 
-        leave_top_teams_from_robin_round(self.db, self.tournament)
+        with patch(
+            "src.crud.tournament_standing.get_ordered_team_ids",
+            return_value=[team1.id, team2.id, team3.id],
+        ) as mock_ordering:
+            leave_top_teams_from_robin_round(self.db, self.tournament)
 
+        mock_ordering.assert_called_once_with(self.db, self.tournament)
         self.assertEqual(team1.tournament_id, self.tournament_id)
         self.assertEqual(team2.tournament_id, self.tournament_id)
         self.assertIsNone(team3.tournament_id)
@@ -424,149 +398,28 @@ class TeamServiceShould(unittest.TestCase):
 
     def test_create_teams_lst_existing_team_no_tournament(self):
         """Test creating teams list with existing team not in tournament."""
-        existing_team = Team(id=uuid4(), name="Existing Team", tournament_id=None)
+        existing_team = MagicMock(id=uuid4(), tournament_id=None)
+        existing_team.name = "Existing Team"
 
         mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = existing_team
+        mock_query.filter.return_value.all.return_value = [existing_team]
+        mock_query.filter.return_value.update.return_value = 1
         self.db.query.return_value = mock_query
 
-        create_teams_lst_for_tournament(self.db, ["Existing Team"], self.tournament_id)
-
-        self.assertEqual(existing_team.tournament_id, self.tournament_id)
+        create_teams_lst_for_tournament(
+            self.db, ["Existing Team", "New Team"], self.tournament_id
+        )
 
+        mock_query.filter.return_value.update.assert_called_once_with(
+            {Team.tournament_id: self.tournament_id}
+        )
+        self.db.execute.assert_called_once()
+        self.assertEqual(
+            self.db.execute.call_args[0][1],
+            [{"name": "New Team", "tournament_id": self.tournament_id}],
+        )
         self.db.add.assert_not_called()
 
-        mock_query.filter.assert_called_once()
-        self.db.query.assert_called_once_with(Team)
-
-    def test_get_teams_with_lost_matches(self):
-        """Test get_teams with a team that has lost matches."""
-        team1 = Team(id=uuid4(), name="Losing Team", played_games=5, won_games=2)
-
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [team1]
-        self.db.query.return_value = mock_query
-
-        mock_player_counts = [(team1.id, 5)]
-        mock_player_query = MagicMock()
-        mock_player_query.group_by.return_value.all.return_value = mock_player_counts
-
-        call_count = 0
-
-        def side_effect(*args):
-            nonlocal call_count
-            call_count += 1
-            return mock_player_query if call_count == 2 else mock_query
-
-        self.db.query.side_effect = side_effect
-
-        result = get_teams(self.db, self.pagination, sort_by="desc")
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].name, "Losing Team")
-
-        self.assertEqual(result[0].game_win_ratio, "40%")  # 2/5 * 100
-
-    def test_get_teams_with_finished_tournament(self):
-        """Test get_teams for teams that participated in finished tournaments."""
-        team = Team(id=uuid4(), name="Tournament Team", played_games=5, won_games=2)
-
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [team]
-        self.db.query.return_value = mock_query
-
-        mock_player_counts = [(team.id, 5)]
-        mock_player_query = MagicMock()
-        mock_player_query.group_by.return_value.all.return_value = mock_player_counts
-
-        call_count = 0
-
-        def side_effect(*args):
-            nonlocal call_count
-            call_count += 1
-            return mock_player_query if call_count == 2 else mock_query
-
-        self.db.query.side_effect = side_effect
-
-        result = get_teams(self.db, self.pagination)
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].name, "Tournament Team")
-
-    def test_get_teams_with_full_roster(self):
-        """Test get_teams filtering for teams with full rosters (10 or more players)."""
-        team_full = Team(id=uuid4(), name="Full Team", played_games=5, won_games=2)
-
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [team_full]
-
-        mock_player_counts = [(team_full.id, 10)]
-        mock_player_query = MagicMock()
-        mock_player_query.group_by.return_value = mock_player_query
-        mock_player_query.all.return_value = mock_player_counts
-
-        call_count = 0
-
-        def side_effect(*args):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return mock_query
-            return mock_player_query
-
-        self.db.query.side_effect = side_effect
-
-        result = get_teams(self.db, self.pagination, has_space="false")
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].name, "Full Team")
-
-        call_count = 0
-
-        result_with_space = get_teams(self.db, self.pagination, has_space="true")
-
-        self.assertEqual(len(result_with_space), 0)
-
-    def test_get_teams_with_available_space(self):
-        """Test get_teams filtering for teams with
-        available space (less than 10 players)."""
-        team = Team(id=uuid4(), name="Team With Space", played_games=5, won_games=2)
-
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [team]
-
-        mock_player_counts = [(team.id, 8)]
-        mock_player_query = MagicMock()
-        mock_player_query.group_by.return_value = mock_player_query
-        mock_player_query.all.return_value = mock_player_counts
-
-        call_count = 0
-
-        def side_effect(*args):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return mock_query
-            return mock_player_query
-
-        self.db.query.side_effect = side_effect
-
-        result = get_teams(self.db, self.pagination, has_space="true")
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].name, "Team With Space")
-
-        call_count = 0
-
-        result_full = get_teams(self.db, self.pagination, has_space="false")
-
-        self.assertEqual(len(result_full), 0)
-
     @patch("src.utils.validators.team_exists")
     def test_tournaments_played_when_match_finished(self, mock_team_exists):
         """Test counting tournaments played when a
@@ -605,3 +458,226 @@ class TeamServiceShould(unittest.TestCase):
         result = get_team(self.db, self.team_id)
 
         self.assertEqual(result.team_stats["tournaments_played"], 1)
+
+    def test_import_teams_rejects_existing_and_repeated_names(self):
+        """Test that team names are checked against the database and the file."""
+        self.db.query.return_value.filter.return_value.__iter__.return_value = iter(
+            [("Test Team",)]
+        )
+        session_factory = MagicMock()
+        session_factory.return_value.__enter__.return_value = self.db
+        content = b"name\nTest Team\nNew Team\nNew Team\n"
+
+        events = [
+            json.loads(line)
+            for line in import_teams(
+                session_factory, content, "teams.csv", "text/csv", self.director_user
+            )
+        ]
+
+        self.assertEqual(events[0]["detail"], "Team 'Test Team' already exists")
+        self.assertEqual(
+            events[1]["detail"], "'New Team' appears more than once in the file"
+        )
+        self.assertEqual(events[-1]["event"], "failed")
+        self.db.execute.assert_not_called()
+        self.db.commit.assert_not_called()
+
+
+class TeamListShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database with teams of players."""
+        super().setUp()
+
+        tournament = Tournament(
+            title="Team Cup",
+            tournament_format=TournamentFormat.ROUND_ROBIN,
+            start_date=datetime(2030, 5, 1),
+            end_date=datetime(2030, 5, 3),
+            prize_pool=1000,
+            current_stage=Stage.GROUP_STAGE,
+            director=User(
+                email="director@example.com", password_hash="hash", role=Role.DIRECTOR
+            ),
+        )
+        # (name, played, won, players, in a tournament)
+        teams = [
+            ("Losing Team", 5, 2, 3, False),
+            ("Winning Team", 4, 3, 10, True),
+            ("Fresh Team", 0, 0, 0, False),
+            ("Even Team", 6, 3, 8, True),
+        ]
+        for name, played, won, players, in_tournament in teams:
+            db_team = Team(
+                name=name,
+                played_games=played,
+                won_games=won,
+                tournament=tournament if in_tournament else None,
+            )
+            for i in range(players):
+                prefix = name.split()[0].lower()
+                user = User(
+                    email=f"{prefix}{i}@example.com",
+                    password_hash="hash",
+                    role=Role.PLAYER,
+                )
+                self.db.add(
+                    Player(
+                        username=f"{prefix}{i}",
+                        first_name="Kitten",
+                        last_name="Player",
+                        country="Bulgaria",
+                        team=db_team,
+                        user=user,
+                    )
+                )
+            self.db.add(db_team)
+        self.db.commit()
+        self.db.expunge_all()
+
+        self.pagination = PaginationParams(offset=0, limit=10)
+
+    def test_get_teams_sorts_by_win_ratio_before_paginating(self):
+        """Test that teams are sorted by win ratio across pages."""
+        ascending = get_teams(self.db, self.pagination)
+        first_page = get_teams(
+            self.db, PaginationParams(offset=0, limit=2), sort_by="desc"
+        )
+        second_page = get_teams(
+            self.db, PaginationParams(offset=2, limit=2), sort_by="desc"
+        )
+
+        self.assertEqual(
+            [team.name for team in ascending],
+            ["Fresh Team", "Losing Team", "Even Team", "Winning Team"],
+        )
+        self.assertEqual(
+            [team.name for team in first_page + second_page],
+            ["Winning Team", "Even Team", "Losing Team", "Fresh Team"],
+        )
+        self.assertEqual(ascending[1].game_win_ratio, "40%")
+        self.assertEqual(ascending[0].game_win_ratio, "0%")
+
+    def test_get_teams_with_all_filters(self):
+        """Test get_teams with all filters applied."""
+        result = get_teams(
+            self.db,
+            self.pagination,
+            search="Team",
+            is_available="false",
+            has_space="true",
+            sort_by="desc",
+        )
+
+        self.assertEqual([team.name for team in result], ["Even Team"])
+
+    def test_get_teams_by_space(self):
+        """Test that teams with a full roster of 10 players have no space."""
+        with_space = get_teams(self.db, self.pagination, has_space="true")
+        full = get_teams(self.db, self.pagination, has_space="false")
+
+        self.assertEqual(
+            [team.name for team in with_space],
+            ["Fresh Team", "Losing Team", "Even Team"],
+        )
+        self.assertEqual([team.name for team in full], ["Winning Team"])
+
+    def test_get_teams_loads_players_in_a_fixed_number_of_queries(self):
+        """Test that the players and their users are not lazy-loaded."""
+        statements = self.count_statements()
+
+        result = get_teams(self.db, self.pagination)
+
+        # The teams, their players and the players' users
+        self.assertEqual(len(statements), 3)
+        players = {
+            player.username: player for team in result for player in team.players
+        }
+        self.assertEqual(len(players), 21)
+        self.assertEqual(players["winning0"].user_email, "winning0@example.com")
+        self.assertEqual(players["winning0"].team_name, "Winning Team")
+
+    def test_get_teams_without_emails_skips_users(self):
+        """Test that player summaries without emails do not load users."""
+        statements = self.count_statements()
+
+        result = get_teams(self.db, self.pagination, include_emails=False)
+
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(
+            all(player.user_email is None for team in result for player in team.players)
+        )
+
+    def test_get_teams_without_players_field_skips_players(self):
+        """Test that a fieldset without players does not load them."""
+        statements = self.count_statements()
+
+        result = get_teams(
+            self.db, self.pagination, fields=parse_fields(TeamListResponse, "id,name")
+        )
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(len(result), 4)
+        self.assertTrue(all(team.players == [] for team in result))
+
+    def add_matches(self) -> dict:
+        teams = {team.name: team for team in self.db.query(Team)}
+        tournament = self.db.query(Tournament).one()
+        for day, (team1, team2) in enumerate(
+            [("Winning Team", "Even Team"), ("Even Team", "Losing Team")] * 3
+        ):
+            self.db.add(
+                Match(
+                    match_format=MatchFormat.MR12,
+                    start_time=datetime(2030, 5, 1 + day),
+                    stage=Stage.GROUP_STAGE,
+                    team1=teams[team1],
+                    team2=teams[team2],
+                    winner_team_id=teams[team1].id,
+                    tournament=tournament,
+                )
+            )
+        self.db.commit()
+        team_ids = {name: team.id for name, team in teams.items()}
+        self.db.expunge_all()
+        return team_ids
+
+    def test_get_teams_by_ids_in_a_fixed_number_of_queries(self):
+        """Test that a batch of teams is loaded without lazy loads."""
+        teams = self.add_matches()
+        statements = self.count_statements()
+
+        result = get_teams_by_ids(
+            self.db,
+            [teams["Even Team"], teams["Fresh Team"], teams["Winning Team"]],
+        )
+
+        # The teams, their players, users and prize cuts, their matches and
+        # the matches' two teams and tournaments
+        self.assertEqual(len(statements), 8)
+        self.assertEqual(
+            [team.name for team in result], ["Even Team", "Fresh Team", "Winning Team"]
+        )
+        self.assertEqual(len(result[0].matches), 6)
+        self.assertEqual(result[0].team_stats["best_opponent"], "Losing Team")
+        self.assertEqual(result[1].matches, [])
+        self.assertEqual(len(result[2].players), 10)
+
+    def test_get_teams_by_ids_matches_get_team(self):
+        """Test that a batch get returns the same details as single gets."""
+        teams = self.add_matches()
+        team_ids = list(teams.values())
+
+        batch = get_teams_by_ids(self.db, team_ids)
+
+        self.assertEqual(batch, [get_team(self.db, team_id) for team_id in team_ids])
+
+    def test_get_teams_by_ids_missing_team(self):
+        """Test that a batch get fails when any of the teams is missing."""
+        missing_id = uuid4()
+
+        with self.assertRaises(HTTPException) as context:
+            get_teams_by_ids(self.db, [self.db.query(Team).first().id, missing_id])
+
+        self.assertEqual(context.exception.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(context.exception.detail, f"Team not found: {missing_id}")
@@ -0,0 +1,210 @@
+from datetime import datetime
+from types import SimpleNamespace
+import unittest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from src.crud.tournament_standing import (
+    create_standings,
+    get_ordered_team_ids,
+    get_standings,
+    rebuild_standings,
+    record_match_result,
+)
+from src.models import Match, Team, Tournament, TournamentStanding
+from src.models.enums import MatchFormat, Stage, TournamentFormat
+
+
+class TournamentStandingServiceShould(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.db = MagicMock(spec=Session)
+        self.tournament_id = uuid4()
+        self.team1 = Team(id=uuid4(), name="Team 1")
+        self.team2 = Team(id=uuid4(), name="Team 2")
+        self.team3 = Team(id=uuid4(), name="Team 3")
+
+        self.tournament = Tournament(
+            id=self.tournament_id,
+            title="Test Tournament",
+            tournament_format=TournamentFormat.ROUND_ROBIN,
+            start_date=datetime.now(),
+            end_date=datetime.now(),
+            prize_pool=10000,
+            current_stage=Stage.GROUP_STAGE,
+        )
+        self.tournament.teams = [self.team1, self.team2, self.team3]
+
+        self.match = Match(
+            id=uuid4(),
+            match_format=MatchFormat.MR12,
+            stage=Stage.GROUP_STAGE,
+            is_finished=True,
+            team1_id=self.team1.id,
+            team2_id=self.team2.id,
+            team1_score=13,
+            team2_score=7,
+            winner_team_id=self.team1.id,
+            tournament_id=self.tournament_id,
+        )
+
+    def test_create_standings_adds_empty_row_per_team(self):
+        """Test that every team of the group gets a standing row."""
+        create_standings(self.db, self.tournament)
+
+        standings = list(self.db.add_all.call_args[0][0])
+        self.assertEqual(
+            [standing.team_id for standing in standings],
+            [self.team1.id, self.team2.id, self.team3.id],
+        )
+        for standing in standings:
+            self.assertEqual(standing.tournament_id, self.tournament_id)
+
+    @patch("src.crud.tournament_standing._has_standings", return_value=True)
+    def test_record_match_result_increments_existing_rows(self, _):
+        """Test that a result updates both rows in place."""
+        update = self.db.query.return_value.filter.return_value.update
+        update.return_value = 1
+
+        record_match_result(self.db, self.match)
+
+        self.assertEqual(update.call_count, 2)
+        self.db.add.assert_not_called()
+        self.db.flush.assert_called_once()
+
+    @patch("src.crud.tournament_standing._has_standings", return_value=True)
+    def test_record_match_result_adds_row_for_swapped_in_team(self, _):
+        """Test that a team without a row gets one holding the result."""
+        self.db.query.return_value.filter.return_value.update.side_effect = [1, 0]
+
+        record_match_result(self.db, self.match)
+
+        standing = self.db.add.call_args[0][0]
+        self.assertIsInstance(standing, TournamentStanding)
+        self.assertEqual(standing.team_id, self.team2.id)
+        self.assertEqual(standing.played_games, 1)
+        self.assertEqual(standing.wins, 0)
+        self.assertEqual(standing.losses, 1)
+        self.assertEqual(standing.points, 0)
+        self.assertEqual(standing.score_difference, -6)
+        self.assertEqual(standing.total_score, 7)
+
+    @patch("src.crud.tournament_standing.rebuild_standings")
+    @patch("src.crud.tournament_standing._has_standings", return_value=False)
+    def test_record_match_result_rebuilds_missing_standings(self, _, mock_rebuild):
+        """Test that a group without standings is rebuilt from its matches."""
+        record_match_result(self.db, self.match)
+
+        mock_rebuild.assert_called_once_with(self.db, self.tournament_id)
+        self.db.query.return_value.filter.return_value.update.assert_not_called()
+
+    def test_rebuild_standings_counts_finished_group_matches(self):
+        """Test rebuilding the standings from the finished group matches."""
+        unfinished = SimpleNamespace(
+            team1_id=self.team1.id,
+            team2_id=self.team3.id,
+            team1_score=5,
+            team2_score=3,
+            winner_team_id=None,
+            is_finished=False,
+        )
+        self.db.query.return_value.filter.return_value.all.return_value = [
+            self.match,
+            unfinished,
+        ]
+
+        rebuild_standings(self.db, self.tournament_id)
+
+        self.db.query.return_value.filter.return_value.delete.assert_called_once()
+        standings = {
+            standing.team_id: standing for standing in self.db.add_all.call_args[0][0]
+        }
+        self.assertEqual(len(standings), 3)
+
+        winner = standings[self.team1.id]
+        self.assertEqual(winner.played_games, 1)
+        self.assertEqual(winner.wins, 1)
+        self.assertEqual(winner.points, 2)
+        self.assertEqual(winner.score_difference, 6)
+        self.assertEqual(winner.total_score, 13)
+
+        loser = standings[self.team2.id]
+        self.assertEqual(loser.losses, 1)
+        self.assertEqual(loser.points, 0)
+        self.assertEqual(loser.score_difference, -6)
+
+        self.assertEqual(standings[self.team3.id].played_games, 0)
+
+    @patch("src.crud.tournament_standing._has_standings", return_value=True)
+    def test_get_standings_assigns_places_in_order(self, _):
+        """Test that the standings are returned with their places."""
+        first = TournamentStanding(
+            team_id=self.team1.id,
+            played_games=2,
+            wins=2,
+            losses=0,
+            points=4,
+            score_difference=12,
+            total_score=26,
+        )
+        second = TournamentStanding(
+            team_id=self.team2.id,
+            played_games=2,
+            wins=1,
+            losses=1,
+            points=2,
+            score_difference=1,
+            total_score=20,
+        )
+        query = self.db.query.return_value.join.return_value.filter.return_value
+        query.order_by.return_value.all.return_value = [
+            (first, "Team 1", None),
+            (second, "Team 2", "logo.png"),
+        ]
+
+        with patch(
+            "src.utils.validators.tournament_exists", return_value=self.tournament
+        ):
+            result = get_standings(self.db, self.tournament_id)
+
+        self.assertEqual([row.place for row in result], [1, 2])
+        self.assertEqual(result[0].team_name, "Team 1")
+        self.assertEqual(result[0].points, 4)
+        self.assertEqual(result[1].team_logo, "logo.png")
+        self.db.commit.assert_not_called()
+
+    @patch("src.crud.tournament_standing.rebuild_standings")
+    @patch("src.crud.tournament_standing._has_standings", return_value=False)
+    def test_get_standings_rebuilt_concurrently(self, _, mock_rebuild):
+        """Test that a rebuild racing with another first read is re-read."""
+        self.db.commit.side_effect = IntegrityError("INSERT", {}, Exception())
+        query = self.db.query.return_value.join.return_value.filter.return_value
+        query.order_by.return_value.all.return_value = []
+
+        with patch(
+            "src.utils.validators.tournament_exists", return_value=self.tournament
+        ):
+            result = get_standings(self.db, self.tournament_id)
+
+        mock_rebuild.assert_called_once_with(self.db, self.tournament_id)
+        self.db.rollback.assert_called_once()
+        query.order_by.return_value.all.assert_called_once()
+        self.assertEqual(result, [])
+
+    @patch("src.crud.tournament_standing.rebuild_standings")
+    @patch("src.crud.tournament_standing._has_standings", return_value=False)
+    def test_get_ordered_team_ids_rebuilds_without_committing(self, _, mock_rebuild):
+        """Test reading the ordering of a group that has no standings yet."""
+        query = self.db.query.return_value.join.return_value.filter.return_value
+        query.order_by.return_value.all.return_value = [
+            (self.team2.id,),
+            (self.team1.id,),
+        ]
+
+        result = get_ordered_team_ids(self.db, self.tournament)
+
+        self.assertEqual(result, [self.team2.id, self.team1.id])
+        mock_rebuild.assert_called_once_with(self.db, self.tournament_id)
+        self.db.commit.assert_not_called()
@@ -0,0 +1,209 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+from src.crud import tournament_view as crud_tournament_view
+from src.crud.convert_db_to_response import convert_db_to_match_list_response
+from src.models import Match, Team, Tournament, TournamentView, User
+from src.models.enums import MatchFormat, Stage, TournamentFormat
+from tests.utils import SQLiteTestCase
+
+
+class TournamentViewShould(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.db = MagicMock(spec=Session)
+        self.start_date = datetime(2030, 5, 1, 11, tzinfo=timezone.utc)
+        self.tournament = Tournament(
+            id=uuid4(),
+            title="View Cup",
+            tournament_format=TournamentFormat.SINGLE_ELIMINATION,
+            start_date=self.start_date,
+            end_date=self.start_date + timedelta(days=2),
+            prize_pool=1000,
+            current_stage=Stage.SEMI_FINAL,
+            director_id=uuid4(),
+        )
+        self.teams = [Team(id=uuid4(), name=f"Team {i}") for i in range(4)]
+        self.matches = [
+            Match(
+                id=uuid4(),
+                match_format=MatchFormat.MR15,
+                start_time=self.start_date + timedelta(hours=3 * i),
+                is_finished=False,
+                stage=Stage.SEMI_FINAL,
+                team1=self.teams[2 * i],
+                team2=self.teams[2 * i + 1],
+                team1_id=self.teams[2 * i].id,
+                team2_id=self.teams[2 * i + 1].id,
+                team1_score=0,
+                team2_score=0,
+                tournament_id=self.tournament.id,
+                tournament=self.tournament,
+            )
+            for i in range(2)
+        ]
+        self.view = TournamentView(
+            id=self.tournament.id,
+            schema_version=crud_tournament_view.SCHEMA_VERSION,
+            payload={
+                **crud_tournament_view._build_summary(self.db, self.tournament),
+                "number_of_teams": 4,
+                "matches_of_current_stage": [
+                    crud_tournament_view._to_json(convert_db_to_match_list_response(m))
+                    for m in self.matches
+                ],
+                "teams": [],
+                "prizes": [],
+            },
+        )
+        # The view locked for rebuilding sections
+        locked = self.db.query.return_value.filter.return_value.with_for_update
+        locked.return_value.populate_existing.return_value.one_or_none.return_value = (
+            self.view
+        )
+
+    def test_get_tournament_view_reads_the_stored_view(self):
+        """Test that an up to date view is served with a single lookup."""
+        self.db.get.return_value = self.view
+
+        result = crud_tournament_view.get_tournament_view(self.db, self.tournament.id)
+
+        self.db.get.assert_called_once_with(TournamentView, self.tournament.id)
+        self.db.query.assert_not_called()
+        self.assertEqual(result.title, "View Cup")
+        self.assertEqual(len(result.matches_of_current_stage), 2)
+
+    def test_get_tournament_view_rebuilds_an_outdated_view(self):
+        """Test that a view built for another layout is rebuilt and stored."""
+        self.view.schema_version = crud_tournament_view.SCHEMA_VERSION - 1
+        self.db.get.return_value = self.view
+        self.tournament.title = "Renamed Cup"
+
+        with patch(
+            "src.crud.tournament_view.v.tournament_exists",
+            return_value=self.tournament,
+        ):
+            result = crud_tournament_view.get_tournament_view(
+                self.db, self.tournament.id
+            )
+
+        self.assertEqual(result.title, "Renamed Cup")
+        self.assertEqual(self.view.schema_version, crud_tournament_view.SCHEMA_VERSION)
+        self.db.commit.assert_called_once()
+
+    def test_refresh_view_match_of_another_stage_does_nothing(self):
+        """Test that matches outside the current stage are not in the view."""
+        self.matches[0].stage = Stage.QUARTER_FINAL
+
+        crud_tournament_view.refresh_view_match(self.db, self.matches[0])
+
+        self.db.get.assert_not_called()
+
+    def test_refresh_view_match_rebuilds_matches_for_a_new_match(self):
+        """Test that a match missing from the view rebuilds its section."""
+        self.view.payload = {**self.view.payload, "matches_of_current_stage": []}
+        self.db.get.return_value = self.view
+        build_matches = MagicMock(return_value={"matches_of_current_stage": ["new"]})
+
+        with patch.dict(
+            crud_tournament_view.SECTION_BUILDERS,
+            {crud_tournament_view.MATCHES: build_matches},
+        ):
+            crud_tournament_view.refresh_view_match(self.db, self.matches[0])
+
+        build_matches.assert_called_once_with(self.db, self.tournament)
+        self.assertEqual(self.view.payload["matches_of_current_stage"], ["new"])
+        self.assertEqual(self.view.payload["title"], "View Cup")
+
+    def test_view_dates_are_naive_utc(self):
+        """Test that new and loaded objects give the same JSON dates."""
+        summary = crud_tournament_view._build_summary(self.db, self.tournament)
+
+        self.assertEqual(summary["start_date"], "2030-05-01T11:00:00")
+        self.assertNotIn("number_of_teams", summary)
+
+
+class ConcurrentViewUpdatesShould(SQLiteTestCase):
+    ON_DISK = True
+
+    def setUp(self):
+        """Set up a database file with the view of a tournament of two matches."""
+        super().setUp()
+
+        start_date = datetime(2030, 5, 1, 11)
+        teams = [Team(name=f"Team {i}") for i in range(4)]
+        tournament = Tournament(
+            title="View Cup",
+            tournament_format=TournamentFormat.SINGLE_ELIMINATION,
+            start_date=start_date,
+            end_date=start_date + timedelta(days=2),
+            prize_pool=1000,
+            current_stage=Stage.SEMI_FINAL,
+            director=User(email="director@example.com", password_hash="hash"),
+            teams=teams,
+        )
+        self.matches = [
+            Match(
+                match_format=MatchFormat.MR15,
+                start_time=start_date + timedelta(hours=3 * i),
+                stage=Stage.SEMI_FINAL,
+                team1=teams[2 * i],
+                team2=teams[2 * i + 1],
+                tournament=tournament,
+            )
+            for i in range(2)
+        ]
+        with self.session() as db:
+            db.add(tournament)
+            db.commit()
+            self.tournament_id = tournament.id
+            self.match_ids = [match.id for match in self.matches]
+            crud_tournament_view.get_tournament_view(db, self.tournament_id)
+
+    def open_with_view(self) -> tuple[Session, TournamentView]:
+        """Open a session that has read the current view."""
+        db = self.session()
+        self.addCleanup(db.close)
+        return db, db.get(TournamentView, self.tournament_id)
+
+    def score(self, db: Session, match_id, team1_score: int) -> None:
+        """Set the score of a match and patch it into the view."""
+        db_match = db.get(Match, match_id)
+        db_match.team1_score = team1_score
+        crud_tournament_view.refresh_view_match(db, db_match)
+
+    def test_score_updates_of_different_matches_do_not_conflict(self):
+        """Test that patching one match keeps a concurrent patch of another."""
+        (first, _), (second, stale_view) = self.open_with_view(), self.open_with_view()
+
+        self.score(first, self.match_ids[0], 7)
+        first.commit()
+        self.score(second, self.match_ids[1], 3)
+        second.commit()
+
+        self.assertEqual(stale_view.version_id, 3)
+        with self.session() as db:
+            view = crud_tournament_view.get_tournament_view(db, self.tournament_id)
+        scores = {m.id: m.team1_score for m in view.matches_of_current_stage}
+        self.assertEqual(scores, dict(zip(self.match_ids, (7, 3))))
+
+    def test_section_rebuild_keeps_a_concurrent_patch(self):
+        """Test that a rebuild started before a patch builds on top of it."""
+        (first, _), (second, _) = self.open_with_view(), self.open_with_view()
+
+        self.score(first, self.match_ids[0], 7)
+        first.commit()
+        db_tournament = second.get(Tournament, self.tournament_id)
+        db_tournament.title = "Renamed Cup"
+        crud_tournament_view.refresh_view(
+            second, db_tournament, crud_tournament_view.SUMMARY
+        )
+        second.commit()
+
+        with self.session() as db:
+            view = crud_tournament_view.get_tournament_view(db, self.tournament_id)
+        self.assertEqual(view.title, "Renamed Cup")
+        self.assertEqual(view.matches_of_current_stage[0].team1_score, 7)
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from src.crud.tournament import (
     _calculate_tournament_end_date,
@@ -19,7 +20,7 @@ from src.crud.tournament import (
     update_tournament,
 )
 from src.models import Match, Team, Tournament, User
-from src.models.enums import MatchFormat, Role, Stage, TournamentFormat
+from src.models.enums import MatchFormat, Payout, Role, Stage, TournamentFormat
 from src.schemas.tournament import TournamentCreate, TournamentUpdate
 from src.utils.pagination import PaginationParams
 from starlette.status import (
@@ -27,6 +28,7 @@ from starlette.status import (
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
 )
+from tests.utils import SQLiteTestCase
 
 
 class TournamentServiceShould(unittest.TestCase):
@@ -84,51 +86,10 @@ class TournamentServiceShould(unittest.TestCase):
 
         self.pagination = PaginationParams(offset=0, limit=10)
 
-    def test_get_tournaments_with_all_filters(self):
-        """Test get_tournaments with all possible filters applied."""
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [self.tournament]
-        self.db.query.return_value = mock_query
-
-        result = get_tournaments(
-            db=self.db,
-            pagination=self.pagination,
-            period="present",
-            status="active",
-            tournament_format=TournamentFormat.SINGLE_ELIMINATION,
-            search="Test",
-            author_id=self.director_id,
-        )
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].id, self.tournament_id)
-        mock_query.filter.assert_called()
-        mock_query.order_by.assert_called_once()
-
-    def test_get_tournaments_no_filters(self):
-        """Test get_tournaments without any filters."""
-        mock_query = MagicMock()
-        mock_query.options.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [self.tournament]
-        self.db.query.return_value = mock_query
-
-        result = get_tournaments(db=self.db, pagination=self.pagination)
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].id, self.tournament_id)
-        mock_query.options.assert_called_once()
-
     def test_get_tournament_success(self):
         """Test get_tournament successfully retrieves a tournament."""
-        self.db.query.return_value.filter.return_value.first.return_value = (
-            self.tournament
+        self.db.get.side_effect = lambda model, id: {Tournament: self.tournament}.get(
+            model
         )
 
         result = get_tournament(self.db, self.tournament_id)
@@ -139,7 +100,7 @@ class TournamentServiceShould(unittest.TestCase):
 
     def test_get_tournament_not_found(self):
         """Test get_tournament raises exception when tournament not found."""
-        self.db.query.return_value.filter.return_value.first.return_value = None
+        self.db.get.return_value = None
 
         with self.assertRaises(HTTPException) as context:
             get_tournament(self.db, uuid4())
@@ -223,6 +184,8 @@ class TournamentServiceShould(unittest.TestCase):
             self.tournament
         )
 
+        self.db.flush.side_effect = IntegrityError("INSERT", {}, Exception())
+
         with self.assertRaises(HTTPException) as context:
             create_tournament(
                 db=self.db,
@@ -235,6 +198,81 @@ class TournamentServiceShould(unittest.TestCase):
             context.exception.detail, "Tournament with this title already exists"
         )
 
+    def test_create_tournament_prize_amounts_exceed_prize_pool(self):
+        """Test create_tournament fails when fixed prizes exceed the prize pool."""
+        tournament_create = TournamentCreate(
+            title="Test Tournament",
+            tournament_format=TournamentFormat.SINGLE_ELIMINATION,
+            start_date=datetime.now(timezone.utc) + timedelta(days=2),
+            prize_pool=1000,
+            prize_amounts=[800, 300],
+            team_names=["Team 1", "Team 2", "Team 3", "Team 4"],
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            create_tournament(
+                db=self.db,
+                tournament=tournament_create,
+                current_user=self.director_user,
+            )
+
+        self.assertEqual(context.exception.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            context.exception.detail, "Prize amounts exceed the prize pool"
+        )
+        self.db.add.assert_not_called()
+
+    def test_create_tournament_payout_with_more_places_than_teams(self):
+        """Test create_tournament fails when some prizes could never be won."""
+        tournament_create = TournamentCreate(
+            title="Test Tournament",
+            tournament_format=TournamentFormat.ONE_OFF_MATCH,
+            start_date=datetime.now(timezone.utc) + timedelta(days=2),
+            prize_pool=1000,
+            payout=Payout.TOP_THREE,
+            team_names=["Team 1", "Team 2"],
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            create_tournament(
+                db=self.db,
+                tournament=tournament_create,
+                current_user=self.director_user,
+            )
+
+        self.assertEqual(context.exception.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            context.exception.detail,
+            "The payout pays more places than the tournament has teams",
+        )
+        self.db.add.assert_not_called()
+
+    def test_update_tournament_payout_counts_knocked_out_teams(self):
+        """Test that teams knocked out of a started tournament still count."""
+        from src.crud.tournament import _count_teams
+
+        team1, team2, team3 = (Team(id=uuid4()) for _ in range(3))
+        self.tournament.teams = [team1]
+        self.tournament.matches = [
+            Match(team1_id=team1.id, team2_id=team2.id),
+            Match(team1_id=team1.id, team2_id=team3.id),
+        ]
+        self.db.get.return_value = self.tournament
+
+        with self.assertRaises(HTTPException) as context:
+            update_tournament(
+                db=self.db,
+                tournament_id=self.tournament_id,
+                tournament=TournamentUpdate(payout=Payout.TOP_FOUR),
+                current_user=self.admin_user,
+            )
+
+        self.assertEqual(
+            context.exception.detail,
+            "The payout pays more places than the tournament has teams",
+        )
+        self.assertEqual(_count_teams(self.tournament), 3)
+
     def test_create_tournament_invalid_start_date(self):
         """Test create_tournament fails with start date in the past."""
         tournament_create = TournamentCreate(
@@ -267,16 +305,16 @@ class TournamentServiceShould(unittest.TestCase):
             prize_pool=2000,
         )
 
-        self.tournament.teams = []
+        self.tournament.teams = [Team(id=uuid4()), Team(id=uuid4())]
         self.tournament.matches = []
         self.tournament.prize_cuts = []
         self.tournament.title = "Old Tournament"
         self.tournament.director_id = self.director_user.id
 
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.side_effect = [self.tournament, self.tournament, None]
-        self.db.query.return_value = mock_query
+        self.db.get.side_effect = lambda model, id: {Tournament: self.tournament}.get(
+            model
+        )
+        self.db.query.return_value.filter.return_value.first.return_value = None
 
         mock_transaction = MagicMock()
         self.db.begin_nested.return_value = mock_transaction
@@ -305,7 +343,6 @@ class TournamentServiceShould(unittest.TestCase):
 
         self.db.begin_nested.assert_called_once()
         self.db.commit.assert_called_once()
-        self.db.refresh.assert_called_once()
         mock_delete_cuts.assert_called_once()
         mock_create_cuts.assert_called_once()
 
@@ -379,11 +416,12 @@ class TournamentServiceShould(unittest.TestCase):
     def test_get_tournament_current_stage_invalid_teams(self):
         """Test _get_tournament_current_stage with invalid number of teams."""
         with self.assertRaises(HTTPException) as context:
-            _get_tournament_current_stage(TournamentFormat.SINGLE_ELIMINATION.value, 3)
+            _get_tournament_current_stage(TournamentFormat.SINGLE_ELIMINATION.value, 2)
         self.assertEqual(context.exception.status_code, HTTP_400_BAD_REQUEST)
         self.assertEqual(
             context.exception.detail,
-            "Invalid number of teams for single " "elimination - must be 4, 8 or 16",
+            "Invalid number of teams for single "
+            "elimination - must be between 3 and 64",
         )
 
     def test_validate_tournament_title_length(self):
@@ -397,10 +435,7 @@ class TournamentServiceShould(unittest.TestCase):
 
         self.tournament.director_id = self.director_user.id
 
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.filter.return_value.first.return_value = self.tournament
-        self.db.query.return_value = mock_query
+        self.db.get.return_value = self.tournament
 
         invalid_update = TournamentUpdate.model_construct(
             title="", end_date=None, prize_pool=None
@@ -478,10 +513,23 @@ class TournamentServiceShould(unittest.TestCase):
         )
         self.assertEqual(stage, Stage.QUARTER_FINAL)
 
+        # Byes fill the bracket up to the next power of two
+        for number_of_teams, expected in [
+            (3, Stage.SEMI_FINAL),
+            (5, Stage.QUARTER_FINAL),
+            (16, Stage.ROUND_OF_16),
+            (17, Stage.ROUND_OF_32),
+            (64, Stage.ROUND_OF_64),
+        ]:
+            stage = _get_tournament_current_stage(
+                TournamentFormat.SINGLE_ELIMINATION.value, number_of_teams
+            )
+            self.assertEqual(stage, expected)
+
     def test_get_tournament_current_stage_invalid_single_elimination(self):
         """Test _get_tournament_current_stage fails for
         invalid number of teams in single elimination."""
-        invalid_numbers = [2, 3, 5, 6, 7, 9, 16]
+        invalid_numbers = [0, 1, 2, 65, 128]
 
         for num in invalid_numbers:
             with self.assertRaises(HTTPException) as context:
@@ -492,11 +540,12 @@ class TournamentServiceShould(unittest.TestCase):
             self.assertEqual(context.exception.status_code, HTTP_400_BAD_REQUEST)
             self.assertEqual(
                 context.exception.detail,
-                "Invalid number of teams for single elimination - must be 4, 8 or 16",
+                "Invalid number of teams for single elimination "
+                "- must be between 3 and 64",
             )
 
     def test_get_tournament_with_teams(self):
-        """Test get_tournament correctly collects unique teams from matches."""
+        """Test get_tournament builds a missing view from the tournament's rows."""
         match1 = Match(
             id=uuid4(),
             team1=self.team1,
@@ -531,16 +580,133 @@ class TournamentServiceShould(unittest.TestCase):
             team2_score=0,
         )
 
-        self.tournament.matches = [match1, match2]
-        self.tournament.teams = [self.team1, self.team2]
+        rows = {Team: [self.team1, self.team2], Match: [match1, match2]}
 
-        mock_query = MagicMock()
-        mock_query.filter.return_value = mock_query
-        mock_query.filter.return_value.first.return_value = self.tournament
-        self.db.query.return_value = mock_query
+        self.db.get.side_effect = lambda model, id: {Tournament: self.tournament}.get(
+            model
+        )
+
+        def query(model):
+            mock_query = MagicMock()
+            rows_query = mock_query.options.return_value.filter.return_value
+            rows_query.order_by.return_value.all.return_value = rows.get(model, [])
+            return mock_query
+
+        self.db.query.side_effect = query
+        self.db.get.return_value = None
 
         result = get_tournament(self.db, self.tournament_id)
 
+        self.assertEqual(result.number_of_teams, 2)
+        self.assertEqual(len(result.matches_of_current_stage), 2)
         self.assertEqual(len(result.teams), 2)
         team_names = {team.name for team in result.teams}
         self.assertEqual(team_names, {"Team 1", "Team 2"})
+
+
+class TournamentListShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database with tournaments of many matches."""
+        super().setUp()
+
+        director = User(
+            email="director@example.com", password_hash="hash", role=Role.DIRECTOR
+        )
+        self.db.add(director)
+        self.day = datetime(2030, 5, 1, 11)
+
+        self.tournaments = []
+        for number in range(3):
+            db_tournament = Tournament(
+                title=f"List Cup {number}",
+                tournament_format=TournamentFormat.ROUND_ROBIN,
+                start_date=self.day + timedelta(days=number),
+                end_date=self.day + timedelta(days=number + 2),
+                prize_pool=1000,
+                current_stage=Stage.GROUP_STAGE,
+                director=director,
+            )
+            teams = [
+                Team(name=f"List {number} {i}", tournament=db_tournament)
+                for i in range(4 + number)
+            ]
+            # 120 matches, the first 10 * number of them finished
+            for i in range(120):
+                self.db.add(
+                    Match(
+                        match_format=MatchFormat.MR12,
+                        start_time=self.day + timedelta(hours=i),
+                        is_finished=i < 10 * number,
+                        stage=Stage.GROUP_STAGE,
+                        team1=teams[0],
+                        team2=teams[1],
+                        tournament=db_tournament,
+                    )
+                )
+            self.tournaments.append(db_tournament)
+        self.db.commit()
+
+    def test_get_tournaments_counts_matches_and_teams(self):
+        """Test that every tournament comes with its match and team counts."""
+        result = get_tournaments(self.db, PaginationParams(offset=0, limit=10))
+
+        self.assertEqual(
+            [tournament.title for tournament in result],
+            ["List Cup 2", "List Cup 1", "List Cup 0"],
+        )
+        self.assertEqual(
+            [
+                (
+                    tournament.number_of_teams,
+                    tournament.number_of_matches,
+                    tournament.finished_matches,
+                    tournament.next_match_time,
+                )
+                for tournament in result
+            ],
+            [
+                (6, 120, 20, self.day + timedelta(hours=20)),
+                (5, 120, 10, self.day + timedelta(hours=10)),
+                (4, 120, 0, self.day),
+            ],
+        )
+
+    def test_get_tournaments_paginates_tournaments_not_matches(self):
+        """Test that a page holds whole tournaments, whatever their matches."""
+        first_page = get_tournaments(self.db, PaginationParams(offset=0, limit=2))
+        second_page = get_tournaments(self.db, PaginationParams(offset=2, limit=2))
+
+        self.assertEqual(len(first_page), 2)
+        self.assertEqual([t.title for t in second_page], ["List Cup 0"])
+        self.assertEqual(second_page[0].number_of_matches, 120)
+
+    def test_get_tournaments_with_filters(self):
+        """Test that the filters apply before the page is cut."""
+        self.tournaments[0].current_stage = Stage.FINISHED
+        self.db.commit()
+
+        result = get_tournaments(
+            self.db,
+            PaginationParams(offset=0, limit=1),
+            status="finished",
+            tournament_format=TournamentFormat.ROUND_ROBIN,
+            search="List",
+        )
+
+        self.assertEqual([t.title for t in result], ["List Cup 0"])
+
+    def test_get_tournaments_runs_one_query_without_loading_teams(self):
+        """Test that a page is a single statement and hydrates no team."""
+        self.db.expunge_all()
+        statements = self.count_statements()
+
+        result = get_tournaments(self.db, PaginationParams(offset=0, limit=10))
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(len(statements), 1)
+        self.assertFalse(
+            any(
+                isinstance(entity, (Team, Match))
+                for entity in self.db.identity_map.values()
+            )
+        )
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from src.crud.user import (
     convert_db_to_user_response,
@@ -13,6 +14,7 @@ from src.crud.user import (
 from src.models.enums import Role
 from src.models.user import User
 from src.schemas.user import UserCreate
+from src.utils.events import UserEmailChanged, UserRegistered
 
 
 class UserServiceShould(unittest.TestCase):
@@ -27,10 +29,10 @@ class UserServiceShould(unittest.TestCase):
 
     @patch("src.crud.user.get_password_hash")
     @patch("src.crud.user.user_email_exists")
-    @patch("src.crud.user.send_email_notification")
+    @patch("src.crud.user.publish")
     def test_create_user_success(
         self,
-        mock_send_email_notification,
+        mock_publish,
         mock_user_email_exists,
         mock_get_password_hash,
     ):
@@ -49,25 +51,22 @@ class UserServiceShould(unittest.TestCase):
         self.db.add.assert_called_once()
         self.db.commit.assert_called_once()
         self.db.refresh.assert_called_once()
-        mock_send_email_notification.assert_called_with(
-            email="new_user@example.com",
-            subject="Account Created",
-            message="Your account has been created with email new_user@example.com",
+        mock_publish.assert_called_once_with(
+            self.db, UserRegistered(email="new_user@example.com")
         )
         self.assertEqual(created_user.email, "new_user@example.com")
         self.assertEqual(created_user.password_hash, "hashed_password")
 
-    @patch("src.utils.notifications.send_email_notification")
+    @patch("src.crud.user.publish")
     @patch("src.utils.validators.user_email_exists")
-    def test_create_user_email_exists(
-        self, mock_user_email_exists, mock_send_email_notification
-    ):
+    def test_create_user_email_exists(self, mock_user_email_exists, _):
         """Test user creation fails when email already exists."""
         mock_user_email_exists.side_effect = HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Email already exists."
         )
 
         user_data = UserCreate(email="existing_user@example.com", password="Secure@123")
+        self.db.commit.side_effect = IntegrityError("INSERT", {}, Exception())
 
         with self.assertRaises(HTTPException) as context:
             create_user(user=user_data, db=self.db)
@@ -75,7 +74,7 @@ class UserServiceShould(unittest.TestCase):
         self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(context.exception.detail, "Email already exists")
 
-        mock_send_email_notification.assert_not_called()
+        self.db.rollback.assert_called_once()
 
     def test_get_user_by_id_success(self):
         """Test retrieving a user by ID succeeds."""
@@ -99,10 +98,8 @@ class UserServiceShould(unittest.TestCase):
         self.assertEqual(context.exception.detail, "User not found.")
 
     @patch("src.crud.user.user_email_exists")
-    @patch("src.crud.user.send_email_notification")
-    def test_update_email_success(
-        self, mock_send_email_notification, mock_user_email_exists
-    ):
+    @patch("src.crud.user.publish")
+    def test_update_email_success(self, mock_publish, mock_user_email_exists):
         """Test updating user email succeeds."""
         mock_user_email_exists.return_value = None
 
@@ -119,27 +116,27 @@ class UserServiceShould(unittest.TestCase):
 
         self.db.commit.assert_called_once()
         self.db.refresh.assert_called_once()
-        mock_send_email_notification.assert_any_call(
-            email="test_user@example.com",
-            subject="Email Updated",
-            message=f"Your email has been changed from "
-            f"test_user@example.com to {updated_email}",
-        )
-        mock_send_email_notification.assert_any_call(
-            email=updated_email,
-            subject="Email Updated",
-            message=f"Your email has been changed from "
-            f"test_user@example.com to {updated_email}",
+        mock_publish.assert_called_once_with(
+            self.db,
+            UserEmailChanged(
+                old_email="test_user@example.com", new_email=updated_email
+            ),
         )
 
         self.assertEqual(response["message"], "Email updated successfully.")
 
+    @patch("src.crud.user.publish")
     @patch("src.utils.validators.user_email_exists")
-    def test_update_email_conflict(self, mock_user_email_exists):
+    def test_update_email_conflict(self, mock_user_email_exists, _):
         """Test updating user email fails when the new email already exists."""
         mock_user_email_exists.side_effect = HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already exists."
         )
+        self.db.query.return_value.filter.return_value.first.side_effect = [
+            self.current_user,
+            User(email="conflicting_email@example.com"),
+        ]
+        self.db.commit.side_effect = IntegrityError("UPDATE", {}, Exception())
 
         with self.assertRaises(HTTPException) as context:
             update_email(
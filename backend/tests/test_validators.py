@@ -0,0 +1,79 @@
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import HTTPException, status
+from src.models import Team, Tournament, User
+from src.models.enums import Role, Stage, TournamentFormat
+from src.utils import validators as v
+from tests.utils import SQLiteTestCase
+
+
+class ValidatorsShould(SQLiteTestCase):
+    def setUp(self):
+        """Set up an in-memory database with a tournament and a team."""
+        super().setUp()
+
+        self.director = User(
+            email="director@example.com", password_hash="hash", role=Role.DIRECTOR
+        )
+        tournament = Tournament(
+            title="Loader Cup",
+            tournament_format=TournamentFormat.ROUND_ROBIN,
+            start_date=datetime(2030, 5, 1),
+            end_date=datetime(2030, 5, 3),
+            prize_pool=1000,
+            current_stage=Stage.GROUP_STAGE,
+            director=self.director,
+        )
+        team = Team(name="Loader Team", tournament=tournament)
+        self.db.add(team)
+        self.db.commit()
+        self.tournament_id, self.team_id = tournament.id, team.id
+        self.director_id = self.director.id
+        self.db.expunge_all()
+
+        self.statements = self.count_statements()
+
+    def test_validators_reuse_loaded_entities(self):
+        """Test that a tournament is queried once for both of its checks."""
+        db_tournament = v.tournament_exists(self.db, self.tournament_id)
+        v.is_author_of_tournament(self.db, self.tournament_id, self.director_id)
+
+        self.assertIs(v.tournament_exists(self.db, self.tournament_id), db_tournament)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_validators_reuse_entities_loaded_by_relationships(self):
+        """Test that an entity reached through a relationship is not queried."""
+        db_team = v.team_exists(self.db, self.team_id)
+        db_tournament = db_team.tournament
+
+        self.assertIs(v.tournament_exists(self.db, self.tournament_id), db_tournament)
+        self.assertEqual(len(self.statements), 2)
+
+    def test_validators_get_entities_from_the_session(self):
+        """Test that an ID lookup is a single Session.get, no other query."""
+        with patch.object(self.db, "get", wraps=self.db.get) as get:
+            db_team = v.team_exists(self.db, self.team_id)
+            self.assertIs(v.team_exists(self.db, self.team_id), db_team)
+
+        get.assert_called_with(Team, self.team_id)
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_validators_query_deleted_entities_again(self):
+        """Test that an entity deleted in the request is not found."""
+        self.db.delete(v.team_exists(self.db, self.team_id))
+        self.db.flush()
+
+        with self.assertRaises(HTTPException) as context:
+            v.team_exists(self.db, self.team_id)
+
+        self.assertEqual(context.exception.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_missing_entity_is_not_found(self):
+        """Test that a missing ID still fails the validator."""
+        with self.assertRaises(HTTPException) as context:
+            v.match_exists(self.db, uuid4())
+
+        self.assertEqual(context.exception.detail, "Match not found")
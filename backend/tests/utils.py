@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src.models import Base
+
+
+class SQLiteTestCase(unittest.TestCase):
+    """
+    A test case with a fresh SQLite database holding every table, in memory
+    by default, or in a file for tests of several concurrent sessions.
+
+    `self.db` is a session of the database and `self.session` makes more.
+    """
+
+    # Whether the database is kept in a file that separate connections share
+    ON_DISK = False
+
+    def setUp(self):
+        """Set up the database and a session of it."""
+        url = "sqlite://"
+        if self.ON_DISK:
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            url = f"sqlite:///{os.path.join(directory.name, 'db')}"
+
+        self.engine = create_engine(url)
+        self.addCleanup(self.engine.dispose)
+        self.configure_engine(self.engine)
+        Base.metadata.create_all(self.engine)
+
+        self.session = sessionmaker(bind=self.engine, autoflush=False)
+        self.db = self.session()
+        self.addCleanup(self.db.close)
+
+    def configure_engine(self, engine: Engine) -> None:
+        """Add listeners to the engine before it first connects."""
+
+    def count_statements(self) -> list[str]:
+        """
+        Record the SQL statements run from now on, e.g. to assert that a
+        page is loaded with a single query.
+
+        Returns:
+            list[str]: The statements, appended to as they run.
+        """
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", count)
+        self.addCleanup(event.remove, self.engine, "before_cursor_execute", count)
+        return statements
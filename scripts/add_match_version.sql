@@ -0,0 +1,13 @@
+-- Upgrades a database created before matches were versioned
+-- The API creates missing tables on startup, but never changes existing ones
+
+-- In psql use the command:
+-- \c match_score_db
+
+-- STEP 1: Add the version counter of concurrent score updates
+-- Existing matches start at version 1, like new ones
+ALTER TABLE match ADD COLUMN IF NOT EXISTS version_id INTEGER NOT NULL DEFAULT 1;
+
+-- STEP 2: Index the check for unfinished matches of a tournament
+CREATE INDEX IF NOT EXISTS ix_match_tournament_id_is_finished
+    ON match (tournament_id, is_finished);
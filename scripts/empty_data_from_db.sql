@@ -9,6 +9,10 @@ BEGIN
  EXECUTE 'ALTER TABLE "user" DISABLE TRIGGER ALL';
  EXECUTE 'ALTER TABLE request DISABLE TRIGGER ALL';
  EXECUTE 'ALTER TABLE prizecut DISABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE tournamentstanding DISABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE idempotencykey DISABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE bracketnode DISABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE tournamentview DISABLE TRIGGER ALL';
 
  -- Truncate all tables
  EXECUTE 'TRUNCATE TABLE match CASCADE';
@@ -18,6 +22,10 @@ BEGIN
  EXECUTE 'TRUNCATE TABLE "user" CASCADE';
  EXECUTE 'TRUNCATE TABLE request CASCADE';
  EXECUTE 'TRUNCATE TABLE prizecut CASCADE';
+ EXECUTE 'TRUNCATE TABLE tournamentstanding CASCADE';
+ EXECUTE 'TRUNCATE TABLE idempotencykey CASCADE';
+ EXECUTE 'TRUNCATE TABLE bracketnode CASCADE';
+ EXECUTE 'TRUNCATE TABLE tournamentview CASCADE';
 
  -- Re-enable triggers and constraints
  EXECUTE 'ALTER TABLE match ENABLE TRIGGER ALL';
@@ -27,6 +35,10 @@ BEGIN
  EXECUTE 'ALTER TABLE "user" ENABLE TRIGGER ALL';
  EXECUTE 'ALTER TABLE request ENABLE TRIGGER ALL';
  EXECUTE 'ALTER TABLE prizecut ENABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE tournamentstanding ENABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE idempotencykey ENABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE bracketnode ENABLE TRIGGER ALL';
+ EXECUTE 'ALTER TABLE tournamentview ENABLE TRIGGER ALL';
 END $$;
 
 
@@ -35,6 +47,6 @@ END $$;
 
 DO $$
 BEGIN
-    TRUNCATE TABLE match, tournament, player, team, "user", request, prizecut CASCADE;
+    TRUNCATE TABLE match, tournament, player, team, "user", request, prizecut, tournamentstanding, idempotencykey, bracketnode, tournamentview CASCADE;
 
 END $$;
\ No newline at end of file